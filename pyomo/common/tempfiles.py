@@ -207,6 +207,46 @@ class TempfileManagerClass(object):
         ctx.release(remove)
         return ctx
 
+    @property
+    def depth(self):
+        """The number of contexts on the context stack"""
+        return len(self._context_stack)
+
+    def detach(self, depth):
+        """Remove (without releasing) the contexts above ``depth``
+
+        This allows an operation that pushes tempfile contexts and then
+        suspends (e.g., a coroutine) to remove its contexts from the
+        stack so that they do not interleave with contexts pushed by
+        other operations.  The contexts can be restored as the active
+        contexts with :meth:`attach`.
+
+        Parameters
+        ----------
+        depth: int
+            The stack depth (see :attr:`depth`) to return the stack to
+
+        Returns
+        -------
+        list
+            the detached contexts (from the bottom of the stack to the top)
+
+        """
+        contexts = self._context_stack[depth:]
+        del self._context_stack[depth:]
+        return contexts
+
+    def attach(self, contexts):
+        """Push previously detached contexts back onto the context stack
+
+        Parameters
+        ----------
+        contexts: list
+            the contexts returned by :meth:`detach`
+
+        """
+        self._context_stack.extend(contexts)
+
     def __enter__(self):
         ctx = self.push()
         self._context_manager_stack.append(ctx)
@@ -562,6 +562,30 @@ class Test_TempfileManager(unittest.TestCase):
         ctx = self.TM.push()
         self.assertIs(ctx, self.TM.context())
 
+    def test_detach_attach(self):
+        base = self.TM.push()
+        self.assertEqual(self.TM.depth, 1)
+        ctx1 = self.TM.push()
+        ctx2 = self.TM.push()
+        fname = self.TM.create_tempfile()
+        self.assertEqual(self.TM.depth, 3)
+
+        contexts = self.TM.detach(1)
+        self.assertEqual(contexts, [ctx1, ctx2])
+        self.assertEqual(self.TM.depth, 1)
+        self.assertIs(self.TM.context(), base)
+        # Detaching does not release the contexts
+        self.assertTrue(os.path.exists(fname))
+
+        other = self.TM.push()
+        self.TM.attach(contexts)
+        self.assertEqual(self.TM.depth, 4)
+        self.assertIs(self.TM.pop(), ctx2)
+        self.assertFalse(os.path.exists(fname))
+        self.assertIs(self.TM.pop(), ctx1)
+        self.assertIs(self.TM.pop(), other)
+        self.assertIs(self.TM.pop(), base)
+
 
 if __name__ == "__main__":
     unittest.main()
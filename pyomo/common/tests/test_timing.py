@@ -33,6 +33,7 @@ from pyomo.environ import (
     RangeSet,
     Var,
     Any,
+    Constraint,
     TransformationFactory,
 )
 from pyomo.core.base.var import VarData
@@ -69,6 +70,24 @@ class TestTiming(unittest.TestCase):
             r"[0-9\.]+ elapsed seconds",
         )
 
+    def test_sparse_construction_timer(self):
+        m = ConcreteModel()
+        m.r = RangeSet(10)
+        m.x = Var(m.r)
+        os = StringIO()
+        try:
+            report_timing(os)
+            m.c = Constraint(
+                m.r, m.r, rule=lambda m, i, j: m.x[i] <= j, sparse_index=[(1, 2)]
+            )
+        finally:
+            report_timing(False)
+        self.assertRegex(
+            os.getvalue().splitlines()[-1].strip(),
+            r"(0(\.\d+)?) seconds to construct Constraint c; "
+            r"1 of 100 indices constructed",
+        )
+
     def test_raw_transformation_timer(self):
         a = TransformationTimer(None)
         self.assertRegex(
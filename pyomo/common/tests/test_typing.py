@@ -22,4 +22,4 @@ class TestTyping(unittest.TestCase):
         func_list = get_overloads_for(Block.__init__)
         self.assertEqual(len(func_list), 1)
         kwds = inspect.getfullargspec(func_list[0]).kwonlyargs
-        self.assertEqual(kwds, ['rule', 'concrete', 'dense', 'name', 'doc'])
+        self.assertEqual(kwds, ['rule', 'concrete', 'dense', 'parallel', 'name', 'doc'])
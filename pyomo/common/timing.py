@@ -120,18 +120,23 @@ class GeneralTimer(object):
 
 
 class ConstructionTimer(object):
-    __slots__ = ('obj', 'timer')
+    __slots__ = ('obj', 'timer', 'sparse')
     msg = "%6.*f seconds to construct %s %s%s"
     in_progress = "ConstructionTimer object for %s %s; %0.3f elapsed seconds"
 
     def __init__(self, obj):
         self.obj = obj
         self.timer = -default_timer()
+        self.sparse = False
 
-    def report(self):
+    def report(self, sparse=False):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the message string
         self.timer += default_timer()
+        # Components constructed from an explicit (sparse) list of
+        # indices report the number of constructed indices in
+        # addition to the size of the index set
+        self.sparse = sparse
         _construction_logger.info(self)
 
     @property
@@ -155,6 +160,8 @@ class ConstructionTimer(object):
                 else:
                     idx = len(self.obj)
                 idx_label = f'{idx} indices' if idx != 1 else '1 index'
+                if self.sparse:
+                    idx_label = f'{len(self.obj)} of {idx_label} constructed'
             elif hasattr(self.obj, 'index_set'):
                 # scalar indexed components
                 idx = len(self.obj.index_set())
@@ -166,7 +173,7 @@ class ConstructionTimer(object):
             # unknown component
             idx_label = ''
         if idx_label:
-            idx_label = f'; {idx_label} total'
+            idx_label = f'; {idx_label}' if self.sparse else f'; {idx_label} total'
         try:
             _type = self.obj.ctype.__name__
         except AttributeError:
@@ -27,6 +27,7 @@ from pyomo.core.base.var import VarData, Var
 from pyomo.core.base.param import ParamData, Param
 from pyomo.core.base.block import BlockData, Block
 from pyomo.core.base.objective import ObjectiveData
+from pyomo.core.base.journal import ChangeJournal, in_model
 from pyomo.common.collections import ComponentMap
 from .utils.get_objective import get_objective
 from .utils.collect_vars_and_named_exprs import collect_vars_and_named_exprs
@@ -50,7 +51,7 @@ from pyomo.core.base import SymbolMap
 import weakref
 from .cmodel import cmodel, cmodel_available
 from pyomo.core.staleflag import StaleFlagManager
-from pyomo.core.expr.numvalue import NumericConstant
+from pyomo.core.expr.numvalue import NumericConstant, native_numeric_types
 
 
 class TerminationCondition(enum.Enum):
@@ -436,6 +437,7 @@ class UpdateConfig(ConfigDict):
     update_vars: bool
     update_params: bool
     update_named_expressions: bool
+    track_changes: bool
     """
 
     def __init__(
@@ -580,6 +582,24 @@ class UpdateConfig(ConfigDict):
                 updating the values of fixed variables is much faster this way.""",
             ),
         )
+        self.declare(
+            'track_changes',
+            ConfigValue(
+                domain=bool,
+                default=False,
+                doc="""
+                If True, changes made to the model through the component APIs
+                (e.g., fixing variables, changing bounds, Param values or
+                constraint expressions, (de)activating components, and
+                adding / deleting components) are recorded in a change
+                journal (see pyomo.core.base.journal), and subsequent updates
+                only process the recorded components instead of rescanning
+                the entire model. Changes made by directly manipulating
+                private attributes are not detected; call set_instance() to
+                resynchronize. The first update after enabling this option
+                performs a full scan.""",
+            ),
+        )
 
         self.check_for_new_or_removed_constraints: bool = True
         self.check_for_new_or_removed_vars: bool = True
@@ -591,6 +611,7 @@ class UpdateConfig(ConfigDict):
         self.update_named_expressions: bool = True
         self.update_objective: bool = True
         self.treat_fixed_vars_as_params: bool = True
+        self.track_changes: bool = False
 
 
 class Solver(abc.ABC):
@@ -702,6 +723,20 @@ class Solver(abc.ABC):
         return False
 
 
+def _bound_changed(old, new):
+    # Bounds are normally compared by identity (bound expressions are
+    # not rebuilt unless they are changed).  Columnar variables return
+    # new float objects for every access, so fall back on comparing
+    # numeric values.
+    if old is new:
+        return False
+    return not (
+        old.__class__ in native_numeric_types
+        and new.__class__ in native_numeric_types
+        and old == new
+    )
+
+
 class PersistentSolver(Solver):
     def is_persistent(self):
         return True
@@ -929,6 +964,7 @@ class PersistentBase(abc.ABC):
         self._expr_types = None
         self.use_extensions = False
         self._only_child_vars = only_child_vars
+        self._change_journal = None
 
     @property
     def update_config(self):
@@ -1261,10 +1297,51 @@ class PersistentBase(abc.ABC):
     def update_params(self):
         pass
 
+    def _check_for_var_updates(self, vars_to_check, cons_to_remove_and_add):
+        """Update the variables whose bounds, domain, or fixed status /
+        value changed
+
+        Constraints that need to be regenerated (because a fixed
+        variable that is treated as a parameter changed) are added to
+        cons_to_remove_and_add.  Returns True if the objective needs to
+        be regenerated.
+
+        """
+        need_to_set_objective = False
+        vars_to_update = list()
+        for v in vars_to_check:
+            _v, lb, ub, fixed, domain_interval, value = self._vars[id(v)]
+            if (fixed != v.fixed) or (fixed and (value != v.value)):
+                vars_to_update.append(v)
+                if self.update_config.treat_fixed_vars_as_params:
+                    for c in self._referenced_variables[id(v)][0]:
+                        cons_to_remove_and_add[c] = None
+                    if self._referenced_variables[id(v)][2] is not None:
+                        need_to_set_objective = True
+            elif _bound_changed(lb, v._lb):
+                vars_to_update.append(v)
+            elif _bound_changed(ub, v._ub):
+                vars_to_update.append(v)
+            elif domain_interval != v.domain.get_interval():
+                vars_to_update.append(v)
+        self.update_variables(vars_to_update)
+        return need_to_set_objective
+
     def update(self, timer: HierarchicalTimer = None):
         if timer is None:
             timer = HierarchicalTimer()
         config = self.update_config
+        if config.track_changes:
+            if self._change_journal is not None:
+                self._update_from_change_journal(timer)
+                return
+            # Start recording changes (this update performs a full
+            # scan of the model)
+            self._change_journal = ChangeJournal()
+            self._change_journal.start()
+        elif self._change_journal is not None:
+            self._change_journal.stop()
+            self._change_journal = None
         new_vars = list()
         old_vars = list()
         new_params = list()
@@ -1383,23 +1460,8 @@ class PersistentBase(abc.ABC):
             end_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
             vars_to_check = [v for v_id, v in end_vars.items() if v_id in start_vars]
         if config.update_vars:
-            vars_to_update = list()
-            for v in vars_to_check:
-                _v, lb, ub, fixed, domain_interval, value = self._vars[id(v)]
-                if (fixed != v.fixed) or (fixed and (value != v.value)):
-                    vars_to_update.append(v)
-                    if self.update_config.treat_fixed_vars_as_params:
-                        for c in self._referenced_variables[id(v)][0]:
-                            cons_to_remove_and_add[c] = None
-                        if self._referenced_variables[id(v)][2] is not None:
-                            need_to_set_objective = True
-                elif lb is not v._lb:
-                    vars_to_update.append(v)
-                elif ub is not v._ub:
-                    vars_to_update.append(v)
-                elif domain_interval != v.domain.get_interval():
-                    vars_to_update.append(v)
-            self.update_variables(vars_to_update)
+            if self._check_for_var_updates(vars_to_check, cons_to_remove_and_add):
+                need_to_set_objective = True
         timer.stop('vars')
         timer.start('cons')
         cons_to_remove_and_add = list(cons_to_remove_and_add.keys())
@@ -1446,6 +1508,145 @@ class PersistentBase(abc.ABC):
         self.remove_variables(old_vars)
         timer.stop('vars')
 
+    def _update_from_change_journal(self, timer: HierarchicalTimer):
+        """Update the solver using the changes recorded by the change
+        journal (instead of scanning the entire model)"""
+        config = self.update_config
+        model = self._model
+        timer.start('journal')
+        changes = self._change_journal.collect()
+        timer.stop('journal')
+
+        timer.start('cons')
+        new_cons = list()
+        old_cons = list()
+        new_sos = list()
+        old_sos = list()
+        cons_to_remove_and_add = dict()
+        sos_to_update = list()
+        for c in changes.constraints:
+            known = c in self._vars_referenced_by_con
+            if in_model(c, model, active=True):
+                if not known:
+                    if config.check_for_new_or_removed_constraints:
+                        new_cons.append(c)
+                elif (
+                    config.update_constraints
+                    and c.expr is not self._active_constraints[c]
+                ):
+                    cons_to_remove_and_add[c] = None
+            elif known and config.check_for_new_or_removed_constraints:
+                old_cons.append(c)
+        for c in changes.sos_constraints:
+            known = c in self._vars_referenced_by_con
+            if in_model(c, model, active=True):
+                if not known:
+                    if config.check_for_new_or_removed_constraints:
+                        new_sos.append(c)
+                elif config.update_constraints:
+                    sos_to_update.append(c)
+            elif known and config.check_for_new_or_removed_constraints:
+                old_sos.append(c)
+        self.remove_constraints(old_cons)
+        self.remove_sos_constraints(old_sos)
+        timer.stop('cons')
+
+        timer.start('params')
+        new_params = list()
+        old_params = list()
+        if config.check_for_new_or_removed_params:
+            for p in changes.params:
+                known = id(p) in self._params
+                if in_model(p, model):
+                    if not known:
+                        new_params.append(p)
+                elif known:
+                    old_params.append(p)
+        self.remove_params(old_params)
+        if config.update_params and changes.params:
+            self.update_params()
+        self.add_params(new_params)
+        timer.stop('params')
+
+        timer.start('vars')
+        new_vars = list()
+        old_vars = list()
+        if self._only_child_vars and config.check_for_new_or_removed_vars:
+            for v in changes.variables:
+                known = id(v) in self._vars
+                if in_model(v, model):
+                    if not known:
+                        new_vars.append(v)
+                elif known:
+                    old_vars.append(v)
+        self.add_variables(new_vars)
+        timer.stop('vars')
+
+        timer.start('cons')
+        self.add_constraints(new_cons)
+        self.add_sos_constraints(new_sos)
+        self.remove_sos_constraints(sos_to_update)
+        self.add_sos_constraints(sos_to_update)
+        timer.stop('cons')
+
+        timer.start('vars')
+        need_to_set_objective = False
+        if config.update_vars:
+            new_vars_set = set(id(v) for v in new_vars)
+            vars_to_check = [
+                v
+                for v in changes.variables
+                if id(v) in self._vars and id(v) not in new_vars_set
+            ]
+            if self._check_for_var_updates(vars_to_check, cons_to_remove_and_add):
+                need_to_set_objective = True
+        timer.stop('vars')
+
+        timer.start('cons')
+        cons_to_remove_and_add = list(cons_to_remove_and_add.keys())
+        self.remove_constraints(cons_to_remove_and_add)
+        self.add_constraints(cons_to_remove_and_add)
+        timer.stop('cons')
+
+        timer.start('named expressions')
+        if config.update_named_expressions and changes.named_expressions:
+            new_cons_set = set(new_cons)
+            cons_to_update = list()
+            for c, expr_list in self._named_expressions.items():
+                if c in new_cons_set:
+                    continue
+                for named_expr, old_expr in expr_list:
+                    if named_expr.expr is not old_expr:
+                        cons_to_update.append(c)
+                        break
+            self.remove_constraints(cons_to_update)
+            self.add_constraints(cons_to_update)
+            for named_expr, old_expr in self._obj_named_expressions:
+                if named_expr.expr is not old_expr:
+                    need_to_set_objective = True
+                    break
+        timer.stop('named expressions')
+
+        timer.start('objective')
+        if config.check_for_new_objective and changes.objectives:
+            pyomo_obj = get_objective(model)
+            if pyomo_obj is not self._objective:
+                need_to_set_objective = True
+        else:
+            pyomo_obj = self._objective
+        if config.update_objective and pyomo_obj is not None:
+            if pyomo_obj.expr is not self._objective_expr:
+                need_to_set_objective = True
+            elif pyomo_obj.sense is not self._objective_sense:
+                need_to_set_objective = True
+        if need_to_set_objective:
+            self.set_objective(pyomo_obj)
+        timer.stop('objective')
+
+        timer.start('vars')
+        self.remove_variables(old_vars)
+        timer.stop('vars')
+
 
 legacy_termination_condition_map = {
     TerminationCondition.unknown: LegacyTerminationCondition.unknown,
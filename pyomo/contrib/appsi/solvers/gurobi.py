@@ -15,7 +15,12 @@ import math
 from typing import List, Dict, Optional
 from pyomo.common.collections import ComponentSet, ComponentMap, OrderedSet
 from pyomo.common.log import LogStream
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import (
+    attempt_import,
+    numpy as np,
+    scipy,
+    scipy_available,
+)
 from pyomo.common.errors import PyomoException
 from pyomo.common.tee import capture_output, TeeStream
 from pyomo.common.timing import HierarchicalTimer
@@ -165,6 +170,59 @@ class _MutableConstant(object):
         self.con.rhs = value(self.expr)
 
 
+class _MutableLinearRows(object):
+    """The mutable (parameterized) coefficients and right-hand sides of
+    the linear constraints added in bulk (with addMConstr)
+
+    The expressions are stored in flat parallel lists (keyed by the
+    Pyomo constraint) rather than in per-coefficient helper objects so
+    that they can be evaluated and sent to Gurobi in bulk.
+    """
+
+    def __init__(self):
+        self.coef_cons = list()
+        self.coef_vars = list()
+        self.coef_exprs = list()
+        self.rhs_cons = list()
+        self.rhs_exprs = list()
+
+    def __len__(self):
+        return len(self.coef_cons) + len(self.rhs_cons)
+
+    def add_coefficient(self, con, gurobi_var, expr):
+        self.coef_cons.append(con)
+        self.coef_vars.append(gurobi_var)
+        self.coef_exprs.append(expr)
+
+    def add_rhs(self, con, expr):
+        self.rhs_cons.append(con)
+        self.rhs_exprs.append(expr)
+
+    def remove(self, cons):
+        cons = set(cons)
+        if any(c in cons for c in self.coef_cons):
+            keep = [i for i, c in enumerate(self.coef_cons) if c not in cons]
+            self.coef_cons = [self.coef_cons[i] for i in keep]
+            self.coef_vars = [self.coef_vars[i] for i in keep]
+            self.coef_exprs = [self.coef_exprs[i] for i in keep]
+        if any(c in cons for c in self.rhs_cons):
+            keep = [i for i, c in enumerate(self.rhs_cons) if c not in cons]
+            self.rhs_cons = [self.rhs_cons[i] for i in keep]
+            self.rhs_exprs = [self.rhs_exprs[i] for i in keep]
+
+    def update(self, gurobi_model, con_map):
+        if self.rhs_cons:
+            gurobi_model.setAttr(
+                'RHS',
+                [con_map[c] for c in self.rhs_cons],
+                [value(e) for e in self.rhs_exprs],
+            )
+        # Gurobi does not provide a bulk interface for changing
+        # individual matrix coefficients
+        for con, var, expr in zip(self.coef_cons, self.coef_vars, self.coef_exprs):
+            gurobi_model.chgCoeff(con_map[con], var, value(expr))
+
+
 class _MutableQuadraticConstraint(object):
     def __init__(
         self, gurobi_model, gurobi_con, constant, linear_coefs, quadratic_coefs
@@ -257,6 +315,7 @@ class Gurobi(PersistentBase, PersistentSolver):
         self._pyomo_sos_to_solver_sos_map = dict()
         self._range_constraints = OrderedSet()
         self._mutable_helpers = dict()
+        self._mutable_rows = _MutableLinearRows()
         self._mutable_bounds = dict()
         self._mutable_quadratic_helpers = dict()
         self._mutable_objective = None
@@ -529,10 +588,11 @@ class Gurobi(PersistentBase, PersistentSolver):
         if self._objective is None:
             self.set_objective(None)
 
-    def _get_expr_from_pyomo_expr(self, expr):
+    def _get_expr_from_pyomo_expr(self, expr, repn=None):
         mutable_linear_coefficients = list()
         mutable_quadratic_coefficients = list()
-        repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
+        if repn is None:
+            repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
 
         degree = repn.polynomial_degree()
         if (degree is None) or (degree > 2):
@@ -579,15 +639,100 @@ class Gurobi(PersistentBase, PersistentSolver):
             mutable_quadratic_coefficients,
         )
 
+    def _add_linear_constraints(self, cons, repns):
+        """Add linear (non-range) constraints with a single call to
+        addMConstr
+
+        The constraint matrix is assembled in CSR form over the (local)
+        list of Gurobi variables that appear in the constraints.
+        """
+        var_map = self._pyomo_var_to_solver_var_map
+        mutable_rows = self._mutable_rows
+        columns = dict()
+        gurobi_vars = list()
+        starts = list()
+        col_indices = list()
+        coef_values = list()
+        senses = list()
+        rhs_values = list()
+        names = list()
+        for con, repn in zip(cons, repns):
+            names.append(self._symbol_map.getSymbol(con, self._labeler))
+            starts.append(len(coef_values))
+            for coef, v in zip(repn.linear_coefs, repn.linear_vars):
+                v_id = id(v)
+                col = columns.get(v_id, None)
+                if col is None:
+                    col = columns[v_id] = len(gurobi_vars)
+                    gurobi_vars.append(var_map[v_id])
+                if coef.__class__ not in native_numeric_types and not is_constant(coef):
+                    mutable_rows.add_coefficient(con, var_map[v_id], coef)
+                col_indices.append(col)
+                coef_values.append(value(coef))
+            if con.equality:
+                senses.append(gurobipy.GRB.EQUAL)
+                rhs_expr = con.lower - repn.constant
+            elif con.has_lb():
+                senses.append(gurobipy.GRB.GREATER_EQUAL)
+                rhs_expr = con.lower - repn.constant
+            else:
+                senses.append(gurobipy.GRB.LESS_EQUAL)
+                rhs_expr = con.upper - repn.constant
+            if not is_constant(rhs_expr):
+                mutable_rows.add_rhs(con, rhs_expr)
+            rhs_values.append(value(rhs_expr))
+        starts.append(len(coef_values))
+
+        A = scipy.sparse.csr_array(
+            (
+                np.array(coef_values, dtype=np.double),
+                np.array(col_indices, dtype=np.int64),
+                np.array(starts, dtype=np.int64),
+            ),
+            shape=(len(cons), len(gurobi_vars)),
+        )
+        gurobi_cons = self._solver_model.addMConstr(
+            A, gurobi_vars, np.array(senses), np.array(rhs_values, dtype=np.double)
+        )
+        if hasattr(gurobi_cons, 'tolist'):
+            gurobi_cons = gurobi_cons.tolist()
+        self._solver_model.setAttr('ConstrName', gurobi_cons, names)
+        for con, gurobipy_con in zip(cons, gurobi_cons):
+            self._pyomo_con_to_solver_con_map[con] = gurobipy_con
+            self._solver_con_to_pyomo_con_map[id(gurobipy_con)] = con
+
     def _add_constraints(self, cons: List[ConstraintData]):
-        for con in cons:
+        if scipy_available and hasattr(gurobipy.Model, 'addMConstr'):
+            # Load all linear (non-range) constraints in bulk and fall
+            # back on adding range and quadratic constraints one at a
+            # time below.
+            linear_cons = list()
+            linear_repns = list()
+            other_cons = list()
+            other_repns = list()
+            for con in cons:
+                repn = generate_standard_repn(
+                    con.body, quadratic=True, compute_values=False
+                )
+                if repn.is_linear() and (con.equality or con.has_lb() != con.has_ub()):
+                    linear_cons.append(con)
+                    linear_repns.append(repn)
+                else:
+                    other_cons.append(con)
+                    other_repns.append(repn)
+            if linear_cons:
+                self._add_linear_constraints(linear_cons, linear_repns)
+        else:
+            other_cons = cons
+            other_repns = [None] * len(cons)
+        for con, repn in zip(other_cons, other_repns):
             conname = self._symbol_map.getSymbol(con, self._labeler)
             (
                 gurobi_expr,
                 repn_constant,
                 mutable_linear_coefficients,
                 mutable_quadratic_coefficients,
-            ) = self._get_expr_from_pyomo_expr(con.body)
+            ) = self._get_expr_from_pyomo_expr(con.body, repn)
 
             if (
                 gurobi_expr.__class__ in {gurobipy.LinExpr, gurobipy.Var}
@@ -747,6 +892,7 @@ class Gurobi(PersistentBase, PersistentSolver):
             self._range_constraints.discard(con)
             self._mutable_helpers.pop(con, None)
             self._mutable_quadratic_helpers.pop(con, None)
+        self._mutable_rows.remove(cons)
         self._needs_updated = True
 
     def _remove_sos_constraints(self, cons: List[SOSConstraintData]):
@@ -798,6 +944,7 @@ class Gurobi(PersistentBase, PersistentSolver):
         for con, helpers in self._mutable_helpers.items():
             for helper in helpers:
                 helper.update()
+        self._mutable_rows.update(self._solver_model, self._pyomo_con_to_solver_con_map)
         for k, (v, helper) in self._mutable_bounds.items():
             helper.update()
 
@@ -24,7 +24,7 @@ from pyomo.core.base.var import VarData
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.sos import SOSConstraintData
 from pyomo.core.base.param import ParamData
-from pyomo.core.expr.numvalue import value, is_constant
+from pyomo.core.expr.numvalue import value, is_constant, native_numeric_types
 from pyomo.repn import generate_standard_repn
 from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
 from pyomo.contrib.appsi.base import (
@@ -97,19 +97,78 @@ class _MutableVarBounds(object):
         self.highs.changeColBounds(col_ndx, lb, ub)
 
 
-class _MutableLinearCoefficient(object):
-    def __init__(self, pyomo_con, pyomo_var_id, con_map, var_map, expr, highs):
-        self.expr = expr
-        self.highs = highs
-        self.pyomo_var_id = pyomo_var_id
-        self.pyomo_con = pyomo_con
-        self.con_map = con_map
-        self.var_map = var_map
+class _MutableRowData(object):
+    """The mutable (parameterized) coefficients and bounds of the rows
+    in the HiGHS model
 
-    def update(self):
-        row_ndx = self.con_map[self.pyomo_con]
-        col_ndx = self.var_map[self.pyomo_var_id]
-        self.highs.changeCoeff(row_ndx, col_ndx, value(self.expr))
+    Rather than creating a helper object for every mutable coefficient
+    and every row with mutable bounds, the expressions are stored in
+    flat parallel lists (keyed by the Pyomo constraint) so that they
+    can be evaluated and sent to HiGHS in bulk.
+    """
+
+    def __init__(self):
+        self.coef_cons = list()
+        self.coef_var_ids = list()
+        self.coef_exprs = list()
+        self.bound_cons = list()
+        self.lower_exprs = list()
+        self.upper_exprs = list()
+
+    def __len__(self):
+        return len(self.coef_cons) + len(self.bound_cons)
+
+    def add_coefficient(self, con, var_id, expr):
+        self.coef_cons.append(con)
+        self.coef_var_ids.append(var_id)
+        self.coef_exprs.append(expr)
+
+    def add_bounds(self, con, lower_expr, upper_expr):
+        self.bound_cons.append(con)
+        self.lower_exprs.append(lower_expr)
+        self.upper_exprs.append(upper_expr)
+
+    def remove(self, cons):
+        cons = set(cons)
+        if any(c in cons for c in self.coef_cons):
+            keep = [i for i, c in enumerate(self.coef_cons) if c not in cons]
+            self.coef_cons = [self.coef_cons[i] for i in keep]
+            self.coef_var_ids = [self.coef_var_ids[i] for i in keep]
+            self.coef_exprs = [self.coef_exprs[i] for i in keep]
+        if any(c in cons for c in self.bound_cons):
+            keep = [i for i, c in enumerate(self.bound_cons) if c not in cons]
+            self.bound_cons = [self.bound_cons[i] for i in keep]
+            self.lower_exprs = [self.lower_exprs[i] for i in keep]
+            self.upper_exprs = [self.upper_exprs[i] for i in keep]
+
+    def update(self, highs, con_map, var_map):
+        n = len(self.bound_cons)
+        if n:
+            highs.changeRowsBounds(
+                n,
+                np.array([con_map[c] for c in self.bound_cons]),
+                np.fromiter(map(value, self.lower_exprs), dtype=np.double, count=n),
+                np.fromiter(map(value, self.upper_exprs), dtype=np.double, count=n),
+            )
+        # HiGHS does not provide a bulk interface for changing
+        # individual matrix coefficients
+        for con, v_id, expr in zip(self.coef_cons, self.coef_var_ids, self.coef_exprs):
+            highs.changeCoeff(con_map[con], var_map[v_id], value(expr))
+
+
+class _LpBuffer(object):
+    """Columns and rows collected during set_instance so that the model
+    can be loaded into HiGHS with a single call to passModel"""
+
+    def __init__(self):
+        self.col_lower = list()
+        self.col_upper = list()
+        self.integrality = list()
+        self.row_lower = list()
+        self.row_upper = list()
+        self.starts = list()
+        self.indices = list()
+        self.values = list()
 
 
 class _MutableObjectiveCoefficient(object):
@@ -133,21 +192,6 @@ class _MutableObjectiveOffset(object):
         self.highs.changeObjectiveOffset(value(self.expr))
 
 
-class _MutableConstraintBounds(object):
-    def __init__(self, lower_expr, upper_expr, pyomo_con, con_map, highs):
-        self.lower_expr = lower_expr
-        self.upper_expr = upper_expr
-        self.con = pyomo_con
-        self.con_map = con_map
-        self.highs = highs
-
-    def update(self):
-        row_ndx = self.con_map[self.con]
-        lb = value(self.lower_expr)
-        ub = value(self.upper_expr)
-        self.highs.changeRowBounds(row_ndx, lb, ub)
-
-
 class Highs(PersistentBase, PersistentSolver):
     """
     Interface to HiGHS
@@ -163,11 +207,12 @@ class Highs(PersistentBase, PersistentSolver):
         self._pyomo_var_to_solver_var_map = dict()
         self._pyomo_con_to_solver_con_map = dict()
         self._solver_con_to_pyomo_con_map = dict()
-        self._mutable_helpers = dict()
+        self._mutable_rows = _MutableRowData()
         self._mutable_bounds = dict()
         self._objective_helpers = list()
         self._last_results_object: Optional[HighsResults] = None
         self._sol = None
+        self._lp_buffer = None
 
     def available(self):
         if highspy_available:
@@ -336,6 +381,11 @@ class Highs(PersistentBase, PersistentSolver):
             self._pyomo_var_to_solver_var_map[v_id] = current_num_vars
             current_num_vars += 1
 
+        if self._lp_buffer is not None:
+            self._lp_buffer.col_lower.extend(lbs)
+            self._lp_buffer.col_upper.extend(ubs)
+            self._lp_buffer.integrality.extend(vtypes)
+            return
         self._solver_model.addVars(
             len(lbs), np.array(lbs, dtype=np.double), np.array(ubs, dtype=np.double)
         )
@@ -380,9 +430,35 @@ class Highs(PersistentBase, PersistentSolver):
                     self._expr_types = cmodel.PyomoExprTypes()
 
                 self._solver_model = highspy.Highs()
+                # Collect all of the columns and rows and pass them to
+                # HiGHS at once (before the objective is set)
+                self._lp_buffer = _LpBuffer()
                 self.add_block(model)
                 if self._objective is None:
                     self.set_objective(None)
+                if self._lp_buffer is not None:
+                    self._load_lp_buffer()
+
+    def _load_lp_buffer(self):
+        buf = self._lp_buffer
+        self._lp_buffer = None
+        lp = highspy.HighsLp()
+        lp.num_col_ = len(buf.col_lower)
+        lp.num_row_ = len(buf.row_lower)
+        lp.col_cost_ = np.zeros(lp.num_col_, dtype=np.double)
+        lp.col_lower_ = np.array(buf.col_lower, dtype=np.double)
+        lp.col_upper_ = np.array(buf.col_upper, dtype=np.double)
+        lp.row_lower_ = np.array(buf.row_lower, dtype=np.double)
+        lp.row_upper_ = np.array(buf.row_upper, dtype=np.double)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = lp.num_col_
+        lp.a_matrix_.num_row_ = lp.num_row_
+        buf.starts.append(len(buf.values))
+        lp.a_matrix_.start_ = np.array(buf.starts)
+        lp.a_matrix_.index_ = np.array(buf.indices)
+        lp.a_matrix_.value_ = np.array(buf.values, dtype=np.double)
+        lp.integrality_ = buf.integrality
+        self._solver_model.passModel(lp)
 
     def _add_constraints(self, cons: List[ConstraintData]):
         self._sol = None
@@ -394,6 +470,12 @@ class Highs(PersistentBase, PersistentSolver):
         starts = list()
         var_indices = list()
         coef_values = list()
+        var_map = self._pyomo_var_to_solver_var_map
+        mutable_rows = self._mutable_rows
+        if self._lp_buffer is not None:
+            nnz_offset = len(self._lp_buffer.values)
+        else:
+            nnz_offset = 0
 
         for con in cons:
             repn = generate_standard_repn(
@@ -404,26 +486,18 @@ class Highs(PersistentBase, PersistentSolver):
                     f'Highs interface does not support expressions of degree {repn.polynomial_degree()}'
                 )
 
-            starts.append(len(coef_values))
-            for ndx, coef in enumerate(repn.linear_coefs):
-                v = repn.linear_vars[ndx]
+            starts.append(nnz_offset + len(coef_values))
+            for coef, v in zip(repn.linear_coefs, repn.linear_vars):
                 v_id = id(v)
-                coef_val = value(coef)
-                if not is_constant(coef):
-                    mutable_linear_coefficient = _MutableLinearCoefficient(
-                        pyomo_con=con,
-                        pyomo_var_id=v_id,
-                        con_map=self._pyomo_con_to_solver_con_map,
-                        var_map=self._pyomo_var_to_solver_var_map,
-                        expr=coef,
-                        highs=self._solver_model,
-                    )
-                    if con not in self._mutable_helpers:
-                        self._mutable_helpers[con] = list()
-                    self._mutable_helpers[con].append(mutable_linear_coefficient)
-                    if coef_val == 0:
-                        continue
-                var_indices.append(self._pyomo_var_to_solver_var_map[v_id])
+                if coef.__class__ in native_numeric_types:
+                    coef_val = coef
+                else:
+                    coef_val = value(coef)
+                    if not is_constant(coef):
+                        mutable_rows.add_coefficient(con, v_id, coef)
+                        if coef_val == 0:
+                            continue
+                var_indices.append(var_map[v_id])
                 coef_values.append(coef_val)
 
             if con.has_lb():
@@ -436,17 +510,7 @@ class Highs(PersistentBase, PersistentSolver):
                 ub = highspy.kHighsInf
 
             if not is_constant(lb) or not is_constant(ub):
-                mutable_con_bounds = _MutableConstraintBounds(
-                    lower_expr=lb,
-                    upper_expr=ub,
-                    pyomo_con=con,
-                    con_map=self._pyomo_con_to_solver_con_map,
-                    highs=self._solver_model,
-                )
-                if con not in self._mutable_helpers:
-                    self._mutable_helpers[con] = [mutable_con_bounds]
-                else:
-                    self._mutable_helpers[con].append(mutable_con_bounds)
+                mutable_rows.add_bounds(con, lb, ub)
 
             lbs.append(value(lb))
             ubs.append(value(ub))
@@ -454,6 +518,14 @@ class Highs(PersistentBase, PersistentSolver):
             self._solver_con_to_pyomo_con_map[current_num_cons] = con
             current_num_cons += 1
 
+        if self._lp_buffer is not None:
+            buf = self._lp_buffer
+            buf.row_lower.extend(lbs)
+            buf.row_upper.extend(ubs)
+            buf.starts.extend(starts)
+            buf.indices.extend(var_indices)
+            buf.values.extend(coef_values)
+            return
         self._solver_model.addRows(
             len(lbs),
             np.array(lbs, dtype=np.double),
@@ -479,7 +551,7 @@ class Highs(PersistentBase, PersistentSolver):
             con_ndx = self._pyomo_con_to_solver_con_map.pop(con)
             del self._solver_con_to_pyomo_con_map[con_ndx]
             indices_to_remove.append(con_ndx)
-            self._mutable_helpers.pop(con, None)
+        self._mutable_rows.remove(cons)
         self._solver_model.deleteRows(
             len(indices_to_remove), np.sort(np.array(indices_to_remove))
         )
@@ -559,15 +631,19 @@ class Highs(PersistentBase, PersistentSolver):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
-        for con, helpers in self._mutable_helpers.items():
-            for helper in helpers:
-                helper.update()
+        self._mutable_rows.update(
+            self._solver_model,
+            self._pyomo_con_to_solver_con_map,
+            self._pyomo_var_to_solver_var_map,
+        )
         for k, (v, helper) in self._mutable_bounds.items():
             helper.update()
         for helper in self._objective_helpers:
             helper.update()
 
     def _set_objective(self, obj):
+        if self._lp_buffer is not None:
+            self._load_lp_buffer()
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
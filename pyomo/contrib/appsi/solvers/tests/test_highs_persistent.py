@@ -80,6 +80,34 @@ class TestBugs(unittest.TestCase):
         res = opt.solve(m)
         self.assertAlmostEqual(res.best_feasible_objective, -9)
 
+    def test_mutable_coefficients_and_bounds(self):
+        m = pe.ConcreteModel()
+        m.x = pe.Var(bounds=(0, 10))
+        m.y = pe.Var(bounds=(0, 10))
+        m.a = pe.Param(mutable=True, initialize=1)
+        m.b = pe.Param(mutable=True, initialize=4)
+
+        m.obj = pe.Objective(expr=m.x + 2 * m.y, sense=pe.maximize)
+        m.c1 = pe.Constraint(expr=m.a * m.x + m.y <= m.b)
+        m.c2 = pe.Constraint(expr=(None, m.x - m.y, m.b / 2))
+
+        opt = Highs()
+        opt.set_instance(m)
+        self.assertEqual(len(opt._mutable_rows), 3)
+        res = opt.solve(m)
+        self.assertAlmostEqual(res.best_feasible_objective, 8)
+
+        m.a.value = 0
+        m.b.value = 6
+        res = opt.solve(m)
+        self.assertAlmostEqual(res.best_feasible_objective, 21)
+        self.assertAlmostEqual(m.x.value, 9)
+
+        del m.c1
+        res = opt.solve(m)
+        self.assertEqual(len(opt._mutable_rows), 1)
+        self.assertAlmostEqual(res.best_feasible_objective, 30)
+
     def test_fix_and_unfix(self):
         # Tests issue https://github.com/Pyomo/pyomo/issues/3127
 
@@ -100,3 +100,80 @@ class TestResults(unittest.TestCase):
         slacks2 = res.solution_loader.get_slacks([m.c2])
         self.assertNotIn(m.c1, slacks2)
         self.assertAlmostEqual(slacks[m.c2], slacks2[m.c2])
+
+
+class _Recorder(appsi.base.PersistentBase):
+    def __init__(self, only_child_vars=False):
+        super().__init__(only_child_vars=only_child_vars)
+        self.log = []
+
+    def _record(self, name, comps):
+        comps = [c.name for c in comps]
+        if comps:
+            self.log.append((name, sorted(comps)))
+
+    def _add_variables(self, variables):
+        self._record('add_vars', variables)
+
+    def _add_params(self, params):
+        self._record('add_params', params)
+
+    def _add_constraints(self, cons):
+        self._record('add_cons', cons)
+
+    def _add_sos_constraints(self, cons):
+        self._record('add_sos', cons)
+
+    def _set_objective(self, obj):
+        self.log.append(('set_objective', None if obj is None else obj.name))
+
+    def _remove_constraints(self, cons):
+        self._record('remove_cons', cons)
+
+    def _remove_sos_constraints(self, cons):
+        self._record('remove_sos', cons)
+
+    def _remove_variables(self, variables):
+        self._record('remove_vars', variables)
+
+    def _remove_params(self, params):
+        self._record('remove_params', params)
+
+    def _update_variables(self, variables):
+        self._record('update_vars', variables)
+
+    def update_params(self):
+        self.log.append(('update_params', None))
+
+
+class TestChangeJournalUpdate(unittest.TestCase):
+    def _run(self, only_child_vars, track_changes):
+        m = pe.ConcreteModel()
+        m.x = pe.Var([1, 2, 3], bounds=(0, 10))
+        m.p = pe.Param(mutable=True, initialize=2)
+        m.c1 = pe.Constraint(expr=m.x[1] + m.p * m.x[2] >= 1)
+        m.c2 = pe.Constraint(expr=m.x[2] + m.x[3] <= 5)
+        m.o = pe.Objective(expr=m.x[1] + m.x[3])
+        opt = _Recorder(only_child_vars=only_child_vars)
+        opt.update_config.track_changes = track_changes
+        opt.set_instance(m)
+        opt.update()
+        opt.log = []
+
+        m.x[1].setub(5)
+        m.c1.deactivate()
+        m.y = pe.Var()
+        m.c3 = pe.Constraint(expr=m.y + m.x[1] <= 3)
+        m.p = 3
+        opt.update()
+        return opt.log
+
+    def test_update(self):
+        for only_child_vars in (False, True):
+            full = self._run(only_child_vars, False)
+            tracked = self._run(only_child_vars, True)
+            self.assertEqual(full, tracked)
+            self.assertIn(('add_cons', ['c3']), tracked)
+            self.assertIn(('remove_cons', ['c1']), tracked)
+            self.assertIn(('update_vars', ['x[1]']), tracked)
+            self.assertIn(('add_vars', ['y']), tracked)
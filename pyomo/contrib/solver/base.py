@@ -11,7 +11,17 @@
 
 import abc
 import enum
-from typing import Sequence, Dict, Optional, Mapping, NoReturn, List, Tuple
+from typing import (
+    Sequence,
+    Dict,
+    Optional,
+    Mapping,
+    NoReturn,
+    List,
+    Tuple,
+    Iterable,
+    Iterator,
+)
 import os
 
 from pyomo.core.base.constraint import ConstraintData
@@ -196,6 +206,74 @@ class PersistentSolverBase(SolverBase):
         """
         return True
 
+    def sweep(self, model: BlockData, updates: Iterable, **kwds) -> Iterator[Results]:
+        """
+        Solve the model for a sequence of parameter updates.
+
+        For each update, the new parameter values are set, the model is
+        re-solved through the persistent interface, and the results are
+        yielded.  Each re-solve is warm-started from the previous solve
+        (e.g., using the previous LP basis or MIP solution) if the
+        solver supports it.  The updates are applied lazily: the next
+        update is not applied (or solved) until the next results are
+        requested.
+
+        Note that the solution loader of each results object is
+        invalidated by the next re-solve.
+
+        Parameters
+        ----------
+        model: BlockData
+            The model to solve
+        updates: Iterable
+            The sequence of updates.  Each update is either a mapping
+            (e.g., a ComponentMap) from mutable Params (ParamData) to
+            their new values or a sequence of (param, value) tuples.
+        **kwds
+            Options passed to :meth:`solve`
+
+        Returns
+        -------
+        Iterator[Results]
+            The results of each re-solve
+        """
+        warm_start = None
+        for update in updates:
+            if hasattr(update, 'items'):
+                update = update.items()
+            for param, value in update:
+                param.set_value(value)
+            if warm_start is not None:
+                self._set_warm_start(warm_start)
+            res = self.solve(model, **kwds)
+            warm_start = self._get_warm_start()
+            yield res
+
+    def _get_warm_start(self):
+        """
+        Get the warm start information (e.g., the basis or primal
+        solution) from the last solve.
+
+        Returns
+        -------
+        warm_start: object
+            Solver-specific warm start information, or None if the solver
+            does not support warm starts (or no warm start is available)
+        """
+        return None
+
+    def _set_warm_start(self, warm_start):
+        """
+        Use the warm start information returned by
+        :meth:`_get_warm_start` for the next solve.
+
+        Parameters
+        ----------
+        warm_start: object
+            The value returned by :meth:`_get_warm_start`
+        """
+        pass
+
     def _load_vars(self, vars_to_load: Optional[Sequence[VarData]] = None) -> NoReturn:
         """
         Load the solution of the primal variables into the value attribute of the variables.
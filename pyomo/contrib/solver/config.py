@@ -207,6 +207,7 @@ class AutoUpdateConfig(ConfigDict):
     update_named_expressions: bool
     update_objective: bool
     treat_fixed_vars_as_params: bool
+    track_changes: bool
     """
 
     def __init__(
@@ -352,6 +353,24 @@ class AutoUpdateConfig(ConfigDict):
                 updating the values of fixed variables is much faster this way.""",
             ),
         )
+        self.track_changes: bool = self.declare(
+            'track_changes',
+            ConfigValue(
+                domain=bool,
+                default=False,
+                description="""
+                If True, changes made to the model through the component APIs
+                (e.g., fixing variables, changing bounds, Param values or
+                constraint expressions, (de)activating components, and
+                adding / deleting components) are recorded in a change
+                journal (see pyomo.core.base.journal), and subsequent updates
+                only process the recorded components instead of rescanning
+                the entire model. Changes made by directly manipulating
+                private attributes are not detected; call set_instance() to
+                resynchronize. The first update after enabling this option
+                performs a full scan.""",
+            ),
+        )
 
 
 class PersistentSolverConfig(SolverConfig):
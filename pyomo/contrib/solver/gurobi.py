@@ -258,6 +258,7 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
         self._vars_added_since_update = ComponentSet()
         self._last_results_object: Optional[Results] = None
         self._config: Optional[GurobiConfig] = None
+        self._warm_start = None
 
     def available(self):
         if not gurobipy_available:  # this triggers the deferred import
@@ -350,6 +351,10 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
                     if pyomo_var.is_integer() and pyomo_var.value is not None:
                         self.set_var_attr(pyomo_var, 'Start', pyomo_var.value)
 
+            if self._warm_start is not None:
+                self._apply_warm_start(self._warm_start)
+                self._warm_start = None
+
             for key, option in options.items():
                 self._solver_model.setParam(key, option)
 
@@ -1080,6 +1085,41 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
 
         return dual
 
+    def _get_warm_start(self):
+        gprob = self._solver_model
+        if gprob is None or gprob.SolCount == 0:
+            return None
+        gvars = gprob.getVars()
+        if gprob.IsMIP:
+            return {'Start': gprob.getAttr('X', gvars)}
+        try:
+            return {
+                'VBasis': gprob.getAttr('VBasis', gvars),
+                'CBasis': gprob.getAttr('CBasis', gprob.getConstrs()),
+            }
+        except gurobipy.GurobiError:
+            # No basis is available (e.g., barrier without crossover)
+            return None
+
+    def _set_warm_start(self, warm_start):
+        self._warm_start = warm_start
+
+    def _apply_warm_start(self, warm_start):
+        # The warm start is stored by position, so it can only be
+        # applied if the structure of the gurobi model did not change
+        gprob = self._solver_model
+        gvars = gprob.getVars()
+        if 'Start' in warm_start:
+            if len(warm_start['Start']) == len(gvars):
+                gprob.setAttr('Start', gvars, warm_start['Start'])
+        elif gprob.IsMIP == 0:
+            gcons = gprob.getConstrs()
+            if len(warm_start['VBasis']) == len(gvars) and len(
+                warm_start['CBasis']
+            ) == len(gcons):
+                gprob.setAttr('VBasis', gvars, warm_start['VBasis'])
+                gprob.setAttr('CBasis', gcons, warm_start['CBasis'])
+
     def update(self, timer: HierarchicalTimer = None):
         if self._needs_updated:
             self._update_gurobi_model()
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
 import logging
 import os
 import subprocess
@@ -290,6 +291,96 @@ class Ipopt(SolverBase):
 
     @document_kwargs_from_configdict(CONFIG)
     def solve(self, model, **kwds):
+        config, timer, start_timestamp = self._solve_setup(kwds)
+        with TempfileManager.new_context() as tempfile:
+            nl_info, basename, command = self._write_problem(
+                model, config, timer, tempfile
+            )
+            if command is None:
+                returncode = log = None
+            else:
+                cmd, env, timeout = command
+                log = io.StringIO()
+                with TeeStream(log, *config.tee) as t:
+                    timer.start('subprocess')
+                    process = subprocess.run(
+                        cmd,
+                        timeout=timeout,
+                        env=env,
+                        universal_newlines=True,
+                        stdout=t.STDOUT,
+                        stderr=t.STDERR,
+                    )
+                    timer.stop('subprocess')
+                returncode = process.returncode
+            results = self._process_results(nl_info, basename, returncode, log, timer)
+        return self._solve_postsolve(
+            model, config, timer, start_timestamp, nl_info, results, log
+        )
+
+    @document_kwargs_from_configdict(CONFIG)
+    async def async_solve(self, model, **kwds):
+        """Solve the model (as a coroutine)
+
+        This accepts the same arguments as :meth:`solve`.  The NL file
+        is written and the solution is loaded synchronously, but the
+        ipopt subprocess is awaited (through
+        :func:`asyncio.create_subprocess_exec`), so that the event loop
+        can drive many solves concurrently.
+
+        Example::
+
+            async def solve_all(models):
+                return await asyncio.gather(
+                    *(Ipopt().async_solve(m) for m in models)
+                )
+
+        """
+        config, timer, start_timestamp = self._solve_setup(kwds)
+        with TempfileManager.new_context() as tempfile:
+            nl_info, basename, command = self._write_problem(
+                model, config, timer, tempfile
+            )
+            if command is None:
+                returncode = log = None
+            else:
+                cmd, env, timeout = command
+                log = io.StringIO()
+                with TeeStream(log, *config.tee) as t:
+                    timer.start('subprocess')
+                    returncode = await self._async_execute_command(cmd, env, timeout, t)
+                    timer.stop('subprocess')
+            results = self._process_results(nl_info, basename, returncode, log, timer)
+        return self._solve_postsolve(
+            model, config, timer, start_timestamp, nl_info, results, log
+        )
+
+    async def _async_execute_command(self, cmd, env, timeout, tee):
+        """Run the ipopt subprocess (as a coroutine) and return the return code"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd, env=env, stdout=tee.STDOUT, stderr=tee.STDERR
+        )
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except asyncio.CancelledError:
+            # Do not leave the solver running if the solve is cancelled
+            process.kill()
+            raise
+        tee.STDOUT.flush()
+        tee.STDERR.flush()
+        return process.returncode
+
+    def _solve_setup(self, kwds):
+        """Process the solve() arguments
+
+        Returns the configuration for this solve, the timer and the
+        start timestamp.
+
+        """
         # Begin time tracking
         start_timestamp = datetime.datetime.now(datetime.timezone.utc)
         # Update configuration options, based on keywords passed to solve
@@ -310,126 +401,130 @@ class Ipopt(SolverBase):
         else:
             timer = config.timer
         StaleFlagManager.mark_all_as_stale()
-        with TempfileManager.new_context() as tempfile:
-            if config.working_dir is None:
-                dname = tempfile.mkdtemp()
-            else:
-                dname = config.working_dir
-            if not os.path.exists(dname):
-                os.mkdir(dname)
-            basename = os.path.join(dname, model.name)
-            if os.path.exists(basename + '.nl'):
-                raise RuntimeError(
-                    f"NL file with the same name {basename + '.nl'} already exists!"
-                )
-            # Note: the ASL has an issue where string constants written
-            # to the NL file (e.g. arguments in external functions) MUST
-            # be terminated with '\n' regardless of platform.  We will
-            # disable universal newlines in the NL file to prevent
-            # Python from mapping those '\n' to '\r\n' on Windows.
-            with open(basename + '.nl', 'w', newline='\n') as nl_file, open(
-                basename + '.row', 'w'
-            ) as row_file, open(basename + '.col', 'w') as col_file:
-                timer.start('write_nl_file')
-                self._writer.config.set_value(config.writer_config)
-                try:
-                    nl_info = self._writer.write(
-                        model,
-                        nl_file,
-                        row_file,
-                        col_file,
-                        symbolic_solver_labels=config.symbolic_solver_labels,
-                    )
-                    proven_infeasible = False
-                except InfeasibleConstraintException:
-                    proven_infeasible = True
-                timer.stop('write_nl_file')
-            if not proven_infeasible and len(nl_info.variables) > 0:
-                # Get a copy of the environment to pass to the subprocess
-                env = os.environ.copy()
-                if nl_info.external_function_libraries:
-                    if env.get('AMPLFUNC'):
-                        nl_info.external_function_libraries.append(env.get('AMPLFUNC'))
-                    env['AMPLFUNC'] = "\n".join(nl_info.external_function_libraries)
-                # Write the opt_file, if there should be one; return a bool to say
-                # whether or not we have one (so we can correctly build the command line)
-                opt_file = self._write_options_file(
-                    filename=basename, options=config.solver_options
-                )
-                # Call ipopt - passing the files via the subprocess
-                cmd = self._create_command_line(
-                    basename=basename, config=config, opt_file=opt_file
-                )
-                # this seems silly, but we have to give the subprocess slightly longer to finish than
-                # ipopt
-                if config.time_limit is not None:
-                    timeout = config.time_limit + min(
-                        max(1.0, 0.01 * config.time_limit), 100
-                    )
-                else:
-                    timeout = None
+        return config, timer, start_timestamp
 
-                ostreams = [io.StringIO()] + config.tee
-                with TeeStream(*ostreams) as t:
-                    timer.start('subprocess')
-                    process = subprocess.run(
-                        cmd,
-                        timeout=timeout,
-                        env=env,
-                        universal_newlines=True,
-                        stdout=t.STDOUT,
-                        stderr=t.STDERR,
-                    )
-                    timer.stop('subprocess')
-                    # This is the stuff we need to parse to get the iterations
-                    # and time
-                    (iters, ipopt_time_nofunc, ipopt_time_func, ipopt_total_time) = (
-                        self._parse_ipopt_output(ostreams[0])
-                    )
+    def _write_problem(self, model, config, timer, tempfile):
+        """Write the NL (and options) files for the model
+
+        Returns the NL writer info (None if the problem was proven
+        infeasible), the base name of the problem files and the
+        ``(cmd, env, timeout)`` for the ipopt subprocess (None if ipopt
+        does not need to be run).
 
-            if proven_infeasible:
+        """
+        if config.working_dir is None:
+            dname = tempfile.mkdtemp()
+        else:
+            dname = config.working_dir
+        if not os.path.exists(dname):
+            os.mkdir(dname)
+        basename = os.path.join(dname, model.name)
+        if os.path.exists(basename + '.nl'):
+            raise RuntimeError(
+                f"NL file with the same name {basename + '.nl'} already exists!"
+            )
+        # Note: the ASL has an issue where string constants written
+        # to the NL file (e.g. arguments in external functions) MUST
+        # be terminated with '\n' regardless of platform.  We will
+        # disable universal newlines in the NL file to prevent
+        # Python from mapping those '\n' to '\r\n' on Windows.
+        with open(basename + '.nl', 'w', newline='\n') as nl_file, open(
+            basename + '.row', 'w'
+        ) as row_file, open(basename + '.col', 'w') as col_file:
+            timer.start('write_nl_file')
+            self._writer.config.set_value(config.writer_config)
+            try:
+                nl_info = self._writer.write(
+                    model,
+                    nl_file,
+                    row_file,
+                    col_file,
+                    symbolic_solver_labels=config.symbolic_solver_labels,
+                )
+            except InfeasibleConstraintException:
+                nl_info = None
+            timer.stop('write_nl_file')
+        if nl_info is None or len(nl_info.variables) == 0:
+            return nl_info, basename, None
+        # Get a copy of the environment to pass to the subprocess
+        env = os.environ.copy()
+        if nl_info.external_function_libraries:
+            if env.get('AMPLFUNC'):
+                nl_info.external_function_libraries.append(env.get('AMPLFUNC'))
+            env['AMPLFUNC'] = "\n".join(nl_info.external_function_libraries)
+        # Write the opt_file, if there should be one; return a bool to say
+        # whether or not we have one (so we can correctly build the command line)
+        opt_file = self._write_options_file(
+            filename=basename, options=config.solver_options
+        )
+        # Call ipopt - passing the files via the subprocess
+        cmd = self._create_command_line(
+            basename=basename, config=config, opt_file=opt_file
+        )
+        # this seems silly, but we have to give the subprocess slightly longer to finish than
+        # ipopt
+        if config.time_limit is not None:
+            timeout = config.time_limit + min(max(1.0, 0.01 * config.time_limit), 100)
+        else:
+            timeout = None
+        return nl_info, basename, (cmd, env, timeout)
+
+    def _process_results(self, nl_info, basename, returncode, log, timer):
+        """Create the Results from the solver log and the SOL file"""
+        if nl_info is None:
+            # The problem was proven infeasible when writing the NL file
+            results = Results()
+            results.termination_condition = TerminationCondition.provenInfeasible
+            results.solution_loader = SolSolutionLoader(None, None)
+            results.iteration_count = 0
+            results.timing_info.total_seconds = 0
+            return results
+        if len(nl_info.variables) == 0:
+            if len(nl_info.eliminated_vars) == 0:
                 results = Results()
-                results.termination_condition = TerminationCondition.provenInfeasible
+                results.termination_condition = TerminationCondition.emptyModel
                 results.solution_loader = SolSolutionLoader(None, None)
+            else:
+                results = Results()
+                results.termination_condition = (
+                    TerminationCondition.convergenceCriteriaSatisfied
+                )
+                results.solution_status = SolutionStatus.optimal
+                results.solution_loader = SolSolutionLoader(None, nl_info=nl_info)
                 results.iteration_count = 0
                 results.timing_info.total_seconds = 0
-            elif len(nl_info.variables) == 0:
-                if len(nl_info.eliminated_vars) == 0:
-                    results = Results()
-                    results.termination_condition = TerminationCondition.emptyModel
-                    results.solution_loader = SolSolutionLoader(None, None)
-                else:
-                    results = Results()
-                    results.termination_condition = (
-                        TerminationCondition.convergenceCriteriaSatisfied
-                    )
-                    results.solution_status = SolutionStatus.optimal
-                    results.solution_loader = SolSolutionLoader(None, nl_info=nl_info)
-                    results.iteration_count = 0
-                    results.timing_info.total_seconds = 0
-            else:
-                if os.path.isfile(basename + '.sol'):
-                    with open(basename + '.sol', 'r') as sol_file:
-                        timer.start('parse_sol')
-                        results = self._parse_solution(sol_file, nl_info)
-                        timer.stop('parse_sol')
-                else:
-                    results = Results()
-                if process.returncode != 0:
-                    results.extra_info.return_code = process.returncode
-                    results.termination_condition = TerminationCondition.error
-                    results.solution_loader = SolSolutionLoader(None, None)
-                else:
-                    results.iteration_count = iters
-                    if ipopt_time_nofunc is not None:
-                        results.timing_info.ipopt_excluding_nlp_functions = (
-                            ipopt_time_nofunc
-                        )
-
-                    if ipopt_time_func is not None:
-                        results.timing_info.nlp_function_evaluations = ipopt_time_func
-                    if ipopt_total_time is not None:
-                        results.timing_info.total_seconds = ipopt_total_time
+            return results
+        # This is the stuff we need to parse to get the iterations
+        # and time
+        (iters, ipopt_time_nofunc, ipopt_time_func, ipopt_total_time) = (
+            self._parse_ipopt_output(log)
+        )
+        if os.path.isfile(basename + '.sol'):
+            with open(basename + '.sol', 'r') as sol_file:
+                timer.start('parse_sol')
+                results = self._parse_solution(sol_file, nl_info)
+                timer.stop('parse_sol')
+        else:
+            results = Results()
+        if returncode != 0:
+            results.extra_info.return_code = returncode
+            results.termination_condition = TerminationCondition.error
+            results.solution_loader = SolSolutionLoader(None, None)
+        else:
+            results.iteration_count = iters
+            if ipopt_time_nofunc is not None:
+                results.timing_info.ipopt_excluding_nlp_functions = ipopt_time_nofunc
+
+            if ipopt_time_func is not None:
+                results.timing_info.nlp_function_evaluations = ipopt_time_func
+            if ipopt_total_time is not None:
+                results.timing_info.total_seconds = ipopt_total_time
+        return results
+
+    def _solve_postsolve(
+        self, model, config, timer, start_timestamp, nl_info, results, log
+    ):
+        """Load the solution (if requested) and finalize the Results"""
         if (
             config.raise_exception_on_nonoptimal_result
             and results.solution_status != SolutionStatus.optimal
@@ -485,8 +580,8 @@ class Ipopt(SolverBase):
                 )
 
         results.solver_configuration = config
-        if not proven_infeasible and len(nl_info.variables) > 0:
-            results.solver_log = ostreams[0].getvalue()
+        if log is not None:
+            results.solver_log = log.getvalue()
 
         # Capture/record end-time / wall-time
         end_timestamp = datetime.datetime.now(datetime.timezone.utc)
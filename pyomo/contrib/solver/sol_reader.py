@@ -11,6 +11,7 @@
 
 
 from typing import Tuple, Dict, Any, List
+from itertools import islice
 import io
 
 from pyomo.common.errors import DeveloperError, PyomoException
@@ -29,6 +30,18 @@ class SolFileData:
         self.other: List(str) = list()
 
 
+def _read_values(sol_file: io.TextIOBase, n: int) -> List[float]:
+    """Read a block of `n` values (one per line) from the sol file"""
+    # Converting the block in bulk (instead of calling readline() for
+    # each value) is significantly faster for large models
+    values = list(map(float, islice(sol_file, n)))
+    if len(values) != n:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected {n} values; found {len(values)}."
+        )
+    return values
+
+
 def parse_sol_file(
     sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
 ) -> Tuple[Results, SolFileData]:
@@ -77,8 +90,8 @@ developers.
     assert number_of_cons == len(nl_info.constraints)
     assert number_of_vars == len(nl_info.variables)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+    duals = _read_values(sol_file, number_of_cons)
+    variable_vals = _read_values(sol_file, number_of_vars)
 
     # Parse the exit code line and capture it
     exit_code = [0, 0]
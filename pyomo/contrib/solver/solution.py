@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 import abc
+from operator import truediv
 from typing import Sequence, Dict, Optional, Mapping, NoReturn
 
 from pyomo.core.base.constraint import ConstraintData
@@ -23,6 +24,21 @@ from pyomo.repn.plugins.nl_writer import NLWriterInfo
 from pyomo.core.expr.visitor import replace_expressions
 
 
+def _load_var_values(variables, values):
+    """Load (native numeric) values into a sequence of variables.
+
+    This is equivalent to calling ``v.set_value(val,
+    skip_validation=True)`` for each variable, but avoids the per-call
+    overhead of set_value() (which is significant when loading
+    solutions for large models).
+
+    """
+    get_flag = StaleFlagManager.get_flag
+    for v, val in zip(variables, values):
+        v._value = val
+        v._stale = get_flag(v._stale)
+
+
 class SolutionLoaderBase(abc.ABC):
     """
     Base class for all future SolutionLoader classes.
@@ -148,16 +164,10 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
+            primals = self._sol_data.primals
             if self._nl_info.scaling:
-                for v, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    v.set_value(val / scale, skip_validation=True)
-            else:
-                for v, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    v.set_value(val, skip_validation=True)
+                primals = map(truediv, primals, self._nl_info.scaling.variables)
+            _load_var_values(self._nl_info.variables, primals)
 
         for v, v_expr in self._nl_info.eliminated_vars:
             v.value = value(v_expr)
@@ -176,14 +186,10 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling is None:
-                scale_list = [1] * len(self._nl_info.variables)
-            else:
-                scale_list = self._nl_info.scaling.variables
-            for v, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
-            ):
-                val_map[id(v)] = val / scale
+            primals = self._sol_data.primals
+            if self._nl_info.scaling is not None:
+                primals = map(truediv, primals, self._nl_info.scaling.variables)
+            val_map.update(zip(map(id, self._nl_info.variables), primals))
 
         for v, v_expr in self._nl_info.eliminated_vars:
             val = replace_expressions(v_expr, substitution_map=val_map)
@@ -15,7 +15,6 @@ from pyomo.contrib.solver.gurobi import Gurobi
 from pyomo.contrib.solver.results import SolutionStatus
 from pyomo.core.expr.taylor_series import taylor_series_expansion
 
-
 opt = Gurobi()
 if not opt.available():
     raise unittest.SkipTest
@@ -185,6 +184,21 @@ class TestGurobiPersistentSimpleLPUpdates(unittest.TestCase):
         self.assertAlmostEqual(x, self.m.x.value)
         self.assertAlmostEqual(y, self.m.y.value)
 
+    def test_sweep(self):
+        m = self.m
+        params = [(-1, -2, 0.1, -2), (-1.25, -1, 0.5, -2), (-1, -1.5, 0.25, -2)]
+        updates = [list(zip([m.p1, m.p2, m.p3, m.p4], p)) for p in params]
+        opt = Gurobi()
+        for res in opt.sweep(m, updates):
+            x, y = self.get_solution()
+            self.assertAlmostEqual(x + y, res.incumbent_objective)
+            self.assertAlmostEqual(x, m.x.value)
+            self.assertAlmostEqual(y, m.y.value)
+            # the basis is captured for the next re-solve
+            ws = opt._get_warm_start()
+            self.assertEqual(len(ws['VBasis']), 2)
+            self.assertEqual(len(ws['CBasis']), 2)
+
 
 class TestGurobiPersistent(unittest.TestCase):
     def test_nonconvex_qcp_objective_bound_1(self):
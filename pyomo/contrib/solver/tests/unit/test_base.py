@@ -12,7 +12,9 @@
 import os
 
 from pyomo.common import unittest
+from pyomo.common.collections import ComponentMap
 from pyomo.common.config import ConfigDict
+import pyomo.environ as pyo
 from pyomo.contrib.solver import base
 
 
@@ -111,7 +113,9 @@ class TestPersistentSolverBase(unittest.TestCase):
             '_get_duals',
             '_get_primals',
             '_get_reduced_costs',
+            '_get_warm_start',
             '_load_vars',
+            '_set_warm_start',
             'add_block',
             'add_constraints',
             'add_parameters',
@@ -125,6 +129,7 @@ class TestPersistentSolverBase(unittest.TestCase):
             'set_instance',
             'set_objective',
             'solve',
+            'sweep',
             'update_parameters',
             'update_variables',
             'version',
@@ -179,6 +184,54 @@ class TestPersistentSolverBase(unittest.TestCase):
             self.assertEqual(self.instance.update_variables(None), None)
             self.assertEqual(self.instance.update_parameters(), None)
 
+    @unittest.mock.patch.multiple(base.PersistentSolverBase, __abstractmethods__=set())
+    def test_sweep(self):
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param(mutable=True, initialize=0)
+        m.q = pyo.Param(mutable=True, initialize=0)
+        log = []
+
+        class _Solver(base.PersistentSolverBase):
+            def solve(self, model, **kwds):
+                log.append(('solve', model.p.value, model.q.value, kwds))
+                return len(log)
+
+            def _get_warm_start(self):
+                log.append(('get_warm_start',))
+                return 'ws%s' % (len(log),)
+
+            def _set_warm_start(self, warm_start):
+                log.append(('set_warm_start', warm_start))
+
+        opt = _Solver()
+        updates = [ComponentMap([(m.p, 1), (m.q, 2)]), [(m.p, 2), (m.q, 4)]]
+        updates.append(((m.p, 3), (m.q, 6)))
+        results = opt.sweep(m, iter(updates), tee=True)
+        # The updates are applied lazily
+        self.assertEqual(log, [])
+        self.assertEqual(next(results), 1)
+        # The warm start is captured before the results are returned
+        self.assertEqual(log, [('solve', 1, 2, {'tee': True}), ('get_warm_start',)])
+        self.assertEqual(list(results), [4, 7])
+        self.assertEqual(
+            log,
+            [
+                ('solve', 1, 2, {'tee': True}),
+                ('get_warm_start',),
+                ('set_warm_start', 'ws2'),
+                ('solve', 2, 4, {'tee': True}),
+                ('get_warm_start',),
+                ('set_warm_start', 'ws5'),
+                ('solve', 3, 6, {'tee': True}),
+                ('get_warm_start',),
+            ],
+        )
+
+        # The default implementation does not warm start
+        base_opt = base.PersistentSolverBase()
+        self.assertIsNone(base_opt._get_warm_start())
+        self.assertIsNone(base_opt._set_warm_start('ws'))
+
 
 class TestLegacySolverWrapper(unittest.TestCase):
     def test_class_method_list(self):
@@ -79,6 +79,7 @@ class TestAutoUpdateConfig(unittest.TestCase):
         self.assertTrue(config.update_objective)
         self.assertTrue(config.update_objective)
         self.assertTrue(config.treat_fixed_vars_as_params)
+        self.assertFalse(config.track_changes)
 
     def test_interface_custom_instantiation(self):
         config = AutoUpdateConfig(description="A description")
@@ -110,6 +111,7 @@ class TestPersistentSolverConfig(unittest.TestCase):
         self.assertTrue(config.auto_updates.update_objective)
         self.assertTrue(config.auto_updates.update_objective)
         self.assertTrue(config.auto_updates.treat_fixed_vars_as_params)
+        self.assertFalse(config.auto_updates.track_changes)
 
     def test_interface_custom_instantiation(self):
         config = PersistentSolverConfig(description="A description")
@@ -9,13 +9,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
 import os
+import stat
+import subprocess
+import sys
+import time
 
 from pyomo.common import unittest, Executable
 from pyomo.common.errors import DeveloperError
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.repn.plugins.nl_writer import NLWriter
 from pyomo.contrib.solver import ipopt
+import pyomo.environ as pyo
 
 
 ipopt_available = ipopt.Ipopt().available()
@@ -83,6 +89,7 @@ class TestIpoptInterface(unittest.TestCase):
             'Availability',
             'CONFIG',
             'config',
+            'async_solve',
             'available',
             'has_linear_solver',
             'is_persistent',
@@ -247,3 +254,96 @@ class TestIpoptInterface(unittest.TestCase):
         )
         with self.assertRaises(ValueError):
             result = opt._create_command_line('myfile', opt.config, False)
+
+
+# A stand-in for the ipopt executable: it reports the version, "solves"
+# the NL file (after sleeping FAKE_IPOPT_SLEEP seconds) by setting all
+# variables to 1.5, and writes a SOL file
+fake_ipopt = """#!{python}
+import os, sys, time
+if sys.argv[1] == '--version':
+    print('Ipopt 3.14.0 (fake)')
+    sys.exit(0)
+time.sleep(float(os.environ.get('FAKE_IPOPT_SLEEP', 0)))
+basename = sys.argv[1][:-3]
+with open(sys.argv[1]) as nl:
+    nl.readline()
+    nvars, ncons = map(int, nl.readline().split()[:2])
+print('Number of Iterations....: 3')
+with open(basename + '.sol', 'w') as sol:
+    sol.write('\\nfake: Optimal Solution Found\\n\\nOptions\\n3\\n1\\n1\\n0\\n')
+    sol.write('%d\\n%d\\n%d\\n%d\\n' % (ncons, ncons, nvars, nvars))
+    sol.write('0\\n' * ncons + '1.5\\n' * nvars + 'objno 0 0\\n')
+"""
+
+
+@unittest.skipIf(sys.platform.startswith('win'), "requires an executable script")
+class TestIpoptAsyncSolve(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+        self.executable = TempfileManager.create_tempfile(suffix='.py')
+        with open(self.executable, 'w') as FILE:
+            FILE.write(fake_ipopt.format(python=sys.executable))
+        os.chmod(self.executable, os.stat(self.executable).st_mode | stat.S_IEXEC)
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def make_solver(self):
+        return ipopt.Ipopt(executable=Executable(self.executable))
+
+    def make_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+        m.c = pyo.Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.o = pyo.Objective(expr=(m.x[1] - 2) ** 2 + m.x[2] ** 2)
+        return m
+
+    def test_async_solve(self):
+        m = self.make_model()
+        results = asyncio.run(self.make_solver().async_solve(m))
+        self.assertEqual(
+            results.termination_condition,
+            ipopt.TerminationCondition.convergenceCriteriaSatisfied,
+        )
+        self.assertEqual(results.iteration_count, 3)
+        self.assertIn('Number of Iterations', results.solver_log)
+        self.assertEqual(results.solver_version, (3, 14, 0))
+        self.assertEqual(m.x[1].value, 1.5)
+        self.assertEqual(m.x[2].value, 1.5)
+        self.assertEqual(results.incumbent_objective, 2.5)
+
+        # The synchronous solve gives the same result
+        m = self.make_model()
+        sync_results = self.make_solver().solve(m)
+        self.assertEqual(
+            sync_results.termination_condition, results.termination_condition
+        )
+        self.assertEqual(sync_results.solver_log, results.solver_log)
+        self.assertEqual(m.x[1].value, 1.5)
+
+    def test_concurrent_solves(self):
+        models = [self.make_model() for i in range(4)]
+
+        async def solve_all():
+            return await asyncio.gather(
+                *(self.make_solver().async_solve(m) for m in models)
+            )
+
+        with unittest.mock.patch.dict(os.environ, {'FAKE_IPOPT_SLEEP': '1'}):
+            start = time.time()
+            results = asyncio.run(solve_all())
+            elapsed = time.time() - start
+        # The solvers ran concurrently
+        self.assertLess(elapsed, 3)
+        for m, res in zip(models, results):
+            self.assertEqual(res.incumbent_objective, 2.5)
+            self.assertEqual(m.x[1].value, 1.5)
+
+    def test_async_solve_timeout(self):
+        m = self.make_model()
+        with unittest.mock.patch.dict(os.environ, {'FAKE_IPOPT_SLEEP': '30'}):
+            start = time.time()
+            with self.assertRaises(subprocess.TimeoutExpired):
+                asyncio.run(self.make_solver().async_solve(m, time_limit=0))
+        self.assertLess(time.time() - start, 10)
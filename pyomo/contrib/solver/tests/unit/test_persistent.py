@@ -0,0 +1,253 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from pyomo.common import unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+import pyomo.environ as pyo
+from pyomo.contrib.solver.config import PersistentSolverConfig
+from pyomo.contrib.solver.persistent import PersistentSolverUtils
+
+
+class _Recorder(PersistentSolverUtils):
+    """A PersistentSolverUtils that records the calls it receives"""
+
+    def __init__(self):
+        super().__init__()
+        self.config = PersistentSolverConfig()
+        self.log = []
+
+    def set_instance(self, model):
+        super().set_instance(model)
+        self.log = []
+
+    def _record(self, name, comps):
+        comps = [c.name for c in comps]
+        if comps:
+            self.log.append((name, sorted(comps)))
+
+    def _add_variables(self, variables):
+        self._record('add_vars', variables)
+
+    def _add_parameters(self, params):
+        self._record('add_params', params)
+
+    def _add_constraints(self, cons):
+        self._record('add_cons', cons)
+
+    def _add_sos_constraints(self, cons):
+        self._record('add_sos', cons)
+
+    def _set_objective(self, obj):
+        self.log.append(('set_objective', None if obj is None else obj.name))
+
+    def _remove_constraints(self, cons):
+        self._record('remove_cons', cons)
+
+    def _remove_sos_constraints(self, cons):
+        self._record('remove_sos', cons)
+
+    def _remove_variables(self, variables):
+        self._record('remove_vars', variables)
+
+    def _remove_parameters(self, params):
+        self._record('remove_params', params)
+
+    def _update_variables(self, variables):
+        self._record('update_vars', variables)
+
+    def update_parameters(self):
+        self.log.append(('update_params', None))
+
+
+class TestChangeJournalUpdate(unittest.TestCase):
+    def make_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, 10))
+        m.p = pyo.Param(mutable=True, initialize=2)
+        m.c1 = pyo.Constraint(expr=m.x[1] + m.p * m.x[2] >= 1)
+        m.c2 = pyo.Constraint(expr=m.x[2] + m.x[3] <= 5)
+        m.o = pyo.Objective(expr=m.x[1] + m.x[3])
+        if numpy_available:
+            m.z = pyo.Var([1, 2, 3], bounds=(0, 10.5), columnar=True)
+            m.z[3].fix(2)
+            m.cz = pyo.Constraint(expr=m.z[1] + m.z[2] + m.z[3] <= 8)
+        return m
+
+    def make_solver(self, m, track_changes):
+        opt = _Recorder()
+        opt.config.auto_updates.track_changes = track_changes
+        opt.set_instance(m)
+        # The first update starts the journal (and scans the model)
+        opt.update()
+        opt.log = []
+        return opt
+
+    def check(self, changes, expected):
+        logs = []
+        for track_changes in (False, True):
+            m = self.make_model()
+            opt = self.make_solver(m, track_changes)
+            changes(m)
+            opt.update()
+            logs.append(opt.log)
+        self.assertEqual(logs[1], expected)
+        # The full scan always updates the parameters; the journal only
+        # does so when a Param changed.
+        update_params = ('update_params', None)
+        self.assertEqual(
+            [i for i in logs[0] if i != update_params],
+            [i for i in logs[1] if i != update_params],
+        )
+
+    def test_no_changes(self):
+        m = self.make_model()
+        opt = self.make_solver(m, True)
+        opt.update()
+        self.assertEqual(opt.log, [])
+        self.assertIsNotNone(opt._change_journal)
+        opt.config.auto_updates.track_changes = False
+        opt.update()
+        self.assertIsNone(opt._change_journal)
+
+    def test_var_changes(self):
+        def changes(m):
+            m.x[1].setub(5)
+            m.x[3].fix(1)
+
+        self.check(
+            changes,
+            [
+                ('update_vars', ['x[1]', 'x[3]']),
+                ('remove_cons', ['c2']),
+                ('add_cons', ['c2']),
+                ('set_objective', 'o'),
+            ],
+        )
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_no_changes(self):
+        # Columnar Vars return new bound objects on every access: this
+        # must not look like a bound change to the full scan
+        m = self.make_model()
+        opt = self.make_solver(m, False)
+        opt.update()
+        self.assertEqual(opt.log, [('update_params', None)])
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_var_changes(self):
+        def changes(m):
+            m.z[2].setub(7.5)
+            m.z[3].value = 3
+
+        self.check(
+            changes,
+            [
+                ('update_vars', ['z[2]', 'z[3]']),
+                ('remove_cons', ['cz']),
+                ('remove_vars', ['z[1]', 'z[2]', 'z[3]']),
+                ('add_vars', ['z[1]', 'z[2]', 'z[3]']),
+                ('add_cons', ['cz']),
+            ],
+        )
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_array_setters(self):
+        def set_values_array(m):
+            m.z.set_values_array(np.array([4, 4, 4]))
+
+        def set_values(m):
+            m.z.set_values({1: 1, 3: 1}, skip_validation=True)
+
+        for changes in (set_values_array, set_values):
+            self.check(
+                changes,
+                [
+                    ('update_vars', ['z[3]']),
+                    ('remove_cons', ['cz']),
+                    ('remove_vars', ['z[1]', 'z[2]', 'z[3]']),
+                    ('add_vars', ['z[1]', 'z[2]', 'z[3]']),
+                    ('add_cons', ['cz']),
+                ],
+            )
+
+        def set_bounds_array(m):
+            m.z.set_bounds_array(lb=np.array([1, 1, 1]))
+
+        self.check(set_bounds_array, [('update_vars', ['z[1]', 'z[2]', 'z[3]'])])
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_container_changes(self):
+        def changes(m):
+            m.z.fix(1)
+
+        self.check(
+            changes,
+            [
+                ('update_vars', ['z[1]', 'z[2]', 'z[3]']),
+                ('remove_cons', ['cz']),
+                ('remove_vars', ['z[1]', 'z[2]', 'z[3]']),
+                ('add_vars', ['z[1]', 'z[2]', 'z[3]']),
+                ('add_cons', ['cz']),
+            ],
+        )
+
+    def test_constraint_changes(self):
+        def changes(m):
+            m.c1.deactivate()
+            m.c2.set_value(m.x[2] + m.x[3] <= 4)
+            m.c3 = pyo.Constraint(expr=m.x[1] <= 3)
+
+        self.check(
+            changes,
+            [
+                ('remove_cons', ['c1']),
+                ('add_cons', ['c3']),
+                ('remove_cons', ['c2']),
+                ('remove_vars', ['x[2]']),
+                ('add_vars', ['x[2]']),
+                ('add_cons', ['c2']),
+            ],
+        )
+
+    def test_compact_constraints(self):
+        base_model = self.make_model
+
+        def make_model():
+            m = base_model()
+            m.cc = pyo.Constraint(
+                [1, 2], rule=lambda m, i: m.x[i] + 2 * m.x[3] <= 4, compact=True
+            )
+            return m
+
+        # The full scan compares the constraint expressions by identity:
+        # compact rows must not look modified on every update
+        m = make_model()
+        opt = self.make_solver(m, False)
+        opt.update()
+        self.assertEqual(opt.log, [('update_params', None)])
+
+        self.make_model = make_model
+        self.check(
+            lambda m: m.cc[2].set_value(m.x[2] + m.x[3] <= 3),
+            [('remove_cons', ['cc[2]']), ('add_cons', ['cc[2]'])],
+        )
+
+    def test_param_and_objective_changes(self):
+        def changes(m):
+            m.p = 3
+            m.o.deactivate()
+            m.o2 = pyo.Objective(expr=m.x[2], sense=pyo.maximize)
+
+        self.check(changes, [('update_params', None), ('set_objective', 'o2')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,10 +9,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+
+import pyomo.environ as pyo
 from pyomo.common import unittest
+from pyomo.common.errors import PyomoException
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.contrib.solver.results import Results, SolutionStatus
 from pyomo.contrib.solver.sol_reader import parse_sol_file, SolFileData
+from pyomo.contrib.solver.solution import SolSolutionLoader
+from pyomo.repn.plugins.nl_writer import NLWriter
 
 currdir = this_file_dir()
 
@@ -49,3 +56,42 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def _write_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(3))
+        m.c1 = pyo.Constraint(expr=m.x[0] + m.x[1] >= 1)
+        m.c2 = pyo.Constraint(expr=m.x[1] ** 2 + m.x[2] <= 4)
+        m.o = pyo.Objective(expr=m.x[0] + m.x[2])
+        nl_info = NLWriter().write(m, io.StringIO(), linear_presolve=False)
+        return m, nl_info
+
+    def test_parse_and_load(self):
+        m, nl_info = self._write_model()
+        sol = io.StringIO(
+            "\nIpopt 3.14: Optimal Solution Found\n\nOptions\n3\n1\n1\n0\n"
+            "2\n2\n3\n3\n0.5\n-1.5\n1.25\n2.5\n-3\nobjno 0 0\n"
+            "suffix 4 1 13 0 0\nipopt_zU_out\n2 -0.75\n"
+        )
+        result, sol_data = parse_sol_file(sol, nl_info, Results())
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(sol_data.duals, [0.5, -1.5])
+        self.assertEqual(sol_data.primals, [1.25, 2.5, -3.0])
+        self.assertEqual(sol_data.var_suffixes, {'ipopt_zU_out': {2: -0.75}})
+
+        loader = SolSolutionLoader(sol_data, nl_info)
+        primals = loader.get_primals()
+        self.assertEqual([primals[v] for v in nl_info.variables], [1.25, 2.5, -3.0])
+        loader.load_vars()
+        self.assertEqual([v.value for v in nl_info.variables], [1.25, 2.5, -3.0])
+        for v in nl_info.variables:
+            self.assertFalse(v.stale)
+
+    def test_truncated_file(self):
+        m, nl_info = self._write_model()
+        sol = io.StringIO(
+            "\nIpopt 3.14: Optimal Solution Found\n\nOptions\n3\n1\n1\n0\n"
+            "2\n2\n3\n3\n0.5\n-1.5\n1.25\n"
+        )
+        with self.assertRaisesRegex(PyomoException, "Expected 3 values; found 1"):
+            parse_sol_file(sol, nl_info, Results())
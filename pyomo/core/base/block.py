@@ -12,6 +12,8 @@
 from __future__ import annotations
 import copy
 import logging
+import os
+import pickle
 import sys
 import weakref
 import textwrap
@@ -20,7 +22,7 @@ from collections import defaultdict
 from contextlib import contextmanager
 from inspect import isclass, currentframe
 from io import StringIO
-from itertools import filterfalse, chain
+from itertools import filterfalse, chain, repeat
 from operator import itemgetter, attrgetter
 from typing import Union, Any, Type
 
@@ -43,6 +45,7 @@ from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.set import Any
 from pyomo.core.base.var import Var
 from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
     UnindexedComponent_set,
@@ -1022,6 +1025,8 @@ component, use the block del_component() and add_component() methods.
         _new_idx = len(self._decl_order)
         self._decl[name] = _new_idx
         self._decl_order.append((val, None))
+        if active_journals:
+            record_change(val)
         #
         # Add the component as an attribute.  Note that
         #
@@ -1157,6 +1162,8 @@ component, use the block del_component() and add_component() methods.
 
         # Clear the _parent attribute
         obj._parent = None
+        if active_journals:
+            record_change(obj)
         # Update the context of any anonymous sets
         if getattr(obj, '_anonymous_sets', None) is not None:
             for _set in obj._anonymous_sets:
@@ -1272,6 +1279,9 @@ component, use the block del_component() and add_component() methods.
         if memo is None:
             memo = {}
         memo['__block_scope__'] = {id(self): True, id(None): False}
+        # Expression trees are immutable: subtrees that do not reference
+        # anything within this block can be shared with the clone
+        memo['__share_expressions__'] = True
         memo[id(parent)] = parent
 
         with PauseGC():
@@ -1975,6 +1985,27 @@ class _BlockData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+def _construct_block_data_in_worker(rule, idx, data):
+    """Construct a single BlockData (in a worker process)
+
+    This is the task run by :py:meth:`Block._construct_in_parallel`.
+    The rule is fired on a temporary (Any-indexed) Block so that the
+    BlockData sees the correct index, and the result is returned as a
+    pickle that the parent process can unpickle and transfer into the
+    real BlockData.
+
+    """
+    tmp = Block(Any, rule=rule, dense=False)
+    tmp._constructed = True
+    if data is not None:
+        _BlockConstruction.data[id(tmp)] = {idx: data}
+    try:
+        _block = tmp[idx]
+    finally:
+        _BlockConstruction.data.pop(id(tmp), None)
+    return pickle.dumps(_block, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 @ModelComponentFactory.register(
     "A component that contains one or more model components."
 )
@@ -1986,6 +2017,13 @@ class Block(ActiveIndexedComponent):
     that they contain except blocks.  Blocks contained by other
     blocks use their local attribute to determine whether construction
     is deferred.
+
+    Indexed Blocks whose BlockData are independent of each other (e.g.,
+    scenario or time-period sub-models) may be constructed in a process
+    pool by passing ``parallel=True`` (or the number of worker
+    processes).  The rule must be picklable (i.e., a module-level
+    function) and the blocks it builds must not reference components
+    outside the block.
     """
 
     _ComponentDataClass = BlockData
@@ -2013,7 +2051,14 @@ class Block(ActiveIndexedComponent):
     # `options` is ignored since it is deprecated
     @overload
     def __init__(
-        self, *indexes, rule=None, concrete=False, dense=True, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        concrete=False,
+        dense=True,
+        parallel=None,
+        name=None,
+        doc=None,
     ): ...
 
     def __init__(self, *args, **kwargs):
@@ -2026,8 +2071,16 @@ class Block(ActiveIndexedComponent):
         # As dense applies to the whole container, we will not use an
         # initializer
         self._dense = kwargs.pop('dense', True)
+        # As parallel construction applies to the whole container, we
+        # will not use an initializer
+        self._parallel = kwargs.pop('parallel', None)
         kwargs.setdefault('ctype', Block)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
+        if self._parallel and not self.is_indexed():
+            raise ValueError(
+                "Block '%s': parallel construction is only supported for "
+                "indexed Blocks" % (self.name,)
+            )
         if _options is not None:
             deprecation_warning(
                 "The Block 'options=' keyword is deprecated.  "
@@ -2132,9 +2185,12 @@ class Block(ActiveIndexedComponent):
                 if self.index_set().isfinite() and (
                     self._dense or self._rule is not None
                 ):
-                    for _idx in self.index_set():
-                        # Trigger population & call the rule
-                        self._getitem_when_not_present(_idx)
+                    if self._parallel and self._rule is not None:
+                        self._construct_in_parallel(data)
+                    else:
+                        for _idx in self.index_set():
+                            # Trigger population & call the rule
+                            self._getitem_when_not_present(_idx)
             else:
                 # We must check that any pre-existing components are
                 # constructed.  This catches the case where someone is
@@ -2168,6 +2224,38 @@ class Block(ActiveIndexedComponent):
                 _BlockConstruction.data.pop(id(self), None)
             timer.report()
 
+    def _construct_in_parallel(self, data):
+        """Construct all BlockData for this indexed Block in a process pool
+
+        Each BlockData is built by firing the rule in a worker process
+        (see :py:func:`_construct_block_data_in_worker`).  The pickled
+        results are collected in index order and their components are
+        transferred into the BlockData on this Block.
+
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._parallel is True:
+            workers = os.cpu_count() or 1
+        else:
+            workers = int(self._parallel)
+        index = list(self.index_set())
+        if data is None:
+            data = {}
+        # Send the tasks in chunks to amortize the IPC overhead
+        chunksize = max(1, len(index) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                _construct_block_data_in_worker,
+                repeat(self._rule),
+                index,
+                (data.get(idx, None) for idx in index),
+                chunksize=chunksize,
+            )
+            for idx, result in zip(index, results):
+                _block = self._setitem_when_not_present(idx)
+                _block.transfer_attributes_from(pickle.loads(result))
+
     def _pprint_callback(self, ostream, idx, data):
         if not self.is_indexed():
             data._pprint_blockdata_components(ostream)
@@ -20,6 +20,7 @@ from pyomo.core.staleflag import StaleFlagManager
 from pyomo.core.expr.boolean_value import BooleanValue
 from pyomo.core.expr import GetItemExpression
 from pyomo.core.expr.numvalue import value
+from pyomo.core.expr.structure_cache import StructureCache
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
@@ -234,6 +235,7 @@ class BooleanVarData(ComponentData, BooleanValue):
 
         """
         self.fixed = True
+        StructureCache.mutated()
         if value is not NOTSET:
             self.set_value(value, skip_validation)
 
@@ -244,6 +246,7 @@ class BooleanVarData(ComponentData, BooleanValue):
 
         """
         self.fixed = False
+        StructureCache.mutated()
 
     def free(self):
         """Alias for :py:meth:`unfix`"""
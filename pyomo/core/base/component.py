@@ -17,7 +17,7 @@ from weakref import ref as weakref_ref
 
 import pyomo.common
 from pyomo.common import DeveloperError
-from pyomo.common.autoslots import AutoSlots, fast_deepcopy
+from pyomo.common.autoslots import AutoSlots, fast_deepcopy, _atomic_types
 from pyomo.common.collections import OrderedDict
 from pyomo.common.deprecation import (
     RenamedClass,
@@ -32,6 +32,7 @@ from pyomo.common.sorting import sorted_robust
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.core.base.component_namer import name_repr, index_repr
 from pyomo.core.base.global_set import UnindexedComponent_index
+from pyomo.core.base.journal import active_journals, record_change
 
 logger = logging.getLogger('pyomo.core')
 
@@ -41,6 +42,82 @@ relocated_module_attribute(
 
 _ref_types = {type(None), weakref_ref}
 
+# Map of class to the generated function that copies the state of one
+# instance into a new instance (see _get_state_copier())
+_state_copiers = {}
+
+
+def _get_state_copier(cls):
+    """Return (and cache) a function that deepcopies the state of cls
+
+    For classes that use the generic :py:class:`AutoSlots` state
+    protocol and do not have a ``__dict__`` (i.e., the ComponentData
+    classes that make up the bulk of a model), this generates a
+    function with the signature ``copier(src, dest, memo)`` that
+    copies each slot directly (applying the slot mappers).  This is
+    equivalent to (but significantly faster than)::
+
+        dest.__setstate__([fast_deepcopy(f, memo) for f in src.__getstate__()])
+
+    Returns None for all other classes.
+
+    """
+    info = getattr(cls, '__auto_slots__', None)
+    if (
+        info is None
+        or info.has_dict
+        or cls.__getstate__ is not AutoSlots.Mixin.__getstate__
+        or cls.__setstate__ is not AutoSlots.Mixin.__setstate__
+    ):
+        _state_copiers[cls] = None
+        return None
+    if cls.__setattr__ is object.__setattr__:
+
+        def set_slot(slot):
+            return f"    dest.{slot} = val"
+
+    else:
+
+        def set_slot(slot):
+            return f"    setter(dest, {slot!r}, val)"
+
+    lines = ["def copier(src, dest, memo):"]
+    for i, slot in enumerate(info.slots):
+        lines.append(f"    val = src.{slot}")
+        mapper = info.slot_mappers.get(i, None)
+        if mapper is AutoSlots.weakref_mapper:
+            lines.extend(
+                [
+                    "    if val is not None:",
+                    "        val = val()",
+                    "        if val is not None:",
+                    "            val = weakref_ref(fast_deepcopy(val, memo))",
+                ]
+            )
+        elif mapper is not None:
+            lines.append(
+                f"    val = mappers[{i}](False, "
+                f"fast_deepcopy(mappers[{i}](True, val), memo))"
+            )
+        else:
+            lines.extend(
+                [
+                    "    if val.__class__ not in atomic_types:",
+                    "        val = fast_deepcopy(val, memo)",
+                ]
+            )
+        lines.append(set_slot(slot))
+    ns = {
+        'atomic_types': _atomic_types,
+        'fast_deepcopy': fast_deepcopy,
+        'mappers': info.slot_mappers,
+        'setter': object.__setattr__,
+        'weakref_ref': weakref_ref,
+    }
+    exec('\n'.join(lines), ns)
+    ans = _state_copiers[cls] = ns['copier']
+    return ans
+
 
 class ModelComponentFactoryClass(Factory):
     def register(self, doc=None):
@@ -217,9 +294,20 @@ class ComponentBase(PyomoObject):
         # sane (deepcopy-able) model, we will try to do everything in
         # one try-except block.
         #
+        # Most of the objects are ComponentData that use the generic
+        # AutoSlots state: copy their slots directly using the
+        # (generated) per-class copiers.
+        #
+        copiers = _state_copiers
         try:
             for i, comp in enumerate(component_list):
                 saved_memo = len(memo)
+                copier = copiers.get(comp.__class__, NOTSET)
+                if copier is NOTSET:
+                    copier = _get_state_copier(comp.__class__)
+                if copier is not None:
+                    copier(comp, memo[id(comp)], memo)
+                    continue
                 # Note: this implementation avoids deepcopying the
                 # temporary 'state' list, significantly speeding things
                 # up.
@@ -779,10 +867,14 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        if active_journals:
+            record_change(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        if active_journals:
+            record_change(self)
 
 
 class ComponentData(ComponentBase):
@@ -1059,7 +1151,11 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        if active_journals:
+            record_change(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        if active_journals:
+            record_change(self)
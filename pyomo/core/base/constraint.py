@@ -12,6 +12,7 @@
 from __future__ import annotations
 import sys
 import logging
+from array import array
 from weakref import ref as weakref_ref
 from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
@@ -37,6 +38,9 @@ from pyomo.core.expr import (
     EqualityExpression,
     InequalityExpression,
     RangedExpression,
+    LinearExpression,
+    MonomialTermExpression,
+    SumExpression,
 )
 from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
@@ -46,6 +50,7 @@ from pyomo.core.base.indexed_component import (
     rule_wrapper,
     IndexedComponent,
 )
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.base.set import Set
 from pyomo.core.base.disable_methods import disable_methods
 from pyomo.core.base.initializer import (
@@ -166,6 +171,7 @@ class ConstraintData(ActiveComponentData):
         #   - ActiveComponentData
         #   - ComponentData
         self._component = weakref_ref(component) if (component is not None) else None
+        self._index = NOTSET
         self._active = True
 
         self._expr = None
@@ -372,6 +378,15 @@ class ConstraintData(ActiveComponentData):
         """Set the expression on this constraint."""
         # Clear any previously-cached normalized constraint
         self._expr = None
+        if active_journals:
+            record_change(self)
+        if self._component is not None:
+            # Record rows that are (re)set after the component was
+            # constructed (e.g., so that writers do not regenerate them
+            # from the rule)
+            component = self._component()
+            if component is not None and component._modified_indices is not None:
+                component._modified_indices.add(self._index)
         if expr.__class__ in _known_relational_expressions:
             if getattr(expr, 'strict', False) in _strict_relational_exprs:
                 raise ValueError(
@@ -527,6 +542,249 @@ class _GeneralConstraintData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+class _LinearRows(object):
+    """Shared storage for the bodies of an :class:`IndexedCompactLinearConstraint`
+
+    The terms of each row are stored as a contiguous segment of the
+    ``cols`` / ``coefs`` arrays, where ``cols`` holds positions in the
+    ``vars`` table.  The map from ``id(var)`` to the position in the
+    table is rebuilt on demand (it is not preserved by pickle or
+    deepcopy).  Segments are not reclaimed when rows are deleted or
+    reset.
+
+    """
+
+    def __init__(self):
+        self.vars = []
+        self.cols = array('q')
+        self.coefs = array('d')
+        self._col_map = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_col_map'] = None
+        return state
+
+    def append(self, terms):
+        """Append a row of (var, coef) terms and return its starting position"""
+        col_map = self._col_map
+        if col_map is None:
+            col_map = self._col_map = {id(v): i for i, v in enumerate(self.vars)}
+        start = len(self.cols)
+        for var, coef in terms:
+            col = col_map.get(id(var), None)
+            if col is None:
+                col = col_map[id(var)] = len(self.vars)
+                self.vars.append(var)
+            self.cols.append(col)
+            self.coefs.append(coef)
+        return start
+
+
+def _linear_body_terms(body):
+    """Return (constant, terms) if `body` is linear with native coefficients
+
+    `terms` is a list of ``(var, coef)`` pairs with repeated variables
+    aggregated.  Returns None for any other expression.
+
+    """
+    if body.__class__ in native_numeric_types:
+        return body, []
+    if body.__class__ in native_types:
+        return None
+    if body.__class__ is MonomialTermExpression:
+        args = (body,)
+    elif isinstance(body, SumExpression):
+        args = body.args
+    elif not body.is_expression_type() and body.is_variable_type():
+        return 0, [(body, 1)]
+    else:
+        return None
+    const = 0
+    terms = {}
+    for arg in args:
+        if arg.__class__ in native_numeric_types:
+            const += arg
+            continue
+        elif arg.__class__ is MonomialTermExpression:
+            coef, var = arg.args
+            if coef.__class__ not in native_numeric_types:
+                return None
+        elif arg.__class__ in native_types:
+            return None
+        elif not arg.is_expression_type() and arg.is_variable_type():
+            coef, var = 1, arg
+        else:
+            return None
+        if id(var) in terms:
+            terms[id(var)][1] += coef
+        else:
+            terms[id(var)] = [var, coef]
+    return const, [(var, coef) for var, coef in terms.values()]
+
+
+class CompactLinearConstraintData(ConstraintData):
+    """A ConstraintData that stores linear bodies as coefficient arrays
+
+    Linear constraints (with native numeric coefficients) are not
+    stored as expression trees: the variables and coefficients are
+    appended to the :class:`_LinearRows` storage of the owning
+    :class:`IndexedCompactLinearConstraint`, and only the body
+    constant and the (unevaluated) bounds are kept on the object.  The
+    expression returned by :attr:`body` and :attr:`expr` is rebuilt on
+    demand in canonical form (a :class:`LinearExpression` with
+    aggregated terms); the :attr:`expr` relational expression is
+    cached until the next :meth:`set_value`.  Any other expression is
+    stored as for :class:`ConstraintData`.
+
+    """
+
+    __slots__ = ('_lb', '_ub', '_const', '_start', '_nnz')
+
+    def __init__(self, expr=None, component=None):
+        self._start = None
+        self._nnz = 0
+        self._lb = self._ub = self._const = None
+        super().__init__(expr, component)
+
+    @property
+    def _linear_canonical_form(self):
+        return self._start is not None
+
+    def _terms(self):
+        rows = self.parent_component()._rows
+        var = rows.vars
+        cols = rows.cols
+        coefs = rows.coefs
+        return [
+            (var[cols[i]], coefs[i])
+            for i in range(self._start, self._start + self._nnz)
+        ]
+
+    def linear_terms(self):
+        """Return (constant, [(var, coef), ...]) for the body of a compact row
+
+        Returns None if the body is not stored in compact (linear) form.
+
+        """
+        if self._start is None:
+            return None
+        return self._const, self._terms()
+
+    def __call__(self, exception=True):
+        """Compute the value of the body of this constraint."""
+        if self._start is None:
+            return super().__call__(exception)
+        ans = self._const
+        for var, coef in self._terms():
+            val = value(var, exception=exception)
+            if val is None:
+                return None
+            ans += coef * val
+        return ans
+
+    def to_bounded_expression(self, evaluate_bounds=False):
+        if self._start is None:
+            return super().to_bounded_expression(evaluate_bounds)
+        args = [
+            var if coef == 1 else MonomialTermExpression((coef, var))
+            for var, coef in self._terms()
+        ]
+        if self._const.__class__ not in native_numeric_types or self._const:
+            args.insert(0, self._const)
+        body = LinearExpression(args)
+        if evaluate_bounds:
+            return (
+                self._evaluate_bound(self._lb, True),
+                body,
+                self._evaluate_bound(self._ub, False),
+            )
+        return self._lb, body, self._ub
+
+    to_bounded_expression.__doc__ = ConstraintData.to_bounded_expression.__doc__
+
+    @property
+    def lb(self):
+        """Access the value of the lower bound of a constraint expression."""
+        if self._start is None:
+            return ConstraintData.lb.fget(self)
+        return self._evaluate_bound(self._lb, True)
+
+    @property
+    def ub(self):
+        """Access the value of the upper bound of a constraint expression."""
+        if self._start is None:
+            return ConstraintData.ub.fget(self)
+        return self._evaluate_bound(self._ub, False)
+
+    @property
+    def equality(self):
+        """A boolean indicating whether this is an equality constraint."""
+        if self._start is None:
+            return ConstraintData.equality.fget(self)
+        return self._lb is not None and self._lb is self._ub
+
+    @property
+    def expr(self):
+        """Return the expression associated with this constraint."""
+        if self._start is None or self._expr is not None:
+            return self._expr
+        # Build the expression once and cache it (set_value() clears
+        # it): persistent solvers detect modified constraints by
+        # comparing the identity of the expression.
+        lb, body, ub = self.to_bounded_expression()
+        if lb is None:
+            self._expr = InequalityExpression((body, ub), False)
+        elif lb is ub:
+            self._expr = EqualityExpression((body, ub))
+        elif ub is None:
+            self._expr = InequalityExpression((lb, body), False)
+        else:
+            self._expr = RangedExpression((lb, body, ub), False)
+        return self._expr
+
+    def set_value(self, expr):
+        """Set the expression on this constraint."""
+        self._start = None
+        super().set_value(expr)
+        component = self.parent_component()
+        if self._expr is None or component is None:
+            return
+        try:
+            lb, body, ub = super().to_bounded_expression()
+        except ValueError:
+            # Ranged constraint with variable bounds
+            return
+        ans = _linear_body_terms(body)
+        if ans is None:
+            return
+        self._const, terms = ans
+        self._lb = lb
+        self._ub = ub
+        self._nnz = len(terms)
+        self._start = component._rows.append(terms)
+        self._expr = None
+
+    def canonical_form(self, compute_values=True):
+        """Build a canonical representation of the body of this constraint"""
+        from pyomo.repn.standard_repn import StandardRepn
+
+        variables = []
+        coefficients = []
+        constant = self._const
+        for var, coef in self._terms():
+            if var.fixed:
+                constant += coef * (value(var) if compute_values else var)
+            else:
+                variables.append(var)
+                coefficients.append(coef)
+        repn = StandardRepn()
+        repn.linear_vars = tuple(variables)
+        repn.linear_coefs = tuple(coefficients)
+        repn.constant = constant
+        return repn
+
+
 @ModelComponentFactory.register("General constraint expressions.")
 class Constraint(ActiveIndexedComponent):
     """
@@ -538,6 +796,13 @@ class Constraint(ActiveIndexedComponent):
             A Pyomo expression for this constraint
         rule
             A function that is used to construct constraint expressions
+        sparse_index
+            An iterable of indices (or a rule returning one) that
+            restricts construction to only those indices
+        compact
+            If True, store the bodies of linear constraints as
+            variable / coefficient arrays (see
+            :class:`IndexedCompactLinearConstraint`)
         name
             A name for this component
         doc
@@ -557,6 +822,9 @@ class Constraint(ActiveIndexedComponent):
     Private class attributes:
         _constructed
             A boolean that is true if this component has been constructed
+        _modified_indices
+            The set of indices whose expression was set after the
+            component was constructed (None until construction completes)
         _data
             A dictionary from the index set to component data objects
         _index
@@ -570,6 +838,7 @@ class Constraint(ActiveIndexedComponent):
     """
 
     _ComponentDataClass = ConstraintData
+    _modified_indices = None
 
     class Infeasible(object):
         pass
@@ -595,11 +864,22 @@ class Constraint(ActiveIndexedComponent):
             return super(Constraint, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
             return super(Constraint, cls).__new__(AbstractScalarConstraint)
+        elif kwds.get('compact', False):
+            return super(Constraint, cls).__new__(IndexedCompactLinearConstraint)
         else:
             return super(Constraint, cls).__new__(IndexedConstraint)
 
     @overload
-    def __init__(self, *indexes, expr=None, rule=None, name=None, doc=None): ...
+    def __init__(
+        self,
+        *indexes,
+        expr=None,
+        rule=None,
+        sparse_index=None,
+        compact=False,
+        name=None,
+        doc=None,
+    ): ...
 
     def __init__(self, *args, **kwargs):
         _init = self._pop_from_kwargs('Constraint', kwargs, ('rule', 'expr'), None)
@@ -608,9 +888,17 @@ class Constraint(ActiveIndexedComponent):
             self.rule = Initializer(_init, treat_sequences_as_mappings=False)
         else:
             self.rule = Initializer(_init)
+        sparse_index = kwargs.pop('sparse_index', None)
+        compact = kwargs.pop('compact', False)
 
         kwargs.setdefault('ctype', Constraint)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
+        self._init_sparse_index(sparse_index)
+        if compact and not self.is_indexed():
+            logger.warning(
+                "ScalarConstraint object '%s': compact=True is not supported "
+                "for scalar constraints; ignoring" % (self.name,)
+            )
 
     def construct(self, data=None):
         """
@@ -645,7 +933,16 @@ class Constraint(ActiveIndexedComponent):
                 )
 
             block = self.parent_block()
-            if rule.contains_indices():
+            if self._sparse_index is not None:
+                # Only evaluate the rule for the indices declared by the
+                # sparse index (which we need to validate before calling
+                # the rule).  Repeated indices are only constructed once.
+                for index in self._sparse_index(block, None):
+                    index = self._validate_index(index)
+                    if index in self._data:
+                        continue
+                    self._setitem_when_not_present(index, rule(block, index))
+            elif rule.contains_indices():
                 # The index is coming in externally; we need to validate it
                 for index in rule.indices():
                     self[index] = rule(block, index)
@@ -660,6 +957,7 @@ class Constraint(ActiveIndexedComponent):
                 # Bypass the index validation and create the member directly
                 for index in self.index_set():
                     self._setitem_when_not_present(index, rule(block, index))
+            self._modified_indices = set()
         except Exception:
             err = sys.exc_info()[1]
             logger.error(
@@ -669,7 +967,7 @@ class Constraint(ActiveIndexedComponent):
             )
             raise
         finally:
-            timer.report()
+            timer.report(sparse=self._sparse_index is not None)
 
     def _getitem_when_not_present(self, idx):
         if self.rule is None:
@@ -889,6 +1187,31 @@ class IndexedConstraint(Constraint):
     __getitem__ = IndexedComponent.__getitem__  # type: ignore
 
 
+class IndexedCompactLinearConstraint(IndexedConstraint):
+    """An indexed constraint that stores linear bodies as arrays
+
+    The variables and (native numeric) coefficients of all linear
+    constraints in this container are stored in shared
+    variable-table / coefficient arrays instead of as expression
+    trees (see :class:`CompactLinearConstraintData`).  Expression
+    trees are only built when the :attr:`body` (or :attr:`expr`) of
+    a constraint is requested, and the LP / NL writers read the
+    arrays directly.  Declare using ``Constraint(..., compact=True)``.
+
+    """
+
+    _ComponentDataClass = CompactLinearConstraintData
+
+    def __init__(self, *args, **kwargs):
+        self._rows = _LinearRows()
+        super().__init__(*args, **kwargs)
+
+    def clear(self):
+        """Clear the data in this component"""
+        super().clear()
+        self._rows = _LinearRows()
+
+
 @ModelComponentFactory.register("A list of constraint expressions.")
 class ConstraintList(IndexedConstraint):
     """
@@ -30,7 +30,9 @@ import pyomo.core.expr.numeric_expr as numeric_expr
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.expr.numvalue import as_numeric
+from pyomo.core.expr.structure_cache import StructureCache
 from pyomo.core.base.initializer import Initializer
 
 logger = logging.getLogger('pyomo.core')
@@ -140,6 +142,11 @@ class NamedExpressionData(numeric_expr.NumericValue):
 
     def set_value(self, expr):
         """Set the expression on this expression."""
+        # Redefining a named expression changes all expressions that
+        # contain it
+        StructureCache.mutated()
+        if active_journals:
+            record_change(self)
         if expr is None or expr.__class__ in native_numeric_types:
             self._args_ = (expr,)
             return
@@ -246,6 +253,8 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        sparse_index  An iterable of indices (or a rule returning one)
+                        that restricts construction to only those indices.
         name        Name for this component.
         doc         Text describing this component.
     """
@@ -264,7 +273,14 @@ class Expression(IndexedComponent):
 
     @overload
     def __init__(
-        self, *indexes, rule=None, expr=None, initialize=None, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        expr=None,
+        initialize=None,
+        sparse_index=None,
+        name=None,
+        doc=None,
     ): ...
 
     def __init__(self, *args, **kwds):
@@ -279,9 +295,11 @@ class Expression(IndexedComponent):
         # initialize={} (to require explicit setitem before a getitem),
         # or initialize=NOTSET (to allow getitem before setitem)
         self._rule = Initializer(_init, arg_not_specified=NOTSET)
+        sparse_index = kwds.pop('sparse_index', None)
 
         kwds.setdefault('ctype', Expression)
         IndexedComponent.__init__(self, *args, **kwds)
+        self._init_sparse_index(sparse_index)
 
     def _pprint(self):
         return (
@@ -374,7 +392,7 @@ class Expression(IndexedComponent):
             assert data is None
             self._construct_from_rule_using_setitem()
         finally:
-            timer.report()
+            timer.report(sparse=self._sparse_index is not None)
 
 
 class ScalarExpression(ExpressionData, Expression):
@@ -32,7 +32,10 @@ class GlobalSetBase(PyomoObject):
         return _get_global_set, (self.local_name,)
 
     def __deepcopy__(self, memo):
-        # Prevent deepcopy from duplicating this object
+        # Prevent deepcopy from duplicating this object (and record it
+        # in the memo so later references resolve without calling
+        # deepcopy() again)
+        memo[id(self)] = self
         return self
 
     def __str__(self):
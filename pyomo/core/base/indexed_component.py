@@ -22,11 +22,13 @@ from pyomo.core.base.component import Component, ActiveComponent, ComponentData
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.expr.numeric_expr import _ndarray
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.common import DeveloperError
 from pyomo.common.autoslots import fast_deepcopy
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import TemplateExpressionError
 from pyomo.common.modeling import NOTSET
@@ -299,6 +301,14 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    #
+    # Components that support sparse construction (e.g., Constraint
+    # and Expression) store an Initializer here that generates the
+    # indices to construct.  When None, the rule is evaluated for every
+    # index in the index set.
+    #
+    _sparse_index = None
+
     def __init__(self, *args, **kwds):
         #
         kwds.pop('noruleinit', None)
@@ -740,10 +750,32 @@ You can silence this warning by one of three ways:
         else:
             # Handle the normal deletion operation
             if self.is_indexed():
+                if active_journals:
+                    record_change(self._data[index])
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
 
+    def _init_sparse_index(self, sparse_index):
+        """Process the ``sparse_index`` constructor argument
+
+        The sparse index may be any iterable of indices (including a
+        Set), or a rule (or generator) that takes the parent block and
+        returns an iterable of indices.  Only these indices will be
+        passed to the component rule during construction.
+
+        """
+        if sparse_index is None:
+            return
+        if not self.is_indexed():
+            raise ValueError(
+                "The 'sparse_index' argument is only valid for indexed "
+                "%s components" % (self.ctype.__name__,)
+            )
+        self._sparse_index = Initializer(
+            sparse_index, allow_generators=True, treat_sequences_as_mappings=False
+        )
+
     def _construct_from_rule_using_setitem(self):
         if self._rule is None:
             return
@@ -762,7 +794,16 @@ You can silence this warning by one of three ways:
                     arg_not_specified=NOTSET,
                 )
 
-            if rule.contains_indices():
+            if self._sparse_index is not None:
+                # Only evaluate the rule for the indices declared by the
+                # sparse index (which we need to validate before calling
+                # the rule).  Repeated indices are only constructed once.
+                for index in self._sparse_index(block, None):
+                    index = self._validate_index(index)
+                    if index in self._data:
+                        continue
+                    self._setitem_when_not_present(index, rule(block, index))
+            elif rule.contains_indices():
                 # The index is coming in externally; we need to validate it
                 for index in rule.indices():
                     self[index] = rule(block, index)
@@ -1224,3 +1265,48 @@ class IndexedComponent_NDArrayMixin(object):
         return _ndarray.NumericNDArray.__array_ufunc__(
             None, ufunc, method, *inputs, **kwargs
         )
+
+    def _aligned_array(self, values, n, dtype=None):
+        """Convert ``values`` to a 1-D ndarray with ``n`` entries
+
+        Multidimensional arrays (e.g., generated by :meth:`__array__`)
+        are flattened in C (row-major) order.
+
+        """
+        ans = np.asarray(values, dtype=dtype).reshape(-1)
+        if ans.shape[0] != n:
+            raise ValueError(
+                "Cannot store an array with %s entries in %s: expected an "
+                "array with %s entries (aligned with the indices)"
+                % (ans.shape[0], self.name, n)
+            )
+        return ans
+
+
+def _in_domain_mask(domain, values):
+    """Vectorized test of ``values`` (an ndarray) for membership in ``domain``
+
+    Returns a boolean ndarray, or None if membership in the domain
+    cannot be tested through the domain interval (in which case the
+    caller should fall back on testing individual values).
+
+    """
+    if values.dtype.kind not in 'biuf':
+        return None
+    if isinstance(domain, BASE.set._AnySet):
+        return np.ones(values.shape, dtype=bool)
+    interval = domain.get_interval()
+    if interval is None or interval[2] is None:
+        return None
+    lb, ub, step = interval
+    # Note: NaN is never in the domain (all comparisons are False)
+    mask = values == values
+    if lb is not None:
+        mask &= values >= lb
+    if ub is not None:
+        mask &= values <= ub
+    if step:
+        origin = lb if lb is not None else (ub if ub is not None else 0)
+        with np.errstate(invalid='ignore'):
+            mask &= np.mod(values - origin, step) == 0
+    return mask
@@ -0,0 +1,227 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Change notification for modeling components
+
+A :class:`ChangeJournal` records the modeling components that are
+added, removed, or modified while the journal is active.  This allows
+clients that maintain a derived representation of a model (e.g.,
+persistent solver interfaces) to process only the components that
+changed instead of rescanning the entire model.
+
+Changes are reported by the component APIs (e.g., ``VarData.fix()``,
+``VarData.setlb()``, ``ParamData.set_value()``,
+``ConstraintData.set_value()``, ``activate()`` / ``deactivate()``,
+``Block.add_component()`` and ``Block.del_component()``).  Changes
+made by directly manipulating private attributes are not recorded.
+
+The journal only records *which* components were touched: clients are
+expected to compare the current state of those components against
+their own records to determine what actually changed.
+
+"""
+
+from weakref import WeakSet
+
+# The set of journals that are currently recording changes.  Journals
+# are held by weak reference so that discarded journals do not continue
+# to accumulate changes.
+active_journals = WeakSet()
+
+
+def record_change(obj):
+    """Record that `obj` (a component or component data) was modified
+
+    Callers should check that :data:`active_journals` is not empty
+    before calling this function.
+
+    """
+    for journal in active_journals:
+        journal._changes[id(obj)] = obj
+
+
+class ModelChanges(object):
+    """The components recorded by a :class:`ChangeJournal`, grouped by type
+
+    Attributes
+    ----------
+    constraints: list
+        ConstraintData objects that were added, removed, (de)activated,
+        or modified
+    sos_constraints: list
+        SOSConstraintData objects that were added, removed,
+        (de)activated, or modified
+    variables: list
+        VarData objects that were added, removed, or modified
+    params: list
+        Mutable ParamData objects that were added, removed, or modified
+    objectives: bool
+        True if any Objective was added, removed, (de)activated, or
+        modified
+    named_expressions: bool
+        True if any named Expression was redefined
+
+    """
+
+    def __init__(self):
+        self.constraints = []
+        self.sos_constraints = []
+        self.variables = []
+        self.params = []
+        self.objectives = False
+        self.named_expressions = False
+        self._seen = set()
+
+    def _add(self, obj):
+        from pyomo.core.base.block import BlockData
+        from pyomo.core.base.component import Component
+        from pyomo.core.base.param import Param
+
+        if isinstance(obj, BlockData):
+            self._add_block(obj)
+        elif isinstance(obj, Component):
+            if obj.ctype is Param and not obj.mutable:
+                return
+            for data in obj.values():
+                self._add_data(data)
+        else:
+            self._add_data(obj)
+
+    def _add_block(self, block):
+        from pyomo.core.base.constraint import Constraint
+        from pyomo.core.base.objective import Objective
+        from pyomo.core.base.param import Param
+        from pyomo.core.base.sos import SOSConstraint
+        from pyomo.core.base.var import Var
+
+        for ctype in (Constraint, SOSConstraint, Var):
+            for data in block.component_data_objects(
+                ctype, descend_into=True, sort=False
+            ):
+                self._add_data(data)
+        for p in block.component_objects(Param, descend_into=True, sort=False):
+            if p.mutable:
+                for data in p.values():
+                    self._add_data(data)
+        for _ in block.component_data_objects(Objective, descend_into=True):
+            self.objectives = True
+            break
+
+    def _add_data(self, data):
+        from pyomo.core.base.constraint import ConstraintData
+        from pyomo.core.base.expression import NamedExpressionData
+        from pyomo.core.base.objective import ObjectiveData
+        from pyomo.core.base.param import ParamData
+        from pyomo.core.base.sos import SOSConstraintData
+        from pyomo.core.base.var import VarData
+
+        if id(data) in self._seen:
+            return
+        self._seen.add(id(data))
+        if isinstance(data, ConstraintData):
+            self.constraints.append(data)
+        elif isinstance(data, VarData):
+            self.variables.append(data)
+        elif isinstance(data, ParamData):
+            self.params.append(data)
+        elif isinstance(data, SOSConstraintData):
+            self.sos_constraints.append(data)
+        elif isinstance(data, ObjectiveData):
+            self.objectives = True
+        elif isinstance(data, NamedExpressionData):
+            self.named_expressions = True
+
+
+class ChangeJournal(object):
+    """Record the modeling components that are changed
+
+    The journal records changes from the time :meth:`start` is called
+    (or the journal is entered as a context manager) until
+    :meth:`stop` is called.  Changes to all models are recorded; use
+    :func:`in_model` to filter the recorded components.
+
+    Example::
+
+        journal = ChangeJournal()
+        journal.start()
+        m.x.fix(1)
+        m.c.deactivate()
+        changes = journal.collect()
+        # changes.variables == [m.x], changes.constraints == [m.c]
+
+    """
+
+    def __init__(self):
+        self._changes = {}
+
+    def start(self):
+        """Start recording changes"""
+        active_journals.add(self)
+
+    def stop(self):
+        """Stop recording changes"""
+        active_journals.discard(self)
+
+    @property
+    def active(self):
+        """True if this journal is recording changes"""
+        return self in active_journals
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, et, ev, tb):
+        self.stop()
+
+    def __len__(self):
+        return len(self._changes)
+
+    def clear(self):
+        """Discard all recorded changes"""
+        self._changes = {}
+
+    def changes(self):
+        """Return the list of recorded components (in the order that
+        they were first changed)"""
+        return list(self._changes.values())
+
+    def collect(self):
+        """Return the recorded changes as :class:`ModelChanges` and
+        clear the journal
+
+        Components and Blocks are expanded into the component data
+        objects that they contain.
+
+        """
+        ans = ModelChanges()
+        changes, self._changes = self._changes, {}
+        for obj in changes.values():
+            ans._add(obj)
+        return ans
+
+
+def in_model(obj, model, active=False):
+    """Return True if the component (data) `obj` is part of `model`
+
+    If `active` is True, then `obj` and all Blocks between `obj` and
+    `model` must also be active.
+
+    """
+    if active and not obj.active:
+        return False
+    blk = obj.parent_block()
+    while blk is not None:
+        if active and not blk.active:
+            return False
+        if blk is model:
+            return True
+        blk = blk.parent_block()
+    return False
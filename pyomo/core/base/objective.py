@@ -30,6 +30,7 @@ from pyomo.core.base.indexed_component import (
     rule_wrapper,
 )
 from pyomo.core.base.expression import NamedExpressionData
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.base.set import Set
 from pyomo.core.base.initializer import (
     Initializer,
@@ -141,6 +142,8 @@ class ObjectiveData(NamedExpressionData, ActiveComponentData):
     def set_sense(self, sense):
         """Set the sense (direction) of this objective."""
         self._sense = ObjectiveSense(sense)
+        if active_journals:
+            record_change(self)
 
 
 class _ObjectiveData(metaclass=RenamedClass):
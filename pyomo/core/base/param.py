@@ -18,19 +18,23 @@ from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
 from pyomo.common.numeric_types import native_types, value as expr_value
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.expr.numvalue import NumericValue
+from pyomo.core.expr.structure_cache import StructureCache
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set,
     IndexedComponent_NDArrayMixin,
+    _in_domain_mask,
 )
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.base.initializer import Initializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
 from pyomo.core.base.set import Reals, _AnySet, SetInitializer
@@ -196,6 +200,9 @@ class ParamData(ComponentData, NumericValue):
         except:
             self._value = old_value
             raise
+        StructureCache.mutated()
+        if active_journals:
+            record_change(self)
 
     def __call__(self, exception=True):
         """
@@ -501,6 +508,9 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
         """
         if not self._mutable:
             _raise_modifying_immutable_error(self, '*')
+        StructureCache.mutated()
+        if active_journals:
+            record_change(self)
         #
         _srcType = type(new_values)
         _isDict = _srcType is dict or (
@@ -559,6 +569,53 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def store_array(self, values, indices=None, check=True):
+        """
+        A utility to update a mutable Param from a NumPy array.
+
+        ``values`` must be aligned with ``indices`` (by default, all
+        indices in the Param index set, in index set order).
+        Multidimensional arrays are flattened in C order.  If
+        check=True, then the indices are validated and the values are
+        checked against the Param domain (vectorized, where possible)
+        and any validation rule before any values are stored.
+        """
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        StructureCache.mutated()
+        if active_journals:
+            record_change(self)
+        if indices is None:
+            indices = list(self._index_set)
+        elif check:
+            indices = [
+                idx if idx in self._data else self._validate_index(idx)
+                for idx in indices
+            ]
+        vals = self._aligned_array(values, len(indices))
+        if check:
+            domain = self.domain
+            mask = _in_domain_mask(domain, vals)
+            if mask is None:
+                for index, val in zip(indices, vals.tolist()):
+                    self._validate_value(index, val)
+            else:
+                for i in np.flatnonzero(~mask)[:1].tolist():
+                    self._validate_value(indices[i], vals[i].item())
+                if self._validate:
+                    for index, val in zip(indices, vals.tolist()):
+                        self._validate_value(index, val, validate_domain=False)
+        if not self.is_indexed():
+            self[None] = vals[0].item()
+            return
+        _data = self._data
+        for index, val in zip(indices, vals.tolist()):
+            obj = _data.get(index, None)
+            if obj is None:
+                obj = _data[index] = ParamData(self)
+                obj._index = index
+            obj._value = val
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -23,6 +23,7 @@ from typing import Union, Type, Any as typingAny
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -1928,6 +1929,302 @@ class _InsertionOrderSetData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+class ArrayOrderedSetData(InsertionOrderSetData):
+    """
+    This class defines the data for an insertion-ordered set of
+    integer members (or tuples of integers) stored in a NumPy array.
+
+    Members are stored as rows of a 2-D int64 array (one column for
+    each dimension of the set).  Membership / position lookups use a
+    sorted index (built lazily) over the rows, plus a dict for the
+    members added since the sorted index was last built (the "tail").
+    The sorted index is rebuilt once the tail grows beyond 1/8 of the
+    set, so adding members one at a time is amortized O(log n).  This
+    uses significantly less memory than the dict used by
+    :class:`InsertionOrderSetData` for large sets, and allows new
+    members to be added in bulk by passing an integer
+    ``numpy.ndarray`` to :meth:`update`.  All members of the Set must
+    be integers and have the same dimension.
+
+    Constructor Arguments:
+        component   The Set object that owns this data.
+
+    Public Class Attributes:
+    """
+
+    __slots__ = ('_size', '_lookup', '_tail')
+
+    # Updates with more than this many values are processed in bulk
+    # (vectorized) instead of one value at a time
+    _bulk_update_size = 64
+    # The minimum number of members held in the (dict) tail before the
+    # sorted index is rebuilt
+    _min_tail_size = 64
+
+    def __init__(self, component):
+        self._values = None
+        self._size = 0
+        self._lookup = None
+        self._tail = {}
+        self._ordered_values = None
+        FiniteSetData.__init__(self, component=component)
+
+    def _rows(self):
+        if self._values is None:
+            return np.empty((0, self._dimen), dtype=np.int64)
+        return self._values[: self._size]
+
+    def _row_keys(self, rows):
+        # Map each row to a scalar key (a "void" view of the row bytes
+        # for multidimensional sets) that can be sorted and searched
+        if rows.shape[1] == 1:
+            return rows[:, 0]
+        rows = np.ascontiguousarray(rows)
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1])))[
+            :, 0
+        ]
+
+    def _reset_index(self):
+        self._lookup = None
+        self._tail = {}
+
+    def _sorted_index(self):
+        # Return the (sorted keys, positions) index, building it over
+        # all rows (and emptying the tail) if necessary
+        if self._lookup is None:
+            keys = self._row_keys(self._rows())
+            perm = np.argsort(keys, kind='stable')
+            self._lookup = keys[perm], perm
+            self._tail = {}
+        return self._lookup
+
+    def _index_rows(self, start):
+        # Add the rows appended at positions [start, _size) to the tail
+        # (or discard the sorted index if the tail would grow too large)
+        if self._lookup is None:
+            return
+        n = self._size - start
+        if len(self._tail) + n > max(self._min_tail_size, self._size // 8):
+            self._reset_index()
+            return
+        rows = self._values[start : self._size].tolist()
+        if self._dimen == 1:
+            keys = (r[0] for r in rows)
+        else:
+            keys = map(tuple, rows)
+        self._tail.update(zip(keys, range(start, self._size)))
+
+    def _find_rows(self, rows):
+        """Return the position of each row (or -1 if the row is not present)"""
+        ans = np.full(len(rows), -1, dtype=np.intp)
+        if not self._size:
+            return ans
+        sorted_keys, perm = self._sorted_index()
+        if len(perm):
+            keys = self._row_keys(rows)
+            i = np.minimum(np.searchsorted(sorted_keys, keys), len(perm) - 1)
+            ans = np.where(sorted_keys[i] == keys, perm[i], -1)
+        if self._tail:
+            missing = np.flatnonzero(ans < 0)
+            if self._dimen == 1:
+                keys = rows[missing, 0].tolist()
+            else:
+                keys = map(tuple, rows[missing].tolist())
+            ans[missing] = [self._tail.get(k, -1) for k in keys]
+        return ans
+
+    def _as_rows(self, values):
+        if self._dimen is None:
+            raise TypeError(
+                "Set %s: array storage requires Set members with a "
+                "consistent dimension (dimen=None)" % (self.name,)
+            )
+        ans = np.asarray(values)
+        if ans.dtype.kind not in 'iu' or ans.ndim > 2:
+            raise TypeError(
+                "Set %s: array storage only supports integer members "
+                "(or tuples of integers)" % (self.name,)
+            )
+        return ans.astype(np.int64, copy=False).reshape(len(ans), -1)
+
+    def _as_key(self, value):
+        # Return the lookup key (an int, or a tuple of ints) for a new
+        # member of this Set
+        if self._dimen is not None:
+            row = value if value.__class__ is tuple else (value,)
+            if all(
+                v.__class__ is not bool
+                and isinstance(v, (int, np.integer))
+                and -(2**63) <= v < 2**63
+                for v in row
+            ):
+                if self._dimen == 1:
+                    return int(row[0])
+                return tuple(map(int, row))
+        # Raise the same exceptions as for bulk updates
+        self._as_rows([value])
+        raise TypeError(
+            "Set %s: array storage only supports integer members "
+            "(or tuples of integers) representable as int64" % (self.name,)
+        )
+
+    def _find(self, value):
+        if value.__class__ is int and self._dimen == 1:
+            # Fast path for the most common case
+            if -(2**63) <= value < 2**63:
+                return self._find_key(value)
+            return -1
+        # Convert value to the lookup key (as for the dict-based Sets,
+        # integral floats match the corresponding ints)
+        if value.__class__ is not tuple:
+            value = (value,)
+        if len(value) != self._dimen:
+            return -1
+        key = []
+        for v in value:
+            if isinstance(v, (int, np.integer)):
+                v = int(v)
+            elif v.__class__ is float and v.is_integer():
+                v = int(v)
+            else:
+                return -1
+            if not -(2**63) <= v < 2**63:
+                return -1
+            key.append(v)
+        return self._find_key(key[0] if self._dimen == 1 else tuple(key))
+
+    def _find_key(self, key):
+        i = self._tail.get(key, -1)
+        if i >= 0 or not self._size:
+            return i
+        sorted_keys, perm = self._sorted_index()
+        if not len(perm):
+            return -1
+        if self._dimen != 1:
+            return int(self._find_rows(np.array([key], dtype=np.int64))[0])
+        i = int(sorted_keys.searchsorted(key))
+        if i < len(perm) and sorted_keys.item(i) == key:
+            return perm.item(i)
+        return -1
+
+    def get(self, value, default=None):
+        if normalize_index.flatten:
+            value = normalize_index(value)
+        if self._find(value) >= 0:
+            return value
+        return default
+
+    def _iter_impl(self):
+        rows = self._rows()
+        if self._dimen == 1:
+            return iter(rows[:, 0].tolist())
+        return map(tuple, rows.tolist())
+
+    def __reversed__(self):
+        return reversed(list(self._iter_impl()))
+
+    def __len__(self):
+        return self._size
+
+    def update(self, values):
+        comp = self.parent_component()
+        if (
+            isinstance(values, np.ndarray)
+            and self._domain is Any
+            and comp._filter is None
+            and comp._validate is None
+        ):
+            # Bulk (vectorized) update
+            rows = self._as_rows(values)
+            if self._dimen is UnknownSetDimen:
+                self._dimen = rows.shape[1]
+            elif rows.shape[1] != self._dimen:
+                raise ValueError(
+                    "Cannot add array of dimension %s to Set %s which has "
+                    "dimen=%s" % (rows.shape[1], self.name, self._dimen)
+                )
+            self._append_rows(rows)
+        else:
+            super().update(values)
+
+    def _update_impl(self, values):
+        values = list(values)
+        if len(values) > self._bulk_update_size:
+            self._append_rows(self._as_rows(values))
+            return
+        for val in values:
+            key = self._as_key(val)
+            if self._find_key(key) < 0:
+                n = self._size
+                self._reserve(n + 1)
+                self._values[n] = key
+                self._size = n + 1
+                self._index_rows(n)
+
+    def _reserve(self, n):
+        if self._values is None or n > len(self._values):
+            new = np.empty((max(n, 2 * self._size), self._dimen), dtype=np.int64)
+            new[: self._size] = self._rows()
+            self._values = new
+
+    def _append_rows(self, rows):
+        # Drop rows that are already in the Set (or are repeated in
+        # rows), preserving the insertion order
+        rows = rows[self._find_rows(rows) < 0]
+        _, first = np.unique(self._row_keys(rows), return_index=True)
+        if len(first) < len(rows):
+            rows = rows[np.sort(first)]
+        if not len(rows):
+            return
+        start = self._size
+        n = start + len(rows)
+        self._reserve(n)
+        self._values[start:n] = rows
+        self._size = n
+        self._index_rows(start)
+
+    def remove(self, val):
+        i = self._find(val)
+        if i < 0:
+            raise KeyError(val)
+        self._values = np.delete(self._rows(), i, axis=0)
+        self._size -= 1
+        self._reset_index()
+
+    def clear(self):
+        self._values = None
+        self._size = 0
+        self._reset_index()
+
+    def at(self, index):
+        """
+        Return the specified member of the set.
+
+        The public Set API is 1-based, even though the
+        internal storage is (pythonically) 0-based.
+        """
+        i = self._to_0_based_index(index)
+        if i >= self._size:
+            raise IndexError(f"{self.name} index out of range")
+        row = self._values[i].tolist()
+        return row[0] if self._dimen == 1 else tuple(row)
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then a ValueError is raised.
+        """
+        i = self._find(item)
+        if i < 0 and item.__class__ is tuple and len(item) == 1:
+            i = self._find(item[0])
+        if i < 0:
+            raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+        return i + 1
+
+
 class _SortedSetMixin(object):
     """"""
 
@@ -2049,6 +2346,11 @@ class Set(IndexedComponent):
           ``<function>``          Ordered with this comparison function
           ======================  =====================================
 
+    storage : str, optional
+        If ``'array'``, store the Set members in a NumPy array (see
+        :class:`ArrayOrderedSetData`).  Only supported for insertion
+        ordered Sets whose members are integers (or tuples of integers).
+
     within : initialiser(set), optional
         A set that defines the valid values that can be contained
         in this set. If the latter is indexed, the former can be indexed or
@@ -2163,8 +2465,22 @@ class Set(IndexedComponent):
                         )
                     )
                 )
+        storage = kwds.get('storage', None)
+        if storage is not None:
+            if storage != 'array':
+                raise ValueError(
+                    "Set 'storage' argument is not valid (must be one of "
+                    "{None, 'array'})"
+                )
+            if ordered is not Set.InsertionOrder:
+                raise ValueError(
+                    "Set storage='array' is only supported for insertion "
+                    "ordered Sets"
+                )
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
-            if ordered is Set.InsertionOrder:
+            if storage is not None:
+                return super(Set, cls).__new__(AbstractArrayOrderedScalarSet)
+            elif ordered is Set.InsertionOrder:
                 return super(Set, cls).__new__(AbstractOrderedScalarSet)
             elif ordered is Set.SortedOrder:
                 return super(Set, cls).__new__(AbstractSortedScalarSet)
@@ -2172,7 +2488,9 @@ class Set(IndexedComponent):
                 return super(Set, cls).__new__(AbstractFiniteScalarSet)
         else:
             newObj = super(Set, cls).__new__(IndexedSet)
-            if ordered is Set.InsertionOrder:
+            if storage is not None:
+                newObj._ComponentDataClass = ArrayOrderedSetData
+            elif ordered is Set.InsertionOrder:
                 newObj._ComponentDataClass = InsertionOrderSetData
             elif ordered is Set.SortedOrder:
                 newObj._ComponentDataClass = SortedSetData
@@ -2187,6 +2505,7 @@ class Set(IndexedComponent):
         initialize=None,
         dimen=UnknownSetDimen,
         ordered=InsertionOrder,
+        storage=None,
         within=None,
         domain=None,
         bounds=None,
@@ -2202,6 +2521,8 @@ class Set(IndexedComponent):
         # The ordered flag was processed by __new__, but if this is a
         # sorted set, then we need to set the sorting function
         _ordered = kwds.pop('ordered', None)
+        # The storage flag was also processed by __new__
+        kwds.pop('storage', None)
         if _ordered and _ordered is not Set.InsertionOrder and _ordered is not True:
             if inspect.isfunction(_ordered):
                 self._sort_fcn = _ordered
@@ -2499,6 +2820,15 @@ class OrderedSimpleSet(metaclass=RenamedClass):
     __renamed__version__ = '6.0'
 
 
+class ArrayOrderedScalarSet(_ScalarOrderedSetMixin, ArrayOrderedSetData, Set):
+    def __init__(self, **kwds):
+        kwds.setdefault('ordered', Set.InsertionOrder)
+
+        ArrayOrderedSetData.__init__(self, component=self)
+        Set.__init__(self, **kwds)
+        self._index = UnindexedComponent_index
+
+
 class SortedScalarSet(_ScalarOrderedSetMixin, SortedSetData, Set):
     def __init__(self, **kwds):
         # In case someone inherits from us, we will provide a rational
@@ -2535,6 +2865,11 @@ class AbstractOrderedSimpleSet(metaclass=RenamedClass):
     __renamed__version__ = '6.0'
 
 
+@disable_methods(_ORDEREDSET_API + _SETDATA_API)
+class AbstractArrayOrderedScalarSet(ArrayOrderedScalarSet):
+    pass
+
+
 @disable_methods(_ORDEREDSET_API + _SETDATA_API)
 class AbstractSortedScalarSet(SortedScalarSet):
     pass
@@ -16,6 +16,8 @@ from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 from typing import Union, Type
 
+from pyomo.common.autoslots import fast_deepcopy
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -24,6 +26,7 @@ from pyomo.common.timing import ConstructionTimer
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.core.expr import GetItemExpression
 from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
+from pyomo.core.expr.structure_cache import StructureCache
 from pyomo.core.expr.numvalue import (
     NumericValue,
     value,
@@ -37,7 +40,10 @@ from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set,
     IndexedComponent_NDArrayMixin,
+    _in_domain_mask,
 )
+from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
+from pyomo.core.base.journal import active_journals, record_change
 from pyomo.core.base.initializer import (
     Initializer,
     DefaultInitializer,
@@ -57,6 +63,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _nonfinite_values = {_inf, _ninf}
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
@@ -187,6 +194,12 @@ class VarData(ComponentData, NumericValue):
 
         self._value = val
         self._stale = StaleFlagManager.get_flag(self._stale)
+        if self._fixed:
+            # The values of fixed variables can change the degree /
+            # fixed status of expressions (e.g., 0*x)
+            StructureCache.mutated()
+            if active_journals:
+                record_change(self)
 
     @property
     def value(self):
@@ -212,6 +225,8 @@ class VarData(ComponentData, NumericValue):
             self._domain = SetInitializer(domain)(
                 self.parent_block(), self.index(), self
             )
+            if active_journals:
+                record_change(self)
         except:
             logger.error(
                 "%s is not a valid domain. Variable domains must be an "
@@ -382,6 +397,8 @@ class VarData(ComponentData, NumericValue):
     @lower.setter
     def lower(self, val):
         self._lb = self._process_bound(val, 'lower')
+        if active_journals:
+            record_change(self)
 
     @property
     def upper(self):
@@ -407,6 +424,8 @@ class VarData(ComponentData, NumericValue):
     @upper.setter
     def upper(self, val):
         self._ub = self._process_bound(val, 'upper')
+        if active_journals:
+            record_change(self)
 
     def get_units(self):
         """Return the units for this variable entry."""
@@ -450,6 +469,9 @@ class VarData(ComponentData, NumericValue):
     @fixed.setter
     def fixed(self, val):
         self._fixed = bool(val)
+        StructureCache.mutated()
+        if active_journals:
+            record_change(self)
 
     @property
     def stale(self):
@@ -580,6 +602,251 @@ class _GeneralVarData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+class _VarColumns(object):
+    """Contiguous storage for the data of an :class:`IndexedColumnarVar`
+
+    Values and numeric bounds are stored in float64 arrays (using NaN
+    to represent ``None``).  Python ints stored in the float arrays are
+    flagged in the ``int_*`` arrays (so that they are returned as
+    ints).  Bounds that are (non-potentially-variable) expressions are
+    stored in the ``lb_expr`` / ``ub_expr`` dicts, keyed by position.
+    The domain is stored once (``domain``), with any variables that
+    have a different domain recorded in the ``domains`` dict.  The
+    ``index`` array records the index of the variable in each row.
+
+    """
+
+    # (name, dtype, fill value) for each column array
+    _arrays = (
+        ('index', object, None),
+        ('value', float, _nan),
+        ('lb', float, _nan),
+        ('ub', float, _nan),
+        ('fixed', bool, False),
+        ('stale', 'int64', 0),
+        ('int_value', bool, False),
+        ('int_lb', bool, False),
+        ('int_ub', bool, False),
+    )
+
+    def __init__(self, capacity=0):
+        self.size = 0
+        for name, dtype, fill in self._arrays:
+            setattr(self, name, np.full(capacity, fill, dtype=dtype))
+        self.lb_expr = {}
+        self.ub_expr = {}
+        self.domain = None
+        self.domains = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # Stale flags are relative to the current global flag: store
+        # them as booleans (see StaleFlagManager.stale_mapper)
+        state['stale'] = StaleFlagManager.is_stale(self.stale)
+        return state
+
+    def __setstate__(self, state):
+        state['stale'] = np.where(
+            state['stale'], 0, StaleFlagManager.get_flag(0)
+        ).astype('int64')
+        self.__dict__.update(state)
+
+    def reserve(self, capacity):
+        n = len(self.value)
+        if capacity <= n:
+            return
+        extra = capacity - n
+        for name, dtype, fill in self._arrays:
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate((arr, np.full(extra, fill, dtype))))
+
+    def allocate(self):
+        pos = self.size
+        if pos == len(self.value):
+            self.reserve(max(2 * pos, 16))
+        self.size += 1
+        return pos
+
+    def copy_row(self, src, dest):
+        """Copy the state of row `src` to the row(s) `dest`
+
+        `dest` may be a position or a ``range`` of positions.  The
+        ``index`` column is not copied.
+
+        """
+        if dest.__class__ is range:
+            rows = dest
+            dest = slice(dest.start, dest.stop)
+        else:
+            rows = (dest,)
+        for name, dtype, fill in self._arrays:
+            if name != 'index':
+                arr = getattr(self, name)
+                arr[dest] = arr[src]
+        for exprs in (self.lb_expr, self.ub_expr, self.domains):
+            if src in exprs:
+                exprs.update(dict.fromkeys(rows, exprs[src]))
+
+    def get(self, name, pos):
+        """Return the value stored in the `name` column at `pos`"""
+        val = getattr(self, name)[pos]
+        if val != val:
+            return None
+        if getattr(self, 'int_' + name)[pos]:
+            return int(val)
+        return float(val)
+
+    def set(self, name, pos, val):
+        """Store a native numeric value (or None) in the `name` column
+
+        `pos` may be a position or a NumPy index (slice or array).
+
+        """
+        getattr(self, name)[pos] = np.nan if val is None else val
+        getattr(self, 'int_' + name)[pos] = val.__class__ is int
+
+    def get_bound(self, name, pos):
+        """Return the lower ('lb') or upper ('ub') bound at `pos`"""
+        exprs = getattr(self, name + '_expr')
+        if pos in exprs:
+            return exprs[pos]
+        return self.get(name, pos)
+
+    def set_bound(self, name, pos, val):
+        """Store the lower ('lb') or upper ('ub') bound at `pos`"""
+        exprs = getattr(self, name + '_expr')
+        if val is None or val.__class__ in native_numeric_types:
+            exprs.pop(pos, None)
+            self.set(name, pos, val)
+        else:
+            exprs[pos] = val
+            self.set(name, pos, None)
+
+    def get_domain(self, pos):
+        if self.domains:
+            return self.domains.get(pos, self.domain)
+        return self.domain
+
+    def set_domain(self, pos, val):
+        if self.domain is None:
+            self.domain = val
+        if val is self.domain:
+            self.domains.pop(pos, None)
+        else:
+            self.domains[pos] = val
+
+
+class ColumnarVarData(VarData):
+    """A variable whose state is stored in the parent component arrays
+
+    This is a view onto the :class:`_VarColumns` storage of the owning
+    :class:`IndexedColumnarVar`: the value, bounds, domain, and fixed /
+    stale flags are read from (and written to) the column arrays at
+    position ``_pos``.  Values (and numeric bounds) are stored as
+    floats (Python ints are converted back to ints).
+
+    """
+
+    __slots__ = ('_pos',)
+
+    def __init__(self, component):
+        self._component = weakref_ref(component)
+        self._index = NOTSET
+        self._pos = component._columns.allocate()
+
+    @classmethod
+    def copy(cls, src):
+        self = cls.__new__(cls)
+        self._component = src._component
+        self._index = src._index
+        cols = src._component()._columns
+        self._pos = cols.allocate()
+        cols.copy_row(src._pos, self._pos)
+        return self
+
+    @property
+    def _domain(self):
+        return self._component()._columns.get_domain(self._pos)
+
+    @_domain.setter
+    def _domain(self, val):
+        self._component()._columns.set_domain(self._pos, val)
+
+    @property
+    def _value(self):
+        return self._component()._columns.get('value', self._pos)
+
+    @_value.setter
+    def _value(self, val):
+        self._component()._columns.set('value', self._pos, val)
+
+    @property
+    def _lb(self):
+        return self._component()._columns.get_bound('lb', self._pos)
+
+    @_lb.setter
+    def _lb(self, val):
+        self._component()._columns.set_bound('lb', self._pos, val)
+
+    @property
+    def _ub(self):
+        return self._component()._columns.get_bound('ub', self._pos)
+
+    @_ub.setter
+    def _ub(self, val):
+        self._component()._columns.set_bound('ub', self._pos, val)
+
+    @property
+    def _fixed(self):
+        return bool(self._component()._columns.fixed[self._pos])
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._component()._columns.fixed[self._pos] = val
+
+    @property
+    def _stale(self):
+        return int(self._component()._columns.stale[self._pos])
+
+    @_stale.setter
+    def _stale(self, val):
+        self._component()._columns.stale[self._pos] = val
+
+
+# The value / bound / domain / flag "slots" inherited from VarData are
+# properties on ColumnarVarData (the data lives in the component
+# arrays, which are copied / pickled with the component).  Remove them
+# from the state generated by __getstate__.
+def _remove_autoslots(cls, names):
+    info = cls.__auto_slots__
+    slots = tuple(s for s in info.slots if s not in names)
+    slot_mappers = {
+        slots.index(info.slots[i]): mapper
+        for i, mapper in info.slot_mappers.items()
+        if info.slots[i] not in names
+    }
+    cls.__auto_slots__ = info._replace(slots=slots, slot_mappers=slot_mappers)
+
+
+_remove_autoslots(
+    ColumnarVarData, ('_value', '_lb', '_ub', '_domain', '_fixed', '_stale')
+)
+
+
+class _DetachedColumnarVarData(VarData):
+    """A :class:`ColumnarVarData` that was deleted from its container
+
+    Deleting an element from an :class:`IndexedColumnarVar` copies the
+    row state into the :class:`VarData` slots of the
+    :class:`ColumnarVarData` and converts it to this class, so that
+    expressions that still reference the variable remain valid.
+
+    """
+
+    # The layout must match ColumnarVarData (for __class__ assignment)
+    __slots__ = ('_pos',)
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
     """A numeric variable, which may be defined over an index.
@@ -599,6 +866,10 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             :meth:`index_set` when constructing the Var (True) or just the
             variables returned by ``initialize``/``rule`` (False).  Defaults
             to ``True``.
+        columnar (bool, optional): Store the values, bounds, and fixed /
+            stale flags for all elements of an indexed Var in contiguous
+            NumPy arrays (see :class:`IndexedColumnarVar`).  Defaults to
+            ``False``.
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
         name (str, optional): Name for this component.
@@ -621,6 +892,8 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
             return super(Var, cls).__new__(AbstractScalarVar)
+        elif kwargs.get('columnar', False):
+            return super(Var, cls).__new__(IndexedColumnarVar)
         else:
             return super(Var, cls).__new__(IndexedVar)
 
@@ -634,6 +907,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         initialize=None,
         rule=None,
         dense=True,
+        columnar=False,
         units=None,
         name=None,
         doc=None,
@@ -651,6 +925,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         )
         _bounds_arg = kwargs.pop('bounds', None)
         self._dense = kwargs.pop('dense', True)
+        _columnar = kwargs.pop('columnar', False)
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
@@ -668,6 +943,11 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "for scalar variables; converting to dense=True" % (self.name,)
             )
             self._dense = True
+        if _columnar and not self.is_indexed():
+            logger.warning(
+                "ScalarVar object '%s': columnar=True is not supported "
+                "for scalar variables; ignoring" % (self.name,)
+            )
         self._rule_bounds = BoundInitializer(_bounds_arg, self)
 
     def flag_as_stale(self):
@@ -701,6 +981,124 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         for index, new_value in new_values.items():
             self[index].set_value(new_value, skip_validation)
 
+    def _bulk_data(self, indices):
+        """Return the list of VarData for the indices used by the array API"""
+        if indices is None:
+            _data = self._data
+            return [_data[idx] for idx in self.keys()]
+        return [self[idx] for idx in indices]
+
+    def get_values_array(self, indices=None):
+        """Return the variable values as a NumPy array
+
+        The values are returned in the order of ``indices`` (by default,
+        all indices of this Var in :meth:`keys` order).  Variables
+        without a value are reported as NaN.
+
+        """
+        data = self._bulk_data(indices)
+        return np.fromiter(
+            (_nan if v._value is None else v._value for v in data),
+            dtype=float,
+            count=len(data),
+        )
+
+    def set_values_array(self, values, indices=None, skip_validation=False):
+        """Set variable values from a NumPy array
+
+        ``values`` must be aligned with ``indices`` (by default, all
+        indices of this Var in :meth:`keys` order).  Multidimensional
+        arrays are flattened in C order.  NaN entries clear the
+        corresponding variable values.  Unless ``skip_validation`` is
+        True, the values are checked (vectorized) against the variable
+        domains and bounds, logging the same warnings as
+        :meth:`VarData.set_value`.
+
+        """
+        data = self._bulk_data(indices)
+        vals = self._aligned_array(values, len(data), float)
+        if not skip_validation:
+            self._validate_values_array(data, vals)
+        self._store_values_array(data, vals)
+
+    def set_bounds_array(self, lb=None, ub=None, indices=None):
+        """Set variable bounds from NumPy arrays
+
+        ``lb`` and ``ub`` must be aligned with ``indices`` (by default,
+        all indices of this Var in :meth:`keys` order).  NaN entries
+        remove the corresponding bound.  Passing None for ``lb`` (or
+        ``ub``) leaves the lower (upper) bounds unchanged.
+
+        """
+        data = self._bulk_data(indices)
+        if lb is not None:
+            lb = self._aligned_array(lb, len(data), float)
+        if ub is not None:
+            ub = self._aligned_array(ub, len(data), float)
+        self._store_bounds_array(data, lb, ub)
+
+    def _store_values_array(self, data, vals):
+        for v, val in zip(data, vals.tolist()):
+            v.set_value(None if val != val else val, skip_validation=True)
+
+    def _store_bounds_array(self, data, lb, ub):
+        if lb is not None:
+            for v, val in zip(data, lb.tolist()):
+                v.lower = None if val != val else val
+        if ub is not None:
+            for v, val in zip(data, ub.tolist()):
+                v.upper = None if val != val else val
+
+    def _bounds_arrays(self, data):
+        # Note: numpy converts None to NaN
+        lb = np.array([v.lb for v in data], dtype=float)
+        ub = np.array([v.ub for v in data], dtype=float)
+        return lb, ub
+
+    def _domain_groups(self, data):
+        # Return (domain, [positions in data]) for each distinct domain
+        by_domain = {}
+        for i, v in enumerate(data):
+            _id = id(v._domain)
+            if _id in by_domain:
+                by_domain[_id][1].append(i)
+            else:
+                by_domain[_id] = (v._domain, [i])
+        return by_domain.values()
+
+    def _bulk_var(self, data, i):
+        return data[i]
+
+    def _validate_values_array(self, data, vals):
+        in_domain = vals != vals
+        for domain, idx in self._domain_groups(data):
+            idx = np.array(idx, dtype=np.intp)
+            mask = _in_domain_mask(domain, vals[idx])
+            if mask is None:
+                mask = np.fromiter(
+                    (val in domain for val in vals[idx].tolist()),
+                    dtype=bool,
+                    count=len(idx),
+                )
+            in_domain[idx] |= mask
+        lb, ub = self._bounds_arrays(data)
+        out_of_bounds = (vals < lb) | (vals > ub)
+        for i in np.flatnonzero(~in_domain | out_of_bounds).tolist():
+            v = self._bulk_var(data, i)
+            val = vals[i].item()
+            if not in_domain[i]:
+                logger.warning(
+                    "Setting Var '%s' to a value `%s` (%s) not in domain %s."
+                    % (v.name, val, type(val).__name__, v.domain),
+                    extra={'id': 'W1001'},
+                )
+            else:
+                logger.warning(
+                    "Setting Var '%s' to a numeric value `%s` "
+                    "outside the bounds %s." % (v.name, val, v.bounds),
+                    extra={'id': 'W1002'},
+                )
+
     def get_units(self):
         """Return the units expression for this Var."""
         return self._units
@@ -976,6 +1374,8 @@ class IndexedVar(Var):
                 parent = self.parent_block()
                 for index, vardata in self.items():
                     vardata._domain = domain_rule(parent, index, self)
+            if active_journals:
+                record_change(self)
         except:
             logger.error(
                 "%s is not a valid domain. Variable domains must be an "
@@ -1008,6 +1408,453 @@ class IndexedVar(Var):
             raise
 
 
+class IndexedColumnarVar(IndexedVar):
+    """An array of variables with columnar (array-backed) storage.
+
+    The values, bounds, and fixed / stale flags of all variables in
+    this container are stored in contiguous NumPy arrays.  The
+    :class:`ColumnarVarData` views onto that storage are created (and
+    cached in ``_data``) the first time an element is accessed: until
+    then, the ``_data`` entry for an index is the position of its row.
+    This reduces the memory used by large variables and allows
+    container-level operations (e.g., :meth:`get_values`,
+    :meth:`setlb`, :meth:`fix`) to be vectorized.
+
+    Values and numeric bounds are stored as floats, and NaN is
+    interpreted as ``None``.  Declare using ``Var(..., columnar=True)``.
+
+    """
+
+    _ComponentDataClass = ColumnarVarData
+
+    def __init__(self, *args, **kwargs):
+        self._columns = _VarColumns()
+        super().__init__(*args, **kwargs)
+
+    def construct(self, data=None):
+        """
+        Construct the rows for this variable
+        """
+        if self._constructed:
+            return
+        if self._anonymous_sets is not None:
+            for _set in self._anonymous_sets:
+                _set.construct()
+        if (
+            not self._dense
+            or not self.index_set().isfinite()
+            or (self._rule_init is not None and self._rule_init.contains_indices())
+        ):
+            # Sparse Vars create (and immediately access) the VarData
+            # for each index
+            return super().construct(data)
+        self._constructed = True
+
+        timer = ConstructionTimer(self)
+        if is_debug_set(logger):
+            logger.debug("Constructing Variable %s" % (self.name,))
+
+        index = None
+        try:
+            # We do not (currently) accept data for constructing Variables
+            assert data is None
+
+            indices = list(self.index_set())
+            if not indices:
+                return
+            # As in Var.construct(), initialize the first variable and
+            # then use it as a template for the remaining rows, only
+            # re-calling the rules that are not constant.  This does not
+            # create the ColumnarVarData for the remaining indices.
+            cols = self._columns
+            cols.reserve(cols.size + len(indices))
+            ref = self._getitem_when_not_present(indices[0])
+            start = cols.size
+            cols.size = start + len(indices) - 1
+            rows = range(start, cols.size)
+            cols.copy_row(ref._pos, rows)
+            for pos, index in zip(rows, indices[1:]):
+                cols.index[pos] = index
+            self._data.update(zip(indices[1:], rows))
+            index = None
+
+            block = self.parent_block()
+            call_domain_rule = not self._rule_domain.constant()
+            call_bounds_rule = (
+                self._rule_bounds is not None and not self._rule_bounds.constant()
+            )
+            call_init_rule = self._rule_init is not None and (
+                not self._rule_init.constant()
+                or call_domain_rule
+                or call_bounds_rule
+            )
+            if not (call_domain_rule or call_bounds_rule or call_init_rule):
+                return
+            # Apply the index-specific data through a single (transient)
+            # view, which is only stored in _data while it is in use
+            _data = self._data
+            view = self._row_view(start)
+            for pos, index in zip(rows, indices[1:]):
+                view._pos = pos
+                view._index = index
+                _data[index] = view
+                # We can directly set the attributes (not the
+                # properties): the SetInitializer ensures that the
+                # domain is a proper Set, and the bounds are processed
+                # here as in the VarData.lower / upper setters
+                if call_domain_rule:
+                    view._domain = self._rule_domain(block, index, self)
+                if call_bounds_rule:
+                    lb, ub = self._rule_bounds(block, index)
+                    view._lb = view._process_bound(lb, 'lower')
+                    view._ub = view._process_bound(ub, 'upper')
+                if call_init_rule:
+                    view.set_value(self._rule_init(block, index))
+                _data[index] = pos
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when initializing variable for "
+                "Var %s with index %s:\n%s: %s"
+                % (self.name, str(index), type(err).__name__, err)
+            )
+            raise
+        finally:
+            timer.report()
+
+    def clear(self):
+        """Clear the data in this component"""
+        super().clear()
+        self._columns = _VarColumns()
+
+    def _row_view(self, pos):
+        # Return a new ColumnarVarData for the row at `pos`
+        obj = ColumnarVarData.__new__(ColumnarVarData)
+        obj._component = weakref_ref(self)
+        obj._index = self._columns.index[pos]
+        obj._pos = pos
+        return obj
+
+    def _view(self, pos):
+        # Create (and cache) the ColumnarVarData for the row at `pos`.
+        # This must only be called for rows that do not have one yet.
+        obj = self._row_view(pos)
+        self._data[obj._index] = obj
+        return obj
+
+    def _var_at(self, pos):
+        obj = self._data[self._columns.index[pos]]
+        if obj.__class__ is int:
+            return self._view(obj)
+        return obj
+
+    def _positions(self, objs):
+        # Map _data values (row positions or ColumnarVarData) to positions
+        return np.fromiter(
+            (o if o.__class__ is int else o._pos for o in objs),
+            dtype=np.intp,
+            count=len(objs),
+        )
+
+    def __getitem__(self, args) -> VarData:
+        obj = super().__getitem__(args)
+        if obj.__class__ is int:
+            return self._view(obj)
+        return obj
+
+    def _getitem_when_not_present(self, index):
+        obj = super()._getitem_when_not_present(index)
+        self._columns.index[obj._pos] = obj._index
+        return obj
+
+    def _setitem_impl(self, index, obj, value):
+        if obj.__class__ is int:
+            obj = self._view(obj)
+        return super()._setitem_impl(index, obj, value)
+
+    def __delitem__(self, index):
+        # Deleting an element detaches its ColumnarVarData from the
+        # column arrays: copy the row state into the VarData slots so
+        # that expressions that reference the variable remain valid.
+        if self._constructed:
+            try:
+                obj = self._data.get(index, None)
+            except TypeError:
+                obj = None
+                index = self._processUnhashableIndex(index)
+            if obj is None and index.__class__ is not IndexedComponent_slice:
+                index = self._validate_index(index)
+                if index.__class__ is not IndexedComponent_slice:
+                    obj = self._data.get(index, None)
+            if obj.__class__ is int:
+                obj = self._view(obj)
+            if obj.__class__ is ColumnarVarData:
+                state = (
+                    obj._value,
+                    obj._lb,
+                    obj._ub,
+                    obj._domain,
+                    obj._fixed,
+                    obj._stale,
+                )
+                obj.__class__ = _DetachedColumnarVarData
+                (
+                    obj._value,
+                    obj._lb,
+                    obj._ub,
+                    obj._domain,
+                    obj._fixed,
+                    obj._stale,
+                ) = state
+        super().__delitem__(index)
+
+    def _create_objects_for_deepcopy(self, memo, component_list):
+        _new = self.__class__.__new__(self.__class__)
+        _ans = memo.setdefault(id(self), _new)
+        if _ans is _new:
+            component_list.append(self)
+            # Pre-emptively clone the ColumnarVarData objects (see
+            # IndexedComponent._create_objects_for_deepcopy).  Rows
+            # without a ColumnarVarData are stored as (int) positions.
+            _src = self._data
+            memo[id(_src)] = _new._data = _data = {}
+            for idx, obj in _src.items():
+                if obj.__class__ is not int:
+                    obj = obj._create_objects_for_deepcopy(memo, component_list)
+                _data[fast_deepcopy(idx, memo)] = obj
+        return _ans
+
+    def _update_stale(self, pos):
+        # Vectorized equivalent of calling StaleFlagManager.get_flag()
+        # for each updated variable
+        cols = self._columns
+        flag = StaleFlagManager.get_flag(0)
+        if (cols.stale[pos] == flag).any():
+            flag = StaleFlagManager.get_flag(flag)
+        cols.stale[pos] = flag
+
+    def _values_updated(self, pos):
+        # Vectorized equivalent of the notifications in
+        # VarData.set_value(): the values of fixed variables can change
+        # the degree / fixed status of expressions (e.g., 0*x)
+        fixed = self._columns.fixed[pos]
+        if fixed.any():
+            StructureCache.mutated()
+            if active_journals:
+                for p in pos[fixed].tolist():
+                    record_change(self._var_at(p))
+
+    def _fixed_updated(self):
+        # Vectorized equivalent of the notification in the
+        # VarData.fixed setter
+        StructureCache.mutated()
+
+    def flag_as_stale(self):
+        """
+        Set the 'stale' attribute of every variable data object to True.
+        """
+        cols = self._columns
+        cols.stale[: cols.size] = 0
+
+    def get_values(self, include_fixed_values=True):
+        """
+        Return a dictionary of index-value pairs.
+        """
+        cols = self._columns
+        keys = list(self._data)
+        pos = self._positions(self._data.values())
+        if not include_fixed_values:
+            free = ~cols.fixed[pos]
+            keys = [k for k, f in zip(keys, free.tolist()) if f]
+            pos = pos[free]
+        return {
+            k: None if v != v else (int(v) if i else v)
+            for k, v, i in zip(
+                keys, cols.value[pos].tolist(), cols.int_value[pos].tolist()
+            )
+        }
+
+    extract_values = get_values
+
+    def set_values(self, new_values, skip_validation=False):
+        """
+        Set the values of a dictionary.
+
+        The default behavior is to validate the values in the
+        dictionary.  If ``skip_validation`` is True and all values are
+        native numeric values, the values are assigned in a single
+        (vectorized) operation.
+        """
+        if skip_validation:
+            try:
+                vals = np.fromiter(
+                    new_values.values(), dtype=float, count=len(new_values)
+                )
+            except TypeError:
+                # Non-numeric data (e.g., None or expressions)
+                pass
+            else:
+                pos = self._bulk_data(new_values)
+                self._columns.value[pos] = vals
+                self._columns.int_value[pos] = np.fromiter(
+                    (v.__class__ is int for v in new_values.values()),
+                    dtype=bool,
+                    count=len(new_values),
+                )
+                self._update_stale(pos)
+                self._values_updated(pos)
+                return
+        super().set_values(new_values, skip_validation)
+
+    def _bulk_data(self, indices):
+        # The array API for columnar Vars operates on row positions
+        # (and does not create the ColumnarVarData objects)
+        _data = self._data
+        if indices is None:
+            return self._positions([_data[idx] for idx in self.keys()])
+        objs = []
+        for idx in indices:
+            try:
+                obj = _data[idx]
+            except (KeyError, TypeError):
+                obj = self[idx]
+            objs.append(obj)
+        return self._positions(objs)
+
+    def _domain_groups(self, pos):
+        cols = self._columns
+        if not cols.domains:
+            return ((cols.domain, range(len(pos))),) if len(pos) else ()
+        return super()._domain_groups([self._row_view(p) for p in pos.tolist()])
+
+    def _bulk_var(self, pos, i):
+        return self._var_at(pos[i])
+
+    def get_values_array(self, indices=None):
+        return self._columns.value[self._bulk_data(indices)]
+
+    get_values_array.__doc__ = Var.get_values_array.__doc__
+
+    def _store_values_array(self, pos, vals):
+        self._columns.value[pos] = vals
+        self._columns.int_value[pos] = False
+        self._update_stale(pos)
+        # Clearing a value marks the variable as stale
+        self._columns.stale[pos[vals != vals]] = 0
+        self._values_updated(pos)
+
+    def _store_bounds_array(self, pos, lb, ub):
+        cols = self._columns
+        for arr, is_int, exprs, val in (
+            (cols.lb, cols.int_lb, cols.lb_expr, lb),
+            (cols.ub, cols.int_ub, cols.ub_expr, ub),
+        ):
+            if val is None:
+                continue
+            arr[pos] = val
+            is_int[pos] = False
+            if exprs:
+                for p in pos.tolist():
+                    exprs.pop(p, None)
+        if active_journals and (lb is not None or ub is not None):
+            for p in pos.tolist():
+                record_change(self._var_at(p))
+
+    def _bounds_arrays(self, pos):
+        cols = self._columns
+        if cols.lb_expr or cols.ub_expr or cols.domains or not len(pos):
+            # Evaluate the bounds through (transient) views
+            return super()._bounds_arrays([self._row_view(p) for p in pos.tolist()])
+        domain = cols.domain
+        lb = cols.lb[pos]
+        ub = cols.ub[pos]
+        # The effective bounds are the tighter of the domain and
+        # variable bounds (fmax / fmin ignore NaN, i.e., None)
+        dlb, dub = domain.bounds()
+        if dlb is not None:
+            lb = np.fmax(lb, dlb)
+        if dub is not None:
+            ub = np.fmin(ub, dub)
+        return lb, ub
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable.
+        """
+        if val is None or val.__class__ in native_numeric_types:
+            cols = self._columns
+            cols.set('lb', slice(0, cols.size), val)
+            cols.lb_expr.clear()
+            if active_journals:
+                record_change(self)
+        else:
+            super().setlb(val)
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable.
+        """
+        if val is None or val.__class__ in native_numeric_types:
+            cols = self._columns
+            cols.set('ub', slice(0, cols.size), val)
+            cols.ub_expr.clear()
+            if active_journals:
+                record_change(self)
+        else:
+            super().setub(val)
+
+    def fix(self, value=NOTSET, skip_validation=False):
+        """Fix all variables in this :class:`IndexedColumnarVar`
+
+        This sets the :attr:`fixed` indicator to True for every variable
+        in this IndexedVar.  If ``value`` is provided, the value (and
+        the ``skip_validation`` flag) are first passed to
+        :meth:`set_value`.
+
+        """
+        cols = self._columns
+        if value is NOTSET:
+            cols.fixed[: cols.size] = True
+        elif value.__class__ in native_numeric_types:
+            pos = self._bulk_data(None)
+            if not skip_validation:
+                self._validate_values_array(pos, np.full(len(pos), value, float))
+            cols.fixed[pos] = True
+            cols.set('value', pos, value)
+            self._update_stale(pos)
+        else:
+            super().fix(value, skip_validation)
+            return
+        self._fixed_updated()
+        if active_journals:
+            record_change(self)
+
+    def unfix(self):
+        """Unfix all variables in this :class:`IndexedColumnarVar`
+
+        This sets the :attr:`VarData.fixed` indicator to False for
+        every variable in this :class:`IndexedColumnarVar`.
+
+        """
+        cols = self._columns
+        cols.fixed[: cols.size] = False
+        self._fixed_updated()
+        if active_journals:
+            record_change(self)
+
+    def _pprint(self):
+        headers, _, labels, fcn = super()._pprint()
+        return (
+            headers,
+            (
+                (k, self._row_view(v) if v.__class__ is int else v)
+                for k, v in self._data.items()
+            ),
+            labels,
+            fcn,
+        )
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
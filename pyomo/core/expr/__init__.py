@@ -153,6 +153,7 @@ from .relational_expr import (
     NotEqualExpression,
     inequality,
 )
+from .structure_cache import structure_cache
 from .symbol_map import SymbolMap
 from .template_expr import (
     GetItemExpression,
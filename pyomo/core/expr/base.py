@@ -10,7 +10,10 @@
 #  ___________________________________________________________________________
 
 import enum
+import inspect
+from itertools import islice
 
+from pyomo.common.autoslots import fast_deepcopy, _atomic_types, _deepcopy_mapper
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.numeric_types import native_types
 from pyomo.core.pyomoobject import PyomoObject
@@ -263,6 +266,13 @@ class ExpressionBase(PyomoObject):
             classtype = self.__class__
         return classtype(args)
 
+    def __deepcopy__(self, memo):
+        # Expression trees can be arbitrarily deep: the generic
+        # (recursive, reduce-based) deepcopy can exceed the recursion
+        # limit (and Block.clone() would then silently drop the
+        # expression), so copy the tree in a single non-recursive pass.
+        return _deepcopy_expression(self, memo)
+
     def is_constant(self):
         """Return True if this expression is an atomic constant
 
@@ -450,3 +460,191 @@ class ExpressionArgs_Mixin(object):
             tree immutability.
         """
         return self._args_
+
+
+_NOT_IN_MEMO = object()
+# Map of expression node class to the function that builds a copy of a
+# node from its (copied) children, or None for classes that are not
+# copied by _deepcopy_expression() (leaves, named expressions, etc.)
+_expression_node_copiers = {}
+
+
+def _get_expression_node_copier(cls):
+    """Return (and cache) the function that copies instances of cls
+
+    The copier has the signature ``copier(node, args, changed,
+    duplicate, memo)``, where ``args`` is the list of the (already
+    copied) child nodes and ``changed`` is True if any of the children
+    differ from the originals.  The remaining slots are deepcopied
+    through the ``memo``.  If neither the children nor any of the slots
+    changed, the (immutable) node is returned instead of a copy unless
+    ``duplicate`` is True.
+
+    The copier is generated for each class so that the slots are
+    accessed directly.  Classes that override ``__deepcopy__`` or do
+    not store their children in an ``_args_`` slot map to None.
+
+    """
+    if (
+        not issubclass(cls, ExpressionBase)
+        or cls.__deepcopy__ is not ExpressionBase.__deepcopy__
+        or not inspect.ismemberdescriptor(getattr(cls, '_args_', None))
+    ):
+        _expression_node_copiers[cls] = None
+        return None
+    slots = []
+    for c in reversed(cls.__mro__):
+        for slot in c.__dict__.get('__slots__', ()):
+            if slot not in slots and slot not in ('_args_', '__weakref__', '__dict__'):
+                slots.append(slot)
+    if cls.__setattr__ is object.__setattr__:
+
+        def set_slot(slot, val):
+            return f"    ans.{slot} = {val}"
+
+    else:
+
+        def set_slot(slot, val):
+            return f"    setter(ans, {slot!r}, {val})"
+
+    lines = [
+        "def copier(node, args, changed, duplicate, memo):",
+        "    if node._args_.__class__ is not list:",
+        "        # Like deepcopy(), preserve tuples whose members are unchanged",
+        "        args = tuple(args) if changed else node._args_",
+    ]
+    for i, slot in enumerate(slots):
+        lines.extend(
+            [
+                f"    s{i} = node.{slot}",
+                f"    if s{i}.__class__ not in atomic_types:",
+                f"        val = fast_deepcopy(s{i}, memo)",
+                f"        if val is not s{i}:",
+                f"            s{i} = val",
+                "            changed = True",
+            ]
+        )
+    if cls.__dictoffset__:
+        lines.extend(
+            [
+                "    if hasattr(node, '__dict__'):",
+                "        fields = fast_deepcopy(node.__dict__, memo)",
+                "        changed = True",
+            ]
+        )
+    lines.extend(
+        [
+            "    if not changed and not duplicate:",
+            "        return node",
+            "    ans = cls.__new__(cls)",
+            set_slot('_args_', "args"),
+        ]
+    )
+    lines.extend(set_slot(slot, f"s{i}") for i, slot in enumerate(slots))
+    if cls.__dictoffset__:
+        lines.extend(
+            ["    if hasattr(node, '__dict__'):", "        ans.__dict__.update(fields)"]
+        )
+    lines.append("    return ans")
+    ns = {
+        'cls': cls,
+        'atomic_types': _atomic_types,
+        'fast_deepcopy': fast_deepcopy,
+        'setter': object.__setattr__,
+    }
+    exec('\n'.join(lines), ns)
+    ans = _expression_node_copiers[cls] = ns['copier']
+    # Route fast_deepcopy() directly to the expression copier (and
+    # avoid the overhead of copy.deepcopy())
+    _deepcopy_mapper[cls] = _deepcopy_expression_mapper
+    return ans
+
+
+def _deepcopy_expression_slots(expr, memo):
+    cls = expr.__class__
+    memo[id(expr)] = ans = cls.__new__(cls)
+    setter = object.__setattr__
+    for c in reversed(cls.__mro__):
+        for slot in c.__dict__.get('__slots__', ()):
+            if slot in ('__weakref__', '__dict__') or not hasattr(expr, slot):
+                continue
+            setter(ans, slot, fast_deepcopy(getattr(expr, slot), memo))
+    if hasattr(expr, '__dict__'):
+        ans.__dict__.update(fast_deepcopy(expr.__dict__, memo))
+    return ans
+
+
+def _deepcopy_expression_mapper(expr, memo, _id):
+    return _deepcopy_expression(expr, memo)
+
+
+def _deepcopy_expression(expr, memo):
+    """Deepcopy an expression tree without recursion
+
+    This walks the tree depth-first using an explicit stack, remapping
+    each leaf (Vars, Params, named expressions, etc.) through the
+    ``memo`` (so components within the scope of a ``Block.clone()``
+    point to their clones) and then rebuilding the interior nodes
+    bottom-up.  Within ``Block.clone()`` (which sets
+    ``'__share_expressions__'`` in the memo), subtrees that do not
+    reference anything that is copied (e.g., constant subexpressions or
+    subexpressions that only refer to components outside the scope of
+    the clone) are immutable and are reused instead of duplicated.
+    Unlike the generic :py:func:`copy.deepcopy`, this does not recurse,
+    so arbitrarily deep expressions can be copied.
+
+    """
+    # Nodes are always duplicated unless sharing was requested
+    duplicate = '__share_expressions__' not in memo
+    memo_get = memo.get
+    copiers_get = _expression_node_copiers.get
+    copier = copiers_get(expr.__class__, _NOT_IN_MEMO)
+    if copier is _NOT_IN_MEMO:
+        copier = _get_expression_node_copier(expr.__class__)
+    if copier is None:
+        # This node does not store its children in _args_: copy all
+        # slots (recursing through fast_deepcopy as necessary)
+        return _deepcopy_expression_slots(expr, memo)
+
+    stack = []
+    node = expr
+    args = node._args_
+    args = iter(args) if args.__class__ is tuple else islice(args, node.nargs())
+    new_args = []
+    changed = False
+    while 1:
+        for arg in args:
+            if arg.__class__ in native_types:
+                new_args.append(arg)
+                continue
+            new_arg = memo_get(id(arg), _NOT_IN_MEMO)
+            if new_arg is _NOT_IN_MEMO:
+                arg_copier = copiers_get(arg.__class__, _NOT_IN_MEMO)
+                if arg_copier is _NOT_IN_MEMO:
+                    arg_copier = _get_expression_node_copier(arg.__class__)
+                if arg_copier is not None:
+                    # Descend into this child node
+                    stack.append((node, args, new_args, changed, copier))
+                    node = arg
+                    args = arg._args_
+                    if args.__class__ is tuple:
+                        args = iter(args)
+                    else:
+                        args = islice(args, arg.nargs())
+                    new_args = []
+                    changed = False
+                    copier = arg_copier
+                    break
+                new_arg = fast_deepcopy(arg, memo)
+            if new_arg is not arg:
+                changed = True
+            new_args.append(new_arg)
+        else:
+            ans = memo[id(node)] = copier(node, new_args, changed, duplicate, memo)
+            if not stack:
+                return ans
+            child = node
+            node, args, new_args, changed, copier = stack.pop()
+            if ans is not child:
+                changed = True
+            new_args.append(ans)
@@ -0,0 +1,102 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+class _StructureCache(object):
+    """Cache for structural queries on expression trees
+
+    The results of :func:`polynomial_degree()` and ``is_fixed()`` on
+    an expression depend on the structure of the expression tree (which
+    is immutable), the fixed status of the Vars in the tree, the values
+    of fixed Vars and mutable Params (e.g., ``0*x`` is fixed), and the
+    definition of any named Expressions in the tree.
+
+    The cache is disabled by default (see :class:`structure_cache`).
+    While enabled, the results of the queries are stored for each
+    expression node (by ``id()``; the cache holds a reference to the
+    node so that the id cannot be reused).  All cached results are
+    invalidated by advancing the global model mutation epoch, which
+    happens whenever a Var or BooleanVar is fixed or unfixed, the value
+    of a fixed Var or a mutable Param is changed, or a named Expression
+    is redefined (through the component APIs).
+
+    """
+
+    __slots__ = ('epoch', 'enabled', '_valid_epoch', 'polynomial_degree', 'is_fixed')
+
+    def __init__(self):
+        self.epoch = 0
+        # Nesting depth of the active structure_cache contexts
+        self.enabled = 0
+        self._valid_epoch = 0
+        self.polynomial_degree = {}
+        self.is_fixed = {}
+
+    def mutated(self):
+        """Advance the global model mutation epoch
+
+        This invalidates all cached structural query results.
+
+        """
+        self.epoch += 1
+
+    def clear(self):
+        """Remove all cached results"""
+        self._valid_epoch = self.epoch
+        self.polynomial_degree.clear()
+        self.is_fixed.clear()
+
+    def query(self, table, node, fcn):
+        """Return ``fcn(node)``, using the cached result if it is valid"""
+        if self._valid_epoch != self.epoch:
+            self.clear()
+        ans = table.get(id(node), None)
+        if ans is not None:
+            return ans[1]
+        result = fcn(node)
+        table[id(node)] = node, result
+        return result
+
+
+StructureCache = _StructureCache()
+
+
+class structure_cache(object):
+    """Context manager that enables caching of structural queries
+
+    Within this context, repeated calls to :func:`polynomial_degree()`
+    and ``is_fixed()`` for an unchanged expression return the
+    previously computed result (without walking the expression tree).
+    Contexts may be nested; the cache is cleared when the outermost
+    context exits.
+
+    Note that cached results are only invalidated by changes made
+    through the component APIs (e.g., :meth:`VarData.fix()`,
+    :meth:`ParamData.set_value()`, or :meth:`ExpressionData.set_value()`).
+
+    Example::
+
+        with structure_cache():
+            nonlinear = [
+                c for c in model.component_data_objects(Constraint)
+                if c.body.polynomial_degree() not in (0, 1)
+            ]
+
+    """
+
+    def __enter__(self):
+        StructureCache.enabled += 1
+        return self
+
+    def __exit__(self, et, ev, tb):
+        StructureCache.enabled -= 1
+        if not StructureCache.enabled:
+            StructureCache.clear()
@@ -577,7 +577,8 @@ class IndexTemplate(NumericValue):
         if self._value is _NotSpecified:
             if exception:
                 raise TemplateExpressionError(
-                    self, "Evaluating uninitialized IndexTemplate (%s)" % (self,)
+                    self,
+                    "Evaluating uninitialized IndexTemplate (%s)" % (self.getname(),),
                 )
             return None
         else:
@@ -603,6 +604,12 @@ class IndexTemplate(NumericValue):
         return False
 
     def __str__(self):
+        context = _TemplateIterManager.context
+        if context is not None:
+            # The rule is converting the index to a string (e.g.,
+            # str(i) or f"{i}"): the result does not depend on the
+            # index value, so the template is not faithful to the rule
+            context.string_conversions += 1
         return self.getname()
 
     def getname(self, fully_qualified=False, name_buffer=None, relative_to=None):
@@ -1022,6 +1029,8 @@ class _template_iter_context(object):
         self.cache = []
         self._id = 0
         self._group = 0
+        # Number of times an IndexTemplate was converted to a string
+        self.string_conversions = 0
 
     def get_iter(self, _set):
         return _set_iterator_template_generator(_set, self)
@@ -1124,10 +1133,11 @@ class _template_iter_manager(object):
 _TemplateIterManager = _template_iter_manager()
 
 
-def templatize_rule(block, rule, index_set):
+def templatize_rule(block, rule, index_set, context=None):
     import pyomo.core.base.set
 
-    context = _template_iter_context()
+    if context is None:
+        context = _template_iter_context()
     internal_error = None
     try:
         # Override Set iteration to return IndexTemplates
@@ -1176,8 +1186,10 @@ def templatize_rule(block, rule, index_set):
     return None, indices
 
 
-def templatize_constraint(con):
-    expr, indices = templatize_rule(con.parent_block(), con.rule, con.index_set())
+def templatize_constraint(con, context=None):
+    expr, indices = templatize_rule(
+        con.parent_block(), con.rule, con.index_set(), context
+    )
     if expr.__class__ is tuple:
         expr = tuple_to_relational_expr(expr)
     return expr, indices
@@ -15,6 +15,7 @@ import logging
 import sys
 from copy import deepcopy
 from collections import deque
+from itertools import repeat
 
 logger = logging.getLogger('pyomo.core')
 
@@ -27,6 +28,7 @@ from pyomo.common.numeric_types import (
     value,
 )
 import pyomo.core.expr.expr_common as common
+from pyomo.core.expr.structure_cache import StructureCache
 from pyomo.core.expr.symbol_map import SymbolMap
 
 try:
@@ -78,6 +80,217 @@ class RevertToNonrecursive(Exception):
 # -------------------------------------------------------
 
 
+def _compile_nonrecursive_walker(callbacks):
+    """Generate a nonrecursive walker loop specialized for `callbacks`
+
+    `callbacks` is the string of StreamBasedExpressionVisitor
+    callback codes (see ``client_methods``) defined by the visitor.
+    The generated function walks the expression using an explicit
+    stack (stored in preallocated, reusable lists) and only contains
+    the logic for the callbacks that are actually defined: for
+    example, when ``beforeChild`` or ``acceptChildResult`` are not
+    defined, the corresponding calls (and the child index bookkeeping)
+    are removed from the loop entirely.  Compiled walkers are cached
+    by `callbacks`.
+
+    """
+    if callbacks in _compiled_walkers:
+        return _compiled_walkers[callbacks]
+    enter, exit_, before, after, accept, final = (c in callbacks for c in 'exbacf')
+    track_idx = before or after or accept
+    lines = []
+
+    def emit(level, *code):
+        lines.extend('    ' * level + line for line in code)
+
+    def emit_enter(level):
+        # Enter "child" and make it the current node
+        if enter:
+            emit(
+                level,
+                "tmp = enterNode(child)",
+                "if tmp is None:",
+                "    args = data = None",
+                "else:",
+                "    args, data = tmp",
+                "if args is None:",
+                "    if child.__class__ in nonpyomo_leaf_types"
+                " or not child.is_expression_type():",
+                "        args = ()",
+                "    else:",
+                "        args = child.args",
+                "if hasattr(args, '__enter__'):",
+                "    args.__enter__()",
+                "it = iter(args)",
+            )
+        else:
+            emit(level, "data = []", "it = iter(child.args)")
+        if track_idx:
+            emit(level, "idx = -1")
+        emit(level, "node = child")
+
+    def emit_accept(level, result):
+        if accept:
+            emit(level, f"data = acceptChildResult(node, data, {result}, idx)")
+        elif enter:
+            emit(level, "if data is not None:", f"    data.append({result})")
+        else:
+            emit(level, f"data.append({result})")
+        if after:
+            emit(level, "afterChild(node, child, idx)")
+
+    def emit_leaf_result(level, leaf):
+        emit(level, f"result = exitNode({leaf}, [])" if exit_ else "result = []")
+
+    def emit_return(level):
+        emit(level, "return finalizeResult(result)" if final else "return result")
+
+    emit(0, "def walker(self, child):")
+    emit(
+        1,
+        *(
+            f"{name} = self.{name}"
+            for code, name in (
+                ('e', 'enterNode'),
+                ('x', 'exitNode'),
+                ('b', 'beforeChild'),
+                ('a', 'afterChild'),
+                ('c', 'acceptChildResult'),
+                ('f', 'finalizeResult'),
+            )
+            if code in callbacks
+        ),
+    )
+    if not enter:
+        # Leaves can be processed without touching the stack
+        emit(
+            1,
+            "if child.__class__ in nonpyomo_leaf_types"
+            " or not child.is_expression_type():",
+        )
+        emit_leaf_result(2, 'child')
+        emit_return(2)
+    emit(
+        1,
+        "stack = self._walker_stack",
+        "if stack is None:",
+        "    stack = _new_walker_stack()",
+        "else:",
+        "    self._walker_stack = None",
+        "nodes, iters, datas, idxs, argss = stack",
+        "size = len(nodes)",
+        "high = sp = 0",
+    )
+    if enter:
+        emit(1, "args = ()")
+    emit(1, "try:")
+    emit_enter(2)
+    emit(2, "while 1:", "    for child in it:")
+    if track_idx:
+        emit(4, "idx += 1")
+    if before:
+        emit(
+            4,
+            "tmp = beforeChild(node, child, idx)",
+            "if tmp is not None:",
+            "    descend, child_result = tmp",
+            "    if not descend:",
+        )
+        emit_accept(6, "child_result")
+        emit(6, "continue")
+    if not enter:
+        emit(
+            4,
+            "if child.__class__ in nonpyomo_leaf_types"
+            " or not child.is_expression_type():",
+        )
+        emit_leaf_result(5, 'child')
+        emit_accept(5, "result")
+        emit(5, "continue")
+    emit(
+        4,
+        "if sp >= high:",
+        "    if sp == size:",
+        "        size *= 2",
+        "        for _l in stack:",
+        "            _l.extend(repeat(None, size - len(_l)))",
+        "    high = sp + 1",
+        "nodes[sp] = node",
+        "iters[sp] = it",
+        "datas[sp] = data",
+    )
+    if track_idx:
+        emit(4, "idxs[sp] = idx")
+    if enter:
+        # (args is cleared so that it is not exited twice should
+        # enterNode() raise an exception)
+        emit(4, "argss[sp] = args", "args = ()")
+    emit(4, "sp += 1")
+    emit_enter(4)
+    emit(4, "break")
+    emit(3, "else:")
+    if enter:
+        emit(
+            4,
+            "if hasattr(args, '__exit__'):",
+            "    args.__exit__(None, None, None)",
+            "    args = ()",
+        )
+    emit(4, "result = exitNode(node, data)" if exit_ else "result = data")
+    emit(4, "if not sp:")
+    emit_return(5)
+    emit(
+        4,
+        "sp -= 1",
+        "child = node",
+        "node = nodes[sp]",
+        "it = iters[sp]",
+        "data = datas[sp]",
+    )
+    if track_idx:
+        emit(4, "idx = idxs[sp]")
+    if enter:
+        emit(4, "args = argss[sp]")
+    emit_accept(4, "result")
+    if enter:
+        emit(
+            1,
+            "except BaseException:",
+            "    if hasattr(args, '__exit__'):",
+            "        args.__exit__(None, None, None)",
+            "    for args in argss[:sp]:",
+            "        if hasattr(args, '__exit__'):",
+            "            args.__exit__(None, None, None)",
+            "    raise",
+        )
+    emit(
+        1,
+        "finally:",
+        "    # Release the references held by the stack and return it",
+        "    # to the visitor for reuse",
+        "    for _l in stack:",
+        "        _l[:high] = repeat(None, high)",
+        "    self._walker_stack = stack",
+    )
+    ns = {
+        'nonpyomo_leaf_types': nonpyomo_leaf_types,
+        'repeat': repeat,
+        '_new_walker_stack': _new_walker_stack,
+    }
+    exec('\n'.join(lines), ns)
+    ans = _compiled_walkers[callbacks] = ns['walker']
+    return ans
+
+
+def _new_walker_stack():
+    return tuple([None] * 32 for _ in range(5))
+
+
+# Cache of the compiled nonrecursive walkers, keyed by the set of
+# callbacks defined on the visitor
+_compiled_walkers = {}
+
+
 class StreamBasedExpressionVisitor(object):
     """This class implements a generic stream-based expression walker.
 
@@ -253,6 +466,13 @@ class StreamBasedExpressionVisitor(object):
         self._process_node = getattr(
             self, recursive_node_handler, self._process_node_general
         )
+        # Set up the compiled nonrecursive walker (which also
+        # specializes on finalizeResult)
+        walker_key = recursive_node_handler[len('_process_node_') :]
+        if self.finalizeResult is not None:
+            walker_key += 'f'
+        self._walker = _compile_nonrecursive_walker(walker_key)
+        self._walker_stack = None
 
     def walk_expression(self, expr):
         """Walk an expression, calling registered callbacks.
@@ -507,13 +727,27 @@ class StreamBasedExpressionVisitor(object):
         """Nonrecursively walk an expression, calling registered callbacks.
 
         This routine is safer than the recursive walkers for deep (or
-        unbalanced) trees.  It is, however, slightly slower than the
-        recursive implementations.
+        unbalanced) trees.  The walker is generated (and cached) when
+        the visitor is constructed, specialized for the set of
+        callbacks that the visitor actually defines, and maintains an
+        explicit stack in preallocated lists that are reused across
+        calls (see :py:func:`_compile_nonrecursive_walker`).
 
         """
+        if self.initializeWalker is not None:
+            walk, result = self.initializeWalker(expr)
+            if not walk:
+                return result
+            elif result is not None:
+                expr = result
+        return self._walker(self, expr)
+
+    def _nonrecursive_walker_loop(self, ptr):
         #
-        # This walker uses a linked list to store the stack (instead of
-        # an array).  The nodes of the linked list are 6-member tuples:
+        # This loop is used to resume a walk when the recursive walker
+        # reverts to a nonrecursive walker (RevertToNonrecursive).  It
+        # uses a linked list to store the stack (instead of an array).
+        # The nodes of the linked list are 6-member tuples:
         #
         #    ( pointer to parent,
         #      expression node,
@@ -526,37 +760,6 @@ class StreamBasedExpressionVisitor(object):
         # (ptr).  The beginning of the list is indicated by a None
         # parent pointer.
         #
-        if self.initializeWalker is not None:
-            walk, result = self.initializeWalker(expr)
-            if not walk:
-                return result
-            elif result is not None:
-                expr = result
-        if self.enterNode is not None:
-            tmp = self.enterNode(expr)
-            if tmp is None:
-                args = data = None
-            else:
-                args, data = tmp
-        else:
-            args = None
-            data = []
-        if args is None:
-            if type(expr) in nonpyomo_leaf_types or not expr.is_expression_type():
-                args = ()
-            else:
-                args = expr.args
-        if hasattr(args, '__enter__'):
-            args.__enter__()
-        node = expr
-        # Note that because we increment child_idx just before fetching
-        # the child node, it must be initialized to -1, and ptr[3] must
-        # always be *one less than* the number of arguments
-        return self._nonrecursive_walker_loop(
-            (None, node, args, len(args) - 1, data, -1)
-        )
-
-    def _nonrecursive_walker_loop(self, ptr):
         _, node, args, _, data, child_idx = ptr
         try:
             while 1:
@@ -1589,6 +1792,14 @@ def polynomial_degree(node):
         A non-negative integer that is the polynomial
         degree if the expression is polynomial, or :const:`None` otherwise.
     """
+    if StructureCache.enabled:
+        return StructureCache.query(
+            StructureCache.polynomial_degree, node, _polynomial_degree
+        )
+    return _polynomial_degree(node)
+
+
+def _polynomial_degree(node):
     visitor = _PolynomialDegreeVisitor()
     return visitor.dfs_postorder_stack(node)
 
@@ -1636,6 +1847,12 @@ def _expression_is_fixed(node):
     Returns: bool
 
     """
+    if StructureCache.enabled:
+        return StructureCache.query(StructureCache.is_fixed, node, _is_fixed)
+    return _is_fixed(node)
+
+
+def _is_fixed(node):
     visitor = _IsFixedVisitor()
     return visitor.dfs_postorder_stack(node)
 
@@ -0,0 +1,246 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from pyomo.common.config import ConfigDict, ConfigValue, document_kwargs_from_configdict
+from pyomo.common.modeling import unique_component_name
+from pyomo.core.base import (
+    Block,
+    Constraint,
+    Expression,
+    Objective,
+    TransformationFactory,
+)
+from pyomo.core.expr import ExpressionType, MonomialTermExpression
+from pyomo.core.expr.compare import handler
+from pyomo.core.expr.numvalue import native_types, polynomial_degree
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+from pyomo.core.plugins.transform.hierarchy import Transformation
+
+
+class _StructureHasher(StreamBasedExpressionVisitor):
+    """Assign structural ids to the subtrees of a set of expressions
+
+    Every distinct expression structure is assigned an integer
+    structural id ("sid").  Leaves are identified by identity (Vars,
+    Params, and named Expressions, which are not entered) or by value
+    (native constants).  Interior nodes are identified by the signature
+    generated by :py:mod:`pyomo.core.expr.compare` (the node type,
+    number of arguments and function name) together with the sids of
+    their arguments, so hashing each node is independent of the size
+    of the subtree below it.  As sids are assigned in postorder, the
+    sids of the arguments are always smaller than the sid of the node.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        # structural key -> sid
+        self.sid = {}
+        # sid -> representative node (or leaf)
+        self.node = []
+        # sid -> tuple of argument sids (None for leaves)
+        self.args = []
+        # sid -> polynomial degree
+        self.degree = []
+        # id(node) -> sid for nodes that were already hashed
+        self._seen = {}
+
+    def _record(self, key, node, args, degree):
+        sid = self.sid.get(key, None)
+        if sid is None:
+            sid = self.sid[key] = len(self.node)
+            self.node.append(node)
+            self.args.append(args)
+            self.degree.append(degree)
+        return sid
+
+    def _leaf(self, node):
+        if node.__class__ in native_types:
+            # As in polynomial_degree(), all native constants (including
+            # non-numeric ones like bool) have degree 0
+            return self._record((node.__class__, node), node, None, 0)
+        key = id(node)
+        if key in self.sid:
+            return self.sid[key]
+        return self._record(key, node, None, polynomial_degree(node))
+
+    def initializeWalker(self, expr):
+        if (
+            expr.__class__ in native_types
+            or not expr.is_expression_type()
+            or expr.is_named_expression_type()
+        ):
+            return False, self._leaf(expr)
+        if id(expr) in self._seen:
+            return False, self._seen[id(expr)]
+        return True, None
+
+    def beforeChild(self, node, child, child_idx):
+        if (
+            child.__class__ in native_types
+            or not child.is_expression_type()
+            or child.is_named_expression_type()
+        ):
+            return False, self._leaf(child)
+        if id(child) in self._seen:
+            return False, self._seen[id(child)]
+        return True, None
+
+    def enterNode(self, node):
+        data = []
+        args = handler[node.__class__](node, data)
+        strict = getattr(node, '_strict', None)
+        if strict is not None:
+            data.append(strict)
+        return args, data
+
+    def exitNode(self, node, data):
+        # data is the node signature followed by the argument sids
+        args = tuple(data[len(data) - node.nargs() :])
+        key = tuple(data)
+        sid = self.sid.get(key, None)
+        if sid is None:
+            degree = node._compute_polynomial_degree([self.degree[i] for i in args])
+            sid = self._record(key, node, args, degree)
+        self._seen[id(node)] = sid
+        return sid
+
+
+@TransformationFactory.register(
+    'core.eliminate_common_subexpressions',
+    doc="Replace repeated (structurally identical) subexpressions "
+    "with shared named Expressions.",
+)
+@document_kwargs_from_configdict('CONFIG')
+class EliminateCommonSubexpressions(Transformation):
+    """Replace repeated subexpressions with shared named Expressions
+
+    This transformation hashes every subtree of the active Constraint
+    and Objective expressions on the model (including subblocks) and
+    replaces subexpressions that appear more than once with references
+    to a new indexed :py:class:`Expression` component declared on the
+    model.  Writers that support defined variables (e.g., the NL
+    writer) then emit each shared subexpression only once.
+
+    Subexpressions are compared structurally: two subtrees are
+    identical if they have the same operators (in the same order) over
+    the same Var / Param / named Expression objects and the same
+    constants.  Named Expressions that already exist on the model are
+    treated as leaves (their definitions are not modified).  A
+    subexpression that only appears within a single larger repeated
+    subexpression is not extracted separately.
+
+    """
+
+    CONFIG = ConfigDict('core.eliminate_common_subexpressions')
+    CONFIG.declare(
+        'nonlinear_only',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description="Only extract nonlinear subexpressions",
+            doc="""
+            If True, only nonlinear (polynomial degree > 1 or
+            nonpolynomial) subexpressions are replaced.  Otherwise,
+            repeated linear subexpressions are also replaced.""",
+        ),
+    )
+    CONFIG.declare(
+        'component_name',
+        ConfigValue(
+            default='_common_subexpressions',
+            domain=str,
+            description="Name of the Expression component for the shared "
+            "subexpressions",
+            doc="""
+            Base name for the indexed Expression component that holds the
+            shared subexpressions (a unique name is generated if the
+            model already has a component with this name).""",
+        ),
+    )
+
+    def _is_candidate(self, node, degree, nonlinear_only):
+        # Constant (degree 0) and single-term subexpressions are never
+        # worth sharing, and only numeric expressions can be shared
+        if degree == 0 or node.__class__ is MonomialTermExpression:
+            return False
+        if nonlinear_only and degree is not None and degree <= 1:
+            return False
+        return node.is_expression_type(ExpressionType.NUMERIC)
+
+    def _apply_to(self, model, **kwds):
+        config = self.CONFIG(kwds.pop('options', {}))
+        config.set_value(kwds)
+
+        roots = []
+        for comp in model.component_data_objects(
+            (Constraint, Objective), active=True, descend_into=Block
+        ):
+            roots.append((comp, comp.expr))
+
+        hasher = _StructureHasher()
+        root_sids = [hasher.walk_expression(expr) for _, expr in roots]
+        node_args = hasher.args
+        n = len(hasher.node)
+
+        # Count the number of times each structure is referenced in the
+        # transformed model.  Sids are assigned in postorder, so
+        # processing them in reverse order visits every structure after
+        # all of its parents.  A structure that is shared is only
+        # written once (so it contributes a single reference to its
+        # arguments).
+        uses = [0] * n
+        for sid in root_sids:
+            uses[sid] += 1
+        shared = set()
+        for sid in range(n - 1, -1, -1):
+            args = node_args[sid]
+            if args is None or not uses[sid]:
+                continue
+            if uses[sid] > 1 and self._is_candidate(
+                hasher.node[sid], hasher.degree[sid], config.nonlinear_only
+            ):
+                shared.add(sid)
+            refs = 1 if sid in shared else uses[sid]
+            for arg in args:
+                uses[arg] += refs
+
+        if not shared:
+            return
+        # Number the shared subexpressions so that each definition only
+        # references previously defined subexpressions
+        shared = {sid: i for i, sid in enumerate(sorted(shared))}
+
+        name = unique_component_name(model, config.component_name)
+        model.add_component(name, Expression(range(len(shared))))
+        named = getattr(model, name)
+
+        # Rebuild the expressions bottom-up, replacing shared
+        # structures with the named Expressions
+        new_expr = [None] * n
+        for sid in range(n):
+            if not uses[sid]:
+                continue
+            node = hasher.node[sid]
+            args = node_args[sid]
+            if args is not None:
+                new_args = [new_expr[i] for i in args]
+                if any(a is not b for a, b in zip(new_args, node.args)):
+                    node = node.create_node_with_local_data(tuple(new_args))
+            if sid in shared:
+                e = named[shared[sid]]
+                e.set_value(node)
+                node = e
+            new_expr[sid] = node
+
+        for (comp, expr), sid in zip(roots, root_sids):
+            if new_expr[sid] is not expr:
+                comp.set_value(new_expr[sid])
@@ -0,0 +1,150 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import io
+
+import pyomo.common.unittest as unittest
+
+from pyomo.environ import (
+    ConcreteModel,
+    Block,
+    Constraint,
+    Expression,
+    Expr_if,
+    Objective,
+    RangeSet,
+    TransformationFactory,
+    Var,
+    exp,
+    sin,
+    value,
+)
+from pyomo.core.expr.compare import assertExpressionsEqual
+from pyomo.repn.plugins.nl_writer import NLWriter
+
+
+class TestEliminateCommonSubexpressions(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.x = Var(m.I, initialize=1)
+        m.y = Var(initialize=2)
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: exp(m.x[1] * m.y)
+            + m.x[i] ** 2
+            + sin(m.x[1] * m.y) * exp(m.x[1] * m.y)
+            <= i,
+        )
+        m.b = Block()
+        m.b.d = Constraint(expr=(m.x[2] + m.y) * (m.x[2] + m.y) >= 1)
+        m.o = Objective(expr=exp(m.x[1] * m.y) + m.x[1] * m.y)
+        return m
+
+    def test_eliminate(self):
+        m = self.make_model()
+        ref = [value(c.body) for c in m.component_data_objects(Constraint)]
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+
+        e = m._common_subexpressions
+        self.assertEqual(len(e), 3)
+        assertExpressionsEqual(self, e[0].expr, m.x[1] * m.y)
+        assertExpressionsEqual(self, e[1].expr, exp(e[0]))
+        assertExpressionsEqual(self, e[2].expr, sin(e[0]) * e[1])
+        for i in m.I:
+            assertExpressionsEqual(self, m.c[i].expr, e[1] + m.x[i] ** 2 + e[2] <= i)
+        assertExpressionsEqual(self, m.o.expr, e[1] + e[0])
+        # (x[2] + y) is linear and not extracted by default
+        assertExpressionsEqual(self, m.b.d.expr, (m.x[2] + m.y) * (m.x[2] + m.y) >= 1)
+        self.assertEqual(
+            ref, [value(c.body) for c in m.component_data_objects(Constraint)]
+        )
+
+    def test_nested_repeat(self):
+        # x*y only appears within the repeated exp(x*y)
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.c1 = Constraint(expr=exp(m.x * m.y) <= 1)
+        m.c2 = Constraint(expr=exp(m.x * m.y) + m.x <= 2)
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        e = m._common_subexpressions
+        self.assertEqual(len(e), 1)
+        assertExpressionsEqual(self, e[0].expr, exp(m.x * m.y))
+        assertExpressionsEqual(self, m.c1.expr, e[0] <= 1)
+        assertExpressionsEqual(self, m.c2.expr, e[0] + m.x <= 2)
+
+    def test_linear(self):
+        m = self.make_model()
+        xfrm = TransformationFactory('core.eliminate_common_subexpressions')
+        xfrm.apply_to(m, nonlinear_only=False, component_name='cse')
+        e = m.cse
+        self.assertEqual(len(e), 4)
+        assertExpressionsEqual(self, e[3].expr, m.x[2] + m.y)
+        assertExpressionsEqual(self, m.b.d.expr, e[3] * e[3] >= 1)
+
+    def test_named_expressions_are_leaves(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.e = Expression(expr=m.x**2)
+        m.c1 = Constraint(expr=exp(m.e) <= 1)
+        m.c2 = Constraint(expr=exp(m.e) >= 0)
+        m.c3 = Constraint(expr=m.x**2 <= 4)
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        e = m._common_subexpressions
+        self.assertEqual(len(e), 1)
+        assertExpressionsEqual(self, e[0].expr, exp(m.e))
+        assertExpressionsEqual(self, m.e.expr, m.x**2)
+        assertExpressionsEqual(self, m.c3.expr, m.x**2 <= 4)
+
+    def test_expr_if_constant_condition(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        m.y = Var(initialize=2)
+        m.c1 = Constraint(expr=Expr_if(IF=True, THEN=m.x, ELSE=m.y) + exp(m.x) <= 3)
+        m.c2 = Constraint(expr=Expr_if(IF=False, THEN=m.x, ELSE=m.y) * exp(m.x) <= 4)
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        e = m._common_subexpressions
+        self.assertEqual(len(e), 1)
+        assertExpressionsEqual(self, e[0].expr, exp(m.x))
+        assertExpressionsEqual(
+            self, m.c1.expr, Expr_if(IF=True, THEN=m.x, ELSE=m.y) + e[0] <= 3
+        )
+        assertExpressionsEqual(
+            self, m.c2.expr, Expr_if(IF=False, THEN=m.x, ELSE=m.y) * e[0] <= 4
+        )
+        self.assertEqual(value(m.c1.body), 1 + value(exp(1)))
+        self.assertEqual(value(m.c2.body), 2 * value(exp(1)))
+
+    def test_no_common_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.c1 = Constraint(expr=exp(m.x) <= 1)
+        m.c2 = Constraint(expr=m.x**2 + m.x >= 0)
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        self.assertFalse(hasattr(m, '_common_subexpressions'))
+
+    def test_nl_writer(self):
+        m = self.make_model()
+        OUT = io.StringIO()
+        NLWriter().write(m, OUT)
+        self.assertNotIn('\nV', OUT.getvalue())
+
+        TransformationFactory('core.eliminate_common_subexpressions').apply_to(m)
+        CSE = io.StringIO()
+        NLWriter().write(m, CSE)
+        # The shared subexpressions are written as defined variables
+        self.assertEqual(CSE.getvalue().count('\nV'), 3)
+        self.assertLess(len(CSE.getvalue()), len(OUT.getvalue()))
+
+
+if __name__ == "__main__":
+    unittest.main()
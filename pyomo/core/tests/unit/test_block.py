@@ -59,6 +59,7 @@ from pyomo.core.base.block import (
     declare_custom_block,
 )
 import pyomo.core.expr as EXPR
+from pyomo.core.expr.compare import assertExpressionsEqual
 from pyomo.opt import check_available_solvers
 
 from pyomo.gdp import Disjunct
@@ -79,6 +80,14 @@ class DerivedBlock(ScalarBlock):
 DerivedBlock._Block_reserved_words = set(dir(DerivedBlock()))
 
 
+def _parallel_scenario_rule(b, s, t):
+    # Module-level rule so it can be pickled for parallel construction
+    b.x = Var(range(3), bounds=(0, s))
+    b.c = Constraint(expr=sum(b.x.values()) >= s * t)
+    b.sub = Block()
+    b.sub.y = Var(initialize=t)
+
+
 class TestGenerators(unittest.TestCase):
     def generate_model(self):
         #
@@ -2500,6 +2509,82 @@ class TestBlock(unittest.TestCase):
             self.assertIs(m.d[i].parent_component(), m.d)
             self.assertIs(m.d[i].parent_block(), m)
 
+    def test_clone_expressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.f = Expression(expr=m.x + 1)
+        m.b = Block()
+        m.b.y = Var([1, 2])
+        m.b.e = Expression(expr=m.b.y[1] ** 2)
+        m.b.c = Constraint(expr=m.x**2 + m.b.e + m.f * m.b.y[2] <= 1)
+        # A subexpression that appears twice (the tree is a DAG)
+        s = m.b.y[1] + m.b.e
+        m.b.d = Constraint(expr=s * s <= 1)
+        # Deep expression trees are copied without hitting the recursion
+        # limit (the generic deepcopy silently dropped the expression)
+        e = m.b.y[1]
+        for i in range(sys.getrecursionlimit() * 2):
+            e = 2 * (1 + e)
+        m.b.o = Objective(expr=e + m.b.e)
+
+        OUT = StringIO()
+        with LoggingIntercept(OUT):
+            b = m.b.clone()
+        self.assertEqual(OUT.getvalue(), "")
+
+        # Out-of-scope leaves (including named Expressions) are shared,
+        # in-scope leaves are remapped to their clones
+        lhs = b.c.expr.arg(0)
+        self.assertIsNot(lhs, m.b.c.expr.arg(0))
+        # Subtrees that only reference out-of-scope components are
+        # immutable and are shared with the original model
+        self.assertIs(lhs.arg(0), m.b.c.expr.arg(0).arg(0))
+        self.assertIs(lhs.arg(0).arg(0), m.x)
+        self.assertIs(lhs.arg(1), b.e)
+        self.assertIs(lhs.arg(2).arg(0), m.f)
+        self.assertIs(lhs.arg(2).arg(1), b.y[2])
+        self.assertIs(b.e.expr.arg(0), b.y[1])
+        assertExpressionsEqual(self, b.c.expr, m.x**2 + b.e + m.f * b.y[2] <= 1)
+        # Named Expressions are not duplicated
+        self.assertEqual(len(list(b.component_objects(Expression))), 1)
+        self.assertIs(b.o.expr.arg(1), b.e)
+        self.assertIs(b.d.body.arg(0).arg(1), b.e)
+        # Shared subexpressions remain shared
+        self.assertIsNot(b.d.body.arg(0), s)
+        self.assertIs(b.d.body.arg(0), b.d.body.arg(1))
+        assertExpressionsEqual(self, b.d.body.arg(0), b.y[1] + b.e)
+
+        node = b.o.expr.arg(0)
+        depth = 0
+        while node.is_expression_type():
+            node = node.arg(-1)
+            depth += 1
+        self.assertIs(node, b.y[1])
+        self.assertGreater(depth, 2 * sys.getrecursionlimit())
+
+    def test_clone_data_state(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], domain=NonNegativeIntegers, bounds=(0, 5), initialize=3)
+        m.x[2].fix(4)
+        m.p = Param([1, 2], mutable=True, initialize={1: 2, 2: 3})
+        m.c = Constraint([1, 2], rule=lambda m, i: m.p[i] * m.x[i] <= 10)
+        m.c[2].deactivate()
+
+        n = m.clone()
+        ref, test = StringIO(), StringIO()
+        m.pprint(ostream=ref)
+        n.pprint(ostream=test)
+        self.assertEqual(test.getvalue(), ref.getvalue())
+        for i in (1, 2):
+            self.assertIs(n.x[i].parent_component(), n.x)
+            self.assertIs(n.x[i].domain, NonNegativeIntegers)
+            self.assertEqual(n.x[i].stale, m.x[i].stale)
+            self.assertIs(n.c[i].parent_component(), n.c)
+            self.assertIs(n.c[i].body.arg(0), n.p[i])
+            self.assertIs(n.c[i].body.arg(1), n.x[i])
+        self.assertTrue(n.x[2].fixed)
+        self.assertFalse(n.c[2].active)
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
@@ -3556,6 +3641,34 @@ class TestBlock(unittest.TestCase):
         finally:
             Block._private_data_initializers = _save
 
+    def test_parallel_construction(self):
+        m = ConcreteModel()
+        m.S = Set(initialize=[3, 1, 2])
+        m.T = Set(initialize=[1, 2])
+        m.b = Block(m.S, m.T, rule=_parallel_scenario_rule, parallel=2)
+        m.ref = Block(m.S, m.T, rule=_parallel_scenario_rule)
+
+        self.assertEqual(list(m.b), list(m.ref))
+        for idx in m.ref:
+            b = m.b[idx]
+            self.assertEqual(b.index(), idx)
+            self.assertIs(b.x[0].parent_block(), b)
+            self.assertIs(b.sub.y.parent_block(), b.sub)
+            self.assertEqual(b.sub.y.value, idx[1])
+            self.assertEqual(b.x[2].ub, idx[0])
+            self.assertEqual(
+                [c.name for c in b.component_objects(descend_into=False)],
+                ['b[%s,%s].x' % idx, 'b[%s,%s].c' % idx, 'b[%s,%s].sub' % idx],
+            )
+            self.assertEqual(str(b.c.expr), str(m.ref[idx].c.expr).replace('ref', 'b'))
+        self.assertTrue(all(v.stale for v in m.b[1, 1].x.values()))
+        self.assertFalse(m.b[1, 1].sub.y.stale)
+
+        with self.assertRaisesRegex(
+            ValueError, "parallel construction is only supported for indexed"
+        ):
+            Block(parallel=True)
+
 
 if __name__ == "__main__":
     unittest.main()
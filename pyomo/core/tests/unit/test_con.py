@@ -17,11 +17,13 @@
 
 import sys
 import os
+import pickle
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
 
 import pyomo.common.unittest as unittest
+from pyomo.common.log import LoggingIntercept
 
 from pyomo.environ import (
     ConcreteModel,
@@ -39,12 +41,17 @@ from pyomo.environ import (
     inequality,
 )
 from pyomo.core.expr import (
+    LinearExpression,
     SumExpression,
     EqualityExpression,
     InequalityExpression,
     RangedExpression,
 )
-from pyomo.core.base.constraint import ConstraintData
+from pyomo.core.base.constraint import (
+    ConstraintData,
+    CompactLinearConstraintData,
+    IndexedCompactLinearConstraint,
+)
 
 
 class TestConstraintCreation(unittest.TestCase):
@@ -1142,6 +1149,123 @@ class TestArrayCon(unittest.TestCase):
         m.c[2] = Constraint.Skip
         self.assertEqual(len(m.c), 0)
 
+    def test_sparse_index(self):
+        m = ConcreteModel()
+        m.I = RangeSet(100)
+        m.x = Var(m.I)
+        calls = []
+
+        def rule(m, i, j):
+            calls.append((i, j))
+            if j == 3:
+                return Constraint.Skip
+            return m.x[i] <= j
+
+        m.c = Constraint(m.I, m.I, rule=rule, sparse_index=[(1, 2), (5, 3), (7, 8)])
+        self.assertEqual(calls, [(1, 2), (5, 3), (7, 8)])
+        self.assertEqual(list(m.c), [(1, 2), (7, 8)])
+        self.assertEqual(m.c[7, 8].upper, 8)
+
+        # Sparse index rules are passed the parent block; repeated
+        # indices are only constructed once
+        def sparse(m):
+            for i in m.I:
+                if not i % 40:
+                    yield i, i
+                    yield i, i
+
+        calls = []
+        m.d = Constraint(m.I, m.I, rule=rule, sparse_index=sparse)
+        self.assertEqual(calls, [(40, 40), (80, 80)])
+        self.assertEqual(list(m.d), [(40, 40), (80, 80)])
+
+        # A Set can be used as the sparse index
+        m.S = Set(within=m.I * m.I, initialize=[(2, 4)])
+        m.e = Constraint(m.I, m.I, rule=rule, sparse_index=m.S)
+        self.assertEqual(list(m.e), [(2, 4)])
+
+        # Indices are validated before calling the rule
+        calls = []
+        with self.assertRaisesRegex(KeyError, "Index '0' is not valid"):
+            m.f = Constraint(m.I, rule=lambda m, i: calls.append(i), sparse_index=[0])
+        self.assertEqual(calls, [])
+
+        with self.assertRaisesRegex(
+            ValueError, "'sparse_index' argument is only valid for indexed"
+        ):
+            m.g = Constraint(rule=m.x[1] >= 0, sparse_index=[None])
+
+    def test_compact_linear(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I)
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=4)
+
+        def terms(con):
+            const, terms = con.linear_terms()
+            return const, [(v.name, coef) for v, coef in terms]
+
+        m.c = Constraint(m.I, compact=True)
+        for i in m.I:
+            if i == 2:
+                m.c[i] = (0, m.x[i] * m.y, 5)
+            else:
+                m.c[i] = 2 * m.x[i] + m.y - 3 * m.x[1] + 1 <= m.p
+        self.assertIs(type(m.c), IndexedCompactLinearConstraint)
+        self.assertIs(type(m.c[1]), CompactLinearConstraintData)
+
+        # Linear bodies are stored (with aggregated terms) in the
+        # component arrays; the expression is built on demand
+        self.assertIsNone(m.c[3]._expr)
+        self.assertEqual(terms(m.c[3]), (1, [('x[3]', 2), ('y', 1), ('x[1]', -3)]))
+        self.assertEqual(terms(m.c[1]), (1, [('x[1]', -1), ('y', 1)]))
+        self.assertIs(type(m.c[3].body), LinearExpression)
+        self.assertEqual(str(m.c[3].body), "1 + 2.0*x[3] + y - 3.0*x[1]")
+        self.assertEqual(str(m.c[3].expr), "1 + 2.0*x[3] + y - 3.0*x[1]  <=  p")
+        self.assertIsNone(m.c[3].lb)
+        self.assertEqual(m.c[3].ub, 4)
+        self.assertIs(m.c[3].upper, m.p)
+        self.assertFalse(m.c[3].equality)
+        self.assertTrue(m.c[3]._linear_canonical_form)
+
+        # Nonlinear expressions are stored as for ConstraintData
+        self.assertIsNone(m.c[2].linear_terms())
+        self.assertFalse(m.c[2]._linear_canonical_form)
+        self.assertEqual(str(m.c[2].expr), "0  <=  x[2]*y  <=  5")
+
+        m.x[1] = 1
+        m.x[3] = 2
+        m.y = 3
+        self.assertEqual(m.c[3](), 5)
+        self.assertEqual(m.c[3].uslack(), -1)
+        self.assertIsNone(m.c[2](exception=False))
+
+        # Resetting the value replaces the row
+        m.c[1] = m.x[1] == m.y
+        self.assertTrue(m.c[1].equality)
+        self.assertEqual(m.c[1].lb, 0)
+        self.assertEqual(str(m.c[1].expr), "y - x[1]  ==  0")
+        repn = m.c[1].canonical_form()
+        self.assertIs(repn.linear_vars[0], m.y)
+        self.assertIs(repn.linear_vars[1], m.x[1])
+        self.assertEqual(repn.linear_coefs, (1, -1))
+
+        # The storage is remapped on clone() and pickle
+        for i, n in enumerate((m.clone(), pickle.loads(pickle.dumps(m)))):
+            self.assertIs(n.c[3].linear_terms()[1][0][0], n.x[3])
+            self.assertEqual(n.c[3](), 5)
+            n.c[3] = n.x[2] + n.y >= i
+            self.assertEqual(terms(n.c[3]), (0, [('x[2]', 1), ('y', 1)]))
+            self.assertEqual(
+                [id(v) for v in n.c._rows.vars],
+                [id(v) for v in (n.x[1], n.y, n.x[3], n.x[2])],
+            )
+
+        with LoggingIntercept() as LOG:
+            m.d = Constraint(rule=m.y >= 0, compact=True)
+        self.assertIn("compact=True is not supported for scalar", LOG.getvalue())
+
 
 class TestConList(unittest.TestCase):
     def create_model(self):
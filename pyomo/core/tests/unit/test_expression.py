@@ -1042,6 +1042,22 @@ E : Size=2, Index={1, 2}
         m.e **= m.y
         self.assertTrue(compare_expressions(m.e.expr, m.x**m.y))
 
+    def test_sparse_index(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(10))
+        m.x = Var(m.I)
+        calls = []
+
+        def rule(m, i, j):
+            calls.append((i, j))
+            return m.x[i] * j
+
+        m.e = Expression(m.I, m.I, rule=rule, sparse_index=[(1, 2), (3, 4)])
+        self.assertEqual(calls, [(1, 2), (3, 4)])
+        self.assertEqual(list(m.e), [(1, 2), (3, 4)])
+        assertExpressionsEqual(self, m.e[3, 4].expr, m.x[3] * 4)
+        self.assertNotIn((2, 2), m.e)
+
 
 if __name__ == "__main__":
     unittest.main()
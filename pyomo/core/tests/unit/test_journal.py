@@ -0,0 +1,146 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+
+from pyomo.environ import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    Expression,
+    Objective,
+    Param,
+    SOSConstraint,
+    Var,
+)
+from pyomo.core.base.journal import ChangeJournal, active_journals, in_model
+
+
+class TestChangeJournal(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.p = Param(mutable=True, initialize=1)
+        m.q = Param(initialize=1)
+        m.e = Expression(expr=m.x[1] + m.x[2])
+        m.c = Constraint(expr=m.p * m.e <= 1)
+        m.o = Objective(expr=m.x[3])
+        m.b = Block()
+        m.b.d = Constraint(expr=m.x[3] >= 0)
+        return m
+
+    def test_start_stop(self):
+        m = self.make_model()
+        j = ChangeJournal()
+        self.assertFalse(j.active)
+        m.x[1].fix(1)
+        self.assertEqual(len(j), 0)
+        with j:
+            self.assertTrue(j.active)
+            self.assertIn(j, active_journals)
+            m.x[1].unfix()
+        self.assertFalse(j.active)
+        m.x[2].fix(1)
+        self.assertEqual(j.changes(), [m.x[1]])
+        j.clear()
+        self.assertEqual(len(j), 0)
+
+    def test_discarded_journal(self):
+        j = ChangeJournal()
+        j.start()
+        self.assertIn(j, active_journals)
+        del j
+        self.assertEqual(len(active_journals), 0)
+
+    def test_component_data_changes(self):
+        m = self.make_model()
+        with ChangeJournal() as j:
+            m.x[1].fix(1)
+            m.x[2].setlb(0)
+            m.x[2].setub(1)
+            m.x[3].domain = [0, 5]
+            m.p = 2
+            m.c.set_value(m.x[1] <= 5)
+            m.b.d.deactivate()
+            m.o.sense = -1
+            m.e.expr = m.x[1]
+            # Changing the value of an unfixed Var is not a structural change
+            m.x[3].value = 5
+        changes = j.collect()
+        self.assertEqual(len(j), 0)
+        self.assertEqual(changes.variables, [m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(changes.params, [m.p])
+        self.assertEqual(changes.constraints, [m.c, m.b.d])
+        self.assertEqual(changes.sos_constraints, [])
+        self.assertTrue(changes.objectives)
+        self.assertTrue(changes.named_expressions)
+
+    def test_add_del_component(self):
+        m = self.make_model()
+        with ChangeJournal() as j:
+            m.y = Var([1, 2])
+            m.r = Param([1, 2], mutable=True, initialize=0)
+            m.s = Param(initialize=3)
+            m.b.c2 = Constraint(expr=m.y[1] == m.y[2])
+            m.sos = SOSConstraint(var=m.x, sos=1)
+            m.del_component(m.c)
+        changes = j.collect()
+        self.assertEqual(changes.variables, [m.y[1], m.y[2]])
+        # immutable Params are not recorded
+        self.assertEqual(changes.params, [m.r[1], m.r[2]])
+        self.assertEqual(len(changes.constraints), 2)
+        self.assertIs(changes.constraints[0], m.b.c2)
+        self.assertIsNot(changes.constraints[1].parent_block(), m)
+        self.assertEqual(changes.sos_constraints, [m.sos])
+        self.assertFalse(changes.objectives)
+
+    def test_add_block(self):
+        m = self.make_model()
+        with ChangeJournal() as j:
+            m.b2 = Block()
+            m.b2.v = Var()
+            m.b2.c = Constraint(expr=m.b2.v >= 0)
+            m.b3 = Block()
+            m.b3.o = Objective(expr=m.b2.v)
+            m.b3.deactivate()
+        changes = j.collect()
+        self.assertEqual(changes.variables, [m.b2.v])
+        self.assertEqual(changes.constraints, [m.b2.c])
+        self.assertTrue(changes.objectives)
+
+    def test_delitem(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint([1, 2], rule=lambda m, i: m.x >= i)
+        c1 = m.c[1]
+        with ChangeJournal() as j:
+            del m.c[1]
+        self.assertEqual(j.collect().constraints, [c1])
+
+    def test_in_model(self):
+        m = self.make_model()
+        self.assertTrue(in_model(m.b.d, m))
+        self.assertTrue(in_model(m.x[1], m))
+        self.assertTrue(in_model(m.b.d, m.b))
+        self.assertFalse(in_model(m.c, m.b))
+        m.b.deactivate()
+        self.assertTrue(in_model(m.b.d, m))
+        self.assertFalse(in_model(m.b.d, m, active=True))
+        m.b.activate()
+        m.b.d.deactivate()
+        self.assertFalse(in_model(m.b.d, m, active=True))
+        c = m.c
+        m.del_component(c)
+        self.assertFalse(in_model(c, m))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,7 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 
 from pyomo.environ import (
     Set,
@@ -2207,5 +2208,53 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests, intrinsic_test_list)
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestParamStoreArray(unittest.TestCase):
+    def test_store_array(self):
+        m = ConcreteModel()
+        m.I = RangeSet(2)
+        m.J = RangeSet(3)
+        m.p = Param(m.I, m.J, mutable=True, within=NonNegativeReals)
+        m.p.store_array(np.arange(6).reshape(2, 3))
+        self.assertEqual(
+            m.p.extract_values(),
+            {(1, 1): 0, (1, 2): 1, (1, 3): 2, (2, 1): 3, (2, 2): 4, (2, 3): 5},
+        )
+        self.assertEqual(m.p[2, 3].index(), (2, 3))
+        self.assertIs(type(m.p[1, 2].value), int)
+
+        m.p.store_array([7.5, 8], indices=[(1, 1), (2, 2)])
+        self.assertEqual(m.p[1, 1].value, 7.5)
+        self.assertEqual(m.p[2, 2].value, 8)
+
+        # Invalid values are rejected before anything is stored
+        with self.assertRaisesRegex(
+            ValueError, r"Invalid parameter value: p\[\(1, 3\)\] = '-1'"
+        ):
+            m.p.store_array(np.array([0, 0, -1, 0, 0, 0]))
+        self.assertEqual(m.p[1, 1].value, 7.5)
+        with self.assertRaisesRegex(KeyError, r"Index '\(3, 1\)' is not valid"):
+            m.p.store_array([1], indices=[(3, 1)])
+        with self.assertRaisesRegex(ValueError, "expected an array with 6 entries"):
+            m.p.store_array(np.arange(5))
+
+    def test_store_array_validation_rule(self):
+        m = ConcreteModel()
+        m.p = Param(
+            [1, 2, 3], mutable=True, validate=lambda m, val, i: val < i, initialize=0
+        )
+        m.p.store_array([0.5, 1.5, 2.5])
+        self.assertEqual(m.p.extract_values(), {1: 0.5, 2: 1.5, 3: 2.5})
+        with self.assertRaisesRegex(ValueError, "failed parameter validation rule"):
+            m.p.store_array([0, 3, 0])
+        self.assertEqual(m.p[2].value, 1.5)
+
+    def test_store_array_immutable(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], initialize=0)
+        with self.assertRaisesRegex(TypeError, "immutable"):
+            m.p.store_array([1, 2])
+
+
 if __name__ == "__main__":
     unittest.main()
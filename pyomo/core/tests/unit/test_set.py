@@ -13,6 +13,7 @@ import copy
 import itertools
 import logging
 import pickle
+import timeit
 from io import StringIO
 from collections import namedtuple as NamedTuple
 
@@ -85,6 +86,8 @@ from pyomo.core.base.set import (
     SetData,
     FiniteSetData,
     InsertionOrderSetData,
+    ArrayOrderedSetData,
+    ArrayOrderedScalarSet,
     SortedSetData,
     _FiniteSetMixin,
     _OrderedSetMixin,
@@ -5477,6 +5480,151 @@ I : Size=2, Index={1, 2, 3, 4, 5}, Ordered=Insertion
             normalize_index.flatten = _oldFlatten
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestArrayOrderedSet(unittest.TestCase):
+    def test_scalar(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2, 1], storage='array')
+        self.assertIs(type(m.I), ArrayOrderedScalarSet)
+        self.assertEqual(list(m.I), [3, 1, 2])
+        self.assertEqual(len(m.I), 3)
+        self.assertEqual(m.I.ord(2), 3)
+        self.assertEqual(m.I.at(1), 3)
+        self.assertEqual(m.I.at(-1), 2)
+        self.assertEqual(list(reversed(m.I)), [2, 1, 3])
+        self.assertIn(2, m.I)
+        self.assertIn(2.0, m.I)
+        self.assertNotIn(5, m.I)
+        self.assertNotIn('a', m.I)
+        self.assertEqual(m.I.next(3), 1)
+        self.assertEqual(m.I.prev(2), 1)
+
+    def test_multidimensional(self):
+        m = ConcreteModel()
+        m.J = Set(dimen=2, storage='array')
+        m.J.update(np.array([[1, 2], [3, 4], [1, 2], [5, 6]]))
+        self.assertEqual(list(m.J), [(1, 2), (3, 4), (5, 6)])
+        self.assertTrue(m.J.add((7, 8)))
+        self.assertFalse(m.J.add((3, 4)))
+        self.assertIn((3, 4), m.J)
+        self.assertNotIn((4, 3), m.J)
+        self.assertEqual(m.J.ord((5, 6)), 3)
+        self.assertEqual(m.J.at(-1), (7, 8))
+        m.J.remove((3, 4))
+        self.assertEqual(list(m.J), [(1, 2), (5, 6), (7, 8)])
+        self.assertEqual(m.J.ord((7, 8)), 3)
+        with self.assertRaises(KeyError):
+            m.J.remove((3, 4))
+        m.J.clear()
+        self.assertEqual(len(m.J), 0)
+        self.assertEqual(list(m.J), [])
+
+    def test_product(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1], storage='array')
+        m.J = Set(initialize=[(1, 2), (5, 6)], storage='array')
+        m.P = m.I * m.J
+        self.assertEqual(len(m.P), 4)
+        self.assertEqual(m.P.at(2), (3, 5, 6))
+        self.assertEqual(m.P.ord((1, 1, 2)), 3)
+        m.x = Var(m.P)
+        self.assertEqual(list(m.x), list(m.P))
+
+    def test_indexed_and_abstract(self):
+        m = AbstractModel()
+        m.A = Set([1, 2], initialize={1: [1, 2], 2: [3]}, storage='array')
+        m.B = Set(initialize=[4, 2], storage='array')
+        i = m.create_instance()
+        self.assertIs(type(i.A[1]), ArrayOrderedSetData)
+        self.assertEqual(list(i.A[1]), [1, 2])
+        self.assertEqual(list(i.A[2]), [3])
+        self.assertEqual(list(i.B), [4, 2])
+        with self.assertRaises(RuntimeError):
+            m.B.at(1)
+
+    def test_clone(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2], storage='array')
+        i = m.clone()
+        i.I.add(7)
+        self.assertEqual(list(i.I), [3, 1, 2, 7])
+        self.assertEqual(list(m.I), [3, 1, 2])
+
+    def _count_index_builds(self):
+        builds = []
+        _sorted_index = ArrayOrderedSetData._sorted_index
+
+        def counter(self):
+            if self._lookup is None:
+                builds.append(len(self))
+            return _sorted_index(self)
+
+        ArrayOrderedSetData._sorted_index = counter
+        self.addCleanup(setattr, ArrayOrderedSetData, '_sorted_index', _sorted_index)
+        return builds
+
+    def test_add_scaling(self):
+        builds = self._count_index_builds()
+        m = ConcreteModel()
+        m.I = Set(storage='array')
+        N = 20000
+        for i in range(N):
+            self.assertNotIn(2 * i, m.I)
+            self.assertEqual(m.I.add(2 * i), 1)
+            self.assertIn(2 * i, m.I)
+            self.assertEqual(m.I.add(2 * i), 0)
+        self.assertEqual(list(m.I), list(range(0, 2 * N, 2)))
+        self.assertEqual(m.I.ord(2 * (N - 1)), N)
+        self.assertNotIn(1, m.I)
+        # The sorted index is rebuilt a logarithmic number of times
+        # (and not after every add())
+        self.assertLess(len(builds), 60)
+
+        m.J = Set(dimen=2, storage='array')
+        for i in range(N):
+            m.J.add((i, -i))
+            self.assertIn((i, -i), m.J)
+        self.assertNotIn((1, 1), m.J)
+        self.assertEqual(m.J.ord((N - 1, 1 - N)), N)
+        self.assertLess(len(builds), 120)
+
+    def test_contains_scaling(self):
+        builds = self._count_index_builds()
+        m = ConcreteModel()
+        m.I = Set(initialize=np.arange(0, 3000, 3), storage='array')
+        m.J = Set(initialize=np.arange(0, 300000, 3), storage='array')
+        self.assertIn(300, m.I)
+        self.assertIn(300, m.J)
+        self.assertEqual(len(builds), 2)
+        for s in (m.I, m.J):
+            for i in range(100):
+                self.assertEqual(3 * i in s, True)
+                self.assertEqual(3 * i + 1 in s, False)
+                self.assertEqual(s.ord(3 * i), i + 1)
+        # Lookups do not rebuild the index
+        self.assertEqual(len(builds), 2)
+        # ... and are O(log n)
+        small = min(timeit.repeat(lambda: 300 in m.I, number=2000, repeat=3))
+        large = min(timeit.repeat(lambda: 300 in m.J, number=2000, repeat=3))
+        self.assertLess(large, 10 * small)
+
+    def test_errors(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegex(TypeError, "only supports integer"):
+            m.I = Set(initialize=['a'], storage='array')
+        m.I = Set(storage='array')
+        with self.assertRaisesRegex(TypeError, "only supports integer"):
+            m.I.add(True)
+        with self.assertRaisesRegex(TypeError, "only supports integer"):
+            m.I.add(1.5)
+        with self.assertRaisesRegex(TypeError, "only supports integer"):
+            m.I.add(2**64)
+        with self.assertRaisesRegex(ValueError, "insertion"):
+            m.J = Set(ordered=Set.SortedOrder, storage='array')
+        with self.assertRaisesRegex(ValueError, "not valid"):
+            m.K = Set(storage='list')
+
+
 class TestAbstractSetAPI(unittest.TestCase):
     def testSetData(self):
         # This tests an anstract non-finite set API
@@ -0,0 +1,173 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+
+from pyomo.environ import BooleanVar, ConcreteModel, Expression, Param, Var, exp
+from pyomo.core.expr import structure_cache
+from pyomo.core.expr.structure_cache import StructureCache
+import pyomo.core.expr.visitor as visitor
+
+
+class TestStructureCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        _degree, _fixed = visitor._polynomial_degree, visitor._is_fixed
+
+        def degree(node):
+            self.calls.append('degree')
+            return _degree(node)
+
+        def fixed(node):
+            self.calls.append('fixed')
+            return _fixed(node)
+
+        visitor._polynomial_degree, visitor._is_fixed = degree, fixed
+        self.addCleanup(setattr, visitor, '_polynomial_degree', _degree)
+        self.addCleanup(setattr, visitor, '_is_fixed', _fixed)
+
+        self.m = m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.p = Param(mutable=True, initialize=1)
+        m.e = Expression(expr=m.x[1] ** 2)
+        self.expr = m.p * m.e + m.x[2]
+
+    def test_disabled(self):
+        e = self.expr
+        self.assertEqual(e.polynomial_degree(), 2)
+        self.assertEqual(e.polynomial_degree(), 2)
+        self.assertFalse(e.is_fixed())
+        self.assertEqual(self.calls, ['degree', 'degree', 'fixed'])
+        self.assertEqual(StructureCache.polynomial_degree, {})
+
+    def test_cached(self):
+        e = self.expr
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 2)
+            self.assertEqual(e.polynomial_degree(), 2)
+            self.assertFalse(e.is_fixed())
+            self.assertFalse(e.is_fixed())
+            # Nested contexts share the cache
+            with structure_cache():
+                self.assertEqual(e.polynomial_degree(), 2)
+            self.assertEqual(len(StructureCache.polynomial_degree), 1)
+        self.assertEqual(self.calls, ['degree', 'fixed'])
+        # The cache is cleared when the outermost context exits
+        self.assertEqual(StructureCache.polynomial_degree, {})
+        self.assertEqual(StructureCache.is_fixed, {})
+
+    def test_invalidate(self):
+        m = self.m
+        e = self.expr
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 2)
+            # Changing unfixed Var values does not invalidate the cache
+            m.x[1].value = 0
+            self.assertEqual(e.polynomial_degree(), 2)
+            self.assertEqual(self.calls, ['degree'])
+
+            m.p = 0
+            self.assertEqual(e.polynomial_degree(), 1)
+            m.x[2].fix(3)
+            self.assertEqual(e.polynomial_degree(), 0)
+            self.assertTrue(e.is_fixed())
+            m.x[2].unfix()
+            self.assertFalse(e.is_fixed())
+            m.p = 1
+            m.x[1].fix(2)
+            self.assertEqual(e.polynomial_degree(), 1)
+            # Changing the value of a fixed Var
+            e2 = m.x[1] * m.x[2]
+            self.assertEqual(e2.polynomial_degree(), 1)
+            m.x[1].value = 0
+            self.assertEqual(e2.polynomial_degree(), 0)
+            m.x[1].unfix()
+            # Redefining a named Expression
+            m.e = exp(m.x[1])
+            self.assertIsNone(e.polynomial_degree())
+
+    def test_param_bulk_setters(self):
+        m = self.m
+        m.q = Param([1, 2], mutable=True, initialize=1)
+        e = m.q[1] * m.x[1]
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 1)
+            m.q.store_values({1: 0})
+            self.assertEqual(e.polynomial_degree(), 0)
+            m.q.store_values(1, check=False)
+            self.assertEqual(e.polynomial_degree(), 1)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_param_store_array(self):
+        m = self.m
+        m.q = Param([1, 2], mutable=True, initialize=1)
+        e = m.q[1] * m.x[1]
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 1)
+            m.q.store_array(np.array([0, 1]))
+            self.assertEqual(e.polynomial_degree(), 0)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_var_bulk_setters(self):
+        m = self.m
+        m.z = Var([1, 2, 3], columnar=True)
+        e = m.z[1] * m.x[1]
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 2)
+            m.z.fix(1)
+            self.assertEqual(e.polynomial_degree(), 1)
+            m.z.set_values_array(np.array([0, 0, 0]))
+            self.assertEqual(e.polynomial_degree(), 0)
+            m.z.set_values({1: 2}, skip_validation=True)
+            self.assertEqual(e.polynomial_degree(), 1)
+            m.z.fix(0, skip_validation=True)
+            self.assertEqual(e.polynomial_degree(), 0)
+            m.z.unfix()
+            self.assertEqual(e.polynomial_degree(), 2)
+            # Updating unfixed values does not invalidate the cache
+            epoch = StructureCache.epoch
+            m.z.set_values_array(np.array([1, 1, 1]))
+            self.assertEqual(StructureCache.epoch, epoch)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_columnar_var_fix_unfix(self):
+        m = self.m
+        m.z = Var([1, 2, 3], initialize=0, columnar=True)
+        e = m.z[1] * m.x[1]
+        with structure_cache():
+            self.assertEqual(e.polynomial_degree(), 2)
+            epoch = StructureCache.epoch
+            m.z.fix()
+            self.assertNotEqual(StructureCache.epoch, epoch)
+            self.assertEqual(e.polynomial_degree(), 0)
+            epoch = StructureCache.epoch
+            m.z.unfix()
+            self.assertNotEqual(StructureCache.epoch, epoch)
+            self.assertEqual(e.polynomial_degree(), 2)
+            epoch = StructureCache.epoch
+            m.z.fix(1)
+            self.assertNotEqual(StructureCache.epoch, epoch)
+            self.assertEqual(e.polynomial_degree(), 1)
+
+    def test_boolean_var(self):
+        m = self.m
+        m.Y = BooleanVar()
+        epoch = StructureCache.epoch
+        m.Y.fix(True)
+        self.assertGreater(StructureCache.epoch, epoch)
+        epoch = StructureCache.epoch
+        m.Y.unfix()
+        self.assertGreater(StructureCache.epoch, epoch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
@@ -23,6 +24,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
@@ -49,9 +51,15 @@ from pyomo.environ import (
     NonNegativeReals,
     Integers,
     Binary,
+    Any,
+    Constraint,
+    Objective,
+    Piecewise,
     value,
 )
+from pyomo.core.base.var import ScalarVar, IndexedColumnarVar, ColumnarVarData, VarData
 from pyomo.core.base.units_container import units, pint_available, UnitsError
+from pyomo.repn.plugins.nl_writer import NLWriter
 
 
 class TestVarData(unittest.TestCase):
@@ -1825,5 +1833,298 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.bounds, (0, 1))
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestColumnarVar(unittest.TestCase):
+    def test_declaration(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.x = Var(m.I, bounds=(0, 10), initialize={1: 1, 3: 5}, columnar=True)
+        self.assertIs(type(m.x), IndexedColumnarVar)
+        self.assertIs(type(m.x[1]), ColumnarVarData)
+        self.assertEqual(len(m.x), 4)
+        self.assertEqual(m.x.get_values(), {1: 1, 2: None, 3: 5, 4: None})
+        self.assertEqual(m.x[2].bounds, (0, 10))
+        self.assertFalse(m.x[3].fixed)
+
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.y = Var(columnar=True)
+        self.assertIn("columnar=True is not supported", OUT.getvalue())
+        self.assertIs(type(m.y), ScalarVar)
+
+    def test_data_api(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=3)
+        m.x = Var([1, 2, 3], domain=NonNegativeReals, columnar=True)
+        m.x[1].value = 2
+        m.x[2].setub(m.p)
+        m.x[3].fix(4)
+        self.assertEqual(m.x[1].value, 2)
+        self.assertEqual(m.x[2].ub, 3)
+        self.assertIs(m.x[2].upper, m.p)
+        m.p = 5
+        self.assertEqual(m.x[2].bounds, (0, 5))
+        self.assertTrue(m.x[3].fixed)
+        self.assertEqual(m.x.get_values(include_fixed_values=False), {1: 2, 2: None})
+        m.x[2].setub(7)
+        self.assertEqual(m.x[2].upper, 7)
+        m.x[1].value = None
+        self.assertIsNone(m.x[1].value)
+        self.assertTrue(m.x[1].stale)
+
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x[1].value = 20
+            m.x[2].value = 20
+        self.assertNotIn("x[1]", OUT.getvalue())
+        self.assertIn(
+            "Setting Var 'x[2]' to a numeric value `20` outside", OUT.getvalue()
+        )
+
+    def test_vectorized_container_api(self):
+        m = ConcreteModel()
+        m.x = Var(range(5), initialize=1, columnar=True)
+        m.x.setlb(-1)
+        m.x.setub(None)
+        self.assertEqual([v.bounds for v in m.x.values()], [(-1, None)] * 5)
+        m.x.fix(3, skip_validation=True)
+        self.assertTrue(all(v.fixed for v in m.x.values()))
+        self.assertEqual(m.x.get_values(), dict.fromkeys(range(5), 3))
+        m.x.unfix()
+        self.assertFalse(any(v.fixed for v in m.x.values()))
+
+        StaleFlagManager.mark_all_as_stale()
+        m.x.set_values({0: 5, 3: 6}, skip_validation=True)
+        self.assertEqual(m.x.get_values(), {0: 5, 1: 3, 2: 3, 3: 6, 4: 3})
+        self.assertEqual(
+            [v.stale for v in m.x.values()], [False, True, True, False, True]
+        )
+        m.x.flag_as_stale()
+        self.assertTrue(all(v.stale for v in m.x.values()))
+
+    def test_sparse_growth(self):
+        m = ConcreteModel()
+        m.x = Var(Any, dense=False, columnar=True)
+        for i in range(100):
+            m.x[i].value = i
+        self.assertEqual(len(m.x), 100)
+        self.assertEqual(m.x[99].value, 99)
+        self.assertEqual(m.x.get_values(), {i: i for i in range(100)})
+
+    def test_clone(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=3)
+        m.x = Var([1, 2], initialize=1, columnar=True)
+        m.x[2].setub(m.p)
+        m.x[1].fix()
+        i = m.clone()
+        self.assertIsNot(i.x._columns, m.x._columns)
+        self.assertIs(i.x[2].upper, i.p)
+        self.assertTrue(i.x[1].fixed)
+        i.x[1].value = 5
+        self.assertEqual(i.x[1].value, 5)
+        self.assertEqual(m.x[1].value, 1)
+
+    def test_int_values(self):
+        m = ConcreteModel()
+        m.x = Var(range(3), bounds=(0, 10.5), initialize={0: 1, 1: 1.5}, columnar=True)
+        self.assertIs(type(m.x[0].value), int)
+        self.assertIs(type(m.x[1].value), float)
+        self.assertIs(type(m.x[0].lb), int)
+        self.assertIs(type(m.x[0].ub), float)
+        self.assertEqual(
+            [type(v) for v in m.x.get_values().values()], [int, float, type(None)]
+        )
+        m.x.set_values({0: 2.0, 2: 3}, skip_validation=True)
+        self.assertIs(type(m.x[0].value), float)
+        self.assertIs(type(m.x[2].value), int)
+        m.x.fix(4, skip_validation=True)
+        self.assertEqual([type(v.value) for v in m.x.values()], [int] * 3)
+        m.x.setlb(1.0)
+        self.assertIs(type(m.x[1].lb), float)
+
+    def test_domains(self):
+        m = ConcreteModel()
+        m.x = Var(
+            [1, 2, 3],
+            within=lambda m, i: Binary if i == 2 else NonNegativeReals,
+            columnar=True,
+        )
+        self.assertIs(m.x[1].domain, NonNegativeReals)
+        self.assertIs(m.x[2].domain, Binary)
+        self.assertEqual(m.x[2].bounds, (0, 1))
+        m.x[2].domain = NonNegativeReals
+        self.assertEqual(m.x._columns.domains, {})
+        m.x[3].domain = Integers
+        self.assertIs(m.x[3].domain, Integers)
+        self.assertIs(m.x[1].domain, NonNegativeReals)
+
+    def test_lazy_views(self):
+        m = ConcreteModel()
+        m.x = Var(range(10), bounds=(0, 5), columnar=True)
+
+        def n_views():
+            return sum(1 for v in m.x._data.values() if v.__class__ is not int)
+
+        # Only the first variable (the construction template) has a
+        # VarData; the other indices map to their row
+        self.assertEqual(n_views(), 1)
+        self.assertEqual(len(m.x), 10)
+        self.assertIn(3, m.x)
+        self.assertEqual(len(m.x._columns.value), 10)
+        m.x.fix(1)
+        m.x.set_values_array(np.arange(10.0) / 2)
+        self.assertEqual(m.x.get_values_array().tolist(), [i / 2 for i in range(10)])
+        self.assertEqual(n_views(), 1)
+
+        x3 = m.x[3]
+        self.assertIsInstance(x3, VarData)
+        self.assertIs(m.x[3], x3)
+        self.assertIs(m.x[(3,)], x3)
+        self.assertEqual(x3.index(), 3)
+        self.assertEqual(x3.name, 'x[3]')
+        self.assertEqual(x3.bounds, (0, 5))
+        self.assertEqual(x3.value, 1.5)
+        self.assertTrue(x3.fixed)
+        self.assertEqual(n_views(), 2)
+        self.assertEqual(list(m.x.values())[3:5], [x3, m.x[4]])
+        self.assertEqual(n_views(), 10)
+
+    def test_rules(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=10)
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x = Var(
+                [1, 2, 3],
+                domain=lambda m, i: Integers if i == 3 else Reals,
+                bounds=lambda m, i: (2 * i, m.p),
+                initialize=lambda m, i: 1.5 * i,
+                columnar=True,
+            )
+        self.assertEqual(
+            OUT.getvalue().splitlines(),
+            [
+                "Setting Var 'x[1]' to a numeric value `1.5` outside the "
+                "bounds (2, 10.0).",
+                "Setting Var 'x[2]' to a numeric value `3.0` outside the "
+                "bounds (4, 10.0).",
+                "Setting Var 'x[3]' to a value `4.5` (float) not in domain "
+                "Integers.",
+            ],
+        )
+        self.assertEqual(m.x.get_values(), {1: 1.5, 2: 3, 3: 4.5})
+        self.assertEqual([v.lb for v in m.x.values()], [2, 4, 6])
+        self.assertIs(m.x[2].upper, m.p)
+        self.assertIs(m.x[3].domain, Integers)
+        self.assertFalse(m.x[2].stale)
+
+    def test_del_element(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 4), initialize=2, columnar=True)
+        m.c = Constraint(expr=m.x[1] + m.x[2] <= 3)
+        m.o = Objective(expr=m.x[3])
+        x1 = m.x[1]
+        del m.x[1]
+        del m.x[3]
+        self.assertEqual(list(m.x), [2])
+        self.assertIsNone(x1.parent_component())
+        # The deleted variable keeps its state
+        self.assertEqual(x1.value, 2)
+        self.assertEqual(x1.bounds, (0, 4))
+        x1.value = 3
+        x1.fix()
+        self.assertEqual(x1.value, 3)
+        self.assertEqual(m.x[2].value, 2)
+        self.assertFalse(m.x[2].fixed)
+        OUT = StringIO()
+        NLWriter().write(m, OUT, symbolic_solver_labels=True)
+        # x[1] is fixed (to 3): the constraint is x[2] <= 0
+        self.assertIn("r\t#1 ranges (rhs's)\n1 0\t#c\n", OUT.getvalue())
+        with self.assertRaisesRegex(KeyError, "Index '5' is not valid"):
+            del m.x[5]
+
+    def test_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.x = Var(range(4), initialize={0: 0, 1: 1, 2: 2, 3: 3}, columnar=True)
+        m.c = Constraint(expr=m.x[1] + m.x[2] <= 3)
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIs(i.c.body.args[0], i.x[1])
+            self.assertIsNot(i.x[1], m.x[1])
+            self.assertEqual(i.x.get_values(), {0: 0, 1: 1, 2: 2, 3: 3})
+            i.x[3].value = 5
+            self.assertEqual(m.x[3].value, 3)
+
+    def test_piecewise(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 2), columnar=True)
+        m.y = Var()
+        m.pw = Piecewise(
+            m.y, m.x[1], pw_pts=[0, 1, 2], f_rule=[0, 1, 4], pw_constr_type='EQ'
+        )
+        self.assertIs(m.pw._domain_var, m.x[1])
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestVarArrayAPI(unittest.TestCase):
+    def _test_array_api(self, columnar):
+        m = ConcreteModel()
+        m.x = Var(range(4), bounds=(0, 5), domain=Integers, columnar=columnar)
+        self.assertTrue(np.isnan(m.x.get_values_array()).all())
+
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x.set_values_array(np.array([1, 2.5, 7, np.nan]))
+        self.assertEqual(
+            OUT.getvalue().splitlines(),
+            [
+                "Setting Var 'x[1]' to a value `2.5` (float) not in domain Integers.",
+                "Setting Var 'x[2]' to a numeric value `7.0` outside the bounds "
+                + str(m.x[2].bounds)
+                + ".",
+            ],
+        )
+        self.assertEqual(m.x.get_values(), {0: 1, 1: 2.5, 2: 7, 3: None})
+        self.assertTrue(m.x[3].stale)
+        self.assertFalse(m.x[0].stale)
+
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x.set_values_array([3, 2], indices=[2, 1], skip_validation=True)
+        self.assertEqual(OUT.getvalue(), "")
+        self.assertEqual(m.x.get_values_array().tolist()[:3], [1, 2, 3])
+        self.assertEqual(m.x.get_values_array(indices=[2, 0]).tolist(), [3, 1])
+
+        m.x.set_bounds_array(lb=[1, np.nan, 2, 3], ub=np.full(4, 9))
+        self.assertEqual(
+            [v.bounds for v in m.x.values()], [(1, 9), (None, 9), (2, 9), (3, 9)]
+        )
+        m.x.set_bounds_array(ub=[np.nan, 4], indices=[0, 1])
+        self.assertEqual(m.x[0].bounds, (1, None))
+        self.assertEqual(m.x[1].bounds, (None, 4))
+
+        with self.assertRaisesRegex(ValueError, "expected an array with 4 entries"):
+            m.x.set_values_array([1, 2])
+
+    def test_array_api(self):
+        self._test_array_api(False)
+
+    def test_array_api_columnar(self):
+        self._test_array_api(True)
+
+    def test_array_api_expression_bounds(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=2)
+        m.x = Var([1, 2], domain=NonNegativeReals, columnar=True)
+        m.x[1].setub(m.p)
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            m.x.set_values_array([3, -1])
+        self.assertIn("'x[1]' to a numeric value `3.0` outside", OUT.getvalue())
+        self.assertIn("'x[2]' to a value `-1.0` (float) not in domain", OUT.getvalue())
+        m.x.set_bounds_array(ub=[5, 5])
+        self.assertEqual(m.x[1].upper, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
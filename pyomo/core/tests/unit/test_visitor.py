@@ -1838,6 +1838,111 @@ class TestStreamBasedExpressionVisitor_Deep(unittest.TestCase):
         return self.run_walker(self.evaluate_abex())
 
 
+class TestStreamBasedExpressionVisitor_Compiled(unittest.TestCase):
+    def setUp(self):
+        self.m = m = ConcreteModel()
+        m.x = Var(range(3), initialize=1)
+
+    def test_walker_cache(self):
+        def exit(node, data):
+            return 1 + sum(data)
+
+        w1 = StreamBasedExpressionVisitor(exitNode=exit)
+        w2 = StreamBasedExpressionVisitor(exitNode=lambda node, data: 0)
+        w3 = StreamBasedExpressionVisitor(exitNode=exit, finalizeResult=str)
+        self.assertIs(w1._walker, w2._walker)
+        self.assertIsNot(w1._walker, w3._walker)
+
+        e = self.m.x[0] + self.m.x[1] * self.m.x[2]
+        self.assertEqual(w1.walk_expression_nonrecursive(e), 5)
+        self.assertEqual(w3.walk_expression_nonrecursive(e), '5')
+        # Leaves can be walked directly
+        self.assertEqual(w1.walk_expression_nonrecursive(self.m.x[0]), 1)
+        self.assertEqual(w1.walk_expression_nonrecursive(5), 1)
+
+    def test_deep_expression(self):
+        # Walk expressions that are deeper than the initial size of
+        # the preallocated stack (and the recursion limit)
+        m = self.m
+        e = m.x[0]
+        for i in range(3 * RECURSION_LIMIT):
+            e = sin(e) * m.x[i % 3]
+
+        def before(node, child, idx):
+            if type(child) in native_types or not child.is_expression_type():
+                return False, 1
+            return True, None
+
+        walker = StreamBasedExpressionVisitor(
+            beforeChild=before, exitNode=lambda node, data: 1 + sum(data)
+        )
+        self.assertEqual(
+            walker.walk_expression_nonrecursive(e), 9 * RECURSION_LIMIT + 1
+        )
+        self.assertEqual(walker.walk_expression(e), 9 * RECURSION_LIMIT + 1)
+        # The stack is retained for reuse, but does not hold references
+        # to any of the walked nodes
+        stack = walker._walker_stack
+        self.assertGreater(len(stack[0]), 3 * RECURSION_LIMIT)
+        for _l in stack:
+            self.assertEqual(set(map(id, _l)), {id(None)})
+        self.assertEqual(walker.walk_expression_nonrecursive(m.x[0] + 1), 3)
+        self.assertIs(walker._walker_stack, stack)
+
+    def test_reentrant(self):
+        m = self.m
+
+        class Sizer(StreamBasedExpressionVisitor):
+            def exitNode(self, node, data):
+                if type(node) is PowExpression:
+                    # Walk a different expression using this walker
+                    # while the outer walk is still on the stack
+                    return self.walk_expression_nonrecursive(m.x[1] + m.x[2] * m.x[0])
+                return 1 + sum(data)
+
+        walker = Sizer()
+        self.assertEqual(
+            walker.walk_expression_nonrecursive(m.x[0] * (m.x[1] ** 2 + m.x[2])), 9
+        )
+
+    def test_context_manager_args(self):
+        m = self.m
+        LOG = []
+
+        class Args(list):
+            def __enter__(self):
+                LOG.append('enter %s' % (len(self),))
+
+            def __exit__(self, *args):
+                LOG.append('exit %s' % (len(self),))
+
+        def enter(node):
+            if type(node) in native_types or not node.is_expression_type():
+                return (), None
+            return Args(node.args), []
+
+        def exit(node, data):
+            if data is None:
+                if node is m.x[2]:
+                    raise RuntimeError('leaf')
+                return 1
+            return 1 + sum(data)
+
+        walker = StreamBasedExpressionVisitor(enterNode=enter, exitNode=exit)
+        self.assertEqual(walker.walk_expression_nonrecursive(m.x[0] * (m.x[1] + 2)), 5)
+        self.assertEqual(LOG, ['enter 2', 'enter 2', 'exit 2', 'exit 2'])
+
+        # Args on the stack are exited when the walker raises an exception
+        LOG.clear()
+        with self.assertRaisesRegex(RuntimeError, 'leaf'):
+            walker.walk_expression_nonrecursive(m.x[0] * (m.x[1] + m.x[2] ** 2))
+        self.assertEqual(
+            LOG, ['enter 2', 'enter 2', 'enter 2', 'exit 2', 'exit 2', 'exit 2']
+        )
+        for _l in walker._walker_stack:
+            self.assertEqual(set(map(id, _l)), {id(None)})
+
+
 class TestEvaluateExpression(unittest.TestCase):
     def test_constant(self):
         m = ConcreteModel()
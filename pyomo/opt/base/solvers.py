@@ -18,6 +18,7 @@ import shlex
 from pyomo.common import Factory
 from pyomo.common.errors import ApplicationError
 from pyomo.common.collections import Bunch
+from pyomo.common.tempfiles import TempfileManager
 
 from pyomo.opt.base.convert import convert_problem
 from pyomo.opt.base.formats import ResultsFormat
@@ -530,7 +531,59 @@ class OptSolver(object):
 
     def solve(self, *args, **kwds):
         """Solve the problem"""
+        _model, orig_options = self._solve_setup(args, kwds)
+        try:
+            # we're good to go.
+            presolve_completion_time = self._solve_presolve(_model, args, kwds)
+            _status = self._apply_solver()
+            result = self._solve_postsolve(_model, _status, presolve_completion_time)
+        finally:
+            #
+            # Reset the options dict
+            #
+            self.options = orig_options
+
+        return result
+
+    async def async_solve(self, *args, **kwds):
+        """Solve the problem (as a coroutine)
+
+        This accepts the same arguments as :meth:`solve`.  The problem
+        is written and the solution is loaded synchronously; solver
+        interfaces that run an external executable (e.g.,
+        :class:`SystemCallSolver`) await the solver subprocess, so
+        that the event loop can drive many solves concurrently.  Other
+        solver interfaces run the solver synchronously.
+
+        Note that solver objects hold the state of the current solve:
+        each concurrent solve must use its own solver object.
+
+        Example::
+
+            async def solve_all(models):
+                return await asyncio.gather(
+                    *(SolverFactory('glpk').async_solve(m) for m in models)
+                )
 
+        """
+        _model, orig_options = self._solve_setup(args, kwds)
+        try:
+            tempfile_depth = TempfileManager.depth
+            presolve_completion_time = self._solve_presolve(_model, args, kwds)
+            _status = await self._async_apply_solver(tempfile_depth)
+            result = self._solve_postsolve(_model, _status, presolve_completion_time)
+        finally:
+            self.options = orig_options
+
+        return result
+
+    def _solve_setup(self, args, kwds):
+        """Validate the solve() arguments and set the ephemeral options
+
+        Returns the model being solved (or None) and the original
+        options (that must be restored after the solve).
+
+        """
         self.available(exception_flag=True)
         #
         # If the inputs are models, then validate that they have been
@@ -591,98 +644,97 @@ class OptSolver(object):
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', ''))
         )
-        try:
-            # we're good to go.
-            initial_time = time.time()
+        return _model, orig_options
 
-            self._presolve(*args, **kwds)
+    def _solve_presolve(self, _model, args, kwds):
+        """Run the presolve and return the presolve completion time"""
+        initial_time = time.time()
 
-            presolve_completion_time = time.time()
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for presolve"
-                    % (presolve_completion_time - initial_time)
-                )
+        self._presolve(*args, **kwds)
 
-            if not _model is None:
-                self._initialize_callbacks(_model)
-
-            _status = self._apply_solver()
-            if hasattr(self, '_transformation_data'):
-                del self._transformation_data
-            if not hasattr(_status, 'rc'):
-                logger.warning(
-                    "Solver (%s) did not return a solver status code.\n"
-                    "This is indicative of an internal solver plugin error.\n"
-                    "Please report this to the Pyomo developers."
-                )
-            elif _status.rc:
-                logger.error(
-                    "Solver (%s) returned non-zero return code (%s)"
-                    % (self.name, _status.rc)
-                )
-                if self._tee:
-                    logger.error("See the solver log above for diagnostic information.")
-                elif hasattr(_status, 'log') and _status.log:
-                    logger.error("Solver log:\n" + str(_status.log))
-                raise ApplicationError("Solver (%s) did not exit normally" % self.name)
-            solve_completion_time = time.time()
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for solver"
-                    % (solve_completion_time - presolve_completion_time)
-                )
+        presolve_completion_time = time.time()
+        if self._report_timing:
+            print(
+                "      %6.2f seconds required for presolve"
+                % (presolve_completion_time - initial_time)
+            )
 
-            result = self._postsolve()
-            result._smap_id = self._smap_id
-            result._smap = None
-            if _model:
-                if isinstance(_model, IBlock):
-                    if len(result.solution) == 1:
-                        result.solution(0).symbol_map = getattr(
-                            _model, "._symbol_maps"
-                        )[result._smap_id]
-                        result.solution(0).default_variable_value = (
-                            self._default_variable_value
-                        )
-                        if self._load_solutions:
-                            _model.load_solution(result.solution(0))
-                    else:
-                        assert len(result.solution) == 0
-                    # see the hack in the write method
-                    # we don't want this to stick around on the model
-                    # after the solve
-                    assert len(getattr(_model, "._symbol_maps")) == 1
-                    delattr(_model, "._symbol_maps")
-                    del result._smap_id
-                    if self._load_solutions and (len(result.solution) == 0):
-                        logger.error("No solution is available")
-                else:
-                    if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value,
-                        )
-                        result._smap_id = None
-                        result.solution.clear()
-                    else:
-                        result._smap = _model.solutions.symbol_map[self._smap_id]
-                        _model.solutions.delete_symbol_map(self._smap_id)
-            postsolve_completion_time = time.time()
+        if not _model is None:
+            self._initialize_callbacks(_model)
+        return presolve_completion_time
 
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for postsolve"
-                    % (postsolve_completion_time - solve_completion_time)
-                )
+    def _solve_postsolve(self, _model, _status, presolve_completion_time):
+        """Check the solver status, run the postsolve, and load the results"""
+        from pyomo.core.kernel.block import IBlock
 
-        finally:
-            #
-            # Reset the options dict
-            #
-            self.options = orig_options
+        if hasattr(self, '_transformation_data'):
+            del self._transformation_data
+        if not hasattr(_status, 'rc'):
+            logger.warning(
+                "Solver (%s) did not return a solver status code.\n"
+                "This is indicative of an internal solver plugin error.\n"
+                "Please report this to the Pyomo developers."
+            )
+        elif _status.rc:
+            logger.error(
+                "Solver (%s) returned non-zero return code (%s)"
+                % (self.name, _status.rc)
+            )
+            if self._tee:
+                logger.error("See the solver log above for diagnostic information.")
+            elif hasattr(_status, 'log') and _status.log:
+                logger.error("Solver log:\n" + str(_status.log))
+            raise ApplicationError("Solver (%s) did not exit normally" % self.name)
+        solve_completion_time = time.time()
+        if self._report_timing:
+            print(
+                "      %6.2f seconds required for solver"
+                % (solve_completion_time - presolve_completion_time)
+            )
 
+        result = self._postsolve()
+        result._smap_id = self._smap_id
+        result._smap = None
+        if _model:
+            if isinstance(_model, IBlock):
+                if len(result.solution) == 1:
+                    result.solution(0).symbol_map = getattr(_model, "._symbol_maps")[
+                        result._smap_id
+                    ]
+                    result.solution(0).default_variable_value = (
+                        self._default_variable_value
+                    )
+                    if self._load_solutions:
+                        _model.load_solution(result.solution(0))
+                else:
+                    assert len(result.solution) == 0
+                # see the hack in the write method
+                # we don't want this to stick around on the model
+                # after the solve
+                assert len(getattr(_model, "._symbol_maps")) == 1
+                delattr(_model, "._symbol_maps")
+                del result._smap_id
+                if self._load_solutions and (len(result.solution) == 0):
+                    logger.error("No solution is available")
+            else:
+                if self._load_solutions:
+                    _model.solutions.load_from(
+                        result,
+                        select=self._select_index,
+                        default_variable_value=self._default_variable_value,
+                    )
+                    result._smap_id = None
+                    result.solution.clear()
+                else:
+                    result._smap = _model.solutions.symbol_map[self._smap_id]
+                    _model.solutions.delete_symbol_map(self._smap_id)
+        postsolve_completion_time = time.time()
+
+        if self._report_timing:
+            print(
+                "      %6.2f seconds required for postsolve"
+                % (postsolve_completion_time - solve_completion_time)
+            )
         return result
 
     def _presolve(self, *args, **kwds):
@@ -748,6 +800,19 @@ class OptSolver(object):
         """The routine that performs the solve"""
         raise NotImplementedError  # pragma:nocover
 
+    async def _async_apply_solver(self, tempfile_depth):
+        """The routine that performs the solve (as a coroutine)
+
+        Interfaces that can await the solver should override this
+        method.  While suspended, they must detach the TempfileManager
+        contexts above `tempfile_depth` (the depth of the context stack
+        before :meth:`_presolve` was called) so that they do not
+        interleave with the contexts of other solves.  The default
+        implementation calls :meth:`_apply_solver` (without suspending).
+
+        """
+        return self._apply_solver()
+
     def _postsolve(self):
         """The routine that does solve post-processing"""
         return self.results
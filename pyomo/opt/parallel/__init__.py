@@ -17,3 +17,4 @@ from pyomo.opt.parallel.async_solver import (
 )
 import pyomo.opt.parallel.manager
 import pyomo.opt.parallel.local
+import pyomo.opt.parallel.pool
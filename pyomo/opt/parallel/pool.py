@@ -0,0 +1,204 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import concurrent.futures
+import copy
+import pickle
+import time
+
+import pyomo.opt
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus, ActionHandle
+from pyomo.opt.parallel.async_solver import (
+    AsynchronousSolverManager,
+    SolverManagerFactory,
+)
+
+
+def _solve(opt, args, kwds):
+    """Solve a problem (in a worker thread or process)"""
+    time_start = time.time()
+    if isinstance(opt, str):
+        with pyomo.opt.SolverFactory(opt) as _opt:
+            results = _opt.solve(*args, **kwds)
+    else:
+        results = opt.solve(*args, **kwds)
+    results.pyomo_solve_time = time.time() - time_start
+    return results
+
+
+def _solve_and_store(data):
+    """Solve a model in a worker process
+
+    `data` is the pickled (solver, args, kwds) tuple.  The solution is
+    loaded into the (worker's copy of the) model and then stored back
+    into the results using ComponentUID labels so that it can be loaded
+    into the original model in the parent process.
+
+    """
+    from pyomo.core.base.block import BlockData
+
+    opt, args, kwds = pickle.loads(data)
+    results = _solve(opt, args, kwds)
+    if args and isinstance(args[0], BlockData):
+        args[0].solutions.store_to(results, cuid=True)
+    return results
+
+
+@SolverManagerFactory.register(
+    "pool", doc="Concurrently execute solvers locally using a pool of workers"
+)
+class SolverManager_Pool(AsynchronousSolverManager):
+    """A solver manager that solves queued problems concurrently
+
+    Parameters
+    ----------
+    max_workers: int, optional
+        The maximum number of concurrent solves (defaults to the
+        `concurrent.futures` default for the selected executor)
+
+    executor: str
+        The type of workers: 'thread' (default) or 'process'.
+
+        Threads are appropriate for solvers that run an external
+        executable (e.g., the shell-based solver interfaces): the
+        problem files are written (and the solutions loaded) by the
+        worker threads, while the solver executables run concurrently.
+        Each queued solve uses its own (shallow) copy of the solver
+        object.
+
+        Processes can also parallelize solvers that run within the
+        Python process (e.g., direct / persistent interfaces).  The
+        model (and solver) is pickled and sent to a worker process,
+        and the solution is loaded back into the original model.  The
+        solver must be picklable (or specified by name), and changes
+        that the solver makes to the model other than loading the
+        solution (e.g., adding components) are not returned.
+
+    """
+
+    def __init__(self, max_workers=None, executor='thread', **kwds):
+        if executor not in ('thread', 'process'):
+            raise ValueError(
+                "Unknown executor '%s' for %s: expected 'thread' or 'process'"
+                % (executor, type(self).__name__)
+            )
+        self._max_workers = max_workers
+        self._executor_type = executor
+        self._executor = None
+        super(SolverManager_Pool, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_Pool, self).clear()
+        # maps pending futures to (ActionHandle, model, load_solutions,
+        # select)
+        self._pending = {}
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the worker pool
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self._executor_type == 'process':
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers
+                )
+        return self._executor
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        from pyomo.core.base.block import BlockData
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__)
+            )
+
+        model = None
+        load_solutions = True
+        select = 0
+        if self._executor_type == 'process':
+            if args and isinstance(args[0], BlockData):
+                model = args[0]
+                # The solution is always loaded into the worker's copy
+                # of the model (so that it can be returned to this
+                # process); the decision to load it into the original
+                # model is made when the results are collected.
+                load_solutions = kwds.pop('load_solutions', True)
+                select = kwds.get('select', 0)
+            # Pickle the problem now (and not in the executor's feeder
+            # thread) so that the model can be safely modified after
+            # this method returns
+            future = self._get_executor().submit(
+                _solve_and_store, pickle.dumps((opt, args, kwds))
+            )
+        else:
+            # Solver objects are not reentrant: give each solve its own
+            # copy of the solver
+            if not isinstance(opt, str):
+                opt = copy.copy(opt)
+            future = self._get_executor().submit(_solve, opt, args, kwds)
+        self._pending[future] = (ah, model, load_solutions, select)
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if not self._pending:
+            return ActionHandle(
+                error=True,
+                explanation=(
+                    "No queued evaluations available in the 'pool' solver manager"
+                ),
+            )
+        done, _ = concurrent.futures.wait(
+            self._pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        # Return the completed action that was queued first
+        future = min(done, key=lambda f: self._pending[f][0].id)
+        ah, model, load_solutions, select = self._pending.pop(future)
+        try:
+            results = future.result()
+        except:
+            ah.status = ActionStatus.error
+            raise
+
+        if model is not None and load_solutions:
+            model.solutions.load_from(results, select=select)
+            results.solution.clear()
+
+        self.results[ah.id] = results
+        ah.status = ActionStatus.done
+        return ah
+
+    def __exit__(self, t, v, traceback):
+        self.shutdown()
@@ -14,6 +14,7 @@
 #
 
 import re
+from itertools import islice
 
 from pyomo.opt.base import results
 from pyomo.opt.base.formats import ResultsFormat
@@ -83,18 +84,15 @@ class ResultsReader_sol(results.AbstractResultsReader):
             raise ValueError("no Options line found")
         n = z[nopts + 3]  # variables
         m = z[nopts + 1]  # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
+        # Convert the dual and primal value blocks in bulk (calling
+        # readline() for each value is slow for large models)
+        y = list(map(float, islice(fin, m)))
+        x = list(map(float, islice(fin, n)))
+        if len(y) != m or len(x) != n:
+            raise ValueError(
+                "expected %d dual and %d primal values, but found %d and %d"
+                % (m, n, len(y), len(x))
+            )
         objno = [0, 0]
         line = fin.readline()
         if line:  # WEH - when is this true?
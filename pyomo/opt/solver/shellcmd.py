@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
 import os
 import sys
 import time
@@ -244,6 +245,31 @@ class SystemCallSolver(OptSolver):
             os.remove(self._soln_file)
 
     def _apply_solver(self):
+        self._report_command()
+        sys.stdout.flush()
+        self._rc, self._log = self._execute_command(self._command)
+        sys.stdout.flush()
+        return Bunch(rc=self._rc, log=self._log)
+
+    async def _async_apply_solver(self, tempfile_depth):
+        if type(self)._execute_command is not SystemCallSolver._execute_command:
+            # The derived class customized how the command is executed
+            # (so we cannot await it)
+            return await super()._async_apply_solver(tempfile_depth)
+        self._report_command()
+        sys.stdout.flush()
+        # Other solves may push / pop tempfile contexts while this
+        # solver runs: detach the contexts for this solve from the
+        # stack and restore them before the results are processed
+        contexts = TempfileManager.detach(tempfile_depth)
+        try:
+            self._rc, self._log = await self._async_execute_command(self._command)
+        finally:
+            TempfileManager.attach(contexts)
+        sys.stdout.flush()
+        return Bunch(rc=self._rc, log=self._log)
+
+    def _report_command(self):
         if pyomo.common.Executable('timer'):
             self._timer = pyomo.common.Executable('timer').path()
         #
@@ -262,11 +288,6 @@ class SystemCallSolver(OptSolver):
             if self._problem_files != []:
                 print("Solver problem files: %s" % str(self._problem_files))
 
-        sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
-        sys.stdout.flush()
-        return Bunch(rc=self._rc, log=self._log)
-
     def _postsolve(self):
         if self._log_file is not None:
             OUTPUT = open(self._log_file, "w")
@@ -356,6 +377,69 @@ class SystemCallSolver(OptSolver):
 
         return [rc, log]
 
+    async def _async_execute_command(self, command):
+        """
+        Execute the command (as a coroutine)
+        """
+
+        start_time = time.time()
+
+        if 'script' in command:
+            _input = command.script.encode()
+        else:
+            _input = None
+
+        timeout = self._timelimit
+        if timeout is not None:
+            timeout += max(
+                SUBPROCESS_TIMEOUT_ABS_ADJUST,
+                SUBPROCESS_TIMEOUT_REL_ADJUST * self._timelimit,
+            )
+
+        cmd = command.cmd
+        if isinstance(cmd, str):
+            cmd = [cmd]
+
+        ostreams = [StringIO()]
+        if self._tee:
+            ostreams.append(sys.stdout)
+
+        try:
+            with TeeStream(*ostreams) as t:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=None if _input is None else asyncio.subprocess.PIPE,
+                    stdout=t.STDOUT,
+                    stderr=t.STDERR,
+                    env=command.env,
+                    cwd=command.cwd if "cwd" in command else None,
+                )
+                try:
+                    await asyncio.wait_for(process.communicate(_input), timeout)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise subprocess.TimeoutExpired(command.cmd, timeout)
+                except asyncio.CancelledError:
+                    # Do not leave the solver running if the solve is
+                    # cancelled
+                    process.kill()
+                    raise
+                t.STDOUT.flush()
+                t.STDERR.flush()
+
+            rc = process.returncode
+            log = ostreams[0].getvalue()
+        except OSError:
+            err = sys.exc_info()[1]
+            msg = 'Could not execute the command: %s\tError message: %s'
+            raise ApplicationError(msg % (command.cmd, err))
+        sys.stdout.flush()
+
+        self._last_solve_time = time.time() - start_time
+
+        return [rc, log]
+
     def process_output(self, rc):
         """
         Process the output files.
@@ -0,0 +1,112 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import threading
+
+import pyomo.common.unittest as unittest
+
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.core.base.label import NumericLabeler
+from pyomo.environ import ConcreteModel, Var
+from pyomo.opt import SolverResults, SolverStatus, SolutionStatus
+from pyomo.opt.parallel import SolverManagerFactory
+from pyomo.opt.parallel.manager import ActionManagerError, solve_all_instances
+from pyomo.opt.parallel.pool import SolverManager_Pool
+from pyomo.opt.results.solution import Solution
+
+
+class MockSolver(object):
+    """Solver that reports the process / thread that it ran in"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def solve(self, model, load_solutions=True, select=0):
+        if self.fail:
+            raise RuntimeError("mock solver failure")
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        soln = Solution()
+        soln.status = SolutionStatus.optimal
+        smap = SymbolMap()
+        labeler = NumericLabeler('x')
+        soln.variable[smap.getSymbol(model.pid, labeler)] = {'Value': os.getpid()}
+        soln.variable[smap.getSymbol(model.tid, labeler)] = {
+            'Value': threading.get_ident()
+        }
+        results.solution.insert(soln)
+        results._smap = smap
+        results._smap_id = None
+        if load_solutions:
+            model.solutions.load_from(results, select=select)
+            results.solution.clear()
+        return results
+
+
+def make_model():
+    m = ConcreteModel()
+    m.pid = Var()
+    m.tid = Var()
+    return m
+
+
+class TestPoolSolverManager(unittest.TestCase):
+    def test_factory(self):
+        with SolverManagerFactory('pool', max_workers=2) as manager:
+            self.assertIsInstance(manager, SolverManager_Pool)
+        with self.assertRaisesRegex(ValueError, "Unknown executor 'bogus'"):
+            SolverManagerFactory('pool', executor='bogus')
+
+    def test_no_solver(self):
+        with SolverManager_Pool() as manager:
+            with self.assertRaisesRegex(ActionManagerError, "No solver passed"):
+                manager.queue(make_model())
+
+    def test_threads(self):
+        models = [make_model() for i in range(4)]
+        with SolverManager_Pool(max_workers=2) as manager:
+            ahs = [manager.queue(m, solver=MockSolver()) for m in models]
+            manager.wait_all(ahs)
+            for ah, m in zip(ahs, models):
+                results = manager.get_results(ah)
+                self.assertEqual(results.solver.status, SolverStatus.ok)
+                self.assertEqual(len(results.solution), 0)
+                self.assertEqual(m.pid.value, os.getpid())
+                self.assertNotEqual(m.tid.value, threading.get_ident())
+
+    def test_processes(self):
+        models = [make_model() for i in range(4)]
+        with SolverManager_Pool(max_workers=2, executor='process') as manager:
+            solve_all_instances(manager, MockSolver(), models)
+        for m in models:
+            self.assertIsNotNone(m.pid.value)
+            self.assertNotEqual(m.pid.value, os.getpid())
+
+    def test_processes_no_load(self):
+        m = make_model()
+        with SolverManager_Pool(executor='process') as manager:
+            results = manager.solve(m, solver=MockSolver(), load_solutions=False)
+        self.assertIsNone(m.pid.value)
+        self.assertEqual(len(results.solution), 1)
+        m.solutions.load_from(results)
+        self.assertNotEqual(m.pid.value, os.getpid())
+
+    def test_solver_error(self):
+        for executor in ('thread', 'process'):
+            with SolverManager_Pool(executor=executor) as manager:
+                manager.queue(make_model(), solver=MockSolver(fail=True))
+                with self.assertRaisesRegex(RuntimeError, "mock solver failure"):
+                    manager.wait_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
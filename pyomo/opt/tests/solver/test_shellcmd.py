@@ -12,14 +12,21 @@
 # Unit Tests for pyomo.opt.base.OS
 #
 
+import asyncio
 import os
+import subprocess
+import sys
+import time
 
 import pyomo.common.unittest as unittest
+from pyomo.common.collections import Bunch
 from pyomo.common.errors import ApplicationError
 from pyomo.common.fileutils import this_file_dir
+from pyomo.common.tempfiles import TempfileManager
 
-from pyomo.opt.base import UnknownSolver
+from pyomo.opt.base import ResultsFormat, UnknownSolver
 from pyomo.opt.base.solvers import SolverFactory
+from pyomo.opt.results import SolverResults
 from pyomo.opt.solver import SystemCallSolver
 
 thisdir = os.path.normpath(this_file_dir())
@@ -300,5 +307,118 @@ class TestSystemCallSolver(unittest.TestCase):
                 self.assertTrue(os.path.samefile(opt.executable(), isexe_abspath))
 
 
+class MockShellSolver(SystemCallSolver):
+    """A "solver" that runs a Python script (passed as the problem)
+
+    Like the shell solver plugins, this pushes its own tempfile context
+    (for the script file) in the presolve.  The script reads the input
+    (written to a temporary file in the presolve) from stdin.
+    """
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'mock_shell'
+        SystemCallSolver.__init__(self, **kwds)
+        self._results_format = ResultsFormat.soln
+
+    def _default_executable(self):
+        return sys.executable
+
+    def _presolve(self, *args, **kwds):
+        TempfileManager.push()
+        script_file = TempfileManager.create_tempfile(suffix='.py')
+        with open(script_file, 'w') as FILE:
+            FILE.write("import sys\nsys.stdin = open(sys.argv[1])\n" + args[0])
+        self._input = kwds.pop('input', '')
+        self._problem_files = [script_file]
+        self._smap_id = None
+        SystemCallSolver._presolve(self, **kwds)
+
+    def create_command_line(self, executable, problem_files):
+        self._input_file = TempfileManager.create_tempfile(suffix='.txt')
+        with open(self._input_file, 'w') as FILE:
+            FILE.write(self._input)
+        return Bunch(
+            cmd=[executable, problem_files[0], self._input_file],
+            log_file=None,
+            env=None,
+        )
+
+    def process_logfile(self):
+        results = SolverResults()
+        results.solver.message = self._log.strip()
+        return results
+
+    def _postsolve(self):
+        results = SystemCallSolver._postsolve(self)
+        TempfileManager.pop(remove=not self._keepfiles)
+        return results
+
+
+class MockShellSolver_CustomExecute(MockShellSolver):
+    def _execute_command(self, command):
+        return [0, 'custom']
+
+
+class TestAsyncSolve(unittest.TestCase):
+    def test_async_solve(self):
+        opt = MockShellSolver()
+        results = asyncio.run(opt.async_solve("print(sys.stdin.read())", input="hello"))
+        self.assertEqual(results.solver.message, "hello")
+        self.assertEqual(results.solver.error_rc, 0)
+        self.assertIsNotNone(results.solver.time)
+        self.assertFalse(os.path.exists(opt._input_file))
+
+        # The synchronous solve gives the same result
+        results = opt.solve("print(sys.stdin.read())", input="hello")
+        self.assertEqual(results.solver.message, "hello")
+
+    def test_concurrent_solves(self):
+        script = "import time\ntime.sleep(1)\nprint(sys.stdin.read())"
+        depth = TempfileManager.depth
+
+        async def solve_all(n):
+            opts = [MockShellSolver() for i in range(n)]
+            results = await asyncio.gather(
+                *(opt.async_solve(script, input=str(i)) for i, opt in enumerate(opts))
+            )
+            return opts, results
+
+        start = time.time()
+        opts, results = asyncio.run(solve_all(4))
+        elapsed = time.time() - start
+        # The solvers ran concurrently
+        self.assertLess(elapsed, 3)
+        self.assertEqual([r.solver.message for r in results], ['0', '1', '2', '3'])
+        # Each solve released its own tempfile context
+        self.assertEqual(TempfileManager.depth, depth)
+        for opt in opts:
+            self.assertFalse(os.path.exists(opt._input_file))
+
+    def test_async_solve_error(self):
+        opt = MockShellSolver()
+        depth = TempfileManager.depth
+        with self.assertRaisesRegex(
+            ApplicationError, r"Solver \(mock_shell\) did not exit normally"
+        ):
+            asyncio.run(opt.async_solve("sys.exit(3)"))
+        self.assertEqual(opt._rc, 3)
+        TempfileManager.pop()
+        TempfileManager.pop()
+        self.assertEqual(TempfileManager.depth, depth)
+
+    def test_async_solve_timeout(self):
+        opt = MockShellSolver()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            asyncio.run(opt.async_solve("import time\ntime.sleep(30)", timelimit=0))
+        TempfileManager.pop()
+        TempfileManager.pop()
+
+    def test_async_solve_custom_execute(self):
+        # Solvers that customize _execute_command() are run synchronously
+        opt = MockShellSolver_CustomExecute()
+        results = asyncio.run(opt.async_solve("print('unused')"))
+        self.assertEqual(results.solver.message, "custom")
+
+
 if __name__ == "__main__":
     unittest.main()
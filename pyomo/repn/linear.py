@@ -62,6 +62,14 @@ _GENERAL = ExprType.GENERAL
 
 
 def _merge_dict(dest_dict, mult, src_dict):
+    if not dest_dict:
+        # Fast path (common when accumulating cached named
+        # subexpressions): there are no collisions to resolve
+        if mult == 1:
+            dest_dict.update(src_dict)
+        else:
+            dest_dict.update({vid: mult * coef for vid, coef in src_dict.items()})
+        return
     if mult == 1:
         for vid, coef in src_dict.items():
             if vid in dest_dict:
@@ -346,15 +354,19 @@ def _handle_unary_nonlinear(visitor, node, arg):
 
 
 def _handle_named_constant(visitor, node, arg1):
-    # Record this common expression
-    visitor.subexpression_cache[id(node)] = arg1
+    # Record this common expression (along with the expression it was
+    # generated from so that we can detect if the named expression is
+    # later reassigned)
+    visitor.subexpression_cache[id(node)] = (*arg1, node.arg(0))
     return arg1
 
 
 def _handle_named_ANY(visitor, node, arg1):
-    # Record this common expression
-    visitor.subexpression_cache[id(node)] = arg1
+    # Record this common expression (along with the expression it was
+    # generated from so that we can detect if the named expression is
+    # later reassigned)
     _type, arg1 = arg1
+    visitor.subexpression_cache[id(node)] = (_type, arg1, node.arg(0))
     return _type, arg1.duplicate()
 
 
@@ -681,11 +693,16 @@ class LinearBeforeChildDispatcher(BeforeChildDispatcher):
     def _before_named_expression(visitor, child):
         _id = id(child)
         if _id in visitor.subexpression_cache:
-            _type, expr = visitor.subexpression_cache[_id]
+            _type, repn, expr = visitor.subexpression_cache[_id]
+            if expr is not child.arg(0):
+                # The named expression was reassigned since we last
+                # compiled it: discard the stale entry and descend
+                del visitor.subexpression_cache[_id]
+                return True, None
             if _type is _CONSTANT:
-                return False, (_type, expr)
+                return False, (_type, repn)
             else:
-                return False, (_type, expr.duplicate())
+                return False, (_type, repn.duplicate())
         else:
             return True, None
 
@@ -0,0 +1,637 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Rule-level ("templatized") compilation of linear indexed constraints
+
+Writers normally generate the linear representation of every
+:py:class:`ConstraintData` by walking its expression tree.  For indexed
+constraints that were built from a single rule, this module instead
+templatizes the rule (see :py:func:`templatize_constraint`) and
+compiles the resulting template expression *once* into a list of
+terms (simple nested tuples).  The terms are interpreted for all
+indices of the constraint at once to directly generate the constant
+and the list of ``(VarData, coefficient)`` terms of each (normalized)
+constraint body.  Instantiating a row therefore costs a few list
+operations per term instead of a full expression tree walk.
+
+Only linear templates are supported.  Any construct that the compiler
+does not recognize (nonlinear terms, named expressions, rules with
+data-dependent control flow, rules that convert the index to a
+string, etc.) causes :py:func:`compile_linear_template` to return
+None, and callers should fall back on walking the individual
+constraint expressions.  Rows that were modified after the constraint
+was constructed are never generated from the template (see
+:py:meth:`LinearTemplate.is_modified`).
+
+"""
+
+import logging
+import math
+from io import StringIO
+from operator import mul, truediv
+
+from pyomo.common.errors import DeveloperError
+from pyomo.common.log import LoggingIntercept
+from pyomo.common.numeric_types import native_numeric_types, value
+from pyomo.core.base.initializer import IndexedCallInitializer
+from pyomo.core.base.param import Param
+from pyomo.core.base.set import Set
+from pyomo.core.base.var import Var
+from pyomo.core.expr.numeric_expr import (
+    DivisionExpression,
+    MonomialTermExpression,
+    NegationExpression,
+    PowExpression,
+    ProductExpression,
+    SumExpression,
+    UnaryFunctionExpression,
+)
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+)
+from pyomo.core.expr.template_expr import (
+    GetItemExpression,
+    IndexTemplate,
+    TemplateSumExpression,
+    _template_iter_context,
+    templatize_constraint,
+)
+
+logger = logging.getLogger(__name__)
+
+# Relative tolerance used when checking a compiled template against the
+# representation generated by walking the constraint expression
+TOL = 1e-12
+
+
+class _NotTemplatizable(Exception):
+    pass
+
+
+# Opcodes for the (tuple) nodes generated by the compiler
+_CONST, _INDEX, _ITEM, _PARAM, _PROD, _DIV, _POW, _FCN, _FLOAT, _SUM, _LOOP = range(11)
+
+_ONE = (_CONST, 1)
+
+
+def _scale(factor, node):
+    if node is _ONE:
+        return factor
+    return (_PROD, factor, node)
+
+
+def _expand(loops, cols, n):
+    """Expand a frame of `n` rows over a tuple of nested loops
+
+    Each loop is a ``(targets, set_node)`` tuple, where `targets` are
+    the ids of the IndexTemplate objects bound by iterating over the
+    set.  Returns the columns of the expanded frame, its number of
+    rows, and the row of the original frame that generated each
+    expanded row.
+
+    """
+    owner = range(n)
+    for targets, set_node in loops:
+        rows = []
+        bound = [[] for _ in targets]
+        if set_node[0] == _CONST:
+            members = list(set_node[1])
+            sets = (members for _ in range(n))
+        else:
+            sets = map(list, _evaluate(set_node, cols, n))
+        for r, members in enumerate(sets):
+            rows.extend([r] * len(members))
+            if len(targets) == 1:
+                bound[0].extend(members)
+                continue
+            for val in members:
+                if len(val) != len(targets):
+                    raise ValueError(
+                        f"cannot bind {len(targets)} index templates to {val!r}"
+                    )
+                for col, v in zip(bound, val):
+                    col.append(v)
+        cols = {tid: [col[r] for r in rows] for tid, col in cols.items()}
+        cols.update(zip(targets, bound))
+        owner = [owner[r] for r in rows]
+        n = len(rows)
+    return cols, n, owner
+
+
+def _evaluate(node, cols, n):
+    """Evaluate a compiled template node for a frame of `n` rows
+
+    `cols` maps IndexTemplate ids to the list of index values for each
+    row.  Returns the list of values of `node` for each row.
+
+    """
+    op = node[0]
+    if op == _CONST:
+        return [node[1]] * n
+    if op == _INDEX:
+        return cols[node[1]]
+    if op == _ITEM or op == _PARAM:
+        base = node[1]
+        if len(node[2]) == 1:
+            keys = _evaluate(node[2][0], cols, n)
+        else:
+            keys = zip(*[_evaluate(i, cols, n) for i in node[2]])
+        if op == _ITEM:
+            return [base[k] for k in keys]
+        return [value(base[k]) for k in keys]
+    if op == _PROD:
+        return list(map(mul, _evaluate(node[1], cols, n), _evaluate(node[2], cols, n)))
+    if op == _DIV:
+        return list(
+            map(truediv, _evaluate(node[1], cols, n), _evaluate(node[2], cols, n))
+        )
+    if op == _POW:
+        return list(map(pow, _evaluate(node[1], cols, n), _evaluate(node[2], cols, n)))
+    if op == _FCN:
+        return list(map(node[1], _evaluate(node[2], cols, n)))
+    if op == _FLOAT:
+        return list(map(float, _evaluate(node[1], cols, n)))
+    if op == _SUM:
+        return list(map(sum, zip(*[_evaluate(arg, cols, n) for arg in node[1]])))
+    if op == _LOOP:
+        ans = [0] * n
+        sub_cols, m, owner = _expand(node[1], cols, n)
+        for r, val in zip(owner, _evaluate(node[2], sub_cols, m)):
+            ans[r] += val
+        return ans
+    raise DeveloperError(f"unknown linear template opcode {op}")
+
+
+class _LinearForm(object):
+    """Symbolic linear expression used while compiling a template
+
+    `const` is a list of ``(loops, node)`` and `terms` is a list of
+    ``(loops, var_node, coef_node)`` tuples, where `loops` is a tuple
+    of ``(targets, set_node)`` loops contributed by enclosing template
+    sums.
+
+    """
+
+    __slots__ = ('const', 'terms', 'templated')
+
+    def __init__(self, const=(), terms=(), templated=False):
+        self.const = list(const)
+        self.terms = list(terms)
+        self.templated = templated
+
+    def is_constant(self):
+        return not self.terms
+
+    def const_node(self):
+        parts = [(_LOOP, loops, node) if loops else node for loops, node in self.const]
+        if not parts:
+            return (_CONST, 0)
+        if len(parts) == 1:
+            return parts[0]
+        return (_SUM, tuple(parts))
+
+    def scale(self, factor):
+        return _LinearForm(
+            [(loops, _scale(factor, node)) for loops, node in self.const],
+            [(loops, v, _scale(factor, c)) for loops, v, c in self.terms],
+            self.templated,
+        )
+
+    def add(self, other):
+        self.const.extend(other.const)
+        self.terms.extend(other.terms)
+        self.templated |= other.templated
+        return self
+
+
+def collect_linear_terms(const, terms, visitor, record_var, fixed_value):
+    """Aggregate ``(VarData, coefficient)`` terms into a (constant, linear) pair
+
+    `linear` maps ``id(var)`` to the coefficient.  Variables are
+    registered with the visitor's `var_map` (through `record_var`)
+    using the same rules as the repn visitors: fixed variables that do
+    not already appear in the `var_map` are replaced by
+    ``fixed_value(visitor, id, var)``.  Repeated terms are aggregated
+    and zero coefficients are removed.
+
+    """
+    var_map = visitor.var_map
+    linear = {}
+    for var, coef in terms:
+        vid = id(var)
+        if vid not in var_map:
+            if var.fixed:
+                const += coef * fixed_value(visitor, vid, var)
+                continue
+            record_var(visitor, var)
+        if vid in linear:
+            linear[vid] += coef
+        else:
+            linear[vid] = coef
+    for vid in [vid for vid, coef in linear.items() if not coef]:
+        del linear[vid]
+    return const, linear
+
+
+class LinearTemplate(object):
+    """A compiled linear template for an indexed constraint
+
+    Calling the template with the index of one of the constraint's
+    :py:class:`ConstraintData` returns a tuple ``(lb, constant, terms,
+    ub)`` for the normalized constraint (as returned by
+    :py:meth:`ConstraintData.to_bounded_expression`), where `terms` is
+    a list of ``(VarData, coefficient)`` pairs and the bounds have not
+    been checked for finiteness.  Terms are not aggregated and fixed
+    variables are not substituted; see :py:meth:`collect`.
+
+    The template is interpreted for many indices at once (see
+    :py:meth:`instantiate`), so that the cost of interpreting the
+    template nodes is paid once per term and not once per row.
+
+    """
+
+    __slots__ = (
+        'component',
+        'indices',
+        'lb',
+        'const',
+        'terms',
+        'ub',
+        'float_const',
+        '_rows',
+    )
+
+    def __init__(self, component, indices, lb, const, terms, ub):
+        self.component = component
+        # ids of the IndexTemplate objects bound to the constraint index
+        self.indices = indices
+        self.lb = lb
+        self.const = const
+        # Terms outside of any template sum are generated first
+        self.terms = [t for t in terms if not t[0]] + [t for t in terms if t[0]]
+        self.ub = ub
+        # Set by verify() if the repn visitor generates float constants
+        # for this constraint
+        self.float_const = False
+        # Rows instantiated by collect(): None before the first call,
+        # False after it, then a dict mapping index to row
+        self._rows = None
+
+    def __call__(self, index):
+        return self.instantiate([index])[0]
+
+    def instantiate(self, indices):
+        """Instantiate the template for a list of constraint indices
+
+        Returns the list of ``(lb, constant, terms, ub)`` tuples (see
+        :py:meth:`__call__`) for each index.
+
+        """
+        n = len(indices)
+        if not n:
+            return []
+        if len(self.indices) == 1:
+            cols = {self.indices[0]: list(indices)}
+        else:
+            cols = dict(zip(self.indices, map(list, zip(*indices))))
+        terms = [[] for _ in range(n)]
+        for loops, var, coef in self.terms:
+            if loops:
+                sub_cols, m, owner = _expand(loops, cols, n)
+            else:
+                sub_cols, m, owner = cols, n, range(n)
+            for r, v, c in zip(
+                owner, _evaluate(var, sub_cols, m), _evaluate(coef, sub_cols, m)
+            ):
+                terms[r].append((v, c))
+        none = [None] * n
+        return list(
+            zip(
+                none if self.lb is None else _evaluate(self.lb, cols, n),
+                _evaluate(self.const, cols, n),
+                terms,
+                none if self.ub is None else _evaluate(self.ub, cols, n),
+            )
+        )
+
+    def is_modified(self, con):
+        """Return True if `con` was set after the constraint was constructed
+
+        Rows that were added or modified (e.g., through
+        :py:meth:`ConstraintData.set_value`) after construction need
+        not match the rule and must not be generated from the template.
+
+        """
+        return con._index in self.component._modified_indices
+
+    def _row(self, index):
+        rows = self._rows
+        if rows is None:
+            # The first row is instantiated by itself, as writers use it
+            # to verify the template
+            self._rows = False
+            return self(index)
+        if rows is False:
+            modified = self.component._modified_indices
+            keys = [idx for idx in self.component.keys() if idx not in modified]
+            rows = self._rows = dict(zip(keys, self.instantiate(keys)))
+        if index in rows:
+            return rows.pop(index)
+        return self(index)
+
+    def collect(self, con, visitor, record_var, fixed_value):
+        """Instantiate the template for `con` into (lb, constant, linear, ub)
+
+        Variables are registered with the visitor's `var_map` (through
+        `record_var`) using the same rules as the repn visitors: fixed
+        variables that do not already appear in the `var_map` are
+        replaced by ``fixed_value(visitor, id, var)``.  Repeated terms
+        are aggregated and zero coefficients are removed.  The bounds
+        are evaluated as by ``con.to_bounded_expression(True)``.
+
+        All remaining rows of the constraint are instantiated together
+        (and held until they are collected) the second time this is
+        called.
+
+        """
+        lb, const, terms, ub = self._row(con._index)
+        const, linear = collect_linear_terms(
+            const, terms, visitor, record_var, fixed_value
+        )
+        if self.float_const:
+            const = float(const)
+        return (
+            con._evaluate_bound(lb, True),
+            const,
+            linear,
+            con._evaluate_bound(ub, False),
+        )
+
+    def verify(self, instance, lb, const, linear, ub):
+        """Return True if an instantiated template matches a walked repn
+
+        `instance` is the ``(lb, constant, linear, ub)`` tuple returned
+        by :py:meth:`collect`.  The repn visitors do not agree on when
+        the constant becomes a float (e.g., ``x/2`` may turn a constant
+        ``0`` into ``0.0``).  As the walked constant is written to the
+        output file, a float constant is recorded so that subsequent
+        calls to :py:meth:`collect` generate it, too.
+
+        """
+        t_lb, t_const, t_linear, t_ub = instance
+        if t_lb != lb or t_ub != ub or t_linear.keys() != linear.keys():
+            return False
+        # int / float differences change how the bounds are written
+        if t_lb.__class__ is not lb.__class__ or t_ub.__class__ is not ub.__class__:
+            return False
+        if t_const.__class__ is not const.__class__:
+            if const.__class__ is not float or t_const.__class__ is not int:
+                return False
+            self.float_const = True
+        if not math.isclose(t_const, const, rel_tol=TOL, abs_tol=TOL):
+            return False
+        return all(
+            math.isclose(coef, linear[vid], rel_tol=TOL, abs_tol=TOL)
+            for vid, coef in t_linear.items()
+        )
+
+
+def _is_pyomo_valued(node):
+    """Return True if the (constant) template `node` would resolve to a
+    Pyomo object (and not a native number) for a concrete index"""
+    if node.__class__ in native_numeric_types or node.__class__ is IndexTemplate:
+        return False
+    if not node.is_expression_type():
+        return True
+    if isinstance(node, GetItemExpression):
+        base = node.arg(0)
+        return getattr(base, 'ctype', None) is not Param or base.mutable
+    if isinstance(node, TemplateSumExpression):
+        return _is_pyomo_valued(node._local_args_[0])
+    return any(_is_pyomo_valued(arg) for arg in node.args)
+
+
+class _LinearTemplateCompiler(object):
+    def __init__(self):
+        self.names = {}
+
+    def literal(self, val):
+        if val.__class__ not in native_numeric_types:
+            raise _NotTemplatizable()
+        return (_CONST, val)
+
+    def name_template(self, template):
+        if template._id is None:
+            raise _NotTemplatizable()
+        name = self.names[id(template)] = template._id
+        return name
+
+    def fold(self, lf):
+        """Evaluate a constant (non-templated) linear form"""
+        if not lf.is_constant() or lf.templated:
+            raise _NotTemplatizable()
+        return _evaluate(lf.const_node(), {}, 1)[0]
+
+    def constant(self, lf):
+        if lf.templated:
+            if not lf.is_constant():
+                raise _NotTemplatizable()
+            return lf.const_node()
+        # Fold constant (non-templated) subexpressions at compile time
+        return self.literal(self.fold(lf))
+
+    def compile(self, node):
+        if node.__class__ in native_numeric_types:
+            return _LinearForm([((), self.literal(node))])
+        if node.__class__ is IndexTemplate:
+            try:
+                return _LinearForm(
+                    [((), (_INDEX, self.names[id(node)]))], templated=True
+                )
+            except KeyError:
+                raise _NotTemplatizable()
+        if not node.is_expression_type():
+            if node.is_variable_type():
+                return _LinearForm(terms=[((), (_CONST, node), _ONE)])
+            if node.is_potentially_variable():
+                raise _NotTemplatizable()
+            return _LinearForm([((), self.literal(value(node)))])
+        if node.is_named_expression_type():
+            raise _NotTemplatizable()
+        if isinstance(node, GetItemExpression):
+            return self._compile_getitem(node)
+        if isinstance(node, TemplateSumExpression):
+            return self._compile_template_sum(node)
+        if isinstance(node, SumExpression):
+            ans = _LinearForm()
+            for arg in node.args:
+                ans.add(self.compile(arg))
+            return ans
+        if isinstance(node, NegationExpression):
+            return self.compile(node.arg(0)).scale((_CONST, -1))
+        if isinstance(node, (MonomialTermExpression, ProductExpression)):
+            lhs = self.compile(node.arg(0))
+            rhs = self.compile(node.arg(1))
+            if lhs.is_constant():
+                ans = rhs.scale(self.constant(lhs))
+            elif rhs.is_constant():
+                ans = lhs.scale(self.constant(rhs))
+            else:
+                raise _NotTemplatizable()
+            ans.templated = lhs.templated or rhs.templated
+            return ans
+        if isinstance(node, DivisionExpression):
+            num = self.compile(node.arg(0))
+            den = self.compile(node.arg(1))
+            if den.templated:
+                ans = num.scale((_DIV, _ONE, self.constant(den)))
+            else:
+                ans = num.scale(self.literal(1 / self.fold(den)))
+            ans.templated = num.templated or den.templated
+            return ans
+        if isinstance(node, PowExpression):
+            base = self.compile(node.arg(0))
+            exp = self.compile(node.arg(1))
+            return _LinearForm(
+                [((), (_POW, self.constant(base), self.constant(exp)))],
+                templated=base.templated or exp.templated,
+            )
+        if isinstance(node, UnaryFunctionExpression):
+            arg = self.compile(node.arg(0))
+            return _LinearForm(
+                [((), (_FCN, node._fcn, self.constant(arg)))], templated=arg.templated
+            )
+        raise _NotTemplatizable()
+
+    def _compile_getitem(self, node):
+        base = node.arg(0)
+        if base.__class__ in native_numeric_types or base.is_expression_type():
+            raise _NotTemplatizable()
+        idx = [self.compile(arg) for arg in node.args[1:]]
+        idx_nodes = tuple(self.constant(i) for i in idx)
+        templated = any(i.templated for i in idx)
+        ctype = getattr(base, 'ctype', None)
+        if ctype is Var:
+            return _LinearForm(
+                terms=[((), (_ITEM, base, idx_nodes), _ONE)], templated=templated
+            )
+        if ctype is Param:
+            return _LinearForm([((), (_PARAM, base, idx_nodes))], templated=templated)
+        if ctype is Set:
+            return _LinearForm([((), (_ITEM, base, idx_nodes))], templated=templated)
+        raise _NotTemplatizable()
+
+    def _compile_template_sum(self, node):
+        if not node._iters:
+            # Generators over plain Python iterables are only recorded
+            # for their first element
+            raise _NotTemplatizable()
+        loops = []
+        for group in node._iters:
+            _set = group[0]._set
+            if _set.is_expression_type():
+                set_node = self.constant(self.compile(_set))
+            else:
+                set_node = (_CONST, _set)
+            targets = tuple(self.name_template(t) for t in group)
+            loops.append((targets, set_node))
+        loops = tuple(loops)
+        body = self.compile(node._local_args_[0])
+        return _LinearForm(
+            [(loops + l, n) for l, n in body.const],
+            [(loops + l, v, c) for l, v, c in body.terms],
+            templated=True,
+        )
+
+    def compile_bound(self, node):
+        ans = self.constant(self.compile(node))
+        if _is_pyomo_valued(node):
+            # Mirror ConstraintData._evaluate_bound(), which converts
+            # non-native bounds to float
+            return (_FLOAT, ans)
+        return ans
+
+    def compile_relational(self, expr):
+        """Compile a relational template into (lb, body, ub)
+
+        This follows the normalization applied by
+        :py:meth:`ConstraintData.to_bounded_expression`.  Missing
+        bounds are returned as None.
+
+        """
+        if expr.__class__ is RangedExpression:
+            lb, body, ub = expr.args
+            return self.compile_bound(lb), self.compile(body), self.compile_bound(ub)
+        if expr.__class__ not in (EqualityExpression, InequalityExpression):
+            raise _NotTemplatizable()
+        equality = expr.__class__ is EqualityExpression
+        lhs, rhs = expr.args
+        if rhs.__class__ in native_numeric_types or not rhs.is_potentially_variable():
+            ub = self.compile_bound(rhs)
+            return ub if equality else None, self.compile(lhs), ub
+        if lhs.__class__ in native_numeric_types or not lhs.is_potentially_variable():
+            lb = self.compile_bound(lhs)
+            return lb, self.compile(rhs), lb if equality else None
+        body = self.compile(lhs).add(self.compile(rhs).scale((_CONST, -1)))
+        return (_CONST, 0) if equality else None, body, (_CONST, 0)
+
+
+def compile_linear_template(constraint):
+    """Compile a linear template for an indexed constraint
+
+    Returns a :py:class:`LinearTemplate`, or None if the constraint was
+    not built from a (templatizable) rule or its body is not linear.
+
+    Note that the constraint rule is called (with
+    :py:class:`IndexTemplate` arguments) to generate the template.
+    Rules that convert the index to a string are rejected, as the
+    result would not depend on the index.
+
+    """
+    if (
+        not constraint.is_indexed()
+        or constraint._modified_indices is None
+        or constraint.rule.__class__ not in (IndexedCallInitializer,)
+    ):
+        return None
+    compiler = _LinearTemplateCompiler()
+    context = _template_iter_context()
+    try:
+        # Errors while templatizing the rule are expected for rules
+        # that are not templatizable: suppress the logged error
+        with LoggingIntercept(StringIO(), 'pyomo.core.expr.template_expr'):
+            expr, indices = templatize_constraint(constraint, context)
+        if context.string_conversions:
+            raise _NotTemplatizable("rule converted the index to a string")
+        for template in indices:
+            if template.__class__ is not IndexTemplate or (
+                len(indices) > 1 and template._index is None
+            ):
+                raise _NotTemplatizable()
+            compiler.name_template(template)
+        lb, body, ub = compiler.compile_relational(expr)
+    except Exception:
+        logger.debug(
+            "Constraint '%s' could not be compiled to a linear template",
+            constraint.name,
+            exc_info=True,
+        )
+        return None
+    return LinearTemplate(
+        constraint,
+        tuple(template._id for template in indices),
+        lb,
+        body.const_node(),
+        body.terms,
+        ub,
+    )
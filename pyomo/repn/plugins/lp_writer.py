@@ -10,13 +10,16 @@
 #  ___________________________________________________________________________
 
 import logging
+import multiprocessing
 from io import StringIO
+from itertools import islice
 from operator import itemgetter, attrgetter
 
 from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
     InEnum,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.gc_manager import PauseGC
@@ -36,9 +39,11 @@ from pyomo.core.base import (
     minimize,
 )
 from pyomo.core.base.component import ActiveComponent
+from pyomo.core.base.constraint import CompactLinearConstraintData
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
 from pyomo.opt import WriterFactory
-from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear import LinearBeforeChildDispatcher, LinearRepnVisitor
+from pyomo.repn.linear_template import collect_linear_terms, compile_linear_template
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
     FileDeterminism,
@@ -59,6 +64,10 @@ inf = float('inf')
 neg_inf = float('-inf')
 
 
+def _fixed_value(visitor, vid, var):
+    return visitor.check_constant(var.value, var)
+
+
 # TODO: make a proper base class
 class LPWriterInfo(object):
     """Return type for LPWriter.write()
@@ -186,6 +195,45 @@ class LPWriter(object):
             description='If True, allow quadratic terms in the model constraints',
         ),
     )
+    CONFIG.declare(
+        'compile_processes',
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description='Number of processes used to compile the constraints',
+            doc="""
+            If greater than 1, the (ordered) list of active constraints
+            is partitioned into contiguous shards that are compiled by a
+            pool of worker processes.  The compiled rows are returned
+            (and written) in the original constraint order, so the
+            resulting LP file is identical to the one generated by the
+            serial writer.  This requires the 'fork' process start
+            method; on platforms where it is not available the writer
+            falls back on serial compilation.""",
+        ),
+    )
+    CONFIG.declare(
+        'templatize_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Compile indexed constraints from their (templatized) rule',
+            doc="""
+            If True, linear indexed constraints that were constructed
+            from a rule are compiled once from a template expression
+            generated by calling the rule with IndexTemplate arguments
+            (see :py:func:`~pyomo.repn.linear_template.compile_linear_template`),
+            and the rows are instantiated from the compiled template
+            instead of walking every constraint expression.  The first
+            row of each constraint is checked against the walked
+            expression (and the writer falls back on walking all rows
+            if they disagree).  ConstraintData objects that were
+            modified after construction are always compiled by walking
+            their expression.  This option must not be used if the
+            rules have side effects.  Only
+            applies to serial compilation (`compile_processes` == 1).""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -403,23 +451,26 @@ class _LPWriter_impl(object):
         #
         skip_trivial_constraints = self.config.skip_trivial_constraints
         have_nontrivial = False
-        last_parent = None
-        for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
-                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-                last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-
-            if lb is None and ub is None:
-                # Note: you *cannot* output trivial (unbounded)
-                # constraints in LP format.  I suppose we could add a
-                # slack variable if skip_trivial_constraints is False,
-                # but that seems rather silly.
-                continue
-            repn = constraint_visitor.walk_expression(body)
+        constraints = ordered_active_constraints(model, self.config)
+        if self.config.compile_processes > 1:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                constraints = self._compile_constraints_parallel(
+                    model, list(constraints), constraint_visitor
+                )
+            else:
+                logger.warning(
+                    "The LP writer requires the 'fork' process start method "
+                    "to compile constraints in parallel.  Falling back on "
+                    "serial compilation."
+                )
+                constraints = self._compile_constraints(
+                    constraints, constraint_visitor, timer, with_debug_timing
+                )
+        else:
+            constraints = self._compile_constraints(
+                constraints, constraint_visitor, timer, with_debug_timing
+            )
+        for con, lb, ub, repn in constraints:
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model constraint ({con.name}) contains nonlinear terms that "
@@ -489,9 +540,6 @@ class _LPWriter_impl(object):
                 self.write_expression(ostream, repn, False)
                 ostream.write(f'<= {(ub - offset)!s}\n')
 
-        if with_debug_timing:
-            # report the last constraint
-            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
         if not have_nontrivial:
             # Some solvers (notably CBC through at least 2.10.4) will
             # return a nonzero return code when the model has no
@@ -573,6 +621,181 @@ class _LPWriter_impl(object):
         timer.toc("Generated LP representation", delta=False)
         return info
 
+    def _compile_constraints(self, constraints, visitor, timer, with_debug_timing):
+        """Generate the (con, lb, ub, repn) tuples for all constraints
+
+        Constraints with neither a lower nor an upper bound are omitted.
+
+        """
+        templatize = self.config.templatize_constraints
+        # id(Constraint) -> [LinearTemplate (or None), verified]
+        templates = {}
+        template = None
+        last_parent = None
+        for con in constraints:
+            if (
+                with_debug_timing or templatize
+            ) and con.parent_component() is not last_parent:
+                if with_debug_timing:
+                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                last_parent = con.parent_component()
+                if templatize:
+                    template = templates.get(id(last_parent), None)
+                    if template is None:
+                        template = templates[id(last_parent)] = [
+                            compile_linear_template(last_parent),
+                            False,
+                        ]
+            if con.__class__ is CompactLinearConstraintData:
+                row = con.linear_terms()
+                if row is not None:
+                    # Compact rows can be collected without building
+                    # (and walking) the body expression
+                    lb = con.lb
+                    ub = con.ub
+                    if lb is None and ub is None:
+                        continue
+                    repn = visitor.Result()
+                    repn.constant, repn.linear = collect_linear_terms(
+                        *row,
+                        visitor,
+                        LinearBeforeChildDispatcher._record_var,
+                        _fixed_value,
+                    )
+                    yield con, lb, ub, repn
+                    continue
+            if template is not None and template[0] is not None:
+                lb, repn, ub = self._instantiate_template(template, con, visitor)
+                if lb is None and ub is None:
+                    continue
+                yield con, lb, ub, repn
+                continue
+            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+            # guarantee a return value that is either a (finite)
+            # native_numeric_type, or None
+            lb, body, ub = con.to_bounded_expression(True)
+
+            if lb is None and ub is None:
+                # Note: you *cannot* output trivial (unbounded)
+                # constraints in LP format.  I suppose we could add a
+                # slack variable if skip_trivial_constraints is False,
+                # but that seems rather silly.
+                continue
+            yield con, lb, ub, visitor.walk_expression(body)
+        if with_debug_timing:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+
+    def _instantiate_template(self, template, con, visitor):
+        """Generate the (lb, repn, ub) for `con` from its compiled template
+
+        `template` is the ``[LinearTemplate, verified]`` record for the
+        parent constraint.  The first row generated from each template
+        is compared against the result of walking the expression; if
+        they disagree (or the template cannot be instantiated), the
+        template is discarded and the walked repn is used.  Rows that
+        were modified after the constraint was constructed are always
+        walked.
+
+        """
+        modified = template[0].is_modified(con)
+        if template[1] and not modified:
+            try:
+                lb, const, linear, ub = template[0].collect(
+                    con, visitor, LinearBeforeChildDispatcher._record_var, _fixed_value
+                )
+            except Exception:
+                template[0] = None
+            else:
+                repn = visitor.Result()
+                repn.constant = const
+                repn.linear = linear
+                return lb, repn, ub
+        lb, body, ub = con.to_bounded_expression(True)
+        repn = visitor.walk_expression(body)
+        if not template[1] and not modified:
+            template[1] = True
+            try:
+                instance = template[0].collect(
+                    con, visitor, LinearBeforeChildDispatcher._record_var, _fixed_value
+                )
+            except Exception:
+                instance = None
+            if (
+                instance is None
+                or repn.nonlinear is not None
+                or getattr(repn, 'quadratic', None)
+                or not template[0].verify(instance, lb, repn.constant, repn.linear, ub)
+            ):
+                template[0] = None
+        return lb, repn, ub
+
+    def _compile_constraints_parallel(self, model, constraints, visitor):
+        """Parallel version of :py:meth:`_compile_constraints`
+
+        The constraint list is split into contiguous shards that are
+        compiled in forked worker processes (so the model does not need
+        to be serialized).  Each worker returns the compiled rows along
+        with the variable ids that it added to its (local) var_map.
+        The results are consumed in the original shard order, and the
+        variable additions are replayed against the writer var_map so
+        that the column ordering (and therefore the LP file) is
+        identical to the serial writer.
+
+        """
+        global _parallel_compile_state
+        var_map = self.var_map
+        # Because the worker processes are forked from this process, the
+        # id() of every component is the same in the workers and here.
+        # The lookup table lets us map the var ids reported by the
+        # workers back to the VarData objects.
+        var_lookup = {
+            id(v): v for v in model.component_data_objects(Var, descend_into=True)
+        }
+        var_lookup.update(var_map)
+        record_var = LinearBeforeChildDispatcher._record_var
+
+        nproc = self.config.compile_processes
+        n = len(constraints)
+        chunk = max(1, -(-n // (4 * nproc)))
+        shards = [(i, min(i + chunk, n)) for i in range(0, n, chunk)]
+
+        _parallel_compile_state = (
+            constraints,
+            visitor.__class__,
+            var_map,
+            self.var_order,
+            var_lookup,
+            visitor.sorter,
+        )
+        try:
+            with multiprocessing.get_context('fork').Pool(nproc) as pool:
+                for (start, stop), results in zip(
+                    shards, pool.imap(_compile_constraint_shard, shards)
+                ):
+                    for con, data in zip(constraints[start:stop], results):
+                        if data is None:
+                            continue
+                        if data is False:
+                            # The worker could not (or should not)
+                            # compile this constraint: fall back on
+                            # compiling it here.
+                            lb, body, ub = con.to_bounded_expression(True)
+                            yield con, lb, ub, visitor.walk_expression(body)
+                            continue
+                        lb, ub, constant, linear, quadratic, new_vars = data
+                        for vid in new_vars:
+                            if vid not in var_map:
+                                record_var(visitor, var_lookup[vid])
+                        repn = visitor.Result()
+                        repn.constant = constant
+                        repn.linear = linear
+                        if quadratic:
+                            repn.quadratic = quadratic
+                        yield con, lb, ub, repn
+        finally:
+            _parallel_compile_state = None
+
     def write_expression(self, ostream, expr, is_objective):
         assert not expr.constant
         getSymbol = self.symbol_map.getSymbol
@@ -631,3 +854,51 @@ class _LPWriter_impl(object):
                 ostream.write("] / 2\n")
             else:
                 ostream.write("]\n")
+
+
+# Module-level state shared with the forked compilation workers (see
+# _LPWriter_impl._compile_constraints_parallel)
+_parallel_compile_state = None
+
+
+def _compile_constraint_shard(shard):
+    """Compile a contiguous range of constraints in a worker process
+
+    Returns a list with one entry per constraint in the shard: None for
+    unbounded (omitted) constraints, False for constraints that must be
+    compiled in the main process (nonlinear constraints, so that the
+    main process raises the appropriate exception, or constraints that
+    reference Vars not declared on the model), and otherwise the tuple
+    (lb, ub, constant, linear, quadratic, new_vars).
+
+    """
+    constraints, visitor_type, var_map, var_order, var_lookup, sorter = (
+        _parallel_compile_state
+    )
+    var_map = dict(var_map)
+    visitor = visitor_type({}, var_map, dict(var_order), sorter)
+    ans = []
+    for con in islice(constraints, *shard):
+        lb, body, ub = con.to_bounded_expression(True)
+        if lb is None and ub is None:
+            ans.append(None)
+            continue
+        n = len(var_map)
+        repn = visitor.walk_expression(body)
+        new_vars = list(islice(var_map, n, None))
+        if repn.nonlinear is not None or not all(
+            map(var_lookup.__contains__, new_vars)
+        ):
+            ans.append(False)
+            continue
+        ans.append(
+            (
+                lb,
+                ub,
+                repn.constant,
+                repn.linear,
+                getattr(repn, 'quadratic', None),
+                new_vars,
+            )
+        )
+    return ans
@@ -34,10 +34,21 @@ from pyomo.core.base import (
     is_fixed,
 )
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.standard_repn import StandardRepn
 
 logger = logging.getLogger('pyomo.core')
 
 
+def _repn_degree(repn):
+    """Return the polynomial degree of a compiled repn or StandardRepn"""
+    if repn.__class__ is StandardRepn:
+        return repn.polynomial_degree()
+    elif repn.nonlinear is not None:
+        return None
+    return 1 if (repn.linear or repn.quadratic) else 0
+
+
 def _no_negative_zero(val):
     """Make sure -0 is never output. Makes diff tests easier."""
     if val == 0:
@@ -64,6 +75,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # the object level to avoid additional method arguments.
         # dictionary of id(VarData)->VarData.
         self._referenced_variable_ids = {}
+        # dictionary of id(VarData)->VarData for all variables that the
+        # repn visitor may encounter (populated by _print_model_MPS)
+        self._var_map = {}
 
         # Keven Hunter made a nice point about using %.16g in his attachment
         # to ticket #4319. I am adjusting this to %.17g as this mocks the
@@ -177,31 +191,50 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 )
 
         self._referenced_variable_ids.clear()
+        self._var_map = {}
 
         return output_filename, symbol_map
 
     def _extract_variable_coefficients(
         self, row_label, repn, column_data, quadratic_data, variable_to_column
     ):
+        """Append the row coefficients in `repn` to the column-major storage
+
+        `repn` is a compiled :class:`LinearRepn` / :class:`QuadraticRepn`
+        (keyed by variable id), or a :class:`StandardRepn` (for
+        components that provide their own linear canonical form, or
+        repns cached on the block through ``_gen_obj_repn`` /
+        ``_gen_con_repn``).  Returns the constant part of the row.
+
+        """
+        if repn.__class__ is StandardRepn:
+            for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
+                column_data[variable_to_column[id(vardata)]].append((row_label, coef))
+            if repn.quadratic_vars:
+                quad_terms = []
+                for (var1, var2), coef in zip(
+                    repn.quadratic_vars, repn.quadratic_coefs
+                ):
+                    self._referenced_variable_ids[id(var1)] = var1
+                    self._referenced_variable_ids[id(var2)] = var2
+                    quad_terms.append(((id(var1), id(var2)), coef))
+                quadratic_data.append((row_label, quad_terms))
+            return repn.constant
         #
         # Linear
         #
-        if len(repn.linear_coefs) > 0:
-            for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
-                self._referenced_variable_ids[id(vardata)] = vardata
-                column_data[variable_to_column[vardata]].append((row_label, coef))
-
+        for vid, coef in repn.linear.items():
+            column_data[variable_to_column[vid]].append((row_label, coef))
         #
         # Quadratic
         #
-        if len(repn.quadratic_coefs) > 0:
-            quad_terms = []
-            for vardata, coef in zip(repn.quadratic_vars, repn.quadratic_coefs):
-                self._referenced_variable_ids[id(vardata[0])] = vardata[0]
-                self._referenced_variable_ids[id(vardata[1])] = vardata[1]
-                quad_terms.append((vardata, coef))
-            quadratic_data.append((row_label, quad_terms))
-
+        quadratic = repn.quadratic
+        if quadratic:
+            var_map = self._var_map
+            for vid1, vid2 in quadratic:
+                self._referenced_variable_ids[vid1] = var_map[vid1]
+                self._referenced_variable_ids[vid2] = var_map[vid2]
+            quadratic_data.append((row_label, list(quadratic.items())))
         #
         # Return the constant
         #
@@ -309,10 +342,17 @@ class ProblemWriter_mps(AbstractProblemWriter):
         if column_order is not None:
             variable_list.sort(key=lambda _x: column_order[_x])
 
-        # prepare to hold the sparse columns
-        variable_to_column = ComponentMap(
-            (vardata, i) for i, vardata in enumerate(variable_list)
-        )
+        # prepare to hold the sparse columns.  Rows are compiled with
+        # the (Quadratic)RepnVisitor and their coefficients scattered
+        # directly into column-major storage (indexed by column
+        # position), so the COLUMNS section can be streamed out in
+        # column order without any further sorting.
+        variable_to_column = {id(vardata): i for i, vardata in enumerate(variable_list)}
+        # Note: the visitor var_map must start empty: variables that are
+        # already in the var_map are treated as decision variables even
+        # if they are fixed (instead of being folded into the constant).
+        self._var_map = {}
+        visitor = QuadraticRepnVisitor({}, self._var_map, {}, sortOrder)
         # add one position for ONE_VAR_CONSTANT
         column_data = [[] for i in range(len(variable_list) + 1)]
         quadobj_data = []
@@ -335,12 +375,14 @@ class ProblemWriter_mps(AbstractProblemWriter):
         numObj = 0
         onames = []
         for block in all_blocks:
-            gen_obj_repn = getattr(block, "_gen_obj_repn", True)
+            gen_obj_repn = getattr(block, "_gen_obj_repn", None)
+            if gen_obj_repn is not None:
+                gen_obj_repn = bool(gen_obj_repn)
+                # Get/Create the ComponentMap for the repn
+                if not hasattr(block, '_repn'):
+                    block._repn = ComponentMap()
+                block_repn = block._repn
 
-            # Get/Create the ComponentMap for the repn
-            if not hasattr(block, '_repn'):
-                block._repn = ComponentMap()
-            block_repn = block._repn
             for objective_data in block.component_data_objects(
                 Objective, active=True, sort=sortOrder, descend_into=False
             ):
@@ -371,25 +413,27 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 output_file.write("ROWS\n")
                 output_file.write(" N  %s\n" % (objective_label))
 
-                if gen_obj_repn:
+                if gen_obj_repn == False:
+                    repn = block_repn[objective_data]
+                elif gen_obj_repn:
                     repn = generate_standard_repn(objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
-                    repn = block_repn[objective_data]
+                    repn = visitor.walk_expression(objective_data.expr)
 
-                degree = repn.polynomial_degree()
-                if degree == 0:
-                    logger.warning(
-                        "Constant objective detected, replacing "
-                        "with a placeholder to prevent solver failure."
-                    )
-                    force_objective_constant = True
-                elif degree is None:
+                degree = _repn_degree(repn)
+                if degree is None:
                     raise RuntimeError(
                         "Cannot write legal MPS file. Objective '%s' "
                         "has nonlinear terms that are not quadratic."
                         % objective_data.name
                     )
+                elif degree == 0:
+                    logger.warning(
+                        "Constant objective detected, replacing "
+                        "with a placeholder to prevent solver failure."
+                    )
+                    force_objective_constant = True
 
                 constant = extract_variable_coefficients(
                     objective_label, repn, column_data, quadobj_data, variable_to_column
@@ -408,12 +452,13 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # Constraints
         def constraint_generator():
             for block in all_blocks:
-                gen_con_repn = getattr(block, "_gen_con_repn", True)
-
-                # Get/Create the ComponentMap for the repn
-                if not hasattr(block, '_repn'):
-                    block._repn = ComponentMap()
-                block_repn = block._repn
+                gen_con_repn = getattr(block, "_gen_con_repn", None)
+                if gen_con_repn is not None:
+                    gen_con_repn = bool(gen_con_repn)
+                    # Get/Create the ComponentMap for the repn
+                    if not hasattr(block, '_repn'):
+                        block._repn = ComponentMap()
+                    block_repn = block._repn
 
                 for constraint_data in block.component_data_objects(
                     Constraint, active=True, sort=sortOrder, descend_into=False
@@ -424,13 +469,17 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         assert not constraint_data.equality
                         continue  # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
+                    if gen_con_repn == False:
+                        repn = block_repn[constraint_data]
+                    elif constraint_data._linear_canonical_form:
                         repn = constraint_data.canonical_form()
+                        if gen_con_repn:
+                            block_repn[constraint_data] = repn
                     elif gen_con_repn:
                         repn = generate_standard_repn(constraint_data.body)
                         block_repn[constraint_data] = repn
                     else:
-                        repn = block_repn[constraint_data]
+                        repn = visitor.walk_expression(constraint_data.body)
 
                     yield constraint_data, repn
 
@@ -446,7 +495,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
             yield_all_constraints = constraint_generator
 
         for constraint_data, repn in yield_all_constraints():
-            degree = repn.polynomial_degree()
+            degree = _repn_degree(repn)
 
             # Write constraint
             if degree == 0:
@@ -515,14 +564,14 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # COLUMNS section
         #
         column_template = "     %s %s %" + self._precision_string + "\n"
+        column_entry = " %s %" + self._precision_string + "\n"
         output_file.write("COLUMNS\n")
-        cnt = 0
+        referenced_variable_ids = self._referenced_variable_ids
         in_integer_section = False
         mark_cnt = 0
-        for vardata in variable_list:
-            col_entries = column_data[variable_to_column[vardata]]
-            cnt += 1
-            if len(col_entries) > 0:
+        for vardata, col_entries in zip(variable_list, column_data):
+            if col_entries:
+                referenced_variable_ids[id(vardata)] = vardata
                 if self._int_marker:
                     if vardata.is_integer():
                         if not in_integer_section:
@@ -538,12 +587,21 @@ class ProblemWriter_mps(AbstractProblemWriter):
                         in_integer_section = False
                         mark_cnt += 1
 
-                var_label = variable_symbol_dictionary[id(vardata)]
-                for i, (row_label, coef) in enumerate(col_entries):
-                    output_file.write(
-                        column_template
-                        % (var_label, row_label, _no_negative_zero(coef))
+                # stream the column: the label prefix is formatted once
+                # per column (note that "coef or 0" maps -0 to 0)
+                entry_template = (
+                    "     "
+                    + variable_symbol_dictionary[id(vardata)].replace('%', '%%')
+                    + column_entry
+                )
+                output_file.write(
+                    ''.join(
+                        [
+                            entry_template % (row_label, coef or 0)
+                            for row_label, coef in col_entries
+                        ]
                     )
+                )
             elif include_all_variable_bounds:
                 # the column is empty, so add a (0 * var)
                 # term to the objective
@@ -558,14 +616,17 @@ class ProblemWriter_mps(AbstractProblemWriter):
         if self._int_marker and in_integer_section:
             output_file.write(f"     MARK{mark_cnt:04d} 'MARKER' 'INTEND'\n")
 
-        assert cnt == len(column_data) - 1
         if len(column_data[-1]) > 0:
             col_entries = column_data[-1]
-            var_label = "ONE_VAR_CONSTANT"
-            for i, (row_label, coef) in enumerate(col_entries):
-                output_file.write(
-                    column_template % (var_label, row_label, _no_negative_zero(coef))
+            entry_template = "     ONE_VAR_CONSTANT" + column_entry
+            output_file.write(
+                ''.join(
+                    [
+                        entry_template % (row_label, coef or 0)
+                        for row_label, coef in col_entries
+                    ]
                 )
+            )
 
         #
         # RHS section
@@ -715,8 +776,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
             for term, coef in quad_terms:
                 # sort the term for consistent output
                 var1, var2 = sorted(term, key=lambda _x: variable_to_column[_x])
-                var1_label = variable_symbol_dictionary[id(var1)]
-                var2_label = variable_symbol_dictionary[id(var2)]
+                var1_label = variable_symbol_dictionary[var1]
+                var2_label = variable_symbol_dictionary[var2]
                 # Don't forget that a quadratic objective is always
                 # assumed to be divided by 2
                 if var1_label == var2_label:
@@ -754,8 +815,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 for term, coef in quad_terms:
                     # sort the term for consistent output
                     var1, var2 = sorted(term, key=lambda _x: variable_to_column[_x])
-                    var1_label = variable_symbol_dictionary[id(var1)]
-                    var2_label = variable_symbol_dictionary[id(var2)]
+                    var1_label = variable_symbol_dictionary[var1]
+                    var2_label = variable_symbol_dictionary[var2]
                     if var1_label == var2_label:
                         output_file.write(
                             column_template
@@ -9,11 +9,15 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
 import logging
 import os
+import struct
+import sys
+from array import array
 from collections import defaultdict, namedtuple
 from contextlib import nullcontext
-from itertools import filterfalse, product
+from itertools import accumulate, chain, filterfalse, product
 from math import log10 as _log10
 from operator import itemgetter, attrgetter
 
@@ -27,6 +31,7 @@ from pyomo.common.config import (
 from pyomo.common.deprecation import relocated_module_attribute
 from pyomo.common.errors import DeveloperError, InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -45,16 +50,25 @@ from pyomo.core.base import (
     minimize,
 )
 from pyomo.core.base.component import ActiveComponent
-from pyomo.core.base.constraint import ConstraintData
+from pyomo.core.base.constraint import ConstraintData, CompactLinearConstraintData
 from pyomo.core.base.expression import ScalarExpression, ExpressionData
 from pyomo.core.base.objective import ScalarObjective, ObjectiveData
 from pyomo.core.base.suffix import SuffixFinder
 from pyomo.core.base.var import VarData
+from pyomo.core.expr.numeric_expr import ExternalFunctionExpression
+from pyomo.core.expr.numvalue import native_types, value
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
 import pyomo.core.kernel as kernel
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.opt import WriterFactory
 
-from pyomo.repn.ampl import AMPLRepnVisitor, evaluate_ampl_nl_expression, TOL
+from pyomo.repn.ampl import (
+    AMPLBeforeChildDispatcher,
+    AMPLRepnVisitor,
+    evaluate_ampl_nl_expression,
+    TOL,
+)
+from pyomo.repn.linear_template import collect_linear_terms, compile_linear_template
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
@@ -279,9 +293,81 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled expressions from the previous write()',
+            doc="""
+        If True, this writer will retain the compiled representation of
+        each constraint and objective between calls to :py:meth:`write`.
+        Subsequent writes will only recompile components whose expression
+        was replaced, or that reference mutable Params or fixed Vars whose
+        values (or fixed status) changed since the previous write.  This
+        is intended for repeatedly writing the same model after small
+        data changes.  Components that reference named Expression or
+        ExternalFunction objects are always recompiled.""",
+        ),
+    )
+    CONFIG.declare(
+        'binary',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write the NL file in binary format',
+            doc="""
+        If True, write the NL file using the AMPL binary ("b") format.
+        The header is still written as text, but all subsequent
+        segments are written as packed (native byte order) integers and
+        doubles.  Binary NL files are faster to write and for the solver
+        to read.  The output stream must be opened in binary mode.""",
+        ),
+    )
+    CONFIG.declare(
+        'templatize_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Compile indexed constraints from their (templatized) rule',
+            doc="""
+            If True, linear indexed constraints that were constructed
+            from a rule are compiled once from a template expression
+            generated by calling the rule with IndexTemplate arguments
+            (see :py:func:`~pyomo.repn.linear_template.compile_linear_template`),
+            and the rows are instantiated from the compiled template
+            instead of walking every constraint expression.  The first
+            row of each constraint is checked against the walked
+            expression (and the writer falls back on walking all rows
+            if they disagree).  ConstraintData objects that were
+            modified after construction are always compiled by walking
+            their expression.  This option must not be used if the
+            rules have side effects.  It is ignored when a
+            representation cache is in use and for scaled
+            constraints.""",
+        ),
+    )
+    CONFIG.declare(
+        'low_memory',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Spill compiled nonlinear constraint expressions to disk',
+            doc="""
+            If True, the compiled nonlinear expression of each
+            constraint is written to a temporary file as soon as the
+            constraint is compiled, and only the (compact) array of
+            variables referenced by the expression is retained in
+            memory.  The expressions are read back (in final row order)
+            when the "C" segments are emitted.  This reduces the peak
+            memory needed to write models with many large nonlinear
+            constraints, at the cost of additional I/O.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
+        self._repn_cache = None
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -307,9 +393,13 @@ class NLWriter(object):
             _open = lambda fname: open(fname, 'w')
         else:
             _open = nullcontext
-        with open(filename, 'w', newline='') as FILE, _open(
-            row_fname
-        ) as ROWFILE, _open(col_fname) as COLFILE:
+        if config.binary:
+            _nl_open = lambda fname: open(fname, 'wb')
+        else:
+            _nl_open = lambda fname: open(fname, 'w', newline='')
+        with _nl_open(filename) as FILE, _open(row_fname) as ROWFILE, _open(
+            col_fname
+        ) as COLFILE:
             info = self.write(model, FILE, ROWFILE, COLFILE, config=config)
         if not info.variables:
             # This exception is included for compatibility with the
@@ -350,7 +440,9 @@ class NLWriter(object):
 
         ostream: io.TextIOBase
             The text output stream where the NL "file" will be written.
-            Could be an opened file or a io.StringIO.
+            Could be an opened file or a io.StringIO.  If `binary` is
+            True, this must be a binary stream (e.g., a file opened in
+            'wb' mode or an io.BytesIO).
 
         rowstream: io.TextIOBase
             A text output stream to write the ASL "row file" (list of
@@ -364,10 +456,20 @@ class NLWriter(object):
         """
         config = options.pop('config', self.config)(options)
 
+        if not config.incremental:
+            self._repn_cache = None
+        elif (
+            self._repn_cache is None
+            or self._repn_cache.symbolic_solver_labels != config.symbolic_solver_labels
+        ):
+            self._repn_cache = _NLRepnCache(config.symbolic_solver_labels)
+
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
         # small objects.
-        with _NLWriter_impl(ostream, rowstream, colstream, config) as impl:
+        with _NLWriter_impl(
+            ostream, rowstream, colstream, config, self._repn_cache
+        ) as impl:
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
@@ -488,6 +590,12 @@ class CachingNumericSuffixFinder(SuffixFinder):
         return ans
 
 
+def _fixed_value(visitor, vid, var):
+    if vid not in visitor.fixed_vars:
+        visitor.cache_fixed_var(vid, var)
+    return visitor.fixed_vars[vid]
+
+
 class _NoScalingFactor(object):
     scale = False
 
@@ -495,8 +603,255 @@ class _NoScalingFactor(object):
         return 1
 
 
+class _RepnDependencyVisitor(StreamBasedExpressionVisitor):
+    """Collect the data an :py:class:`AMPLRepn` was compiled from
+
+    This walker gathers the Vars (fixed or not) and the non-constant,
+    non-variable leaves (e.g., mutable Params) referenced by an
+    expression.  Expressions containing named Expression or
+    ExternalFunction nodes are flagged as not cacheable, as compiling
+    them has side effects on the writer state (subexpression and
+    external function bookkeeping).
+
+    """
+
+    def initializeWalker(self, expr):
+        self.variables = {}
+        self.params = {}
+        self.cacheable = True
+        walk, _ = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, self.finalizeResult(None)
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, None
+        if child.is_expression_type():
+            if (
+                child.is_named_expression_type()
+                or child.__class__ is ExternalFunctionExpression
+            ):
+                self.cacheable = False
+                return False, None
+            return True, None
+        if child.is_variable_type():
+            self.variables.setdefault(id(child), child)
+        elif not child.is_constant():
+            self.params.setdefault(id(child), child)
+        return False, None
+
+    def finalizeResult(self, result):
+        if not self.cacheable:
+            return None
+        return list(self.variables.values()), list(self.params.values())
+
+
+def _var_state(var):
+    # Unfixed variables compile to the same representation regardless
+    # of their value.  Fixed variables are compiled as constants (and
+    # checked against their bounds).
+    if var.fixed:
+        return var.value, var.lb, var.ub
+    return None
+
+
+class _NLRepnCacheEntry(object):
+    __slots__ = (
+        'expr',
+        'scale',
+        'repn',
+        'variables',
+        'var_state',
+        'params',
+        'param_values',
+    )
+
+    def __init__(self, expr, scale, repn, dependencies):
+        self.expr = expr
+        self.scale = scale
+        self.repn = repn
+        if dependencies is None:
+            self.variables = self.params = ()
+            self.var_state = self.param_values = []
+        else:
+            self.variables, self.params = dependencies
+            self.var_state = list(map(_var_state, self.variables))
+            self.param_values = [value(p, exception=False) for p in self.params]
+
+    def is_current(self, expr, scale):
+        return (
+            expr is self.expr
+            and scale == self.scale
+            and self.var_state == list(map(_var_state, self.variables))
+            and self.param_values == [value(p, exception=False) for p in self.params]
+        )
+
+
+class _NLRepnCache(object):
+    """Compiled constraint / objective representations retained between
+    calls to :py:meth:`NLWriter.write` (see the ``incremental`` option)
+
+    Entries are keyed by the id() of the source component and store a
+    pristine copy of the compiled :py:class:`AMPLRepn` (the writer
+    modifies the repn in place while emitting the file), along with the
+    Var / Param state the representation was compiled from.
+
+    """
+
+    def __init__(self, symbolic_solver_labels):
+        self.symbolic_solver_labels = symbolic_solver_labels
+        self.entries = {}
+        self.dependency_visitor = _RepnDependencyVisitor()
+        self.recompiled = 0
+        self.reused = 0
+
+    def update(self, entries):
+        self.entries = entries
+
+
+# The ASL "arith" kind used to declare the byte order of binary NL
+# files (1: IEEE little-endian, 2: IEEE big-endian)
+_binary_arith_kind = 1 if sys.byteorder == 'little' else 2
+_pack_double = struct.Struct('=d').pack
+_pack_struct = struct.pack
+# Binary NL bound types (the bound type code is written as an ASCII
+# character, followed by the bound data)
+_bound_formats = {0: 'cdd', 1: 'cd', 2: 'cd', 3: 'c', 4: 'cd', 5: 'cii'}
+_bound_types = {k: str(k).encode() for k in _bound_formats}
+
+
+def _pack_ints(*values):
+    return _pack_struct('=%di' % len(values), *values)
+
+
+def _pack_string(val):
+    val = val.encode('utf-8')
+    return _pack_ints(len(val)) + val
+
+
+def _pack_pairs(data, keys):
+    """Pack (int index, float value) pairs for the listed keys in `data`"""
+    return _pack_struct(
+        '=' + 'id' * len(keys), *chain.from_iterable((k, data[k]) for k in keys)
+    )
+
+
+def _pack_linear(linear, column_order):
+    """Pack the (column, coefficient) pairs for a linear expression"""
+    cols = sorted(linear, key=column_order.__getitem__)
+    return _pack_struct(
+        '=' + 'id' * len(cols),
+        *chain.from_iterable((column_order[_id], linear[_id]) for _id in cols),
+    )
+
+
+def _pack_bounds(bounds):
+    """Pack a list of (type, *data) tuples for the "r" / "b" segments"""
+    return _pack_struct(
+        '=' + ''.join(_bound_formats[b[0]] for b in bounds),
+        *chain.from_iterable((_bound_types[b[0]], *b[1:]) for b in bounds),
+    )
+
+
+class _BinaryNLExpressionWriter(object):
+    """Stream adapter that converts text NL expressions to binary
+
+    The AMPLRepnVisitor compiles nonlinear expressions to text NL
+    fragments (see :py:class:`TextNLTemplate`).  When writing binary NL
+    files, the fully resolved text fragments are passed to
+    :py:meth:`write`, which translates them to the corresponding binary
+    tokens and writes them to the underlying binary stream (`raw`).
+
+    """
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, nl):
+        ans = []
+        i = 0
+        n = len(nl)
+        while i < n:
+            eol = nl.index('\n', i)
+            code = nl[i]
+            if code == 'h':
+                # String arguments may contain newlines: use the
+                # declared length to find the end of the string
+                sep = nl.index(':', i)
+                end = sep + 1 + int(nl[i + 1 : sep])
+                ans.append(b'h' + _pack_string(nl[sep + 1 : end]))
+                i = end + 1
+                continue
+            # Strip any (debugging) comments
+            line = nl[i:eol].split('\t', 1)[0]
+            i = eol + 1
+            if code == 'n':
+                ans.append(b'n' + _pack_double(float(line[1:])))
+            elif code == 'o' or code == 'v':
+                ans.append(code.encode() + _pack_ints(int(line[1:])))
+            elif code == 'f':
+                ans.append(b'f' + _pack_ints(*map(int, line[1:].split())))
+            else:
+                # The argument count following an n-ary operator
+                ans.append(_pack_ints(int(line)))
+        self.raw.write(b''.join(ans))
+
+
+class _SpilledSegment(object):
+    """Location of a nonlinear expression stored in a :py:class:`_NLSegmentSpill`"""
+
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset, length):
+        self.offset = offset
+        self.length = length
+
+
+class _NLSegmentSpill(object):
+    """Temporary file holding compiled nonlinear constraint expressions
+
+    Used by the NL writer when ``low_memory=True``: the compiled NL
+    expression string for each constraint is appended to a temporary
+    (binary) file, and the ``nonlinear`` attribute of the AMPLRepn is
+    replaced by a ``(_SpilledSegment, args)`` tuple, where ``args`` is
+    stored as a compact array of variable ids (when possible).
+
+    """
+
+    def __init__(self):
+        self._context = TempfileManager.new_context()
+        fd, self.filename = self._context.mkstemp(suffix='.nl.spill')
+        self._file = os.fdopen(fd, 'w+b')
+        self._end = 0
+
+    def store(self, nonlinear):
+        nl, args = nonlinear
+        data = nl.encode()
+        self._file.write(data)
+        seg = _SpilledSegment(self._end, len(data))
+        self._end += seg.length
+        try:
+            args = array('Q', args)
+        except (TypeError, OverflowError):
+            args = tuple(args)
+        return seg, args
+
+    def load(self, seg):
+        f = self._file
+        if f.tell() != seg.offset:
+            f.seek(seg.offset)
+        return f.read(seg.length).decode()
+
+    def close(self):
+        self._file.close()
+        self._context.release()
+
+
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, repn_cache=None):
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -521,13 +876,26 @@ class _NLWriter_impl(object):
         self.next_V_line_id = 0
         self.pause_gc = None
         self.template = self.visitor.Result.template
+        self.repn_cache = repn_cache
+        if repn_cache is None:
+            self.walk_expression = self.visitor.walk_expression
+        else:
+            self.walk_expression = self._walk_expression_cached
+            self.current_entries = {}
+            repn_cache.reused = repn_cache.recompiled = 0
+        self.spill = None
 
     def __enter__(self):
         self.pause_gc = PauseGC()
         self.pause_gc.__enter__()
+        if self.config.low_memory:
+            self.spill = _NLSegmentSpill()
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
         self.pause_gc.__exit__(exc_type, exc_value, tb)
 
     def write(self, model):
@@ -574,8 +942,11 @@ class _NLWriter_impl(object):
         # Caching some frequently-used objects into the locals()
         symbolic_solver_labels = self.symbolic_solver_labels
         visitor = self.visitor
+        walk_expression = self.walk_expression
         ostream = self.ostream
+        binary = self.config.binary
         linear_presolve = self.config.linear_presolve
+        spill = self.spill
 
         nl_map = self.var_id_to_nl_map
         var_map = self.var_map
@@ -635,7 +1006,7 @@ class _NLWriter_impl(object):
                 else:
                     timer.toc('Objective %s', last_parent, level=logging.DEBUG)
                 last_parent = obj.parent_component()
-            expr_info = visitor.walk_expression((obj.expr, obj, 1, scaling_factor(obj)))
+            expr_info = walk_expression((obj.expr, obj, 1, scaling_factor(obj)))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, obj, 1)
             if expr_info.nonlinear:
@@ -669,20 +1040,54 @@ class _NLWriter_impl(object):
         n_complementarity_range = 0
         n_complementarity_nz_var_lb = 0
         #
+        templatize = self.config.templatize_constraints and self.repn_cache is None
+        # id(Constraint) -> [LinearTemplate (or None), verified]
+        templates = {}
+        template = None
         last_parent = None
         for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
-                if last_parent is None:
-                    timer.toc(None)
-                else:
-                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+            if (
+                with_debug_timing or templatize
+            ) and con.parent_component() is not last_parent:
+                if with_debug_timing:
+                    if last_parent is None:
+                        timer.toc(None)
+                    else:
+                        timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
+                if templatize:
+                    template = templates.get(id(last_parent), None)
+                    if template is None:
+                        template = templates[id(last_parent)] = [
+                            compile_linear_template(last_parent),
+                            False,
+                        ]
             scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
+            row = None
+            if con.__class__ is CompactLinearConstraintData and scale == 1:
+                row = con.linear_terms()
+            if row is not None:
+                # Compact rows can be collected without building (and
+                # walking) the body expression
+                lb = con.lb
+                ub = con.ub
+                expr_info = self.visitor.Result(
+                    *collect_linear_terms(
+                        *row,
+                        self.visitor,
+                        AMPLBeforeChildDispatcher._record_var,
+                        _fixed_value,
+                    ),
+                    None,
+                )
+            elif template is not None and template[0] is not None and scale == 1:
+                lb, expr_info, ub = self._instantiate_template(template, con)
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+                expr_info = walk_expression((body, con, 0, scale))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -695,6 +1100,8 @@ class _NLWriter_impl(object):
                     ub = ub * scale
                 if scale < 0:
                     lb, ub = ub, lb
+            if spill is not None and expr_info.nonlinear:
+                expr_info.nonlinear = spill.store(expr_info.nonlinear)
             all_constraints.append((con, expr_info, lb, ub))
             if linear_presolve:
                 con_id = id(con)
@@ -708,6 +1115,15 @@ class _NLWriter_impl(object):
         else:
             timer.toc('Processed %s constraints', len(all_constraints))
 
+        if self.repn_cache is not None:
+            self.repn_cache.update(self.current_entries)
+            timer.toc(
+                'Reused %s compiled expressions (%s recompiled)',
+                self.repn_cache.reused,
+                self.repn_cache.recompiled,
+                level=logging.DEBUG,
+            )
+
         # We have identified all the external functions (resolving them
         # by name).  Now we may need to resolve the function by the
         # (local) FID, which we know is indexed by integers starting at
@@ -744,6 +1160,8 @@ class _NLWriter_impl(object):
                 if any(vid not in nl_map for vid in args):
                     constraints.append(info)
                     continue
+                if nl.__class__ is _SpilledSegment:
+                    nl = spill.load(nl)
                 expr_info.const += evaluate_ampl_nl_expression(
                     nl % tuple(nl_map[i] for i in args), self.external_functions
                 )
@@ -1102,20 +1520,20 @@ class _NLWriter_impl(object):
             if lb == ub:  # TBD: should this be within tolerance?
                 if lb is None:
                     # type = 3  # -inf <= c <= inf
-                    r_lines[idx] = "3"
+                    r_lines[idx] = (3,)
                 else:
                     # _type = 4  # L == c == U
-                    r_lines[idx] = f"4 {lb - expr_info.const!s}"
+                    r_lines[idx] = (4, lb - expr_info.const)
                     n_equality += 1
             elif lb is None:
                 # _type = 1  # c <= U
-                r_lines[idx] = f"1 {ub - expr_info.const!s}"
+                r_lines[idx] = (1, ub - expr_info.const)
             elif ub is None:
                 # _type = 2  # L <= c
-                r_lines[idx] = f"2 {lb - expr_info.const!s}"
+                r_lines[idx] = (2, lb - expr_info.const)
             else:
                 # _type = 0  # L <= c <= U
-                r_lines[idx] = f"0 {lb - expr_info.const!s} {ub - expr_info.const!s}"
+                r_lines[idx] = (0, lb - expr_info.const, ub - expr_info.const)
                 n_ranges += 1
             expr_info.const = 0
             # FIXME: this is a HACK to be compatible with the NLv1
@@ -1124,24 +1542,40 @@ class _NLWriter_impl(object):
             # that they are in an acceptable form).
             if hasattr(con, '_complementarity'):
                 # _type = 5
-                r_lines[idx] = f"5 {con._complementarity} {1+column_order[con._vid]}"
+                r_lines[idx] = (5, con._complementarity, 1 + column_order[con._vid])
                 if expr_info.nonlinear:
                     n_complementarity_nonlin += 1
                 else:
                     n_complementarity_lin += 1
-        if symbolic_solver_labels:
-            for idx in range(len(constraints)):
-                r_lines[idx] += row_comments[idx]
+        if not binary:
+            r_lines = [' '.join(map(str, r)) for r in r_lines]
+            if symbolic_solver_labels:
+                for idx in range(len(constraints)):
+                    r_lines[idx] += row_comments[idx]
 
         timer.toc("Generated row/col labels & comments", level=logging.DEBUG)
 
         #
         # Print Header
         #
+        # The header is always text.  For binary NL files, we will
+        # collect the header in a buffer and then emit all subsequent
+        # segments as packed binary data.
+        if binary:
+            bstream = ostream
+            ostream = io.StringIO()
+            nl_format = 'b'
+            arith = _binary_arith_kind
+        else:
+            nl_format = 'g'
+            arith = 0
+        #
         # LINE 1
         #
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
+        if (
+            visitor.encountered_string_arguments
+            and not binary
+            and 'b' not in getattr(ostream, 'mode', '')
         ):
             # Not all streams support tell()
             try:
@@ -1149,7 +1583,7 @@ class _NLWriter_impl(object):
             except IOError:
                 _written_bytes = None
 
-        line_1_txt = f"g3 1 1 0\t# problem {model.name}\n"
+        line_1_txt = f"{nl_format}3 1 1 0\t# problem {model.name}\n"
         ostream.write(line_1_txt)
 
         # If there were any string arguments, then we need to ensure
@@ -1157,8 +1591,10 @@ class _NLWriter_impl(object):
         # than '\n'.  Binary files do not perform newline mapping (of
         # course, we will also need to map all the str to bytes for
         # binary-mode I/O).
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
+        if (
+            visitor.encountered_string_arguments
+            and not binary
+            and 'b' not in getattr(ostream, 'mode', '')
         ):
             if _written_bytes is None:
                 _written_bytes = 0
@@ -1247,9 +1683,9 @@ class _NLWriter_impl(object):
         # LINE 6
         #
         ostream.write(
-            " 0 %d 0 1\t"
+            " 0 %d %d 1\t"
             "# linear network variables; functions; arith, flags\n"
-            % (len(self.external_functions),)
+            % (len(self.external_functions), arith)
         )
         #
         # LINE 7
@@ -1289,6 +1725,10 @@ class _NLWriter_impl(object):
         ostream.write(
             " %d %d %d %d %d\t# common exprs: b,c,o,c1,o1\n" % tuple(n_subexpressions)
         )
+        if binary:
+            bstream.write(ostream.getvalue().encode('utf-8'))
+            ostream = bstream
+            self.ostream = _BinaryNLExpressionWriter(bstream)
 
         #
         # "F" lines (external function definitions)
@@ -1296,7 +1736,12 @@ class _NLWriter_impl(object):
         amplfunc_libraries = set()
         for fid, fcn in self.external_functions:
             amplfunc_libraries.add(fcn._library)
-            ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
+            if binary:
+                ostream.write(
+                    b'F' + _pack_ints(fid, 1, -1) + _pack_string(fcn._function)
+                )
+            else:
+                ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
 
         #
         # "S" lines (suffixes)
@@ -1327,6 +1772,23 @@ class _NLWriter_impl(object):
             ):
                 if not _vals:
                     continue
+                if binary:
+                    ostream.write(
+                        b'S'
+                        + _pack_ints(_field | _float, len(_vals))
+                        + _pack_string(name)
+                    )
+                    if _float:
+                        ostream.write(_pack_pairs(_vals, sorted(_vals)))
+                    else:
+                        ostream.write(
+                            _pack_ints(
+                                *chain.from_iterable(
+                                    (_id, int(_vals[_id])) for _id in sorted(_vals)
+                                )
+                            )
+                        )
+                    continue
                 ostream.write(f"S{_field|_float} {len(_vals)} {name}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1372,6 +1834,15 @@ class _NLWriter_impl(object):
                 # beginning, we can very quickly write all the linear
                 # constraints at the end (as their nonlinear expressions
                 # are the constant 0).
+                if binary:
+                    _expr = b'n' + _pack_double(0)
+                    ostream.write(
+                        b''.join(
+                            b'C' + _pack_ints(i) + _expr
+                            for i in range(row_idx, len(constraints))
+                        )
+                    )
+                    break
                 _expr = self.template.const % 0
                 if symbolic_solver_labels:
                     ostream.write(
@@ -1393,7 +1864,10 @@ class _NLWriter_impl(object):
             if single_use_subexpressions:
                 for _id in single_use_subexpressions.get(id(info[0]), ()):
                     self._write_v_line(_id, row_idx + 1)
-            ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
+            if binary:
+                ostream.write(b'C' + _pack_ints(row_idx))
+            else:
+                ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
             self._write_nl_expression(info[1], False)
 
         #
@@ -1408,7 +1882,10 @@ class _NLWriter_impl(object):
                     self._write_v_line(_id, n_cons + n_lcons + obj_idx + 1)
             lbl = row_comments[n_cons + obj_idx]
             sense = 0 if info[0].sense == minimize else 1
-            ostream.write(f'O{obj_idx} {sense}{lbl}\n')
+            if binary:
+                ostream.write(b'O' + _pack_ints(obj_idx, sense))
+            else:
+                ostream.write(f'O{obj_idx} {sense}{lbl}\n')
             self._write_nl_expression(info[1], True)
 
         #
@@ -1436,7 +1913,13 @@ class _NLWriter_impl(object):
                 logger.warning("ignoring 'dual' suffix for Objective types")
             if data.prob:
                 logger.warning("ignoring 'dual' suffix for Model")
-            if data.con:
+            if data.con and binary:
+                ostream.write(
+                    b'd'
+                    + _pack_ints(len(data.con))
+                    + _pack_pairs(data.con, sorted(data.con))
+                )
+            elif data.con:
                 ostream.write(f"d{len(data.con)}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1456,79 +1939,116 @@ class _NLWriter_impl(object):
                 (var_idx, val * variable_scaling[var_idx])
                 for var_idx, val in _init_lines
             ]
-        ostream.write(
-            'x%d%s\n'
-            % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
-        )
-        ostream.write(
-            ''.join(
-                f'{var_idx} {val!s}{col_comments[var_idx]}\n'
-                for var_idx, val in _init_lines
+        if binary:
+            ostream.write(
+                b'x'
+                + _pack_ints(len(_init_lines))
+                + _pack_struct(
+                    '=' + 'id' * len(_init_lines), *chain.from_iterable(_init_lines)
+                )
+            )
+        else:
+            ostream.write(
+                'x%d%s\n'
+                % (
+                    len(_init_lines),
+                    "\t# initial guess" if symbolic_solver_labels else '',
+                )
+            )
+            ostream.write(
+                ''.join(
+                    f'{var_idx} {val!s}{col_comments[var_idx]}\n'
+                    for var_idx, val in _init_lines
+                )
             )
-        )
 
         #
         # "r" lines (constraint bounds)
         #
-        ostream.write(
-            'r%s\n'
-            % (
-                (
-                    "\t#%d ranges (rhs's)" % len(constraints)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ostream.write(b'r' + _pack_bounds(r_lines))
+        else:
+            ostream.write(
+                'r%s\n'
+                % (
+                    (
+                        "\t#%d ranges (rhs's)" % len(constraints)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        ostream.write("\n".join(r_lines))
-        if r_lines:
-            ostream.write("\n")
+            ostream.write("\n".join(r_lines))
+            if r_lines:
+                ostream.write("\n")
 
         #
         # "b" lines (variable bounds)
         #
-        ostream.write(
-            'b%s\n'
-            % (
-                (
-                    "\t#%d bounds (on variables)" % len(variables)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            b_lines = []
+            for lb, ub in map(var_bounds.__getitem__, variables):
+                if lb == ub:
+                    b_lines.append((3,) if lb is None else (4, lb))
+                elif lb is None:
+                    b_lines.append((1, ub))
+                elif ub is None:
+                    b_lines.append((2, lb))
+                else:
+                    b_lines.append((0, lb, ub))
+            ostream.write(b'b' + _pack_bounds(b_lines))
+        else:
+            ostream.write(
+                'b%s\n'
+                % (
+                    (
+                        "\t#%d bounds (on variables)" % len(variables)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        for var_idx, _id in enumerate(variables):
-            lb, ub = var_bounds[_id]
-            if lb == ub:
-                if lb is None:  # unbounded
-                    ostream.write(f"3{col_comments[var_idx]}\n")
-                else:  # ==
-                    ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
-            elif lb is None:  # var <= ub
-                ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
-            elif ub is None:  # lb <= body
-                ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
-            else:  # lb <= body <= ub
-                ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
+            for var_idx, _id in enumerate(variables):
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        ostream.write(f"3{col_comments[var_idx]}\n")
+                    else:  # ==
+                        ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
+                elif lb is None:  # var <= ub
+                    ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
+                elif ub is None:  # lb <= body
+                    ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
+                else:  # lb <= body <= ub
+                    ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
 
         #
         # "k" lines (column offsets in Jacobian NNZ)
         #
-        ostream.write(
-            'k%d%s\n'
-            % (
-                len(variables) - 1,
-                (
-                    "\t#intermediate Jacobian column lengths"
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ostream.write(
+                b'k'
+                + _pack_ints(
+                    len(variables) - 1,
+                    *accumulate(con_nnz_by_var.get(_id, 0) for _id in variables[:-1]),
+                )
             )
-        )
-        ktot = 0
-        for var_idx, _id in enumerate(variables[:-1]):
-            ktot += con_nnz_by_var.get(_id, 0)
-            ostream.write(f"{ktot}\n")
+        else:
+            ostream.write(
+                'k%d%s\n'
+                % (
+                    len(variables) - 1,
+                    (
+                        "\t#intermediate Jacobian column lengths"
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
+            )
+            ktot = 0
+            for var_idx, _id in enumerate(variables[:-1]):
+                ktot += con_nnz_by_var.get(_id, 0)
+                ostream.write(f"{ktot}\n")
 
         #
         # "J" lines (non-empty terms in the Jacobian)
@@ -1542,6 +2062,13 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write(
+                    b'J'
+                    + _pack_ints(row_idx, len(linear))
+                    + _pack_linear(linear, column_order)
+                )
+                continue
             ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1558,6 +2085,13 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write(
+                    b'G'
+                    + _pack_ints(obj_idx, len(linear))
+                    + _pack_linear(linear, column_order)
+                )
+                continue
             ostream.write(f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1590,6 +2124,87 @@ class _NLWriter_impl(object):
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _instantiate_template(self, template, con):
+        """Generate the (lb, repn, ub) for `con` from its compiled template
+
+        `template` is the ``[LinearTemplate, verified]`` record for the
+        parent constraint.  The first row generated from each template
+        is compared against the result of walking the expression; if
+        they disagree (or the template cannot be instantiated), the
+        template is discarded and the walked repn is used.  Rows that
+        were modified after the constraint was constructed are always
+        walked.
+
+        """
+        visitor = self.visitor
+        modified = template[0].is_modified(con)
+        if template[1] and not modified:
+            try:
+                lb, const, linear, ub = template[0].collect(
+                    con, visitor, AMPLBeforeChildDispatcher._record_var, _fixed_value
+                )
+            except Exception:
+                template[0] = None
+            else:
+                return lb, visitor.Result(const, linear, None), ub
+        lb, body, ub = con.to_bounded_expression(True)
+        repn = self.walk_expression((body, con, 0, 1))
+        if not template[1] and not modified:
+            template[1] = True
+            try:
+                instance = template[0].collect(
+                    con, visitor, AMPLBeforeChildDispatcher._record_var, _fixed_value
+                )
+            except Exception:
+                instance = None
+            if (
+                instance is None
+                or repn.nonlinear
+                or repn.named_exprs
+                or not template[0].verify(instance, lb, repn.const, repn.linear, ub)
+            ):
+                template[0] = None
+        return lb, repn, ub
+
+    def _walk_expression_cached(self, args):
+        """Compile an expression, reusing the representation cached from
+        the previous write() if the source component has not changed.
+
+        This has the same signature as
+        :py:meth:`AMPLRepnVisitor.walk_expression` and is used in place
+        of it when the writer is run with ``incremental=True``.
+
+        """
+        expr, src, src_idx, scale = args
+        cache = self.repn_cache
+        src_expr = getattr(src, 'expr', None)
+        if src_expr is None:
+            return self.visitor.walk_expression(args)
+        entry = cache.entries.get(id(src), None)
+        if entry is not None and entry.is_current(src_expr, scale):
+            self.current_entries[id(src)] = entry
+            if entry.repn is not None:
+                cache.reused += 1
+                # Register the referenced variables exactly as the
+                # AMPLRepnVisitor would have when walking the expression
+                var_map = self.var_map
+                for v in entry.variables:
+                    if id(v) not in var_map and not v.fixed:
+                        AMPLBeforeChildDispatcher._record_var(self.visitor, v)
+                return entry.repn.duplicate()
+            cache.recompiled += 1
+            return self.visitor.walk_expression(args)
+        cache.recompiled += 1
+        repn = self.visitor.walk_expression(args)
+        dependencies = cache.dependency_visitor.walk_expression(expr)
+        self.current_entries[id(src)] = _NLRepnCacheEntry(
+            src_expr,
+            scale,
+            None if dependencies is None else repn.duplicate(),
+            dependencies,
+        )
+        return repn
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1963,6 +2578,8 @@ class _NLWriter_impl(object):
         # already been compiled)
         if repn.nonlinear:
             nl, args = repn.nonlinear
+            if nl.__class__ is _SpilledSegment:
+                nl = self.spill.load(nl)
             if include_const and repn.const:
                 # Add the constant to the NL expression.  AMPL adds the
                 # constant as the second argument, so we will too.
@@ -1993,8 +2610,15 @@ class _NLWriter_impl(object):
         # the Hessian results.
         linear = dict(item for item in info[1].linear.items() if item[1])
         #
-        ostream.write(f'V{self.next_V_line_id} {len(linear)} {k}{lbl}\n')
-        for _id in sorted(linear, key=column_order.__getitem__):
-            ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+        if self.config.binary:
+            ostream.raw.write(
+                b'V'
+                + _pack_ints(self.next_V_line_id, len(linear), k)
+                + _pack_linear(linear, column_order)
+            )
+        else:
+            ostream.write(f'V{self.next_V_line_id} {len(linear)} {k}{lbl}\n')
+            for _id in sorted(linear, key=column_order.__getitem__):
+                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
         self._write_nl_expression(info[1], True)
         self.next_V_line_id += 1
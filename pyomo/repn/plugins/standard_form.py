@@ -11,11 +11,13 @@
 
 import collections
 import logging
-from operator import attrgetter
+from array import array
+from operator import attrgetter, neg
 
 from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
+    In,
     InEnum,
     document_kwargs_from_configdict,
 )
@@ -66,7 +68,9 @@ class LinearStandardFormInfo(object):
 
         The objective coefficients.  Note that this is a sparse array
         and may contain multiple rows (for multiobjective problems).  The
-        objectives may be calculated by "c @ x"
+        objectives may be calculated by "c @ x".  This is a
+        scipy.sparse.csr_array if the compiler was called with
+        `sparse_format='csr'`.
 
     c_offset : numpy.ndarray
 
@@ -75,7 +79,8 @@ class LinearStandardFormInfo(object):
     A : scipy.sparse.csc_array
 
         The constraint coefficients.  The constraint bodies may be
-        calculated by "A @ x"
+        calculated by "A @ x".  This is a scipy.sparse.csr_array if the
+        compiler was called with `sparse_format='csr'`.
 
     rhs : numpy.ndarray
 
@@ -213,6 +218,21 @@ class LinearStandardFormCompiler(object):
             appended to the end of this list.""",
         ),
     )
+    CONFIG.declare(
+        'sparse_format',
+        ConfigValue(
+            default='csc',
+            domain=In(['csc', 'csr']),
+            description='Sparse matrix format for the returned `c` and `A`',
+            doc="""
+            The scipy.sparse format ('csc' or 'csr') of the returned
+            objective and constraint matrices.  The matrices are
+            assembled row-wise, so requesting 'csr' avoids converting
+            the matrices to column-major form (unless `nonnegative_vars`
+            is also requested, as that transformation operates on the
+            columns).""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -332,10 +352,14 @@ class _LinearStandardFormCompiler_impl(object):
                     Objective, active=True, descend_into=False, sort=sorter
                 )
             )
+        # The matrices are assembled directly into (growable) typed
+        # arrays, which are then handed to scipy without copying.
+        # Indices and index pointers share a dtype so that scipy does
+        # not need to upcast (copy) either of them.
         obj_offset = []
-        obj_data = []
-        obj_index = []
-        obj_index_ptr = [0]
+        obj_data = array('d')
+        obj_index = array('q')
+        obj_index_ptr = array('q', [0])
         for obj in objectives:
             repn = visitor.walk_expression(obj.expr)
             if repn.nonlinear is not None:
@@ -343,16 +367,15 @@ class _LinearStandardFormCompiler_impl(object):
                     f"Model objective ({obj.name}) contains nonlinear terms that "
                     "cannot be compiled to standard (linear) form."
                 )
-            N = len(repn.linear)
-            obj_data.append(np.fromiter(repn.linear.values(), float, N))
-            obj_offset.append(repn.constant)
+            linear = repn.linear
             if set_sense is not None and set_sense != obj.sense:
-                obj_data[-1] *= -1
-                obj_offset[-1] *= -1
-            obj_index.append(
-                np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
-            )
-            obj_index_ptr.append(obj_index_ptr[-1] + N)
+                obj_data.extend(map(neg, linear.values()))
+                obj_offset.append(-repn.constant)
+            else:
+                obj_data.extend(linear.values())
+                obj_offset.append(repn.constant)
+            obj_index.extend(map(var_order.__getitem__, linear))
+            obj_index_ptr.append(len(obj_index))
             if with_debug_timing:
                 timer.toc('Objective %s', obj, level=logging.DEBUG)
 
@@ -365,9 +388,9 @@ class _LinearStandardFormCompiler_impl(object):
             raise ValueError("cannot specify both slack_form and mixed_form")
         rows = []
         rhs = []
-        con_data = []
-        con_index = []
-        con_index_ptr = [0]
+        con_data = array('d')
+        con_index = array('q')
+        con_index_ptr = array('q', [0])
         last_parent = None
         for con in ordered_active_constraints(model, self.config):
             if with_debug_timing and con.parent_component() is not last_parent:
@@ -396,7 +419,8 @@ class _LinearStandardFormCompiler_impl(object):
             offset = repn.constant
             repn.constant = 0
 
-            if not repn.linear:
+            linear = repn.linear
+            if not linear:
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
                 raise InfeasibleError(
@@ -404,31 +428,29 @@ class _LinearStandardFormCompiler_impl(object):
                 )
 
             if mixed_form:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
+                _index = list(map(var_order.__getitem__, linear))
                 if ub == lb:
                     rows.append(RowEntry(con, 0))
                     rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_data.extend(linear.values())
+                    con_index.extend(_index)
+                    con_index_ptr.append(len(con_index))
                 else:
                     if ub is not None:
                         rows.append(RowEntry(con, 1))
                         rhs.append(ub - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
+                        con_data.extend(linear.values())
+                        con_index.extend(_index)
+                        con_index_ptr.append(len(con_index))
                     if lb is not None:
                         rows.append(RowEntry(con, -1))
                         rhs.append(lb - offset)
-                        con_data.append(_data)
-                        con_index.append(_index)
-                        con_index_ptr.append(con_index_ptr[-1] + N)
+                        con_data.extend(linear.values())
+                        con_index.extend(_index)
+                        con_index_ptr.append(len(con_index))
             elif slack_form:
-                _data = list(repn.linear.values())
-                _index = list(map(var_order.__getitem__, repn.linear))
+                con_data.extend(linear.values())
+                con_index.extend(map(var_order.__getitem__, linear))
                 if lb == ub:  # TODO: add tolerance?
                     rhs.append(ub - offset)
                 else:
@@ -445,28 +467,24 @@ class _LinearStandardFormCompiler_impl(object):
                             v.lb = lb - ub
                     var_map[id(v)] = v
                     var_order[id(v)] = slack_col = len(var_order)
-                    _data.append(1)
-                    _index.append(slack_col)
+                    con_data.append(1)
+                    con_index.append(slack_col)
                 rows.append(RowEntry(con, 1))
-                con_data.append(np.array(_data))
-                con_index.append(np.array(_index))
-                con_index_ptr.append(con_index_ptr[-1] + len(_index))
+                con_index_ptr.append(len(con_index))
             else:
-                N = len(repn.linear)
-                _data = np.fromiter(repn.linear.values(), float, N)
-                _index = np.fromiter(map(var_order.__getitem__, repn.linear), float, N)
+                _index = list(map(var_order.__getitem__, linear))
                 if ub is not None:
                     rows.append(RowEntry(con, 1))
                     rhs.append(ub - offset)
-                    con_data.append(_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_data.extend(linear.values())
+                    con_index.extend(_index)
+                    con_index_ptr.append(len(con_index))
                 if lb is not None:
                     rows.append(RowEntry(con, -1))
                     rhs.append(offset - lb)
-                    con_data.append(-_data)
-                    con_index.append(_index)
-                    con_index_ptr.append(con_index_ptr[-1] + N)
+                    con_data.extend(map(neg, linear.values()))
+                    con_index.extend(_index)
+                    con_index_ptr.append(len(con_index))
 
         if with_debug_timing:
             # report the last constraint
@@ -474,47 +492,35 @@ class _LinearStandardFormCompiler_impl(object):
 
         # Get the variable list
         columns = list(var_map.values())
-        # Convert the compiled data to scipy sparse matrices
-        if obj_data:
-            obj_data = np.concatenate(obj_data)
-            obj_index = np.concatenate(obj_index)
+        # Convert the compiled data to scipy sparse matrices (these are
+        # views into the underlying typed arrays: no data is copied)
         c = scipy.sparse.csr_array(
-            (obj_data, obj_index, obj_index_ptr), [len(obj_index_ptr) - 1, len(columns)]
-        ).tocsc()
-        if rows:
-            con_data = np.concatenate(con_data)
-            con_index = np.concatenate(con_index)
+            (
+                np.frombuffer(obj_data, float),
+                np.frombuffer(obj_index, np.int64),
+                np.frombuffer(obj_index_ptr, np.int64),
+            ),
+            [len(obj_index_ptr) - 1, len(columns)],
+        )
         A = scipy.sparse.csr_array(
-            (con_data, con_index, con_index_ptr), [len(rows), len(columns)]
-        ).tocsc()
-
-        # Some variables in the var_map may not actually appear in the
-        # objective or constraints (e.g., added from col_order, or
-        # multiplied by 0 in the expressions).  The easiest way to check
-        # for empty columns is to convert from CSR to CSC and then look
-        # at the index pointer list (an O(num_var) operation).
-        c_ip = c.indptr
-        A_ip = A.indptr
-        active_var_mask = (A_ip[1:] > A_ip[:-1]) | (c_ip[1:] > c_ip[:-1])
-
-        # Masks on NumPy arrays are very fast.  Build the reduced A
-        # indptr and then check if we actually have to manipulate the
-        # columns
-        augmented_mask = np.concatenate((active_var_mask, [True]))
-        reduced_A_indptr = A.indptr[augmented_mask]
-        nCol = len(reduced_A_indptr) - 1
-        if nCol != len(columns):
-            columns = [v for k, v in zip(active_var_mask, columns) if k]
-            c = scipy.sparse.csc_array(
-                (c.data, c.indices, c.indptr[augmented_mask]), [c.shape[0], nCol]
-            )
-            # active_var_idx[-1] = len(columns)
-            A = scipy.sparse.csc_array(
-                (A.data, A.indices, reduced_A_indptr), [A.shape[0], nCol]
-            )
+            (
+                np.frombuffer(con_data, float),
+                np.frombuffer(con_index, np.int64),
+                np.frombuffer(con_index_ptr, np.int64),
+            ),
+            [len(rows), len(columns)],
+        )
+
+        if self.config.sparse_format == 'csr' and not self.config.nonnegative_vars:
+            c, A, columns = _csr_remove_empty_columns(c, A, columns)
+        else:
+            c, A, columns = _csc_remove_empty_columns(c.tocsc(), A.tocsc(), columns)
 
         if self.config.nonnegative_vars:
             c, A, columns, eliminated_vars = _csc_to_nonnegative_vars(c, A, columns)
+            if self.config.sparse_format == 'csr':
+                c = c.tocsr()
+                A = A.tocsr()
         else:
             eliminated_vars = []
 
@@ -525,6 +531,54 @@ class _LinearStandardFormCompiler_impl(object):
         return info
 
 
+def _csc_remove_empty_columns(c, A, columns):
+    # Some variables in the var_map may not actually appear in the
+    # objective or constraints (e.g., added from col_order, or
+    # multiplied by 0 in the expressions).  The easiest way to check
+    # for empty columns is to convert from CSR to CSC and then look
+    # at the index pointer list (an O(num_var) operation).
+    c_ip = c.indptr
+    A_ip = A.indptr
+    active_var_mask = (A_ip[1:] > A_ip[:-1]) | (c_ip[1:] > c_ip[:-1])
+
+    # Masks on NumPy arrays are very fast.  Build the reduced A
+    # indptr and then check if we actually have to manipulate the
+    # columns
+    augmented_mask = np.concatenate((active_var_mask, [True]))
+    reduced_A_indptr = A.indptr[augmented_mask]
+    nCol = len(reduced_A_indptr) - 1
+    if nCol != len(columns):
+        columns = [v for k, v in zip(active_var_mask, columns) if k]
+        c = scipy.sparse.csc_array(
+            (c.data, c.indices, c.indptr[augmented_mask]), [c.shape[0], nCol]
+        )
+        # active_var_idx[-1] = len(columns)
+        A = scipy.sparse.csc_array(
+            (A.data, A.indices, reduced_A_indptr), [A.shape[0], nCol]
+        )
+    return c, A, columns
+
+
+def _csr_remove_empty_columns(c, A, columns):
+    # Row-major version of _csc_remove_empty_columns: count the
+    # nonzeros in each column and renumber the column indices of the
+    # remaining columns (only if any columns are actually removed).
+    nCol = len(columns)
+    active_var_mask = (np.bincount(A.indices, minlength=nCol) > 0) | (
+        np.bincount(c.indices, minlength=nCol) > 0
+    )
+    if not active_var_mask.all():
+        columns = [v for k, v in zip(active_var_mask, columns) if k]
+        new_index = np.cumsum(active_var_mask) - 1
+        c = scipy.sparse.csr_array(
+            (c.data, new_index[c.indices], c.indptr), [c.shape[0], len(columns)]
+        )
+        A = scipy.sparse.csr_array(
+            (A.data, new_index[A.indices], A.indptr), [A.shape[0], len(columns)]
+        )
+    return c, A, columns
+
+
 def _csc_to_nonnegative_vars(c, A, columns):
     eliminated_vars = []
     new_columns = []
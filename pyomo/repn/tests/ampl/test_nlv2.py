@@ -2797,3 +2797,344 @@ k-1
                 OUT.getvalue(),
             )
         )
+
+    def test_incremental_write(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.x = Var(m.I, bounds=(0, 10))
+        m.y = Var()
+        m.p = Param(m.I, initialize=lambda m, i: i, mutable=True)
+        m.c = Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] + m.y**2 >= i)
+        m.d = Constraint(expr=sum(m.x.values()) <= 20)
+        m.o = Objective(expr=sum(m.p[i] * m.x[i] ** 2 for i in m.I))
+
+        writer = nl_writer.NLWriter()
+
+        def check(reused, recompiled):
+            OUT = io.StringIO()
+            writer.write(m, OUT, incremental=True)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF)
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            self.assertEqual(writer._repn_cache.reused, reused)
+            self.assertEqual(writer._repn_cache.recompiled, recompiled)
+
+        check(0, 5)
+        # Nothing changed
+        check(5, 0)
+        # Changing a Param only recompiles the components that use it
+        m.p[2] = 7
+        check(3, 2)
+        # Fixing a variable recompiles everything that references it
+        m.x[3].fix(2)
+        check(2, 3)
+        m.x[3].unfix()
+        m.y.fix(1)
+        check(0, 5)
+        # Replacing a constraint expression
+        m.c[1].set_value(m.x[1] >= 1)
+        check(4, 1)
+        # Bound changes on free variables do not require recompiling
+        # expressions (but changing the value of a fixed variable does)
+        m.x[2].setlb(1)
+        m.y.value = 2
+        check(3, 2)
+        # Removing a constraint drops it from the cache
+        m.del_component(m.d)
+        check(4, 0)
+        self.assertEqual(len(writer._repn_cache.entries), 4)
+        # Turning off incremental mode discards the cache
+        writer.write(m, io.StringIO())
+        self.assertIsNone(writer._repn_cache)
+
+    def test_incremental_write_named_expressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=1)
+        m.e = Expression(expr=m.x[1] ** 2)
+        m.c1 = Constraint(expr=m.e + m.x[2] >= 1)
+        m.c2 = Constraint(expr=m.x[1] + m.x[2] <= 5)
+        m.o = Objective(expr=m.x[2])
+
+        writer = nl_writer.NLWriter()
+        for i in range(2):
+            OUT = io.StringIO()
+            writer.write(m, OUT, incremental=True)
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF)
+            self.assertEqual(*nl_diff(REF.getvalue(), OUT.getvalue()))
+            m.e.expr = m.x[1] ** 3
+        # Constraints referencing named expressions are always recompiled
+        self.assertEqual(writer._repn_cache.reused, 2)
+        self.assertEqual(writer._repn_cache.recompiled, 1)
+
+    def _binary_nl_to_tokens(self, data):
+        # Decode a binary NL file into the flat list of tokens that
+        # _text_nl_to_tokens() generates for the equivalent text NL file
+        import struct
+        from pyomo.repn.ampl import nl_operators
+
+        header = data.split(b'\n', 10)
+        self.assertEqual(header[0][:1], b'b')
+        n_vars, n_cons = map(int, header[1].split()[:2])
+        data = header[10]
+        pos = 0
+
+        def unpack(fmt):
+            nonlocal pos
+            ans = struct.unpack_from('=' + fmt, data, pos)
+            pos += struct.calcsize('=' + fmt)
+            return [float(v) if type(v) is int else v for v in ans]
+
+        def char():
+            nonlocal pos
+            pos += 1
+            return chr(data[pos - 1])
+
+        def string():
+            nonlocal pos
+            (n,) = struct.unpack_from('=i', data, pos)
+            pos += 4 + n
+            return data[pos - n : pos].decode()
+
+        def expr():
+            code = char()
+            ans = [code]
+            if code == 'n':
+                ans.extend(unpack('d'))
+            elif code == 'v':
+                ans.extend(unpack('i'))
+            elif code == 'o':
+                ans.extend(unpack('i'))
+                nargs = nl_operators[int(ans[1])][0]
+                if nargs is None:
+                    ans.extend(unpack('i'))
+                    nargs = int(ans[-1])
+                for i in range(nargs):
+                    ans.extend(expr())
+            else:
+                self.fail(f"Unexpected expression code '{code}'")
+            return ans
+
+        bounds = {'0': 'dd', '1': 'd', '2': 'd', '3': '', '4': 'd', '5': 'ii'}
+        tokens = []
+        while pos < len(data):
+            seg = char()
+            tokens.append(seg)
+            if seg == 'S':
+                kind, n = unpack('ii')
+                tokens.extend([kind, n, string()])
+                tokens.extend(unpack(('id' if int(kind) & 4 else 'ii') * int(n)))
+            elif seg == 'V':
+                tokens.extend(unpack('iii'))
+                tokens.extend(unpack('id' * int(tokens[-2])))
+                tokens.extend(expr())
+            elif seg == 'C':
+                tokens.extend(unpack('i'))
+                tokens.extend(expr())
+            elif seg == 'O':
+                tokens.extend(unpack('ii'))
+                tokens.extend(expr())
+            elif seg in 'dx':
+                tokens.extend(unpack('i'))
+                tokens.extend(unpack('id' * int(tokens[-1])))
+            elif seg in 'rb':
+                for i in range(n_cons if seg == 'r' else n_vars):
+                    _type = char()
+                    tokens.append(float(_type))
+                    tokens.extend(unpack(bounds[_type]))
+            elif seg == 'k':
+                tokens.extend(unpack('i'))
+                tokens.extend(unpack('i' * int(tokens[-1])))
+            elif seg in 'JG':
+                tokens.extend(unpack('ii'))
+                tokens.extend(unpack('id' * int(tokens[-1])))
+            else:
+                self.fail(f"Unexpected segment '{seg}'")
+        return tokens
+
+    def _text_nl_to_tokens(self, text):
+        tokens = []
+        for line in text.splitlines()[10:]:
+            line = line.split('#', 1)[0].split()
+            if line[0][0] == 'S':
+                tokens.extend(['S', float(line[0][1:]), float(line[1]), line[2]])
+                continue
+            for tok in line:
+                if tok[0].isalpha():
+                    tokens.append(tok[0])
+                    tok = tok[1:]
+                    if not tok:
+                        continue
+                tokens.append(float(tok))
+        return tokens
+
+    def test_binary_format(self):
+        m = ConcreteModel()
+        m.x = Var(range(4), bounds=(-1, 5), initialize=lambda m, i: i + 0.5)
+        m.x[1].setlb(None)
+        m.x[2].setub(None)
+        m.x[3].fix(3)
+        m.y = Var(domain=Integers, bounds=(0, 2.5))
+        m.z = Var(bounds=(1.5, 1.5))
+        m.w = Var()
+        m.e = Expression(expr=m.x[0] ** 2 + log(m.x[1]) + 0.25 * m.w)
+        m.c1 = Constraint(expr=m.e + m.x[2] * m.y >= 1)
+        m.c2 = Constraint(expr=inequality(-2, m.e + m.x[0] * m.x[3], 3.5))
+        m.c3 = Constraint(expr=m.x[0] + 2 * m.y - 3.5 * m.z == 4)
+        m.c4 = Constraint(expr=m.x[1] - m.w <= 10)
+        m.c5 = Constraint(expr=m.x[0] * m.x[1] + m.x[1] * m.w + m.x[2] * m.y <= 12)
+        m.o = Objective(expr=m.e + 3 * m.y + m.x[0] * m.x[2] * m.w)
+        m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.dual[m.c1] = 0.5
+        m.dual[m.c3] = -1.25
+        m.priority = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.priority[m.y] = 10
+        m.scale = Suffix(direction=Suffix.EXPORT)
+        m.scale[m.c2] = 2.5
+
+        for symbolic in (False, True):
+            REF = io.StringIO()
+            ref_info = nl_writer.NLWriter().write(
+                m, REF, symbolic_solver_labels=symbolic
+            )
+            OUT = io.BytesIO()
+            info = nl_writer.NLWriter().write(
+                m, OUT, binary=True, symbolic_solver_labels=symbolic
+            )
+            self.assertEqual(info.variables, ref_info.variables)
+            self.assertEqual(info.constraints, ref_info.constraints)
+            self.assertEqual(info.objectives, ref_info.objectives)
+
+            ref = REF.getvalue()
+            out = OUT.getvalue()
+            # The header is text, and only differs in the format ("b")
+            # and arith flags
+            ref_header = ref.splitlines()[:10]
+            out_header = out.split(b'\n', 10)[:10]
+            self.assertEqual(out_header[0].decode(), 'b' + ref_header[0][1:])
+            self.assertEqual(
+                out_header[5].decode().split()[:4],
+                ['0', '0', str(nl_writer._binary_arith_kind), '1'],
+            )
+            for i in (1, 2, 3, 4, 6, 7, 8, 9):
+                self.assertEqual(out_header[i].decode(), ref_header[i])
+            tokens = self._binary_nl_to_tokens(out)
+            self.assertEqual(tokens, self._text_nl_to_tokens(ref))
+            # Spot-check that we exercised the interesting segments
+            for seg in 'SVCOdxrbkJG':
+                self.assertIn(seg, tokens)
+
+    def test_binary_format_to_file(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 4))
+        m.c = Constraint(expr=m.x[1] ** 2 + m.x[2] >= 1)
+        m.o = Objective(expr=m.x[1] + m.x[2])
+
+        with TempfileManager:
+            fname = TempfileManager.create_tempfile(suffix='.nl')
+            nl_writer.NLWriter()(m, fname, lambda x: True, {'binary': True})
+            with open(fname, 'rb') as FILE:
+                data = FILE.read()
+        REF = io.StringIO()
+        nl_writer.NLWriter().write(m, REF, scale_model=False, linear_presolve=False)
+        self.assertEqual(
+            self._binary_nl_to_tokens(data), self._text_nl_to_tokens(REF.getvalue())
+        )
+
+    def test_templatize_constraints(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(20)
+        m.J = pyo.RangeSet(3)
+        m.p = Param(m.I, initialize=lambda m, i: i % 4, mutable=True)
+        m.x = Var(m.I, m.J, bounds=(0, 10))
+        m.y = Var(m.I)
+        m.z = Var()
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: sum(j * m.x[i, j] for j in m.J) / 2 + m.p[i] * m.y[i]
+            <= 2 * i,
+        )
+        m.e = Constraint(m.I, rule=lambda m, i: m.y[i] == m.z + m.p[i])
+        m.r = Constraint(m.I, rule=lambda m, i: (-i, m.y[i] - m.x[i, 1], m.p[i]))
+        m.q = Constraint(m.I, rule=lambda m, i: m.x[i, 2] ** 2 <= i)
+        m.o = Objective(expr=sum(m.y[i] for i in m.I))
+        # The rule converts the index to a string: not templatizable
+        # (and the first row matches the string conversion of the template)
+        m.K = pyo.Set(initialize=[10, 5, 7])
+        m.s = Constraint(m.K, rule=lambda m, i: m.y[i] >= len(str(i)))
+        m.z.fix(3)
+        # Rows modified after construction are never generated from the
+        # template (including the first row, which is used to verify it)
+        m.e[1].set_value(m.y[1] + m.z <= 4)
+        m.c[5].set_value(m.y[5] + m.x[5, 1] <= 7)
+
+        for options in ({}, {'symbolic_solver_labels': True}):
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(m, REF, **options)
+            OUT = io.StringIO()
+            nl_writer.NLWriter().write(m, OUT, templatize_constraints=True, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    def test_compact_constraints(self):
+        def build(compact):
+            m = ConcreteModel()
+            m.I = pyo.RangeSet(5)
+            m.p = Param(m.I, initialize=lambda m, i: i % 3, mutable=True)
+            m.x = Var(m.I, bounds=(0, 10))
+            m.y = Var(m.I)
+            m.z = Var()
+            m.c = Constraint(
+                m.I,
+                rule=lambda m, i: m.x[i] / 2 + 3.0 * m.y[i] - 1.5 * m.z + 1 <= m.p[i],
+                compact=compact,
+            )
+            m.e = Constraint(
+                m.I, rule=lambda m, i: m.y[i] == 2.0 * m.x[i] + i, compact=compact
+            )
+            m.r = Constraint(
+                m.I,
+                rule=lambda m, i: (-i, 2.0 * m.y[i] - 4.5 * m.x[i] - m.y[i], 10),
+                compact=compact,
+            )
+            m.q = Constraint(m.I, rule=lambda m, i: m.x[i] ** 2 <= i, compact=compact)
+            m.o = Objective(expr=sum(m.y[i] for i in m.I))
+            m.z.fix(3)
+            return m
+
+        for options in (
+            {},
+            {'symbolic_solver_labels': True},
+            {'linear_presolve': False},
+        ):
+            REF = io.StringIO()
+            nl_writer.NLWriter().write(build(False), REF, **options)
+            OUT = io.StringIO()
+            nl_writer.NLWriter().write(build(True), OUT, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    def test_low_memory(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(5)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.y = Var()
+        m.e = Expression(expr=m.x[1] ** 2 + m.y)
+        m.c = Constraint(m.I, rule=lambda m, i: pyo.exp(m.x[i]) + i * m.y**2 + m.e >= i)
+        m.d = Constraint(expr=sum(m.x.values()) <= 20)
+        # This constraint becomes constant after the presolve eliminates m.y
+        m.f = Constraint(expr=m.y == 2)
+        m.g = Constraint(expr=m.y**3 <= 10)
+        m.o = Objective(expr=sum(m.x[i] ** 2 for i in m.I) + m.e)
+
+        for options in (
+            {},
+            {'symbolic_solver_labels': True},
+            {'linear_presolve': False},
+            {'binary': True},
+        ):
+            if options.get('binary', False):
+                REF, OUT = io.BytesIO(), io.BytesIO()
+            else:
+                REF, OUT = io.StringIO(), io.StringIO()
+            nl_writer.NLWriter().write(m, REF, **options)
+            nl_writer.NLWriter().write(m, OUT, low_memory=True, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import multiprocessing
 from io import StringIO
 
 import pyomo.common.unittest as unittest
@@ -139,3 +140,114 @@ end
         self.assertEqual(LOG.getvalue(), "")
 
         self.assertEqual(ref, OUT.getvalue())
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel compilation requires the 'fork' start method",
+    )
+    def test_parallel_compilation(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(50)
+        m.x = pyo.Var(m.I, bounds=(0, 10))
+        m.z = pyo.Var(m.I, domain=pyo.Binary)
+        m.b = pyo.Block(m.I)
+        for i in m.I:
+            m.b[i].y = pyo.Var(range(3))
+            m.b[i].c = pyo.Constraint(
+                expr=sum((j + 1) / i * m.b[i].y[j] for j in range(3)) + m.x[i] >= i
+            )
+        m.c = pyo.Constraint(
+            m.I, rule=lambda m, i: m.x[i] * m.x[i % 50 + 1] + 3 * m.z[i] <= 5
+        )
+        m.r = pyo.Constraint(m.I, rule=lambda m, i: (0, m.x[i] - m.z[i], 2))
+        m.skip = pyo.Constraint(expr=(None, m.x[1], None))
+        m.o = pyo.Objective(expr=sum(m.x[i] for i in m.I if i % 7 == 0))
+        # Variables not on the model are compiled in the main process
+        other = pyo.ConcreteModel()
+        other.v = pyo.Var()
+        m.f = pyo.Constraint(expr=other.v + m.x[3] >= 1)
+
+        for options in (
+            {},
+            {'symbolic_solver_labels': True},
+            {'column_order': [m.b[5].y, m.z[7]]},
+        ):
+            REF = StringIO()
+            LPWriter().write(m, REF, **options)
+            OUT = StringIO()
+            LPWriter().write(m, OUT, compile_processes=3, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+        m.n = pyo.Constraint(expr=m.x[1] ** 3 >= 1)
+        with self.assertRaisesRegex(
+            ValueError, r"Model constraint \(n\) contains nonlinear terms"
+        ):
+            LPWriter().write(m, StringIO(), compile_processes=2)
+
+    def test_templatize_constraints(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(20)
+        m.J = pyo.RangeSet(3)
+        m.p = pyo.Param(m.I, initialize=lambda m, i: i % 4, mutable=True)
+        m.x = pyo.Var(m.I, m.J, bounds=(0, 10))
+        m.y = pyo.Var(m.I)
+        m.z = pyo.Var()
+        m.c = pyo.Constraint(
+            m.I,
+            rule=lambda m, i: sum(j * m.x[i, j] for j in m.J) / 2 + m.p[i] * m.y[i]
+            <= 2 * i,
+        )
+        m.e = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] == m.z + m.p[i])
+        m.r = pyo.Constraint(m.I, rule=lambda m, i: (-i, m.y[i] - m.x[i, 1], m.p[i]))
+        m.n = pyo.Constraint(
+            m.I, rule=lambda m, i: m.y[i] >= 1 if i % 2 else pyo.Constraint.Skip
+        )
+        m.o = pyo.Objective(expr=sum(m.y[i] for i in m.I))
+        # The rule converts the index to a string: not templatizable
+        # (and the first row matches the string conversion of the template)
+        m.K = pyo.Set(initialize=[10, 5, 7])
+        m.s = pyo.Constraint(m.K, rule=lambda m, i: m.y[i] >= len(str(i)))
+        m.z.fix(3)
+        # Rows modified after construction are never generated from the
+        # template (including the first row, which is used to verify it)
+        m.e[1].set_value(m.y[1] + m.z <= 4)
+        m.c[5].set_value(m.y[5] + m.x[5, 1] <= 7)
+
+        for options in ({}, {'symbolic_solver_labels': True}):
+            REF = StringIO()
+            LPWriter().write(m, REF, **options)
+            OUT = StringIO()
+            LPWriter().write(m, OUT, templatize_constraints=True, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+
+    def test_compact_constraints(self):
+        def build(compact):
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(5)
+            m.p = pyo.Param(m.I, initialize=lambda m, i: i % 3, mutable=True)
+            m.x = pyo.Var(m.I, bounds=(0, 10))
+            m.y = pyo.Var(m.I)
+            m.z = pyo.Var()
+            m.c = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: 0.5 * m.x[i] + 1.5 * m.y[i] - 2.5 * m.z + 1 <= m.p[i],
+                compact=compact,
+            )
+            m.r = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: (-i, 2.0 * m.y[i] - 3.0 * m.x[i] - 0.5 * m.y[i], 4),
+                compact=compact,
+            )
+            m.q = pyo.Constraint(
+                m.I, rule=lambda m, i: m.x[i] * m.y[i] == i, compact=compact
+            )
+            m.o = pyo.Objective(expr=sum(m.y[i] for i in m.I))
+            m.z.fix(3)
+            return m
+
+        for options in ({}, {'symbolic_solver_labels': True}):
+            REF = StringIO()
+            LPWriter().write(build(False), REF, **options)
+            OUT = StringIO()
+            LPWriter().write(build(True), OUT, **options)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
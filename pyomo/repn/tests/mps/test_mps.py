@@ -17,6 +17,8 @@ import random
 
 from filecmp import cmp
 import pyomo.common.unittest as unittest
+from pyomo.common.tempfiles import TempfileManager
+import pyomo.repn.plugins.mps as mps
 
 from pyomo.environ import (
     ConcreteModel,
@@ -245,6 +247,63 @@ class TestMPSOrdering(unittest.TestCase):
 
         self._check_baseline(model, int_marker=True)
 
+    def test_fixed_variable(self):
+        model = ConcreteModel()
+        model.x = Var(bounds=(0, 10))
+        model.y = Var()
+        model.y.fix(3)
+        model.c = Constraint(expr=model.x + 2 * model.y >= 7)
+        model.q = Constraint(expr=model.x**2 + model.x * model.y <= 50)
+        model.o = Objective(expr=model.x + model.y)
+
+        self._check_baseline(model)
+
+
+class TestMPSRepnCache(unittest.TestCase):
+    def _write(self, model):
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.mps')
+            model.write(fname, format='mps')
+            with open(fname) as FILE:
+                return FILE.read()
+
+    def test_gen_repn(self):
+        model = ConcreteModel()
+        model.x = Var()
+        model.y = Var()
+        model.c = Constraint(expr=model.x**2 + model.y >= 1)
+        model.obj = Objective(expr=model.x**2 + 2 * model.y)
+
+        ref = self._write(model)
+        # By default, repns are not cached on the block
+        self.assertFalse(hasattr(model, '_repn'))
+
+        model._gen_obj_repn = True
+        model._gen_con_repn = True
+        self.assertEqual(ref, self._write(model))
+        self.assertEqual(len(model._repn), 2)
+        obj_repn = model._repn[model.obj]
+        c_repn = model._repn[model.c]
+
+        model._gen_obj_repn = False
+        model._gen_con_repn = False
+        gsr = mps.generate_standard_repn
+        try:
+
+            def dont_call_gsr(*args, **kwargs):
+                self.fail("generate_standard_repn should not be called")
+
+            mps.generate_standard_repn = dont_call_gsr
+            self.assertEqual(ref, self._write(model))
+        finally:
+            mps.generate_standard_repn = gsr
+        self.assertIs(obj_repn, model._repn[model.obj])
+        self.assertIs(c_repn, model._repn[model.c])
+
+        # The cached repns are used (even if the model changed)
+        model.c.set_value(model.y >= 1)
+        self.assertEqual(ref, self._write(model))
+
 
 if __name__ == "__main__":
     unittest.main()
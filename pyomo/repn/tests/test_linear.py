@@ -889,7 +889,7 @@ class TestLinear(unittest.TestCase):
         cfg = VisitorConfig()
         repn = LinearRepnVisitor(*cfg).walk_expression(m.e)
         self.assertEqual(
-            cfg.subexpr, {id(m.e): (linear._CONSTANT, InvalidNumber(None))}
+            cfg.subexpr, {id(m.e): (linear._CONSTANT, InvalidNumber(None), None)}
         )
         self.assertEqual(cfg.var_map, {})
         self.assertEqual(cfg.var_order, {})
@@ -901,7 +901,7 @@ class TestLinear(unittest.TestCase):
         cfg = VisitorConfig()
         repn = LinearRepnVisitor(*cfg).walk_expression(2 * m.e)
         self.assertEqual(
-            cfg.subexpr, {id(m.e): (linear._CONSTANT, InvalidNumber(None))}
+            cfg.subexpr, {id(m.e): (linear._CONSTANT, InvalidNumber(None), None)}
         )
         self.assertEqual(cfg.var_map, {})
         self.assertEqual(cfg.var_order, {})
@@ -910,6 +910,42 @@ class TestLinear(unittest.TestCase):
         self.assertEqual(repn.linear, {})
         self.assertEqual(repn.nonlinear, None)
 
+    def test_named_expr_reuse(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.e = Expression(expr=sum((i + 2) * m.x[i] for i in range(3)))
+
+        cfg = VisitorConfig()
+        visitor = LinearRepnVisitor(*cfg)
+        repn = visitor.walk_expression(m.e + m.x[0])
+        self.assertEqual(repn.linear, {id(m.x[0]): 3, id(m.x[1]): 3, id(m.x[2]): 4})
+        self.assertEqual(len(cfg.subexpr), 1)
+        cached = cfg.subexpr[id(m.e)]
+        self.assertIs(cached[2], m.e.expr)
+
+        # Subsequent expressions reuse (and do not modify) the cached repn
+        repn = visitor.walk_expression(2 * m.e + m.x[1])
+        self.assertEqual(repn.linear, {id(m.x[0]): 4, id(m.x[1]): 7, id(m.x[2]): 8})
+        repn = visitor.walk_expression(m.e)
+        self.assertEqual(repn.linear, {id(m.x[0]): 2, id(m.x[1]): 3, id(m.x[2]): 4})
+        self.assertIs(cfg.subexpr[id(m.e)], cached)
+        self.assertEqual(
+            cached[1].linear, {id(m.x[0]): 2, id(m.x[1]): 3, id(m.x[2]): 4}
+        )
+
+        # Reassigning the named expression invalidates the cached repn
+        m.e = m.x[2] - m.x[0]
+        repn = visitor.walk_expression(2 * m.e + m.x[1])
+        self.assertEqual(repn.linear, {id(m.x[2]): 2, id(m.x[0]): -2, id(m.x[1]): 1})
+        self.assertIsNot(cfg.subexpr[id(m.e)], cached)
+        self.assertIs(cfg.subexpr[id(m.e)][2], m.e.expr)
+
+        m.e = 5
+        repn = visitor.walk_expression(m.e + m.x[1])
+        self.assertEqual(repn.constant, 5)
+        self.assertEqual(repn.linear, {id(m.x[1]): 1})
+        self.assertEqual(cfg.subexpr[id(m.e)][:2], (linear._CONSTANT, 5))
+
     def test_pow_expr(self):
         m = ConcreteModel()
         m.x = Var()
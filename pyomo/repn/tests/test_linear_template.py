@@ -0,0 +1,155 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+
+from pyomo.repn.linear import LinearBeforeChildDispatcher, LinearRepnVisitor
+from pyomo.repn.linear_template import compile_linear_template
+
+from pyomo.environ import ConcreteModel, Constraint, Param, RangeSet, Set, Var, exp
+
+
+def _fixed_value(visitor, vid, var):
+    return var.value
+
+
+class TestLinearTemplate(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.J = RangeSet(2)
+        m.p = Param(m.I, initialize=lambda m, i: 10 * i, mutable=True)
+        m.x = Var(m.I, m.J)
+        m.y = Var(m.I)
+        m.z = Var()
+        return m
+
+    def _check_rows(self, con):
+        template = compile_linear_template(con)
+        self.assertIsNotNone(template)
+        visitor = LinearRepnVisitor({}, {}, {}, None)
+        for c in con.values():
+            lb, body, ub = c.to_bounded_expression(True)
+            repn = visitor.walk_expression(body)
+            instance = template.collect(
+                c, visitor, LinearBeforeChildDispatcher._record_var, _fixed_value
+            )
+            self.assertTrue(
+                template.verify(instance, lb, repn.constant, repn.linear, ub),
+                msg=f"{c.name}: {instance} != {(lb, repn.constant, repn.linear, ub)}",
+            )
+        return template
+
+    def test_sum_and_params(self):
+        m = self._model()
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: m.p[i] * m.y[i]
+            + sum(j * m.x[i, j] for j in m.J)
+            + 3 * m.z
+            <= 2 * i,
+        )
+        template = self._check_rows(m.c)
+        lb, const, terms, ub = template(2)
+        self.assertIsNone(lb)
+        self.assertEqual(const, 0)
+        self.assertEqual(ub, 4)
+        self.assertEqual(
+            [(v.name, c) for v, c in terms],
+            [('y[2]', 20), ('z', 3), ('x[2,1]', 1), ('x[2,2]', 2)],
+        )
+
+    def test_nested_sums(self):
+        m = self._model()
+        m.IJ = Set(initialize=[(1, 2), (3, 1), (2, 2)])
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: sum(m.p[a] * m.x[a, b] for a, b in m.IJ)
+            + sum(sum(m.x[i, j] for j in m.J) for k in m.I)
+            >= 60 / i,
+        )
+        template = self._check_rows(m.c)
+        lb, const, terms, ub = template(3)
+        self.assertEqual(lb, 20.0)
+        self.assertEqual(const, 0)
+        self.assertIsNone(ub)
+        self.assertEqual(
+            [(v.name, c) for v, c in terms],
+            [('x[1,2]', 10), ('x[3,1]', 30), ('x[2,2]', 20)]
+            + [('x[3,1]', 1), ('x[3,2]', 1)] * 3,
+        )
+
+    def test_normalization(self):
+        m = self._model()
+        m.e = Constraint(
+            m.I, m.J, rule=lambda m, i, j: m.x[i, j] / 2 - m.y[i] == 4 * m.y[i] + m.p[i]
+        )
+        m.r = Constraint(m.I, rule=lambda m, i: (-i, m.y[i] - m.p[i], m.p[i]))
+        m.g = Constraint(m.I, rule=lambda m, i: m.p[i] <= m.y[i] + m.z)
+        self._check_rows(m.e)
+        self._check_rows(m.r)
+        self._check_rows(m.g)
+        self.assertEqual(compile_linear_template(m.r)(3), (-3, -30, [(m.y[3], 1)], 30))
+
+    def test_fixed_vars(self):
+        m = self._model()
+        m.c = Constraint(m.I, rule=lambda m, i: m.y[i] + 2 * m.z >= 0)
+        m.z.fix(5)
+        template = self._check_rows(m.c)
+        visitor = LinearRepnVisitor({}, {}, {}, None)
+        lb, const, linear, ub = template.collect(
+            m.c[1], visitor, LinearBeforeChildDispatcher._record_var, _fixed_value
+        )
+        self.assertEqual(const, 10)
+        self.assertEqual(linear, {id(m.y[1]): 1})
+
+    def test_not_templatizable(self):
+        m = self._model()
+        data = {1: 5, 2: 6, 3: 7}
+        m.scalar = Constraint(expr=m.z >= 0)
+        m.nonlinear = Constraint(m.I, rule=lambda m, i: exp(m.y[i]) <= 1)
+        m.bilinear = Constraint(m.I, rule=lambda m, i: m.y[i] * m.z <= 1)
+        m.branch = Constraint(
+            m.I, rule=lambda m, i: m.y[i] <= 1 if i > 1 else Constraint.Skip
+        )
+        m.lookup = Constraint(m.I, rule=lambda m, i: m.y[i] <= data[i])
+        m.loop = Constraint(m.I, rule=lambda m, i: sum(m.x[i, j] for j in [1, 2]) <= 1)
+        m.explicit = Constraint([1, 2], rule={1: m.z <= 1, 2: m.z <= 2})
+        m.string = Constraint(m.I, rule=lambda m, i: m.y[i] >= len(str(i)))
+        m.fstring = Constraint(m.I, rule=lambda m, i: m.y[i] >= len(f"x{i}"))
+        self.assertIsNone(compile_linear_template(m.scalar))
+        self.assertIsNone(compile_linear_template(m.nonlinear))
+        self.assertIsNone(compile_linear_template(m.bilinear))
+        self.assertIsNone(compile_linear_template(m.branch))
+        self.assertIsNone(compile_linear_template(m.lookup))
+        self.assertIsNone(compile_linear_template(m.explicit))
+        self.assertIsNone(compile_linear_template(m.loop))
+        self.assertIsNone(compile_linear_template(m.string))
+        self.assertIsNone(compile_linear_template(m.fstring))
+
+    def test_modified(self):
+        m = self._model()
+        m.c = Constraint(m.I, rule=lambda m, i: m.y[i] >= i)
+        template = compile_linear_template(m.c)
+        self.assertFalse(any(template.is_modified(c) for c in m.c.values()))
+        m.c[2].set_value(m.y[2] >= 5)
+        m.c[3] = m.y[3] + m.z >= 0
+        self.assertEqual(
+            [template.is_modified(c) for c in m.c.values()], [False, True, True]
+        )
+        # Constraints that were never constructed from a rule
+        m.d = Constraint(m.I)
+        m.d[1] = m.z >= 1
+        self.assertIsNone(compile_linear_template(m.d))
+
+
+if __name__ == "__main__":
+    unittest.main()
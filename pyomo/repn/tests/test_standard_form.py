@@ -77,6 +77,43 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         self.assertEqual(repn.rows, [(m.d, 1), (m.c, -1)])
         self.assertEqual(repn.columns, [m.y[3], m.x, m.y[1]])
 
+    def test_sparse_format(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.y = pyo.Var([1, 2, 3], bounds=(-1, 1))
+        m.c = pyo.Constraint(expr=m.x + 2 * m.y[1] >= 3)
+        m.d = pyo.Constraint(expr=m.y[1] + 4 * m.y[3] <= 5)
+        m.o = pyo.Objective(expr=m.x + 3 * m.y[3])
+
+        col_order = [m.y[3], m.y[2], m.x, m.y[1]]
+        for options in ({}, {'mixed_form': True}, {'slack_form': True}):
+            ref = LinearStandardFormCompiler().write(
+                m, column_order=col_order, **options
+            )
+            repn = LinearStandardFormCompiler().write(
+                m, column_order=col_order, sparse_format='csr', **options
+            )
+            self.assertEqual(ref.A.format, 'csc')
+            self.assertEqual(repn.A.format, 'csr')
+            self.assertEqual(repn.c.format, 'csr')
+            self.assertTrue(np.all(repn.A.toarray() == ref.A.toarray()))
+            self.assertTrue(np.all(repn.c.toarray() == ref.c.toarray()))
+            self.assertTrue(np.all(repn.rhs == ref.rhs))
+            self.assertEqual(repn.rows, ref.rows)
+            self.assertEqual(list(map(str, repn.columns)), list(map(str, ref.columns)))
+
+        # The unreferenced y[2] is removed from the columns
+        self.assertEqual(repn.columns[:3], [m.y[3], m.x, m.y[1]])
+
+        repn = LinearStandardFormCompiler().write(
+            m, nonnegative_vars=True, sparse_format='csr'
+        )
+        ref = LinearStandardFormCompiler().write(m, nonnegative_vars=True)
+        self.assertEqual(repn.A.format, 'csr')
+        self.assertTrue(np.all(repn.A.toarray() == ref.A.toarray()))
+        self.assertTrue(np.all(repn.c.toarray() == ref.c.toarray()))
+        self.assertEqual(list(map(str, repn.x)), list(map(str, ref.x)))
+
     def test_suffix_warning(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark Block.clone()
+
+This script builds a model with (approximately) the requested number of
+component data objects (Vars, mutable Params and linear / nonlinear
+Constraints) and reports the time to build the model and the time to
+clone it.
+
+Example::
+
+    python clone.py --size 1e6
+
+"""
+
+import argparse
+import gc
+import time
+
+import pyomo.environ as pyo
+
+
+def build_model(size):
+    # Each index contributes 2 Vars, 1 Param and 2 Constraints
+    n = max(1, int(size) // 5)
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0, 10))
+    m.y = pyo.Var(m.I)
+    m.p = pyo.Param(m.I, mutable=True, initialize=2)
+
+    @m.Constraint(m.I)
+    def lin(m, i):
+        return m.x[i] + m.p[i] * m.y[i] - 3 * m.x[max(1, i - 1)] <= 5
+
+    @m.Constraint(m.I)
+    def nonlin(m, i):
+        return pyo.exp(m.x[i]) * m.y[i] ** 2 == 1
+
+    m.obj = pyo.Objective(expr=sum(m.x.values()))
+    return m
+
+
+def timed(fcn, *args):
+    gc.collect()
+    start = time.perf_counter()
+    ans = fcn(*args)
+    return ans, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark Block.clone()",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--size',
+        type=float,
+        default=1e6,
+        help="Approximate number of component data objects (default: 1e6)",
+    )
+    options = parser.parse_args(argv)
+
+    model, build = timed(build_model, options.size)
+    print("build:          %8.3f s" % (build,))
+    clone, elapsed = timed(model.clone)
+    del clone
+    print("clone:          %8.3f s  (%.2fx build)" % (elapsed, elapsed / build))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the memory used by indexed Vars
+
+This script constructs an indexed Var with the default (per-object)
+storage and with columnar storage (``Var(..., columnar=True)``) and
+reports the memory allocated (as traced by :py:mod:`tracemalloc`) per
+variable.  The "uninitialized" case uses shared (scalar) bounds and no
+values; the "initialized" case gives every variable a distinct value
+and lower bound.
+
+Example::
+
+    python var_memory.py --size 2e5
+
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy_available
+
+
+def measure(size, columnar, initialized):
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(size)
+    m.I.construct()
+    if initialized:
+        kwds = {
+            'initialize': lambda m, i: 0.5 * i,
+            'bounds': lambda m, i: (0.25 * i, 1e9),
+        }
+    else:
+        kwds = {'bounds': (0, 10)}
+    gc.collect()
+    tracemalloc.start()
+    m.x = pyo.Var(m.I, columnar=columnar, **kwds)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / size, peak / size, sys.getsizeof(m.x[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory used by indexed Vars",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--size', type=float, default=2e5, help="Number of variables (default: 2e5)"
+    )
+    options = parser.parse_args(argv)
+    size = int(options.size)
+    # Checking numpy_available triggers the (deferred) numpy import, so
+    # that it is not included in the measurements
+    if not numpy_available:
+        sys.exit("columnar Vars require numpy")
+
+    print("%-14s %-9s %10s %10s %8s" % ('', '', 'bytes/var', 'peak', 'sizeof'))
+    for initialized in (False, True):
+        for columnar in (False, True):
+            print(
+                "%-14s %-9s %10.0f %10.0f %8d"
+                % (
+                    ('initialized' if initialized else 'uninitialized'),
+                    ('columnar' if columnar else 'default'),
+                    *measure(size, columnar, initialized),
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
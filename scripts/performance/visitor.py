@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the StreamBasedExpressionVisitor walkers
+
+This script times the recursive walker (``walk_expression``) and the
+compiled nonrecursive walker (``walk_expression_nonrecursive``) for
+several visitors (each defining a different set of callbacks) over
+three families of expressions:
+
+  - wide:  a single sum with many nonlinear terms
+  - deep:  a single deeply nested (unbalanced) expression
+  - small: many small nonlinear expressions
+
+Example::
+
+    python visitor.py --size 1000 --repeat 5
+
+"""
+
+import argparse
+import gc
+import time
+
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+from pyomo.repn.linear import LinearRepnVisitor
+
+
+class Sizer(StreamBasedExpressionVisitor):
+    # 'x' walker
+    def exitNode(self, node, data):
+        return 1 + sum(data)
+
+
+class LeafCounter(StreamBasedExpressionVisitor):
+    # 'bcx' walker
+    def __init__(self):
+        super().__init__()
+        self.leaves = 0
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in pyo.native_types or not child.is_expression_type():
+            self.leaves += 1
+            return False, None
+        return True, None
+
+    def acceptChildResult(self, node, data, child_result, child_idx):
+        return data
+
+    def exitNode(self, node, data):
+        return None
+
+
+def build_expressions(size):
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var(range(size + 1), initialize=1)
+    wide = sum(pyo.exp(m.x[i]) * m.x[i + 1] for i in range(size))
+    deep = m.x[0]
+    for i in range(1, size):
+        deep = pyo.sin(deep) * m.x[i] + 1
+    small = [
+        m.x[i] ** 2 + 3 * m.x[i + 1] * m.x[i] - pyo.exp(m.x[i]) for i in range(size)
+    ]
+    return m, {'wide': [wide] * 10, 'deep': [deep] * 10, 'small': small}
+
+
+def build_visitors():
+    return {
+        'sizer (x)': Sizer(),
+        'leaves (bcx)': LeafCounter(),
+        'linear (bex)': LinearRepnVisitor({}, {}, {}, None),
+    }
+
+
+def timed(fcn, exprs, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for e in exprs:
+            fcn(e)
+        t = time.perf_counter() - start
+        if best is None or t < best:
+            best = t
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the StreamBasedExpressionVisitor walkers",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=1000,
+        help="Number of terms / nesting depth / expressions (default: 1000)",
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help="Number of repetitions (the best time is reported) (default: 5)",
+    )
+    options = parser.parse_args(argv)
+
+    m, expressions = build_expressions(options.size)
+    print("%-14s %-6s %12s %15s" % ('visitor', 'expr', 'recursive', 'nonrecursive'))
+    for name, visitor in build_visitors().items():
+        for ename, exprs in expressions.items():
+            rec = timed(visitor.walk_expression, exprs, options.repeat)
+            nonrec = timed(visitor.walk_expression_nonrecursive, exprs, options.repeat)
+            print(
+                "%-14s %-6s %10.2f ms %10.2f ms  (%.2fx)"
+                % (name, ename, rec * 1e3, nonrec * 1e3, rec / nonrec)
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Benchmark the Pyomo model writers
+
+This script generates parametric test models (dense LP, sparse network
+flow, nonlinear DAE-style and GDP models) sized by an approximate
+number of constraint matrix nonzeros, and records the wall time, peak
+(Python) memory and output file size for each model writer.  Results
+can be appended to a JSON history file and compared against a stored
+baseline run; any metric that grows by more than the specified
+tolerance is reported as a regression (and the script exits with a
+nonzero status).
+
+Example::
+
+    python writers.py --nnz 1e4 1e5 --history writers.json
+    python writers.py --nnz 1e4 1e5 --baseline writers.json
+
+"""
+
+import argparse
+import gc
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+import pyomo.environ as pyo
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt import WriterFactory
+
+#
+# Model generators.  Each generator accepts the (approximate) number of
+# nonzeros in the constraint matrix and returns a ConcreteModel.
+#
+
+
+def dense_lp(nnz):
+    n = max(2, int(math.sqrt(nnz)))
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.x = pyo.Var(m.I, bounds=(0, None))
+    m.obj = pyo.Objective(expr=sum(i * m.x[i] for i in m.I))
+
+    @m.Constraint(m.I)
+    def c(m, i):
+        return sum(((i * j) % 7 + 1) * m.x[j] for j in m.I) >= i
+
+    return m
+
+
+def sparse_network(nnz):
+    # Min-cost flow on a ring-structured graph where every node has
+    # `degree` outgoing arcs.  Each arc contributes two nonzeros.
+    degree = 4
+    n = max(degree + 1, nnz // (2 * degree))
+    m = pyo.ConcreteModel()
+    m.N = pyo.RangeSet(0, n - 1)
+    m.A = pyo.Set(
+        initialize=[(i, (i + 2**k) % n) for i in range(n) for k in range(degree)],
+        dimen=2,
+    )
+    m.flow = pyo.Var(m.A, bounds=(0, 10))
+    m.obj = pyo.Objective(expr=sum(((i + j) % 11 + 1) * m.flow[i, j] for i, j in m.A))
+    out_arcs = {i: [] for i in m.N}
+    in_arcs = {i: [] for i in m.N}
+    for i, j in m.A:
+        out_arcs[i].append((i, j))
+        in_arcs[j].append((i, j))
+
+    @m.Constraint(m.N)
+    def balance(m, i):
+        supply = 1 if i == 0 else (-1 if i == n // 2 else 0)
+        return (
+            sum(m.flow[a] for a in out_arcs[i]) - sum(m.flow[a] for a in in_arcs[i])
+            == supply
+        )
+
+    return m
+
+
+def dae(nnz):
+    # Implicit Euler discretization of a nonlinear ODE system with a
+    # shared control profile: each state equation has ~4 nonzeros.
+    nx = 10
+    nt = max(2, nnz // (4 * nx))
+    h = 1.0 / nt
+    m = pyo.ConcreteModel()
+    m.S = pyo.RangeSet(nx)
+    m.T = pyo.RangeSet(0, nt)
+    m.x = pyo.Var(m.S, m.T, bounds=(-10, 10), initialize=0.5)
+    m.u = pyo.Var(m.T, bounds=(-1, 1), initialize=0)
+    m.obj = pyo.Objective(
+        expr=h * sum(m.x[i, t] ** 2 for i in m.S for t in m.T)
+        + h * sum(m.u[t] ** 2 for t in m.T)
+    )
+
+    @m.Constraint(m.S, m.T)
+    def ode(m, i, t):
+        if t == 0:
+            return m.x[i, t] == 1.0 / i
+        return m.x[i, t] == m.x[i, t - 1] + h * (
+            -(m.x[i, t] ** 3) + m.u[t] * pyo.exp(-m.x[i, t]) + pyo.log(2 + m.u[t])
+        )
+
+    return m
+
+
+def gdp(nnz):
+    # Job-shop style disjunctive scheduling model (transformed to a MILP
+    # with Big-M before writing).  Each disjunction contributes 4
+    # constraints with 3 nonzeros each.
+    n = max(2, int(math.sqrt(nnz / 6)))
+    m = pyo.ConcreteModel()
+    m.J = pyo.RangeSet(n)
+    m.P = pyo.Set(initialize=[(i, j) for i in m.J for j in m.J if i < j], dimen=2)
+    m.start = pyo.Var(m.J, bounds=(0, 10 * n))
+    m.makespan = pyo.Var(bounds=(0, 11 * n))
+    m.obj = pyo.Objective(expr=m.makespan)
+
+    @m.Constraint(m.J)
+    def finish(m, j):
+        return m.start[j] + j % 5 + 1 <= m.makespan
+
+    @m.Disjunction(m.P)
+    def order(m, i, j):
+        return [
+            [m.start[i] + i % 5 + 1 <= m.start[j]],
+            [m.start[j] + j % 5 + 1 <= m.start[i]],
+        ]
+
+    pyo.TransformationFactory('gdp.bigm').apply_to(m)
+    return m
+
+
+# name: (generator, is_linear)
+MODELS = {
+    'dense_lp': (dense_lp, True),
+    'sparse_network': (sparse_network, True),
+    'dae': (dae, False),
+    'gdp': (gdp, True),
+}
+
+#
+# Writers.  Each entry maps a writer name to (file suffix, linear_only,
+# write function).  The write function is called as fcn(model,
+# filename); writers that produce in-memory data are passed filename
+# None.
+#
+
+
+def _file_writer(model, filename):
+    # The output format is inferred from the file suffix
+    model.write(filename)
+
+
+def _standard_form(model, filename):
+    WriterFactory('compile_standard_form').write(model)
+
+
+def _appsi_writer(cls_name):
+    def write(model, filename):
+        from pyomo.contrib.appsi import writers
+
+        getattr(writers, cls_name)().write(model, filename)
+
+    return write
+
+
+def _appsi_available():
+    try:
+        from pyomo.contrib.appsi.cmodel import cmodel_available
+    except ImportError:
+        return False
+    return bool(cmodel_available)
+
+
+WRITERS = {
+    'nl': ('.nl', False, _file_writer),
+    'lp': ('.lp', True, _file_writer),
+    'mps': ('.mps', True, _file_writer),
+    'gams': ('.gms', False, _file_writer),
+    'baron': ('.bar', False, _file_writer),
+    'standard_form': (None, True, _standard_form),
+    'appsi_nl': ('.nl', False, _appsi_writer('NLWriter')),
+    'appsi_lp': ('.lp', True, _appsi_writer('LPWriter')),
+}
+
+
+def count_nonzeros(model):
+    """Return the number of (variable, constraint) incidences"""
+    from pyomo.core.expr.visitor import identify_variables
+
+    return sum(
+        len(list(identify_variables(con.body, include_fixed=False)))
+        for con in model.component_data_objects(pyo.Constraint, active=True)
+    )
+
+
+def run_writer(fcn, model, suffix, replicates, memory):
+    """Run one writer on one model and return a dict of metrics"""
+    ans = {}
+    with TempfileManager.new_context() as tempfile_mgr:
+        tmpdir = tempfile_mgr.mkdtemp()
+        fname = None if suffix is None else os.path.join(tmpdir, 'model' + suffix)
+        times = []
+        for i in range(replicates):
+            gc.collect()
+            gc.collect()
+            start = time.perf_counter()
+            fcn(model, fname)
+            times.append(time.perf_counter() - start)
+        ans['time'] = min(times)
+        ans['file_size'] = None if fname is None else os.path.getsize(fname)
+        if memory:
+            # tracemalloc adds considerable overhead, so memory is
+            # measured in a separate (untimed) pass
+            gc.collect()
+            tracemalloc.start()
+            try:
+                fcn(model, fname)
+                ans['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return ans
+
+
+def run_benchmarks(options):
+    results = {}
+    appsi = _appsi_available()
+    # Run each writer once on a small model so that one-time costs
+    # (e.g., deferred imports) are not attributed to the first benchmark
+    warm_up = dense_lp(100)
+    for writer_name in options.writers:
+        suffix, linear_only, fcn = WRITERS[writer_name]
+        if writer_name.startswith('appsi') and not appsi:
+            continue
+        run_writer(fcn, warm_up, suffix, 1, False)
+    del warm_up
+
+    for model_name in options.models:
+        generator, is_linear = MODELS[model_name]
+        for nnz in options.nnz:
+            model = generator(nnz)
+            actual_nnz = count_nonzeros(model)
+            for writer_name in options.writers:
+                suffix, linear_only, fcn = WRITERS[writer_name]
+                if linear_only and not is_linear:
+                    continue
+                if writer_name.startswith('appsi') and not appsi:
+                    continue
+                key = f'{model_name}/{nnz}/{writer_name}'
+                try:
+                    data = run_writer(
+                        fcn, model, suffix, options.replicates, options.memory
+                    )
+                except Exception as e:
+                    data = {'error': f'{e.__class__.__name__}: {e}'}
+                data['nnz'] = actual_nnz
+                results[key] = data
+                if not options.quiet:
+                    print(format_result(key, data))
+            del model
+    return results
+
+
+def format_result(key, data):
+    if 'error' in data:
+        return f'{key:40s} ERROR {data["error"]}'
+    ans = f'{key:40s} {data["time"]:10.3f} s'
+    if data.get('peak_memory') is not None:
+        ans += f' {data["peak_memory"] / 2**20:10.1f} MB'
+    if data.get('file_size') is not None:
+        ans += f' {data["file_size"] / 2**20:10.1f} MB (file)'
+    return ans
+
+
+def get_run_info():
+    import pyomo.version
+
+    info = {
+        'time': time.time(),
+        'python_implementation': platform.python_implementation(),
+        'python_version': tuple(sys.version_info)[:3],
+        'platform': platform.system(),
+        'hostname': platform.node(),
+        'pyomo_version': pyomo.version.version,
+    }
+    try:
+        cwd = os.path.dirname(pyo.__file__)
+        info['sha'] = os.popen(f'git -C "{cwd}" rev-parse HEAD').read().strip()
+    except OSError:
+        info['sha'] = None
+    return info
+
+
+def load_history(fname):
+    """Return the list of runs stored in a JSON history file"""
+    if not fname or not os.path.exists(fname):
+        return []
+    with open(fname, 'r') as INPUT:
+        data = json.load(INPUT)
+    # Accept either a history (list of runs) or a single run
+    if isinstance(data, dict):
+        data = [data]
+    return data
+
+
+def find_regressions(base, test, tolerance, time_floor=1e-3):
+    """Compare two result dicts and return a list of regressions
+
+    Each regression is a tuple (key, metric, base value, test value).
+    A metric is regressed if the test value exceeds the base value by
+    more than the relative `tolerance`.  Times below `time_floor`
+    seconds are considered noise and never flagged.
+
+    """
+    regressions = []
+    for key, test_data in test.items():
+        base_data = base.get(key)
+        if not base_data or 'error' in base_data:
+            continue
+        if 'error' in test_data:
+            regressions.append((key, 'error', None, test_data['error']))
+            continue
+        for metric in ('time', 'peak_memory', 'file_size'):
+            b = base_data.get(metric)
+            t = test_data.get(metric)
+            if b is None or t is None:
+                continue
+            if metric == 'time' and max(b, t) < time_floor:
+                continue
+            if t > b * (1 + tolerance):
+                regressions.append((key, metric, b, t))
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Pyomo model writers',
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--nnz',
+        nargs='+',
+        type=lambda x: int(float(x)),
+        default=[10**4],
+        help='Approximate constraint matrix nonzeros for each generated '
+        'model (e.g., 1e4 1e5 1e6).',
+    )
+    parser.add_argument(
+        '--models',
+        nargs='+',
+        choices=list(MODELS),
+        default=list(MODELS),
+        help='Model generators to benchmark.',
+    )
+    parser.add_argument(
+        '--writers',
+        nargs='+',
+        choices=list(WRITERS),
+        default=list(WRITERS),
+        help='Writers to benchmark (writers that are not available or '
+        'do not support a model type are skipped).',
+    )
+    parser.add_argument(
+        '-n',
+        '--replicates',
+        type=int,
+        default=1,
+        help='Number of timed replicates (the minimum time is recorded).',
+    )
+    parser.add_argument(
+        '--no-memory',
+        action='store_false',
+        dest='memory',
+        help='Do not record peak memory (skips the tracemalloc pass).',
+    )
+    parser.add_argument(
+        '--history',
+        default=None,
+        help='Append the results of this run to the specified JSON history.',
+    )
+    parser.add_argument(
+        '--baseline',
+        default=None,
+        help='Compare this run against the (last run in the) specified '
+        'JSON file and report regressions.',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='Relative increase in a metric that is flagged as a '
+        'regression (default: 0.1).',
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true', help='Do not print individual results.'
+    )
+    options = parser.parse_args(argv[1:])
+
+    run = {'info': get_run_info(), 'results': run_benchmarks(options)}
+
+    status = 0
+    if options.baseline:
+        baseline = load_history(options.baseline)
+        if not baseline:
+            print(f"Baseline file '{options.baseline}' contains no runs")
+        else:
+            regressions = find_regressions(
+                baseline[-1]['results'], run['results'], options.tolerance
+            )
+            for key, metric, b, t in regressions:
+                print(f'REGRESSION: {key} {metric}: {b} -> {t}')
+            if regressions:
+                status = 1
+            else:
+                print('No regressions detected.')
+
+    if options.history:
+        history = load_history(options.history)
+        history.append(run)
+        with open(options.history, 'w') as OUTPUT:
+            json.dump(history, OUTPUT, indent=2)
+        print(f"Appended results to {options.history}")
+
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))